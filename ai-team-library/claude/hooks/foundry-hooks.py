@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""Foundry hook dispatcher — run several hook scripts in one process.
+
+Claude Code starts one process per hook command, so an Edit that fires
+three PreToolUse scripts pays three interpreter cold starts and parses
+the same stdin JSON three times. The generator (safety_writer) folds the
+``python3 .claude/hooks/<script>.py`` entries sharing an event and matcher
+into one entry that runs this dispatcher with the scripts as arguments:
+
+    python3 .claude/hooks/foundry-hooks.py validate-task-inputs.py vdd-gate.py
+
+Each script runs in order, as its own ``__main__``, with the hook input
+on stdin, its own path in ``sys.argv[0]``, and its stdout/stderr passed
+straight through — as if Claude Code had started it. The exit code is the
+one Claude Code would act on had the scripts run as separate hooks:
+
+- 2 if any script exited 2 (blocks the tool call; stderr is the reason)
+- otherwise the first other non-zero exit (non-blocking error)
+- otherwise 0
+
+A script that raises prints its traceback and counts as exit 1; a script
+that is missing counts as exit 2, as ``python3 missing.py`` would.
+
+Daemon mode
+-----------
+With ``--daemon`` before the scripts (``hooks.daemon`` in the
+composition), the dispatcher is a thin client: it hands the hook input,
+working directory, and environment to a long-lived ``--serve`` process
+for this project over a Unix socket and relays the reply. The server
+keeps the compiled scripts and ``hook_state``'s caches (branch, branch
+start, report listings, bean index) warm across tool calls.
+
+The server starts lazily: when no server answers, the client runs the
+scripts itself, as without ``--daemon``, and starts one in the
+background for the next call. It serves one request at a time, exits
+after ``IDLE_TIMEOUT`` seconds without requests, and exits (answering
+"stale" so the client runs the scripts itself) once this file or a
+helper module it keeps loaded (``hook_state.py``, ``lint_changed.py``)
+changes on disk. ``--stop`` stops it. Where Unix
+sockets are unavailable, ``--daemon`` always runs in-process.
+"""
+
+from __future__ import annotations
+
+import builtins
+import io
+import marshal
+import os
+import sys
+import zlib
+
+# The client path imports only what the interpreter has loaded anyway (or
+# builtin modules): it runs on every tool call, and importing json,
+# pathlib, or socket would cost more than the daemon saves.
+HOOKS_DIR = os.path.dirname(os.path.realpath(__file__))
+
+# Seconds a daemon waits for a request before exiting.
+IDLE_TIMEOUT = 15 * 60
+
+# Seconds a client waits for a daemon to accept its connection.
+CONNECT_TIMEOUT = 0.5
+
+# Modules the daemon keeps loaded; it retires itself when one changes.
+_DAEMON_MODULES = ("foundry-hooks.py", "hook_state.py", "lint_changed.py")
+
+_compiled: dict[str, tuple[tuple[int, int, int], object]] = {}
+
+
+def _stamp(path: str) -> tuple[int, int, int]:
+    st = os.stat(path)
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _code(path: str):
+    """Return *path* compiled, recompiling only when the file changes."""
+    stamp = _stamp(path)
+    hit = _compiled.get(path)
+    if hit is None or hit[0] != stamp:
+        with open(path, "rb") as fh:
+            hit = (stamp, compile(fh.read(), path, "exec", dont_inherit=True))
+        _compiled[path] = hit
+    return hit[1]
+
+
+def run_script(script: str, raw_input: str) -> int:
+    """Run hook *script* as ``__main__`` on *raw_input*; return its exit code."""
+    path = os.path.join(HOOKS_DIR, script)
+    if not os.path.isfile(path):
+        print(
+            f"foundry-hooks: can't open file '{path}': No such file or directory",
+            file=sys.stderr,
+        )
+        return 2
+    saved = sys.stdin, sys.argv, sys.path[0]
+    sys.stdin = io.StringIO(raw_input)
+    sys.argv = [path]
+    sys.path[0] = HOOKS_DIR
+    code = 0
+    try:
+        exec(_code(path), {
+            "__name__": "__main__",
+            "__file__": path,
+            "__builtins__": builtins,
+        })
+    except SystemExit as exc:
+        if exc.code is None:
+            code = 0
+        elif isinstance(exc.code, int):
+            code = exc.code
+        else:
+            print(exc.code, file=sys.stderr)
+            code = 1
+    except Exception:
+        import traceback
+
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdin, sys.argv, sys.path[0] = saved
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return code
+
+
+def dispatch(scripts: list[str], raw_input: str) -> int:
+    """Run every script in order and combine their exit codes."""
+    blocked = False
+    failed = 0
+    for script in scripts:
+        code = run_script(script, raw_input)
+        if code == 2:
+            blocked = True
+        elif code and not failed:
+            failed = code
+    return 2 if blocked else failed
+
+
+# ---------------------------------------------------------------------------
+# Daemon
+# ---------------------------------------------------------------------------
+
+
+def socket_path() -> str | None:
+    """Return this project's daemon socket, or None where there can be none.
+
+    The socket lives in a per-user directory under ``$XDG_RUNTIME_DIR``
+    (or ``$TMPDIR``, or ``/tmp``), named after the hooks directory, so
+    every checkout gets its own daemon. The server checks requests are
+    for its hooks directory, so a name collision only costs the daemon.
+    """
+    try:
+        import _socket
+    except ImportError:
+        return None
+    if not hasattr(_socket, "AF_UNIX") or not hasattr(os, "getuid"):
+        return None
+    base = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp"
+    name = f"{zlib.crc32(os.fsencode(HOOKS_DIR)):08x}.sock"
+    path = os.path.join(base, f"foundry-hooks-{os.getuid()}", name)
+    # sun_path holds about 100 bytes.
+    return path if len(os.fsencode(path)) < 100 else None
+
+
+def _private_dir(path: str) -> bool:
+    """True if *path* is a directory only the current user can use."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077 and os.path.isdir(path)
+
+
+def _receive(conn) -> bytes:
+    chunks = []
+    while chunk := conn.recv(65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _send(path: str, message: dict) -> dict | None:
+    """Send *message* to the daemon at *path*; None if no daemon took it."""
+    import _socket
+
+    conn = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        conn.settimeout(CONNECT_TIMEOUT)
+        try:
+            conn.connect(path)
+        except OSError:
+            return None
+        # Delivered: from here on the daemon may be running the scripts,
+        # so a failure is reported rather than retried in-process.
+        conn.settimeout(None)
+        try:
+            conn.sendall(marshal.dumps(message))
+            conn.shutdown(_socket.SHUT_WR)
+            return marshal.loads(_receive(conn))
+        except (OSError, EOFError, ValueError, TypeError) as exc:
+            return {"code": 1, "stdout": "",
+                    "stderr": f"foundry-hooks: no reply from the hook daemon: {exc}\n"}
+    finally:
+        conn.close()
+
+
+def _spawn_daemon() -> None:
+    import subprocess
+
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.join(HOOKS_DIR, "foundry-hooks.py"), "--serve"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL, cwd=HOOKS_DIR, start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def run_via_daemon(scripts: list[str], raw_input: str) -> int:
+    """Run *scripts* in this project's daemon, or in-process if none answers."""
+    path = socket_path()
+    if path is None:
+        return dispatch(scripts, raw_input)
+    reply = None
+    if _private_dir(os.path.dirname(path)):
+        reply = _send(path, {
+            "hooks_dir": HOOKS_DIR,
+            "scripts": scripts,
+            "input": raw_input,
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+        })
+    if reply is None or reply.get("stale"):
+        _spawn_daemon()
+        return dispatch(scripts, raw_input)
+    if reply.get("foreign"):
+        return dispatch(scripts, raw_input)
+    sys.stdout.write(reply["stdout"])
+    sys.stderr.write(reply["stderr"])
+    return reply["code"]
+
+
+def _handle(request: dict) -> dict:
+    """Run one client's scripts as if in the client's process."""
+    import traceback
+
+    out, err = io.StringIO(), io.StringIO()
+    cwd, env = os.getcwd(), dict(os.environ)
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout, sys.stderr = out, err
+    try:
+        os.chdir(request["cwd"])
+        os.environ.clear()
+        os.environ.update(request["env"])
+        code = dispatch(request["scripts"], request["input"])
+    except Exception:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+        os.chdir(cwd)
+        os.environ.clear()
+        os.environ.update(env)
+    return {"code": code, "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+
+def _module_stamps() -> list[tuple[int, int, int] | None]:
+    stamps = []
+    for name in _DAEMON_MODULES:
+        try:
+            stamps.append(_stamp(os.path.join(HOOKS_DIR, name)))
+        except OSError:
+            stamps.append(None)
+    return stamps
+
+
+def serve(idle_timeout: float = IDLE_TIMEOUT) -> int:
+    """Serve this project's hook requests until idle, stale, or stopped."""
+    import fcntl
+    import socket
+    import time
+
+    path = socket_path()
+    if path is None:
+        return 1
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    if not _private_dir(os.path.dirname(path)):
+        return 1
+    lock = open(path[:-len(".sock")] + ".lock", "w")
+    # A retiring daemon holds the lock until its socket is gone.
+    for _ in range(40):
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            break
+        except OSError:
+            time.sleep(0.05)
+    else:
+        lock.close()
+        return 0  # another daemon serves this project
+    stamps = _module_stamps()
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        if os.path.exists(path):
+            os.unlink(path)
+        server.bind(path)
+        server.listen()
+        server.settimeout(idle_timeout)
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                break
+            with conn:
+                conn.settimeout(None)
+                try:
+                    request = marshal.loads(_receive(conn))
+                except (OSError, EOFError, ValueError, TypeError):
+                    continue
+                if request.get("stop"):
+                    conn.sendall(marshal.dumps({"stopped": True}))
+                    break
+                if _module_stamps() != stamps:
+                    conn.sendall(marshal.dumps({"stale": True}))
+                    break
+                if request.get("hooks_dir") != HOOKS_DIR:
+                    reply = {"foreign": True}
+                else:
+                    reply = _handle(request)
+                try:
+                    conn.sendall(marshal.dumps(reply))
+                except OSError:
+                    pass
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)
+        lock.close()
+    return 0
+
+
+def stop() -> int:
+    """Stop this project's daemon, if one is running."""
+    path = socket_path()
+    if path is not None and _private_dir(os.path.dirname(path)):
+        _send(path, {"stop": True, "hooks_dir": HOOKS_DIR})
+    return 0
+
+
+def main() -> None:
+    sys.dont_write_bytecode = True  # keep .claude/hooks free of __pycache__
+    args = sys.argv[1:]
+    if args[:1] == ["--serve"]:
+        sys.exit(serve())
+    if args[:1] == ["--stop"]:
+        sys.exit(stop())
+    raw_input = sys.stdin.read()
+    if args[:1] == ["--daemon"]:
+        sys.exit(run_via_daemon(args[1:], raw_input))
+    sys.exit(dispatch(args, raw_input))
+
+
+if __name__ == "__main__":
+    main()
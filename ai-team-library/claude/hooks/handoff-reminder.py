@@ -18,6 +18,8 @@ import re
 import sys
 from pathlib import Path
 
+import hook_state
+
 STATUS_DONE_RE = re.compile(r"\*\*Status\*\*\s*\|\s*Done\b", re.IGNORECASE)
 BEAN_ID_RE = re.compile(r"BEAN-(\d+)")
 
@@ -59,9 +61,9 @@ def main() -> None:
         project_root = project_root.parent
 
     handoffs_dir = project_root / "ai" / "handoffs"
-    has_packet = handoffs_dir.is_dir() and any(
-        bean_num in p.name for p in handoffs_dir.glob("*.md")
-        if p.name != "_index.md"
+    has_packet = any(
+        bean_num in name for name in hook_state.dir_entries(handoffs_dir)
+        if name.endswith(".md") and name != "_index.md"
     )
     if not has_packet:
         print(
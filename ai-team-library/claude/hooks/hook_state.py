@@ -0,0 +1,250 @@
+"""Repository state shared by the hook scripts, cached for as long as it holds.
+
+Every hook run used to re-derive the same facts: the current branch
+(``git branch --show-current``), the branch's first commit since it left
+``main`` (for telemetry durations), the reports under
+``ai/outputs/tech-qa/``, and the bean index. The scripts ask this module
+instead. Each answer is cached with the file-system stamps it was derived
+from and recomputed when one of them changes:
+
+- branch and branch start: ``.git/HEAD``, the branch and base refs, and
+  ``packed-refs`` (a commit, checkout, or fetch changes one of them);
+  branch start is also persisted per branch, keyed by the commits the
+  branch and base point at
+- directory listings: the directory's mtime (entries added or removed)
+- parsed files: the file's mtime and size
+
+A hook script run on its own, or through the ``foundry-hooks.py``
+dispatcher, shares the cache within that one process; the dispatcher's
+``--daemon`` mode keeps it across tool calls.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import threading
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+# Branch start dates kept across hook processes, in the git common directory.
+BRANCH_START_CACHE = "foundry-branch-start.json"
+
+_cache: dict[tuple[Any, ...], tuple[Any, Any]] = {}
+_lock = threading.Lock()
+
+
+def _stamp(path: Path) -> tuple[int, int, int] | None:
+    # The inode catches files replaced by rename (git's lockfile writes)
+    # within one mtime tick.
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _cached(key: tuple[Any, ...], stamp: Any, compute: Callable[[], T]) -> T:
+    """Return the value cached under *key* if *stamp* still matches, else compute it."""
+    with _lock:
+        hit = _cache.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    value = compute()
+    with _lock:
+        _cache[key] = (stamp, value)
+    return value
+
+
+def clear() -> None:
+    """Forget everything cached."""
+    with _lock:
+        _cache.clear()
+
+
+# ---------------------------------------------------------------------------
+# Files and directories
+# ---------------------------------------------------------------------------
+
+
+def read_cached(path: str | Path, parse: Callable[[str], T]) -> T | None:
+    """Return ``parse(text of path)``, reparsing only when the file changes.
+
+    Returns None when the file cannot be read.
+    """
+    path = Path(path).absolute()
+
+    def compute() -> T | None:
+        try:
+            return parse(path.read_text(encoding="utf-8"))
+        except OSError:
+            return None
+
+    # Keyed by the parser's name, not the function object: the daemon
+    # re-executes the scripts, so each request defines a fresh function.
+    code = getattr(parse, "__code__", None)
+    parser = (code and code.co_filename, getattr(parse, "__qualname__", repr(parse)))
+    return _cached(("file", path, parser), _stamp(path), compute)
+
+
+def dir_entries(path: str | Path) -> tuple[str, ...]:
+    """Return the sorted entry names of directory *path* (empty if absent)."""
+    path = Path(path).absolute()
+
+    def compute() -> tuple[str, ...]:
+        try:
+            return tuple(sorted(os.listdir(path)))
+        except OSError:
+            return ()
+
+    return _cached(("dir", path), _stamp(path), compute)
+
+
+# ---------------------------------------------------------------------------
+# Git
+# ---------------------------------------------------------------------------
+
+
+def _git(*args: str, cwd: Path) -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", *args], capture_output=True, text=True, timeout=5, cwd=cwd,
+        )
+    except Exception:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def git_dir(cwd: str | Path | None = None) -> Path | None:
+    """Return the git directory of the repository containing *cwd*, if any.
+
+    Follows the ``gitdir:`` pointer of worktrees and submodules. Returns
+    None when ``GIT_DIR`` is set — callers then ask git directly.
+    """
+    if "GIT_DIR" in os.environ:
+        return None
+    start = Path(cwd or os.getcwd()).absolute()
+    for folder in (start, *start.parents):
+        dot_git = folder / ".git"
+        if dot_git.is_dir():
+            return dot_git
+        if dot_git.is_file():
+            try:
+                pointer = dot_git.read_text(encoding="utf-8").strip()
+            except OSError:
+                return None
+            if pointer.startswith("gitdir:"):
+                return (folder / pointer[len("gitdir:"):].strip()).resolve()
+            return None
+    return None
+
+
+def _common_dir(gdir: Path) -> Path:
+    """The directory holding refs shared by all worktrees of *gdir*."""
+    try:
+        common = (gdir / "commondir").read_text(encoding="utf-8").strip()
+    except OSError:
+        return gdir
+    return (gdir / common).resolve()
+
+
+def current_branch(cwd: str | Path | None = None) -> str:
+    """Return the checked-out branch, or "" when detached or not in a repo.
+
+    Matches ``git branch --show-current``.
+    """
+    cwd = Path(cwd or os.getcwd()).absolute()
+    gdir = git_dir(cwd)
+    if gdir is None:
+        return _git("branch", "--show-current", cwd=cwd) or ""
+    head = gdir / "HEAD"
+
+    def compute() -> str:
+        try:
+            ref = head.read_text(encoding="utf-8").strip()
+        except OSError:
+            return ""
+        prefix = "ref: refs/heads/"
+        return ref[len(prefix):] if ref.startswith(prefix) else ""
+
+    return _cached(("branch", head), _stamp(head), compute)
+
+
+def _ref_sha(common: Path, ref: str) -> str | None:
+    """Return the commit *ref* (``refs/heads/...``) points at, read from disk."""
+    try:
+        return (common / ref).read_text(encoding="utf-8").strip() or None
+    except OSError:
+        pass
+    packed = read_cached(common / "packed-refs", _parse_packed_refs)
+    return packed.get(ref) if packed else None
+
+
+def _parse_packed_refs(text: str) -> dict[str, str]:
+    refs = {}
+    for line in text.splitlines():
+        sha, _, ref = line.partition(" ")
+        if ref and not line.startswith(("#", "^")):
+            refs[ref] = sha
+    return refs
+
+
+def branch_start(base: str = "main", cwd: str | Path | None = None) -> str | None:
+    """Return the author date (ISO 8601) of the current branch's first commit since *base*.
+
+    None when on *base* or detached, when *base* is missing, or when the
+    branch has no commits of its own yet. One ``git log`` answers it; the
+    answer is also kept per branch in ``BRANCH_START_CACHE`` (in the git
+    directory) against the commits the branch and *base* point at, so
+    later hook processes reuse it without starting git.
+    """
+    cwd = Path(cwd or os.getcwd()).absolute()
+    branch = current_branch(cwd)
+    if not branch or branch == base:
+        return None
+
+    def compute() -> str | None:
+        log = _git("log", "--format=%aI", "--reverse", f"{base}..HEAD", cwd=cwd)
+        return log.split("\n")[0] if log else None
+
+    gdir = git_dir(cwd)
+    if gdir is None:
+        return compute()
+    common = _common_dir(gdir)
+    heads = common / "refs" / "heads"
+    stamp = tuple(
+        _stamp(p) for p in (
+            gdir / "HEAD", heads / branch, heads / base, common / "packed-refs",
+        )
+    )
+
+    def persisted() -> str | None:
+        tips = [_ref_sha(common, f"refs/heads/{name}") for name in (branch, base)]
+        if None in tips:
+            return compute()
+        path = common / BRANCH_START_CACHE
+        try:
+            starts = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            starts = {}
+        if not isinstance(starts, dict):
+            starts = {}
+        key = f"{branch}..{base}"
+        hit = starts.get(key)
+        if isinstance(hit, dict) and hit.get("tips") == tips:
+            return hit.get("start")
+        start = compute()
+        starts[key] = {"tips": tips, "start": start}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp.write_text(json.dumps(starts), encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+        return start
+
+    return _cached(("branch_start", gdir, branch, base), stamp, persisted)
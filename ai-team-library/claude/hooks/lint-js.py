@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Lint hook for the pre-commit-lint-js pack (JavaScript / TypeScript).
+
+PostToolUse: ``prettier --check`` and ``eslint`` on the edited file only.
+Stop: ``prettier --check .``, ``eslint .`` and ``tsc --noEmit`` over the
+project, debounced, when files were edited since the last pass — type
+errors are a whole-program property, so ``tsc`` only runs there. See
+``lint_changed.py``. Always exits 0.
+"""
+
+from __future__ import annotations
+
+import lint_changed
+from lint_changed import Check
+
+SCRIPT_EXTENSIONS = (".js", ".jsx", ".mjs", ".cjs", ".ts", ".tsx", ".mts", ".cts")
+
+EXTENSIONS = (
+    *SCRIPT_EXTENSIONS,
+    ".json", ".css", ".scss", ".less", ".html", ".vue", ".md", ".yaml", ".yml",
+)
+
+_PRETTIER = (
+    "WARNING: Prettier formatting issues detected in {name}. "
+    "Run prettier --write before committing."
+)
+_ESLINT = "WARNING: ESLint issues detected in {name}. Run eslint --fix before committing."
+_TSC = "WARNING: TypeScript errors detected in {name}. Run tsc --noEmit to investigate."
+
+FILE_CHECKS = (
+    Check(
+        ("npx", "--no-install", "prettier", "--check", "--ignore-unknown", "{path}"),
+        _PRETTIER, frozenset(EXTENSIONS),
+    ),
+    Check(("npx", "--no-install", "eslint", "{path}"), _ESLINT, frozenset(SCRIPT_EXTENSIONS)),
+)
+
+PROJECT_CHECKS = (
+    Check(("npx", "--no-install", "prettier", "--check", "."), _PRETTIER),
+    Check(("npx", "--no-install", "eslint", "."), _ESLINT),
+    Check(("npx", "--no-install", "tsc", "--noEmit"), _TSC),
+)
+
+
+if __name__ == "__main__":
+    lint_changed.run("js", EXTENSIONS, FILE_CHECKS, PROJECT_CHECKS)
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""Lint hook for the pre-commit-lint pack (Python).
+
+PostToolUse: ``ruff check`` on the edited Python file only.
+Stop: ``ruff check .`` over the project, debounced, when files were edited
+since the last pass. See ``lint_changed.py``. Always exits 0.
+"""
+
+from __future__ import annotations
+
+import lint_changed
+from lint_changed import Check
+
+EXTENSIONS = (".py", ".pyi")
+
+FILE_CHECKS = (
+    Check(
+        ("ruff", "check", "--quiet", "{path}"),
+        "WARNING: Lint issues detected in {name}. Run ruff check --fix before committing.",
+        frozenset(EXTENSIONS),
+    ),
+)
+
+PROJECT_CHECKS = (
+    Check(
+        ("ruff", "check", "--quiet", "."),
+        "WARNING: Lint issues detected in {name}. Run ruff check --fix before committing.",
+    ),
+)
+
+
+if __name__ == "__main__":
+    lint_changed.run("python", EXTENSIONS, FILE_CHECKS, PROJECT_CHECKS)
@@ -0,0 +1,146 @@
+"""Lint the file an edit touched, and the whole project once the agent stops.
+
+Shared by the lint hook packs (``lint-python.py``, ``lint-js.py``). They
+used to lint the entire repository after every Edit/Write, so per-edit
+cost grew with the project. Now each pack's script runs twice in the hook
+lifecycle:
+
+- PostToolUse: lint only ``tool_input.file_path`` (when its extension is
+  one the pack covers) and mark the pack's project pass as due.
+- Stop: run the project-wide checks if an edit marked them due and the
+  last project pass is at least ``DEBOUNCE_SECONDS`` old; otherwise leave
+  them due for a later stop.
+
+Findings print as warnings. The scripts always exit 0 — linting must
+never block the edit (or the stop) that triggered it — and a linter that
+is not installed is skipped silently.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import hook_state
+
+# Minimum seconds between two project-wide passes of one pack.
+DEBOUNCE_SECONDS = 60
+
+# Seconds one linter run may take before it is abandoned.
+TIMEOUT = 120
+
+STATE_FILE = "foundry-lint-state.json"
+
+
+class Check(NamedTuple):
+    """One linter invocation; ``{path}`` in *argv* is the edited file."""
+
+    argv: tuple[str, ...]
+    warning: str
+    # File extensions this check lints after an edit; empty means the
+    # check only runs in the project pass.
+    extensions: frozenset[str] = frozenset()
+
+
+def _state_path() -> Path:
+    # Inside .git when there is one, so the state never shows up as a change.
+    gdir = hook_state.git_dir()
+    return (gdir if gdir is not None else Path(".claude")) / STATE_FILE
+
+
+def _load_state() -> dict[str, Any]:
+    try:
+        state = json.loads(_state_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _save_state(state: dict[str, Any]) -> None:
+    path = _state_path()
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(state), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _runner(argv: Sequence[str]) -> list[str] | None:
+    """Resolve *argv*'s program on PATH (``uv run`` for ruff); None if absent."""
+    program = argv[0]
+    if shutil.which(program):
+        return list(argv)
+    if program == "ruff" and shutil.which("uv"):
+        return ["uv", "run", *argv]
+    return None
+
+
+def _passes(argv: Sequence[str]) -> bool:
+    """Run a linter; True unless it ran and reported findings."""
+    command = _runner(argv)
+    if command is None:
+        return True
+    try:
+        result = subprocess.run(
+            command, stdin=subprocess.DEVNULL, capture_output=True, timeout=TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return True
+    return result.returncode == 0
+
+
+def _file_pass(pack: str, file_path: str, extensions: frozenset[str],
+               checks: Sequence[Check]) -> None:
+    suffix = Path(file_path).suffix.lower()
+    if suffix not in extensions or not Path(file_path).is_file():
+        return
+    for check in checks:
+        if suffix in check.extensions:
+            argv = [arg.replace("{path}", file_path) for arg in check.argv]
+            if not _passes(argv):
+                print(check.warning.format(name=Path(file_path).name))
+    state = _load_state()
+    entry = state.setdefault(pack, {})
+    if not entry.get("due"):
+        entry["due"] = True
+        _save_state(state)
+
+
+def _project_pass(pack: str, checks: Sequence[Check]) -> None:
+    state = _load_state()
+    entry = state.get(pack) or {}
+    now = time.time()
+    if not entry.get("due") or now - entry.get("last_pass", 0) < DEBOUNCE_SECONDS:
+        return
+    state[pack] = {"due": False, "last_pass": now}
+    _save_state(state)
+    for check in checks:
+        if not _passes(check.argv):
+            print(check.warning.format(name="the project"))
+
+
+def run(pack: str, extensions: Sequence[str], file_checks: Sequence[Check],
+        project_checks: Sequence[Check]) -> None:
+    """Run *pack*'s hook on the hook input on stdin; always exits 0."""
+    try:
+        input_data = json.load(sys.stdin)
+    except ValueError:
+        sys.exit(0)
+    if not isinstance(input_data, dict):
+        sys.exit(0)
+
+    if input_data.get("hook_event_name") == "Stop":
+        _project_pass(pack, project_checks)
+    elif input_data.get("tool_name") in ("Write", "Edit"):
+        file_path = (input_data.get("tool_input") or {}).get("file_path") or ""
+        if file_path:
+            _file_pass(pack, file_path, frozenset(extensions), file_checks)
+    sys.exit(0)
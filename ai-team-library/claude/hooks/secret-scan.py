@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""PostToolUse hook for the security-scan pack: look for secrets in an edit.
+
+Scans only the text the edit wrote, taken from the hook payload — a
+Write's ``content``, an Edit's ``new_string``, a MultiEdit's new strings —
+so the cost of one edit does not depend on how many files the branch has
+touched (the pack used to grep every file in ``git diff --name-only``).
+
+Patterns come from ``.claude/secret-scan.json``, which the generator
+writes from the composition's ``safety.secrets`` policy on top of the
+built-in ones below; they are compiled once per version of that file.
+Verdicts are cached by a hash of the scanned text in
+``.git/foundry-secret-scan-cache``, so re-writing known content skips
+the scan.
+
+Prints a warning naming the file and the matching pattern. Always exits
+0 — a possible secret must never block the edit that introduced it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+import hook_state
+
+# What the pack's grep looked for; configured patterns extend these.
+DEFAULT_PATTERNS = (
+    r"(?i)api[_-]?key",
+    r"(?i)secret[_-]?key",
+    r"(?i)password\s*=",
+    r"(?i)token\s*=",
+    r"BEGIN (RSA |EC )?PRIVATE KEY",
+)
+
+CONFIG_FILE = Path(__file__).resolve().parent.parent / "secret-scan.json"
+CACHE_FILE = "foundry-secret-scan-cache"
+
+# Verdicts kept in the cache file; the oldest are dropped past this.
+CACHE_LIMIT = 2048
+
+
+class Scanner:
+    """The compiled patterns of one configuration."""
+
+    def __init__(self, enabled: bool, patterns: list[str]):
+        self.enabled = enabled
+        self.patterns = [re.compile(p) for p in dict.fromkeys(patterns)]
+        self.fingerprint = hashlib.sha256(
+            "\n".join(p.pattern for p in self.patterns).encode("utf-8")
+        ).hexdigest()[:16]
+
+    def scan(self, text: str) -> int:
+        """Return the index of the first pattern found in *text*, or -1."""
+        for index, pattern in enumerate(self.patterns):
+            if pattern.search(text):
+                return index
+        return -1
+
+
+def _parse_config(text: str) -> Scanner:
+    try:
+        config = json.loads(text)
+    except ValueError:
+        config = {}
+    patterns = [p for p in config.get("patterns", []) if isinstance(p, str)]
+    try:
+        return Scanner(config.get("scan", True), [*DEFAULT_PATTERNS, *patterns])
+    except re.error:
+        return Scanner(config.get("scan", True), list(DEFAULT_PATTERNS))
+
+
+def load_scanner() -> Scanner:
+    scanner = hook_state.read_cached(CONFIG_FILE, _parse_config)
+    return scanner if scanner is not None else Scanner(True, list(DEFAULT_PATTERNS))
+
+
+def edited_text(tool_input: dict) -> str:
+    """The text an Edit/Write/MultiEdit put into the file."""
+    if "content" in tool_input:
+        return str(tool_input["content"])
+    if "edits" in tool_input:
+        return "\n".join(str(e.get("new_string", "")) for e in tool_input["edits"])
+    return str(tool_input.get("new_string", ""))
+
+
+# ---------------------------------------------------------------------------
+# Verdict cache: "<fingerprint>" on the first line, then "<hash> <pattern index>"
+# ---------------------------------------------------------------------------
+
+
+def _cache_path() -> Path | None:
+    gdir = hook_state.git_dir()
+    return gdir / CACHE_FILE if gdir is not None else None
+
+
+def _parse_cache(text: str) -> tuple[str, dict[str, int]]:
+    lines = text.split("\n")
+    verdicts = {}
+    for line in lines[1:]:
+        digest, _, found = line.partition(" ")
+        if digest and found.lstrip("-").isdigit():
+            verdicts[digest] = int(found)
+    return lines[0], verdicts
+
+
+def cached_verdict(digest: str, fingerprint: str) -> int | None:
+    path = _cache_path()
+    cache = hook_state.read_cached(path, _parse_cache) if path is not None else None
+    if cache is None or cache[0] != fingerprint:
+        return None
+    return cache[1].get(digest)
+
+
+def store_verdict(digest: str, fingerprint: str, found: int) -> None:
+    path = _cache_path()
+    if path is None:
+        return
+    cache = hook_state.read_cached(path, _parse_cache)
+    current = cache is not None and cache[0] == fingerprint
+    try:
+        if current and len(cache[1]) < CACHE_LIMIT:
+            with path.open("a", encoding="utf-8") as fh:
+                fh.write(f"{digest} {found}\n")
+            return
+        # New patterns void every verdict; a full cache keeps its newer half.
+        kept = list(cache[1].items())[-(CACHE_LIMIT // 2):] if current else []
+        lines = [fingerprint, *(f"{d} {f}" for d, f in kept), f"{digest} {found}"]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    except OSError:
+        pass
+
+
+def main() -> None:
+    try:
+        input_data = json.load(sys.stdin)
+    except ValueError:
+        sys.exit(0)
+    if not isinstance(input_data, dict):
+        sys.exit(0)
+    tool_input = input_data.get("tool_input") or {}
+    text = edited_text(tool_input)
+    if not text.strip():
+        sys.exit(0)
+
+    scanner = load_scanner()
+    if not scanner.enabled:
+        sys.exit(0)
+    digest = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()[:32]
+    found = cached_verdict(digest, scanner.fingerprint)
+    if found is None:
+        found = scanner.scan(text)
+        store_verdict(digest, scanner.fingerprint, found)
+    if found >= 0:
+        name = Path(str(tool_input.get("file_path", ""))).name or "the edited file"
+        print(
+            f"WARNING: Potential secret in {name} (matches {scanner.patterns[found].pattern}). "
+            f"Move it to an environment variable or secret store before committing."
+        )
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
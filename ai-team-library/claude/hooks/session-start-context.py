@@ -12,48 +12,36 @@ Always exits 0 — context injection must never block a session.
 from __future__ import annotations
 
 import re
-import subprocess
 import sys
 from collections import Counter
-from pathlib import Path
+
+import hook_state
 
 PROTECTED = ("main", "master", "test", "prod")
 
 
-def _branch() -> str:
-    try:
-        return subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True, text=True, timeout=5,
-        ).stdout.strip()
-    except Exception:
-        return ""
+def _count_statuses(text: str) -> Counter[str]:
+    counts: Counter[str] = Counter()
+    for line in text.splitlines():
+        # Backlog rows: | BEAN-NNN | ... | <Status> | ...
+        if not re.match(r"\|\s*\[?BEAN-\d+", line):
+            continue
+        for status in (
+            "Unapproved", "Approved", "In Progress", "Blocked", "Done",
+        ):
+            if f"| {status} " in line or f"| {status}|" in line:
+                counts[status] += 1
+                break
+    return counts
 
 
 def _backlog_counts() -> Counter[str] | None:
-    index = Path("ai/beans/_index.md")
-    if not index.is_file():
-        return None
-    counts: Counter[str] = Counter()
-    try:
-        for line in index.read_text(encoding="utf-8").splitlines():
-            # Backlog rows: | BEAN-NNN | ... | <Status> | ...
-            if not re.match(r"\|\s*\[?BEAN-\d+", line):
-                continue
-            for status in (
-                "Unapproved", "Approved", "In Progress", "Blocked", "Done",
-            ):
-                if f"| {status} " in line or f"| {status}|" in line:
-                    counts[status] += 1
-                    break
-    except OSError:
-        return None
-    return counts
+    return hook_state.read_cached("ai/beans/_index.md", _count_statuses)
 
 
 def main() -> None:
     lines: list[str] = []
-    branch = _branch()
+    branch = hook_state.current_branch()
     if branch:
         lines.append(f"Current git branch: {branch}")
         if branch in PROTECTED:
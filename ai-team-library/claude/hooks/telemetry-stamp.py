@@ -14,17 +14,32 @@ When a bean is marked Done, duration is computed from git timestamps
 Falls back to Started/Completed metadata if git is unavailable.
 
 Reads hook input JSON from stdin, writes JSON message to stdout when
-a file is modified.
+a file is modified. Most edits touch neither, so when run as a script
+the raw input is checked for a bean path before anything else is
+imported.
 """
 
 from __future__ import annotations
 
-import json
-import re
-import subprocess
 import sys
-from datetime import datetime, timezone
-from pathlib import Path
+
+# Fast path: every bean and task path contains "BEAN-". Reject the rest
+# from the raw payload before paying for json, re, datetime, pathlib,
+# and hook_state (most of this hook's cost on a plain edit).
+if __name__ == "__main__":
+    _RAW_INPUT: str | None = sys.stdin.read()
+    if "BEAN-" not in _RAW_INPUT:
+        sys.exit(0)
+else:
+    _RAW_INPUT = None
+
+import json  # noqa: E402
+import re  # noqa: E402
+from datetime import datetime, timezone  # noqa: E402
+from functools import lru_cache  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+import hook_state  # noqa: E402
 
 SENTINEL = "—"
 TIMESTAMP_FMT = "%Y-%m-%d %H:%M"
@@ -32,6 +47,17 @@ TIMESTAMP_FMT = "%Y-%m-%d %H:%M"
 # Patterns to match bean and task files (relative paths from repo root)
 BEAN_RE = re.compile(r"ai/beans/BEAN-\d+-[^/]+/bean\.md$")
 TASK_RE = re.compile(r"ai/beans/BEAN-\d+-[^/]+/tasks/.*\.md$")
+TABLE_SEPARATOR_RE = re.compile(r"^\|[\s\-|]+\|$")
+
+
+@lru_cache(maxsize=None)
+def _field_patterns(field: str) -> tuple[re.Pattern[str], re.Pattern[str]]:
+    """Compile the (parse, replace) patterns for a metadata *field* once."""
+    name = re.escape(field)
+    return (
+        re.compile(r"^\|\s*\*\*" + name + r"\*\*\s*\|\s*(.*?)\s*\|", re.MULTILINE),
+        re.compile(r"(^\|\s*\*\*" + name + r"\*\*\s*\|\s*)(.*?)(\s*\|)", re.MULTILINE),
+    )
 
 
 def now_stamp() -> str:
@@ -45,11 +71,7 @@ def parse_metadata_field(content: str, field: str) -> str | None:
     Looks for rows like: | **Field** | Value |
     Returns the stripped value, or None if not found.
     """
-    pattern = re.compile(
-        r"^\|\s*\*\*" + re.escape(field) + r"\*\*\s*\|\s*(.*?)\s*\|",
-        re.MULTILINE,
-    )
-    m = pattern.search(content)
+    m = _field_patterns(field)[0].search(content)
     if m:
         return m.group(1).strip()
     return None
@@ -61,11 +83,7 @@ def replace_metadata_field(content: str, field: str, value: str) -> str:
     Replaces: | **Field** | old_value |
     With:     | **Field** | new_value |
     """
-    pattern = re.compile(
-        r"(^\|\s*\*\*" + re.escape(field) + r"\*\*\s*\|\s*)(.*?)(\s*\|)",
-        re.MULTILINE,
-    )
-    return pattern.sub(rf"\g<1>{value}\3", content, count=1)
+    return _field_patterns(field)[1].sub(rf"\g<1>{value}\3", content, count=1)
 
 
 def format_seconds(seconds: float) -> str:
@@ -103,40 +121,15 @@ def git_branch_duration() -> str | None:
     """Compute duration from the first commit on the current feature branch.
 
     Uses git to find the first commit on the current branch that isn't on
-    'test' or 'main', and computes elapsed time from that commit to now.
-    Returns a formatted duration string, or None if git data is unavailable.
+    'main', and computes elapsed time from that commit to now. The commit
+    is looked up through hook_state with one ``git log``, and cached per
+    branch until the branch or ``main`` moves. Returns a formatted duration string, or None if git
+    data is unavailable.
     """
     try:
-        # Get current branch name
-        branch = subprocess.run(
-            ["git", "branch", "--show-current"],
-            capture_output=True, text=True, timeout=5,
-        ).stdout.strip()
-
-        if not branch or branch == "main":
+        first_commit_ts = hook_state.branch_start("main")
+        if not first_commit_ts:
             return None
-
-        # Find the merge base with main
-        for base in ("main",):
-            result = subprocess.run(
-                ["git", "merge-base", base, "HEAD"],
-                capture_output=True, text=True, timeout=5,
-            )
-            if result.returncode == 0:
-                merge_base = result.stdout.strip()
-                break
-        else:
-            return None
-
-        # Get timestamp of first commit after merge base
-        result = subprocess.run(
-            ["git", "log", "--format=%aI", "--reverse", f"{merge_base}..HEAD"],
-            capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode != 0 or not result.stdout.strip():
-            return None
-
-        first_commit_ts = result.stdout.strip().split("\n")[0]
         dt_start = datetime.fromisoformat(first_commit_ts)
         dt_now = datetime.now(timezone.utc)
         # Ensure both are offset-aware for comparison
@@ -172,7 +165,7 @@ def count_done_tasks(content: str) -> int:
                 break
             continue
         # Skip separator rows
-        if re.match(r"^\|[\s\-|]+\|$", stripped):
+        if TABLE_SEPARATOR_RE.match(stripped):
             header_seen = True
             continue
         # Skip header row (contains "Task" or "#")
@@ -207,7 +200,7 @@ def count_total_tasks(content: str) -> int:
             if separator_seen and stripped and not stripped.startswith(">"):
                 break
             continue
-        if re.match(r"^\|[\s\-|]+\|$", stripped):
+        if TABLE_SEPARATOR_RE.match(stripped):
             separator_seen = True
             continue
         if not separator_seen:
@@ -333,10 +326,14 @@ def handle_task_file(path: Path, now: str) -> list[str]:
     return actions
 
 
-def main() -> None:
-    """Entry point: read hook JSON from stdin, process file, output result."""
+def main(raw: str | None = None) -> None:
+    """Entry point: read hook JSON from stdin, process file, output result.
+
+    *raw* is the hook input when the caller has already read stdin.
+    """
     try:
-        raw = sys.stdin.read()
+        if raw is None:
+            raw = sys.stdin.read()
         data = json.loads(raw)
 
         tool_input = data.get("tool_input", {})
@@ -373,4 +370,4 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
+    main(_RAW_INPUT)
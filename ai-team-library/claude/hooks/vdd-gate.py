@@ -29,6 +29,8 @@ import re
 import sys
 from pathlib import Path
 
+import hook_state
+
 STATUS_DONE_RE = re.compile(r"\*\*Status\*\*\s*\|\s*Done\b", re.IGNORECASE)
 SKIP_RE = re.compile(
     r"<!--\s*vdd-gate:\s*skip\s*\(justified:\s*(.{10,}?)\s*\)\s*-->",
@@ -57,12 +59,10 @@ def _old_text(tool_name: str, tool_input: dict, path: Path) -> str:
 
 def _find_vdd_report(project_root: Path, bean_num: str) -> Path | None:
     qa_dir = project_root / "ai" / "outputs" / "tech-qa"
-    if not qa_dir.is_dir():
-        return None
-    for report in sorted(qa_dir.glob("*.md")):
-        name = report.name.lower()
-        if "vdd" in name and bean_num in name:
-            return report
+    for entry in hook_state.dir_entries(qa_dir):
+        name = entry.lower()
+        if entry.endswith(".md") and "vdd" in name and bean_num in name:
+            return qa_dir / entry
     return None
 
 
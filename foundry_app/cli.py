@@ -5,8 +5,12 @@ from __future__ import annotations
 import argparse
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from foundry_app.core.models import Strictness
+# Keep module import cheap: pydantic models and services load inside the
+# command that needs them (see tests/test_cli_import_time.py).
+if TYPE_CHECKING:
+    from foundry_app.core.models import BatchItemResult
 
 # Exit codes
 EXIT_SUCCESS = 0
@@ -52,12 +56,26 @@ def _build_parser() -> argparse.ArgumentParser:
         default=False,
         help="Compute overlay plan without applying (requires --overlay)",
     )
+    gen.add_argument(
+        "--archive",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write the generated project to a zip archive at PATH instead of "
+        "the output directory",
+    )
     gen.add_argument(
         "--force",
         action="store_true",
         default=False,
         help="Proceed even when validation produces errors",
     )
+    gen.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        default=False,
+        help="Regenerate even when the inputs are unchanged since the last run",
+    )
     gen.add_argument(
         "--strictness",
         type=str,
@@ -71,6 +89,199 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Git URL for claude-kit subtree repo (sets up .claude/ via subtree instead of copy)",
     )
+    gen.add_argument(
+        "--link-mode",
+        type=str,
+        choices=["copy", "hardlink", "reflink", "symlink"],
+        default=None,
+        help="How library assets are placed in the project (default: the "
+        "composition's generation.link_mode, else copy)",
+    )
+    gen.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Skip the persistent library index and compile caches",
+    )
+    gen.add_argument(
+        "--index-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Parse library entries on N threads while indexing (default: serial)",
+    )
+    gen.add_argument(
+        "--stage-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Run independent pipeline stages on N threads (1 = serial; default: 4)",
+    )
+    gen.add_argument(
+        "--profile",
+        action="store_true",
+        default=False,
+        help="Print per-stage wall time, CPU time, I/O, and memory growth",
+    )
+    gen.add_argument(
+        "--profile-out",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Also write cProfile stats for the run to PATH (implies --profile; "
+        "runs stages serially)",
+    )
+
+    batch = sub.add_parser(
+        "generate-batch",
+        help="Generate several compositions against one shared library index",
+    )
+    batch.add_argument(
+        "compositions",
+        nargs="+",
+        help="Composition YAML files, directories of them, or glob patterns",
+    )
+    batch.add_argument(
+        "--library",
+        type=str,
+        default="ai-team-library",
+        help="Path to the library directory (default: ai-team-library)",
+    )
+    batch.add_argument(
+        "--output-root",
+        type=str,
+        default=None,
+        help="Parent directory for the generated projects "
+        "(default: each composition's project.output_root)",
+    )
+    batch.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Generate on N worker processes (default: CPU count; 1 = in-process)",
+    )
+    batch.add_argument(
+        "--summary",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Write the combined batch summary as JSON to PATH",
+    )
+    batch.add_argument(
+        "--overlay",
+        action="store_true",
+        default=False,
+        help="Use overlay mode for re-generation",
+    )
+    batch.add_argument(
+        "--force",
+        action="store_true",
+        default=False,
+        help="Proceed even when validation produces errors",
+    )
+    batch.add_argument(
+        "--force-rebuild",
+        action="store_true",
+        default=False,
+        help="Regenerate even when the inputs are unchanged since the last run",
+    )
+    batch.add_argument(
+        "--strictness",
+        type=str,
+        choices=["light", "standard", "strict"],
+        default="standard",
+        help="Validation strictness level (default: standard)",
+    )
+    batch.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Skip the persistent library index and compile caches",
+    )
+
+    affected = sub.add_parser(
+        "affected",
+        help="List generated projects built from changed library files",
+    )
+    affected.add_argument(
+        "changed",
+        nargs="+",
+        help="Changed library files or directories (relative to the working "
+        "directory or the library root)",
+    )
+    affected.add_argument(
+        "--projects-root",
+        type=str,
+        default="generated-projects",
+        help="Directory whose subdirectories are generated projects "
+        "(default: generated-projects)",
+    )
+    affected.add_argument(
+        "--library",
+        type=str,
+        default="ai-team-library",
+        help="Path to the library directory (default: ai-team-library)",
+    )
+    affected.add_argument(
+        "--regenerate",
+        action="store_true",
+        default=False,
+        help="Regenerate the affected projects in overlay mode",
+    )
+    affected.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Regenerate on N worker processes (default: CPU count)",
+    )
+    affected.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Skip the persistent library index and compile caches",
+    )
+
+    serve = sub.add_parser(
+        "serve",
+        help="Serve generate/validate requests as JSON, keeping the library warm",
+    )
+    serve.add_argument(
+        "--library",
+        type=str,
+        default="ai-team-library",
+        help="Path to the library directory (default: ai-team-library)",
+    )
+    listen = serve.add_mutually_exclusive_group()
+    listen.add_argument(
+        "--port",
+        type=int,
+        default=None,
+        help="Listen on 127.0.0.1:PORT (default: 8765)",
+    )
+    listen.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        metavar="PATH",
+        help="Listen on a Unix socket at PATH instead of TCP",
+    )
+    serve.add_argument(
+        "--stage-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Threads for independent pipeline stages in each generation",
+    )
+    serve.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Skip the persistent library index and compile caches",
+    )
 
     vdd = sub.add_parser(
         "vdd",
@@ -113,14 +324,19 @@ def _run_generate(args: argparse.Namespace) -> int:
     from pydantic import ValidationError
 
     from foundry_app.core.logging_config import setup_logging
+    from foundry_app.core.models import LinkMode, Strictness
     from foundry_app.io.composition_io import load_composition
-    from foundry_app.services.generator import generate_project
+    from foundry_app.services.generator import DEFAULT_STAGE_WORKERS, generate_project
+    from foundry_app.services.library_cache import default_cache_dir
 
     setup_logging()
 
     if args.dry_run and not args.overlay:
         print("Error: --dry-run requires --overlay", file=sys.stderr)
         return EXIT_VALIDATION_ERROR
+    if args.archive and args.overlay:
+        print("Error: --archive cannot be combined with --overlay", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
 
     comp_path = Path(args.composition)
     if not comp_path.is_file():
@@ -147,15 +363,34 @@ def _run_generate(args: argparse.Namespace) -> int:
     # Apply CLI overrides to the composition
     if args.claude_kit_url:
         composition.generation.claude_kit_url = args.claude_kit_url
+    if args.link_mode:
+        composition.generation.link_mode = LinkMode(args.link_mode)
 
     print(f"Generating project: {composition.project.name}")
     print(f"  Library: {library_path}")
     print(f"  Strictness: {strictness.value}")
     if args.overlay:
         print(f"  Mode: overlay{' (dry-run)' if args.dry_run else ''}")
+    if args.archive:
+        print(f"  Archive: {args.archive}")
+    if composition.generation.link_mode is not LinkMode.COPY:
+        print(f"  Link mode: {composition.generation.link_mode.value}")
     if args.force:
         print("  Force: yes")
 
+    stage_workers = (
+        args.stage_workers if args.stage_workers is not None
+        else DEFAULT_STAGE_WORKERS
+    )
+    profiler = None
+    if args.profile_out:
+        import cProfile
+
+        # cProfile only sees the thread that enabled it.
+        stage_workers = 1
+        profiler = cProfile.Profile()
+        profiler.enable()
+
     # Generate
     try:
         manifest, validation, overlay_plan = generate_project(
@@ -166,10 +401,19 @@ def _run_generate(args: argparse.Namespace) -> int:
             overlay=args.overlay,
             dry_run=args.dry_run,
             force=args.force,
+            cache_dir=None if args.no_cache else default_cache_dir(),
+            index_workers=args.index_workers,
+            stage_workers=stage_workers,
+            force_rebuild=args.force_rebuild,
+            archive=args.archive,
         )
     except Exception as exc:
         print(f"Generation error: {exc}", file=sys.stderr)
         return EXIT_GENERATION_ERROR
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            profiler.dump_stats(args.profile_out)
 
     # Report validation results
     if validation.errors:
@@ -186,15 +430,27 @@ def _run_generate(args: argparse.Namespace) -> int:
         for msg in validation.warnings:
             print(f"  [{msg.code}] {msg.message}")
 
+    if manifest.up_to_date:
+        print("\nUp to date: inputs unchanged since the last run, nothing written.")
+        print("Use --force-rebuild to regenerate anyway.")
+        return EXIT_SUCCESS
+
     # Report results
     print(f"\nGeneration complete: run_id={manifest.run_id}")
     print(f"  Files written: {manifest.total_files_written}")
+    if manifest.link_mode is not composition.generation.link_mode:
+        print(f"  Assets: {manifest.link_mode.value} (link mode unavailable)")
 
     if manifest.all_warnings:
         print(f"  Warnings: {len(manifest.all_warnings)}")
         for w in manifest.all_warnings:
             print(f"    - {w}")
 
+    if args.profile or args.profile_out:
+        _print_stage_profile(manifest)
+        if args.profile_out:
+            print(f"  cProfile stats: {args.profile_out}")
+
     if overlay_plan is not None:
         print("\nOverlay plan:")
         print(f"  Creates: {len(overlay_plan.creates)}")
@@ -207,6 +463,205 @@ def _run_generate(args: argparse.Namespace) -> int:
     return EXIT_SUCCESS
 
 
+def _print_stage_profile(manifest) -> None:
+    """Print one row of StageMetrics per stage; "-" where not measured."""
+
+    def _kb(value: int | None) -> str:
+        return "-" if value is None else f"{value / 1024:.1f}"
+
+    print("\nStage profile:")
+    print(
+        f"  {'stage':<20} {'wall ms':>9} {'cpu ms':>9} {'read KB':>10} "
+        f"{'write KB':>10} {'files':>6} {'+rss KB':>8}"
+    )
+    for key, stage in manifest.stages.items():
+        m = stage.metrics
+        if m is None:
+            continue
+        rss = "-" if m.peak_rss_delta_kb is None else str(m.peak_rss_delta_kb)
+        print(
+            f"  {key:<20} {m.wall_seconds * 1000:>9.1f} {m.cpu_seconds * 1000:>9.1f} "
+            f"{_kb(m.bytes_read):>10} {_kb(m.bytes_written):>10} {m.files:>6} {rss:>8}"
+        )
+
+
+def _run_generate_batch(args: argparse.Namespace) -> int:
+    """Execute the generate-batch command."""
+    from foundry_app.core.logging_config import setup_logging
+    from foundry_app.core.models import Strictness
+    from foundry_app.services.batch import discover_compositions, generate_batch
+    from foundry_app.services.library_cache import default_cache_dir
+
+    setup_logging()
+
+    if args.jobs is not None and args.jobs < 1:
+        print("Error: --jobs must be at least 1", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+
+    library_path = Path(args.library)
+    if not library_path.is_dir():
+        print(f"Error: library directory not found: {library_path}", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+
+    try:
+        paths = discover_compositions(args.compositions)
+    except FileNotFoundError as exc:
+        print(f"Error: {exc}", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+
+    strictness = Strictness(args.strictness)
+    print(f"Generating {len(paths)} projects")
+    print(f"  Library: {library_path}")
+    print(f"  Strictness: {strictness.value}")
+
+    def report(item: BatchItemResult) -> None:
+        label = item.project_name or item.composition
+        status = "up to date" if item.up_to_date else item.status
+        print(f"  [{status}] {label} ({item.elapsed_seconds:.1f}s)")
+
+    try:
+        summary = generate_batch(
+            paths,
+            library_path,
+            output_root=args.output_root,
+            strictness=strictness,
+            overlay=args.overlay,
+            force=args.force,
+            jobs=args.jobs,
+            cache_dir=None if args.no_cache else default_cache_dir(),
+            item_callback=report,
+            force_rebuild=args.force_rebuild,
+        )
+    except Exception as exc:
+        print(f"Generation error: {exc}", file=sys.stderr)
+        return EXIT_GENERATION_ERROR
+
+    print(
+        f"\nBatch complete: {len(summary.succeeded)} succeeded, "
+        f"{len(summary.failed)} failed (jobs={summary.jobs})"
+    )
+    for item in summary.failed:
+        print(f"  {item.composition}: {item.status}")
+        for err in item.errors:
+            print(f"    - {err}")
+
+    if args.summary:
+        summary_path = Path(args.summary)
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        summary_path.write_text(summary.model_dump_json(indent=2), encoding="utf-8")
+        print(f"  Summary: {summary_path}")
+
+    if any(item.status == "error" for item in summary.items):
+        return EXIT_GENERATION_ERROR
+    if summary.failed:
+        return EXIT_VALIDATION_ERROR
+    return EXIT_SUCCESS
+
+
+def _run_affected(args: argparse.Namespace) -> int:
+    """Execute the affected command."""
+    from foundry_app.core.logging_config import setup_logging
+    from foundry_app.services.affected import find_affected, regenerate_affected
+    from foundry_app.services.library_cache import default_cache_dir
+
+    setup_logging()
+
+    projects_root = Path(args.projects_root)
+    if not projects_root.is_dir():
+        print(f"Error: projects root not found: {projects_root}", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+    library_path = Path(args.library)
+    if args.regenerate and not library_path.is_dir():
+        print(f"Error: library directory not found: {library_path}", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+
+    projects = find_affected(args.changed, projects_root, library_path)
+    if not projects:
+        print("No generated projects depend on the changed paths.")
+        return EXIT_SUCCESS
+
+    print(f"Affected projects ({len(projects)}):")
+    for project in projects:
+        print(f"  {project.project_dir}")
+        if project.provenance_missing:
+            print("    (no provenance recorded — regenerate to record it)")
+        for rel in project.files:
+            print(f"    - {rel}")
+
+    if not args.regenerate:
+        return EXIT_SUCCESS
+
+    def report(item: BatchItemResult) -> None:
+        label = item.project_name or item.composition
+        print(f"  [{item.status}] {label} ({item.elapsed_seconds:.1f}s)")
+
+    print(f"\nRegenerating {len(projects)} projects")
+    try:
+        summary = regenerate_affected(
+            projects,
+            library_path,
+            jobs=args.jobs,
+            cache_dir=None if args.no_cache else default_cache_dir(),
+            item_callback=report,
+        )
+    except Exception as exc:
+        print(f"Generation error: {exc}", file=sys.stderr)
+        return EXIT_GENERATION_ERROR
+
+    if any(item.status == "error" for item in summary.items):
+        return EXIT_GENERATION_ERROR
+    if summary.failed:
+        return EXIT_VALIDATION_ERROR
+    return EXIT_SUCCESS
+
+
+def _run_serve(args: argparse.Namespace) -> int:
+    """Execute the serve command; runs until interrupted."""
+    from foundry_app.core.logging_config import setup_logging
+    from foundry_app.services.generator import DEFAULT_STAGE_WORKERS
+    from foundry_app.services.library_cache import default_cache_dir
+    from foundry_app.services.server import (
+        DEFAULT_PORT,
+        GenerationService,
+        make_server,
+        remove_socket,
+    )
+
+    setup_logging()
+
+    library_path = Path(args.library)
+    if not library_path.is_dir():
+        print(f"Error: library directory not found: {library_path}", file=sys.stderr)
+        return EXIT_VALIDATION_ERROR
+
+    service = GenerationService(
+        library_path,
+        cache_dir=None if args.no_cache else default_cache_dir(),
+        stage_workers=(
+            args.stage_workers if args.stage_workers is not None
+            else DEFAULT_STAGE_WORKERS
+        ),
+    )
+    health = service.health()
+    port = args.port if args.port is not None else DEFAULT_PORT
+    try:
+        server = make_server(service, port=port, socket_path=args.socket)
+    except OSError as exc:
+        print(f"Error: cannot listen: {exc}", file=sys.stderr)
+        return EXIT_GENERATION_ERROR
+
+    address = args.socket or "http://{}:{}".format(*server.server_address[:2])
+    print(f"Serving library {library_path} ({health['library_version']}) on {address}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        remove_socket(server)
+    return EXIT_SUCCESS
+
+
 def main(argv: list[str] | None = None) -> int:
     """Entry point for the foundry-cli command."""
     parser = _build_parser()
@@ -219,6 +674,15 @@ def main(argv: list[str] | None = None) -> int:
     if args.command == "generate":
         return _run_generate(args)
 
+    if args.command == "generate-batch":
+        return _run_generate_batch(args)
+
+    if args.command == "affected":
+        return _run_affected(args)
+
+    if args.command == "serve":
+        return _run_serve(args)
+
     if args.command == "vdd":
         from foundry_app.services.vdd import main as vdd_main
 
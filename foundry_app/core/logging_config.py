@@ -1,23 +1,36 @@
-"""Structured logging configuration with rotating file handler."""
+"""Structured logging configuration with rotating file handler.
+
+Qt-free so the headless CLI never imports PySide6; ``_app_data_dir``
+mirrors what ``QStandardPaths.writableLocation(AppDataLocation)`` returned
+before an application name is set.
+"""
 
 from __future__ import annotations
 
 import logging
+import os
 import sys
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-from PySide6.QtCore import QStandardPaths
-
 LOG_FORMAT = "%(asctime)s [%(levelname)-8s] %(name)s: %(message)s"
 LOG_DATE_FMT = "%Y-%m-%d %H:%M:%S"
 LOG_MAX_BYTES = 5 * 1024 * 1024  # 5 MB
 LOG_BACKUP_COUNT = 3
 
 
+def _app_data_dir() -> str:
+    """Return the per-user application data directory for this platform."""
+    if sys.platform == "win32":
+        return os.environ.get("APPDATA", "")
+    if sys.platform == "darwin":
+        return str(Path.home() / "Library" / "Application Support")
+    return os.environ.get("XDG_DATA_HOME") or str(Path.home() / ".local" / "share")
+
+
 def _log_dir() -> Path:
     """Return the platform-appropriate log directory, creating it if needed."""
-    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation)
+    base = _app_data_dir()
     if not base:
         base = str(Path.home() / ".foundry")
     log_dir = Path(base) / "logs"
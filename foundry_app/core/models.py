@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import PurePosixPath
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, field_validator, model_serializer
+from pydantic import BaseModel, Field, PrivateAttr, field_validator, model_serializer
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -36,6 +37,15 @@ class SeedMode(str, Enum):
     KICKOFF = "kickoff"
 
 
+class LinkMode(str, Enum):
+    """How library assets are materialized in a generated project."""
+
+    COPY = "copy"
+    HARDLINK = "hardlink"
+    REFLINK = "reflink"
+    SYMLINK = "symlink"
+
+
 class FileActionType(str, Enum):
     CREATE = "create"
     UPDATE = "update"
@@ -288,6 +298,32 @@ class HooksConfig(BaseModel):
             "base packs (e.g. branch protection) is surfaced as a warning."
         ),
     )
+    dispatch: bool = Field(
+        default=True,
+        description=(
+            "When true, hook scripts sharing an event and matcher run in one "
+            "process through the foundry-hooks dispatcher instead of one "
+            "process each."
+        ),
+    )
+    daemon: bool = Field(
+        default=False,
+        description=(
+            "When true (and dispatch is on), the foundry-hooks dispatcher "
+            "hands hook runs to a per-project background process that keeps "
+            "repository state warm across tool calls, starting it on demand."
+        ),
+    )
+
+    @model_serializer(mode="wrap")
+    def _omit_default_dispatch(self, handler):
+        """Drop ``dispatch`` and ``daemon`` from dumps when default (see GenerationOptions)."""
+        data = handler(self)
+        if data.get("dispatch") is True:
+            data.pop("dispatch")
+        if data.get("daemon") is False:
+            data.pop("daemon")
+        return data
 
 
 # ---------------------------------------------------------------------------
@@ -495,19 +531,33 @@ class GenerationOptions(BaseModel):
         ),
     )
 
+    link_mode: LinkMode = Field(
+        default=LinkMode.COPY,
+        description=(
+            "How copied library assets (commands, skills, hooks, settings, "
+            "process files, persona templates) land in the project: 'copy', "
+            "'hardlink' or 'symlink' into the content-addressed asset store "
+            "under the cache directory, or 'reflink' (copy-on-write clone). "
+            "Falls back to copying where the filesystem or cache does not "
+            "allow it; the mode used is recorded in the manifest."
+        ),
+    )
+
     @model_serializer(mode="wrap")
     def _omit_default_profile(self, handler):
-        """Drop ``harness_profile`` from dumps when it is the default.
+        """Drop ``harness_profile`` and ``link_mode`` from dumps when default.
 
         Keeps the serialized shape of 'standard' compositions (the
         generated ``composition.yml`` snapshot and the manifest's
         ``composition_snapshot``) byte-identical to output produced before
-        this field existed. Round-trip is lossless: a missing key loads
+        these fields existed. Round-trip is lossless: a missing key loads
         back as the default.
         """
         data = handler(self)
         if data.get("harness_profile") == "standard":
             data.pop("harness_profile")
+        if data.get("link_mode") in (LinkMode.COPY, LinkMode.COPY.value):
+            data.pop("link_mode")
         return data
 
 
@@ -608,11 +658,59 @@ class ValidationResult(BaseModel):
 # Pipeline results
 # ---------------------------------------------------------------------------
 
+class CacheStats(BaseModel):
+    """Hit/miss counts for a stage that consults a persistent cache."""
+
+    hits: int = Field(default=0, ge=0)
+    misses: int = Field(default=0, ge=0)
+
+
+class StageMetrics(BaseModel):
+    """Resource usage of one pipeline stage (see ``stage_metrics``).
+
+    I/O counters are ``None`` on platforms without per-thread I/O
+    accounting, and ``peak_rss_delta_kb`` is ``None`` where ``resource``
+    is unavailable.
+    """
+
+    wall_seconds: float = Field(default=0.0, ge=0)
+    cpu_seconds: float = Field(default=0.0, ge=0)
+    bytes_read: int | None = Field(default=None, ge=0)
+    bytes_written: int | None = Field(default=None, ge=0)
+    files: int = Field(default=0, ge=0, description="Entries the stage reported writing")
+    peak_rss_delta_kb: int | None = Field(
+        default=None, ge=0, description="Growth of the process's peak RSS during the stage",
+    )
+
+
 class StageResult(BaseModel):
     """Result of a single pipeline stage."""
 
     wrote: list[str] = Field(default_factory=list, description="Files written by this stage")
     warnings: list[str] = Field(default_factory=list, description="Non-fatal warnings")
+    cache: CacheStats | None = Field(
+        default=None, description="Cache hit/miss counts, for stages that use a cache",
+    )
+    metrics: StageMetrics | None = Field(
+        default=None, description="Timing and I/O, recorded by the generator",
+    )
+    sources: dict[str, list[str]] | None = Field(
+        default=None,
+        description="Output file -> library files it was built from (see provenance)",
+    )
+
+    @model_serializer(mode="wrap")
+    def _omit_unset_cache(self, handler):
+        """Drop ``cache``, ``metrics`` and ``sources`` from dumps when unset.
+
+        Keeps manifests of cache-less stages and runs byte-identical to
+        those written before the fields existed.
+        """
+        data = handler(self)
+        for key in ("cache", "metrics", "sources"):
+            if data.get(key) is None:
+                data.pop(key, None)
+        return data
 
 
 class GenerationManifest(BaseModel):
@@ -629,6 +727,19 @@ class GenerationManifest(BaseModel):
         default_factory=dict,
         description="Per-stage results keyed by stage name",
     )
+    input_fingerprint: str = Field(
+        default="",
+        description="Hash of the composition, library, Foundry version and kit "
+        "this run was generated from",
+    )
+    up_to_date: bool = Field(
+        default=False,
+        description="True when generation was skipped because nothing changed",
+    )
+    link_mode: LinkMode = Field(
+        default=LinkMode.COPY,
+        description="How library assets were materialized; 'copy' after a fallback",
+    )
 
     @property
     def total_files_written(self) -> int:
@@ -641,6 +752,106 @@ class GenerationManifest(BaseModel):
             warnings.extend(stage.warnings)
         return warnings
 
+    @property
+    def provenance(self) -> dict[str, list[str]]:
+        """Every stage's ``sources`` merged: output file -> library sources."""
+        merged: dict[str, set[str]] = {}
+        for stage in self.stages.values():
+            for output, sources in (stage.sources or {}).items():
+                merged.setdefault(output, set()).update(sources)
+        return {output: sorted(merged[output]) for output in sorted(merged)}
+
+
+# ---------------------------------------------------------------------------
+# Batch generation
+# ---------------------------------------------------------------------------
+
+class BatchItemResult(BaseModel):
+    """Outcome of generating one composition in a batch run."""
+
+    composition: str = Field(..., description="Path to the composition YAML file")
+    project_name: str = Field(default="", description="Project name from the composition")
+    output_dir: str = Field(default="", description="Directory the project was generated into")
+    status: Literal["ok", "invalid", "error"] = Field(
+        ...,
+        description="ok = generated; invalid = composition or validation failed; "
+        "error = generation raised",
+    )
+    run_id: str = Field(default="", description="Run id of the generation manifest")
+    up_to_date: bool = Field(
+        default=False, description="Skipped: inputs unchanged since the last run",
+    )
+    files_written: int = Field(default=0, ge=0)
+    warnings: list[str] = Field(default_factory=list, description="Stage warnings")
+    errors: list[str] = Field(
+        default_factory=list, description="Validation errors or the failure message",
+    )
+    manifest_path: str = Field(
+        default="", description="manifest.json written for the project, if any",
+    )
+    elapsed_seconds: float = Field(default=0.0, ge=0.0)
+
+
+class BatchSummary(BaseModel):
+    """Combined record of a ``generate-batch`` run."""
+
+    library_root: str = Field(..., description="Library every composition was generated from")
+    library_version: str = Field(default="", description="Git short-hash of library")
+    generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    jobs: int = Field(default=1, ge=1, description="Worker processes used")
+    items: list[BatchItemResult] = Field(default_factory=list)
+
+    @property
+    def succeeded(self) -> list[BatchItemResult]:
+        return [i for i in self.items if i.status == "ok"]
+
+    @property
+    def failed(self) -> list[BatchItemResult]:
+        return [i for i in self.items if i.status != "ok"]
+
+
+class GenerationRequest(BaseModel):
+    """A generate or validate request sent to ``foundry-cli serve``.
+
+    Exactly one of ``composition`` (inline) or ``composition_path`` (a YAML
+    file readable by the server) must be given.
+    """
+
+    composition: CompositionSpec | None = Field(
+        default=None, description="Inline composition spec",
+    )
+    composition_path: str | None = Field(
+        default=None, description="Path to a composition YAML file",
+    )
+    output_root: str | None = Field(
+        default=None,
+        description="Directory to generate into; defaults to the composition's "
+        "output_root/output_folder",
+    )
+    strictness: Strictness = Strictness.STANDARD
+    overlay: bool = False
+    dry_run: bool = Field(default=False, description="Overlay only: plan without applying")
+    force: bool = Field(default=False, description="Generate despite validation errors")
+    force_rebuild: bool = Field(
+        default=False, description="Regenerate even when the inputs are unchanged",
+    )
+
+
+class AffectedProject(BaseModel):
+    """A generated project that depends on changed library sources."""
+
+    project_dir: str = Field(..., description="Directory of the generated project")
+    composition: str = Field(
+        default="", description="The project's ai/team/composition.yml snapshot",
+    )
+    files: list[str] = Field(
+        default_factory=list, description="Generated files built from the changed sources",
+    )
+    provenance_missing: bool = Field(
+        default=False,
+        description="The manifest predates provenance, so every file may be affected",
+    )
+
 
 # ---------------------------------------------------------------------------
 # Overlay mode
@@ -709,6 +920,17 @@ class PersonaInfo(BaseModel):
     has_prompts_md: bool = False
     templates: list[str] = Field(default_factory=list, description="Template filenames")
     category: str = Field(default="", description="Persona category for grouped display")
+    title: str | None = Field(
+        default=None,
+        description=(
+            "Name from persona.md's '# Persona: <Name>' header; '' when the "
+            "file has none, None when the index was not built by the indexer."
+        ),
+    )
+    aliases: list[str] = Field(
+        default_factory=list,
+        description="Other names persona files use for this persona (see persona_names).",
+    )
     produces: list[str] = Field(
         default_factory=list,
         description="Artifact-type names this persona produces. See ADR-013.",
@@ -743,6 +965,41 @@ def _persona_dirname(persona_id: str) -> str:
     )
 
 
+class PersonaAliases(dict[str, str]):
+    """Every name a persona is referred to by, mapped to its persona id.
+
+    Built from ``(name, persona id)`` pairs in library order, with lookups
+    in O(1). Precedence, highest first:
+
+    1. Full names — on a duplicate the later persona wins.
+    2. Each leading part of a slashed name (``Technical Writer`` and
+       ``A / B`` for ``A / B / C``) — the first persona wins.
+    3. *aliases* — the first persona wins.
+    """
+
+    def __init__(
+        self,
+        names: Iterable[tuple[str, str]] = (),
+        aliases: Iterable[tuple[str, str]] = (),
+    ) -> None:
+        super().__init__()
+        full = dict(names)
+        short: dict[str, str] = {}
+        for name, persona_id in full.items():
+            pos = name.find(" / ")
+            while pos > 0:
+                short.setdefault(name[:pos], persona_id)
+                pos = name.find(" / ", pos + 1)
+        for alias, persona_id in aliases:
+            self.setdefault(alias, persona_id)
+        self.update(short)
+        self.update(full)
+
+    def resolve(self, name: str) -> str | None:
+        """Return the persona id *name* refers to, or None."""
+        return self.get(name.strip())
+
+
 class ArtifactTypeInfo(BaseModel):
     """Metadata about an artifact type defined in the contracts registry.
 
@@ -811,14 +1068,69 @@ class LibraryIndex(BaseModel):
         ),
     )
 
+    # Lazily built id -> list-position maps, one per list field. Each entry
+    # remembers the list object and length it was built from so appends or
+    # wholesale list replacement (e.g. ``model_copy(update=...)``) rebuild it;
+    # a miss or a stale hit rebuilds it too, which covers in-place edits that
+    # keep the length (an entry replaced, or one removed and one appended).
+    _lookups: dict[str, tuple[list, int, dict[str, int]]] = PrivateAttr(
+        default_factory=dict,
+    )
+    _aliases: tuple[list, tuple[int, ...], PersonaAliases] | None = PrivateAttr(default=None)
+
+    def _positions(
+        self, field: str, key_attr: str, rebuild: bool = False,
+    ) -> tuple[list, dict[str, int]]:
+        items = getattr(self, field)
+        cached = self._lookups.get(field)
+        if rebuild or cached is None or cached[0] is not items or cached[1] != len(items):
+            positions: dict[str, int] = {}
+            for pos, item in enumerate(items):
+                positions.setdefault(getattr(item, key_attr), pos)
+            cached = (items, len(items), positions)
+            # Reassign rather than mutate: model_copy shares the private dict.
+            self._lookups = {**self._lookups, field: cached}
+        return items, cached[2]
+
+    def _lookup(self, field: str, key_attr: str, key: str) -> Any:
+        items, positions = self._positions(field, key_attr)
+        pos = positions.get(key)
+        if pos is not None and getattr(items[pos], key_attr) == key:
+            return items[pos]
+        # Missing or stale: the list may have changed in place at the same
+        # length. Rebuild once and look again — a miss costs what the linear
+        # scan did.
+        items, positions = self._positions(field, key_attr, rebuild=True)
+        pos = positions.get(key)
+        return None if pos is None else items[pos]
+
     def persona_by_id(self, persona_id: str) -> PersonaInfo | None:
-        return next((p for p in self.personas if p.id == persona_id), None)
+        return self._lookup("personas", "id", persona_id)
+
+    def persona_aliases(self) -> PersonaAliases:
+        """The persona name -> id map, built from titles and aliases once.
+
+        It is rebuilt when ``personas`` is replaced or any of its entries
+        is added, removed, replaced, or moved (checked by entry identity).
+        Callers must treat it as read-only.
+        """
+        personas = self.personas
+        entries = tuple(map(id, personas))
+        cached = self._aliases
+        if cached is None or cached[0] is not personas or cached[1] != entries:
+            aliases = PersonaAliases(
+                ((p.title, p.id) for p in personas if p.title),
+                ((alias, p.id) for p in personas for alias in p.aliases),
+            )
+            cached = (personas, entries, aliases)
+            self._aliases = cached
+        return cached[2]
 
     def expertise_by_id(self, expertise_id: str) -> ExpertiseInfo | None:
-        return next((s for s in self.expertise if s.id == expertise_id), None)
+        return self._lookup("expertise", "id", expertise_id)
 
     def hook_pack_by_id(self, pack_id: str) -> HookPackInfo | None:
-        return next((h for h in self.hook_packs if h.id == pack_id), None)
+        return self._lookup("hook_packs", "id", pack_id)
 
     def artifact_type_by_name(self, name: str) -> ArtifactTypeInfo | None:
-        return next((a for a in self.artifact_types if a.name == name), None)
+        return self._lookup("artifact_types", "name", name)
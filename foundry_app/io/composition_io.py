@@ -26,6 +26,12 @@ def load_composition(path: str | Path) -> CompositionSpec:
     return CompositionSpec.model_validate(data)
 
 
+def dump_composition(spec: CompositionSpec) -> str:
+    """Serialize a CompositionSpec to the YAML text ``save_composition`` writes."""
+    data = spec.model_dump(mode="json", exclude_none=True)
+    return yaml.dump(data, default_flow_style=False, sort_keys=False, allow_unicode=True)
+
+
 def save_composition(spec: CompositionSpec, path: str | Path) -> None:
     """Save a CompositionSpec to a YAML file.
 
@@ -33,9 +39,7 @@ def save_composition(spec: CompositionSpec, path: str | Path) -> None:
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = spec.model_dump(mode="json", exclude_none=True)
-    with path.open("w", encoding="utf-8") as fh:
-        yaml.dump(data, fh, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    path.write_text(dump_composition(spec), encoding="utf-8")
 
 
 def load_manifest(path: str | Path) -> GenerationManifest:
@@ -52,6 +56,12 @@ def load_manifest(path: str | Path) -> GenerationManifest:
     return GenerationManifest.model_validate(data)
 
 
+def dump_manifest(manifest: GenerationManifest) -> str:
+    """Serialize a GenerationManifest to the JSON text ``save_manifest`` writes."""
+    data = manifest.model_dump(mode="json")
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
 def save_manifest(manifest: GenerationManifest, path: str | Path) -> None:
     """Save a GenerationManifest to a JSON file.
 
@@ -59,7 +69,4 @@ def save_manifest(manifest: GenerationManifest, path: str | Path) -> None:
     """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = manifest.model_dump(mode="json")
-    with path.open("w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2, ensure_ascii=False)
-        fh.write("\n")
+    path.write_text(dump_manifest(manifest), encoding="utf-8")
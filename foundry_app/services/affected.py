@@ -0,0 +1,130 @@
+"""Affected projects — which generated projects a library change reaches.
+
+Each ``manifest.json`` records, per generated file, the library files it was
+built from (``GenerationManifest.provenance``). ``find_affected`` reads the
+manifests under a projects root and returns only the projects, and the
+files within them, whose sources match the changed paths; those projects
+can then be regenerated with ``regenerate_affected`` instead of the whole
+fleet.
+
+A changed directory matches every source below it. Projects whose manifest
+predates provenance are always reported, flagged ``provenance_missing``.
+A file newly added to the library is not a recorded source of anything
+yet; pass its directory to catch projects that copy that directory.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterable
+from pathlib import Path, PurePosixPath
+
+from foundry_app.core.models import AffectedProject, BatchSummary, Strictness
+from foundry_app.io.composition_io import load_composition, load_manifest
+from foundry_app.services.batch import BatchItemCallback, generate_batch
+from foundry_app.services.provenance import source_key
+
+logger = logging.getLogger(__name__)
+
+_COMPOSITION_RELPATH = Path("ai") / "team" / "composition.yml"
+
+
+def _changed_keys(changed: Iterable[str | Path], library_root: Path) -> list[str]:
+    """Normalize changed paths to provenance source keys.
+
+    Paths resolve against the working directory first; a relative path
+    that lands outside the library is taken as library-relative instead.
+    """
+    keys: list[str] = []
+    for path in changed:
+        key = source_key(path, library_root)
+        if PurePosixPath(key).is_absolute() and not Path(path).is_absolute():
+            key = PurePosixPath(Path(path).as_posix()).as_posix()
+        keys.append(key.rstrip("/"))
+    return keys
+
+
+def _matches(source: str, keys: list[str]) -> bool:
+    return any(source == key or source.startswith(key + "/") for key in keys)
+
+
+def find_affected(
+    changed: Iterable[str | Path],
+    projects_root: str | Path,
+    library_root: str | Path,
+) -> list[AffectedProject]:
+    """Return the projects under *projects_root* built from any *changed* path.
+
+    Projects are the directories directly below *projects_root* that hold a
+    ``manifest.json``; they are returned in directory order. Unreadable
+    manifests are logged and skipped.
+    """
+    keys = _changed_keys(changed, Path(library_root))
+    affected: list[AffectedProject] = []
+    for manifest_path in sorted(Path(projects_root).glob("*/manifest.json")):
+        project_dir = manifest_path.parent
+        try:
+            manifest = load_manifest(manifest_path)
+        except (OSError, ValueError) as exc:
+            logger.warning("Skipping unreadable manifest %s: %s", manifest_path, exc)
+            continue
+
+        provenance = manifest.provenance
+        files = [
+            output for output, sources in provenance.items()
+            if any(_matches(src, keys) for src in sources)
+        ]
+        if provenance and not files:
+            continue
+        affected.append(AffectedProject(
+            project_dir=str(project_dir),
+            composition=str(project_dir / _COMPOSITION_RELPATH),
+            files=files,
+            provenance_missing=not provenance,
+        ))
+    return affected
+
+
+def regenerate_affected(
+    projects: Iterable[AffectedProject],
+    library_root: str | Path,
+    strictness: Strictness = Strictness.STANDARD,
+    jobs: int | None = None,
+    cache_dir: str | Path | None = None,
+    item_callback: BatchItemCallback | None = None,
+) -> BatchSummary:
+    """Regenerate *projects* in place from their composition snapshots.
+
+    Runs ``generate_batch`` in overlay mode, so user edits in the projects
+    are kept. Each project is regenerated into its own directory; a
+    snapshot whose output folder names a different directory is refused
+    rather than generated somewhere else.
+
+    Raises:
+        ValueError: If a project's composition snapshot is missing or does
+            not regenerate into the project's own directory.
+    """
+    projects = list(projects)
+    roots: set[Path] = set()
+    for project in projects:
+        project_dir = Path(project.project_dir)
+        composition = load_composition(project.composition)
+        if composition.project.resolved_output_folder != project_dir.name:
+            raise ValueError(
+                f"{project.composition} generates into "
+                f"'{composition.project.resolved_output_folder}', not {project_dir}"
+            )
+        roots.add(project_dir.parent.resolve())
+    if len(roots) > 1:
+        raise ValueError("Affected projects must share one projects root")
+
+    return generate_batch(
+        [p.composition for p in projects],
+        library_root,
+        output_root=roots.pop() if roots else None,
+        strictness=strictness,
+        overlay=True,
+        jobs=jobs,
+        cache_dir=cache_dir,
+        item_callback=item_callback,
+    )
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import logging
 import re
+from functools import lru_cache
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader
-
 from foundry_app.core.models import (
     CompositionSpec,
     LibraryIndex,
@@ -15,14 +14,16 @@ from foundry_app.core.models import (
     _persona_dirname,
 )
 from foundry_app.services.compiler import (
-    _PLACEHOLDER_RE,
     _build_context,
     _build_persona_context,
     _expertise_applies_to,
     _expertise_entry_file,
     _get_emitted_expertise_ids,
-    _substitute,
 )
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
+from foundry_app.services.persona_documents import PersonaDocuments
+from foundry_app.services.placeholders import load_template, unresolved_placeholders
+from foundry_app.services.provenance import SourceMap
 
 logger = logging.getLogger(__name__)
 
@@ -117,7 +118,11 @@ def _extract_mission(persona_text: str) -> str:
 
 def _extract_role_description(persona_text: str) -> str:
     """Extract a one-line role description from the Mission section."""
-    mission = _extract_mission(persona_text)
+    return _role_description_from_mission(_extract_mission(persona_text))
+
+
+def _role_description_from_mission(mission: str) -> str:
+    """The first sentence of an extracted Mission section."""
     if not mission:
         return ""
     # Take first sentence
@@ -209,11 +214,25 @@ def _extract_expertise_highlights(conventions_text: str) -> str:
     return "\n".join(highlights).strip()
 
 
+@lru_cache(maxsize=1)
+def _agent_template():
+    """Compile the bundled agent template once per process."""
+    from jinja2 import Environment, FileSystemLoader
+
+    env = Environment(
+        loader=FileSystemLoader(str(_TEMPLATES_DIR)),
+        keep_trailing_newline=True,
+    )
+    return env.get_template("agent.md.j2")
+
+
 def write_agents(
     spec: CompositionSpec,
     library_index: LibraryIndex,
     library_root: str | Path,
     output_dir: str | Path,
+    writer: OutputWriter | None = None,
+    persona_docs: PersonaDocuments | None = None,
 ) -> StageResult:
     """Generate .claude/agents/<persona>.md files for each selected persona.
 
@@ -226,19 +245,24 @@ def write_agents(
         library_index: Index of library contents.
         library_root: Path to the library root directory.
         output_dir: Root directory of the generated project.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
+        persona_docs: The run's parsed persona.md files, shared with the
+            compile stage; built here when omitted.
 
     Returns:
         A StageResult listing written files and any warnings.
     """
     out_root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(out_root)
+    if persona_docs is None:
+        persona_docs = PersonaDocuments(library_index)
     wrote: list[str] = []
     warnings: list[str] = []
+    sources = SourceMap(out_root, library_root)
 
-    env = Environment(
-        loader=FileSystemLoader(str(_TEMPLATES_DIR)),
-        keep_trailing_newline=True,
-    )
-    template = env.get_template("agent.md.j2")
+    template = _agent_template()
 
     # Gather expertise info. Only list expertise whose source file will
     # actually be emitted — a missing-source expertise produces a warning
@@ -259,7 +283,7 @@ def write_agents(
     # Pre-compute the unfiltered expertise highlights so we don't re-read
     # every expertise file once per persona. Each entry retains its source
     # ExpertiseInfo so the per-persona loop can apply the ADR-012 filter.
-    # Each item: {"name", "highlights", "info"}. Missing-source expertise
+    # Each item: {"name", "highlights", "info", "source"}. Missing-source expertise
     # is dropped here once (with a warning) rather than per-persona.
     all_expertise_sections: list[dict[str, object]] = []
     seen_missing: set[str] = set()
@@ -275,20 +299,20 @@ def write_agents(
 
         entry_path = _expertise_entry_file(Path(expertise_info.path))
         if entry_path is not None:
-            conventions_text = _substitute(
-                entry_path.read_text(encoding="utf-8"), shared_context,
-            )
+            conventions_text = load_template(entry_path).render(shared_context)
             highlights = _extract_expertise_highlights(conventions_text)
             if highlights:
                 all_expertise_sections.append({
                     "name": expertise_sel.id.replace("-", " ").title(),
                     "highlights": highlights,
                     "info": expertise_info,
+                    "source": entry_path,
                 })
 
     # Generate agent file for each persona
     agents_dir = out_root / ".claude" / "agents"
-    agents_dir.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(agents_dir)
+    leaks: list[str] = []
 
     for persona_sel in spec.team.personas:
         if not persona_sel.include_agent:
@@ -298,8 +322,9 @@ def write_agents(
             warnings.append(f"Persona '{persona_sel.id}' not found in library index")
             continue
 
-        persona_path = Path(persona_info.path) / "persona.md"
-        if not persona_path.is_file():
+        persona_doc = persona_docs.get(persona_sel.id)
+        persona_path = persona_doc.path
+        if persona_doc.template is None:
             warnings.append(
                 f"Persona '{persona_sel.id}' missing persona.md at {persona_path}"
             )
@@ -312,9 +337,8 @@ def write_agents(
         persona_ctx = _build_persona_context(
             spec, persona_sel, emitted_expertise_ids,
         )
-        persona_text = _substitute(
-            persona_path.read_text(encoding="utf-8"), persona_ctx,
-        )
+        persona_text = persona_doc.template.render(persona_ctx)
+        mission = _extract_mission(persona_text)
 
         # Build role name: expertise + persona (e.g., "Python Developer").
         # Use the emitted list so the role name never derives from a
@@ -338,14 +362,17 @@ def write_agents(
         # inlined into THIS persona's agent file. Empty applies_to means
         # "all personas" (preserves pre-BEAN-259 behavior for unannotated
         # expertise files).
+        applicable_sections = [
+            entry for entry in all_expertise_sections
+            if _expertise_applies_to(persona_sel.id, entry["info"])
+        ]
         expertise_sections: list[dict[str, str]] = [
             {"name": entry["name"], "highlights": entry["highlights"]}
-            for entry in all_expertise_sections
-            if _expertise_applies_to(persona_sel.id, entry["info"])
+            for entry in applicable_sections
         ]
 
         leaf = _persona_dirname(persona_sel.id)
-        role_description = _extract_role_description(persona_text)
+        role_description = _role_description_from_mission(mission)
         # Frontmatter description drives Claude Code's delegation routing;
         # it must be single-line and safe inside double quotes.
         agent_description = (
@@ -388,7 +415,7 @@ def write_agents(
             "role_name": role_name,
             "role_description": role_description,
             "expertise_names": expertise_names,
-            "mission": _extract_mission(persona_text),
+            "mission": mission,
             "key_rules": _extract_key_rules(persona_text),
             "expertise_sections": expertise_sections,
         }
@@ -397,22 +424,25 @@ def write_agents(
         # Use the leaf directory name so .claude/agents/ stays a flat
         # directory regardless of tier (ADR-014).
         agent_file = agents_dir / f"{leaf}.md"
-        agent_file.write_text(content, encoding="utf-8")
-
         rel_path = str(agent_file.relative_to(out_root))
+        # Placeholder-leakage guard: surface any {{ ... }} expressions left
+        # in the rendered file as warnings so the leak isn't silent.
+        unresolved = unresolved_placeholders(content)
+        if unresolved:
+            leaks.append(
+                f"Unresolved placeholders in {rel_path}: {', '.join(unresolved)}"
+            )
+        writer.write_text(agent_file, content)
+
         wrote.append(rel_path)
+        sources.add(agent_file, [
+            persona_path,
+            Path(persona_info.path) / "defaults.yml",
+            *(entry["source"] for entry in applicable_sections),
+        ])
         logger.info("Wrote agent file: %s", rel_path)
 
-    # Placeholder-leakage guard: scan every written agent file and surface
-    # any remaining {{ ... }} expressions as warnings so the leak isn't silent.
-    for rel in wrote:
-        fpath = out_root / rel
-        unresolved = _PLACEHOLDER_RE.findall(fpath.read_text(encoding="utf-8"))
-        if unresolved:
-            unique = sorted(set(unresolved))
-            warnings.append(
-                f"Unresolved placeholders in {rel}: {', '.join(unique)}"
-            )
+    warnings.extend(leaks)
 
     logger.info(
         "Agent writer complete: %d files written, %d warnings",
@@ -420,4 +450,4 @@ def write_agents(
         len(warnings),
     )
 
-    return StageResult(wrote=wrote, warnings=warnings)
+    return StageResult(wrote=wrote, warnings=warnings, sources=sources.as_dict())
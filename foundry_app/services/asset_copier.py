@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import filecmp
 import logging
-import shutil
 from pathlib import Path
 
 from foundry_app.core.models import CompositionSpec, LibraryIndex, StageResult
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
+from foundry_app.services.provenance import RecordingWriter, SourceMap
 
 logger = logging.getLogger(__name__)
 
@@ -140,6 +140,7 @@ def copy_assets(
     library_root: str | Path,
     output_dir: str | Path,
     claude_kit_root: str | Path | None = None,
+    writer: OutputWriter | None = None,
 ) -> StageResult:
     """Copy library assets (templates, commands, hooks) into a generated project.
 
@@ -172,6 +173,8 @@ def copy_assets(
             or for non-checkout-based invocations.  When the resolved path does
             not exist, kit-distributed skills are warned and skipped — generation
             continues so library-copy-mode remains best-effort.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
 
     Returns:
         A StageResult listing all files copied and any warnings.
@@ -179,6 +182,10 @@ def copy_assets(
     lib_root = Path(library_root)
     out_root = Path(output_dir)
     kit_root = Path(claude_kit_root) if claude_kit_root is not None else _default_claude_kit_root()
+    if writer is None:
+        writer = DirectoryWriter(out_root)
+    sources = SourceMap(out_root, lib_root)
+    writer = RecordingWriter(writer, sources)
     wrote: list[str] = []
     warnings: list[str] = []
 
@@ -187,7 +194,9 @@ def copy_assets(
     dev_loop_stack = _select_dev_loop_stack(spec)
 
     # --- Persona templates ---
-    _copy_persona_templates(spec, library_index, lib_root, out_root, wrote, warnings)
+    _copy_persona_templates(
+        spec, library_index, lib_root, out_root, wrote, warnings, writer,
+    )
 
     # --- Commands and skills (selection-aware) ---
     if subtree_mode:
@@ -195,8 +204,11 @@ def copy_assets(
     else:
         _copy_commands(
             team_personas, dev_loop_stack, lib_root, out_root, wrote, warnings,
+            writer,
+        )
+        _copy_skills(
+            team_personas, lib_root, kit_root, out_root, wrote, warnings, writer,
         )
-        _copy_skills(team_personas, lib_root, kit_root, out_root, wrote, warnings)
 
     # --- Other global assets (settings, process dirs) ---
     for src_subdir, dest_subdir in _GLOBAL_ASSET_DIRS:
@@ -218,13 +230,14 @@ def copy_assets(
             out_root,
             wrote,
             warnings,
+            writer,
         )
 
     # --- Hooks (selective — only enabled packs) ---
     if subtree_mode:
         logger.debug("Subtree mode: skipping hook copy (.claude/hooks/ comes from subtree)")
     else:
-        _copy_selected_hooks(spec, lib_root, out_root, wrote, warnings)
+        _copy_selected_hooks(spec, lib_root, out_root, wrote, warnings, writer)
 
     logger.info(
         "Asset copy complete: %d files copied, %d warnings",
@@ -232,7 +245,7 @@ def copy_assets(
         len(warnings),
     )
 
-    return StageResult(wrote=wrote, warnings=warnings)
+    return StageResult(wrote=wrote, warnings=warnings, sources=sources.as_dict())
 
 
 def _copy_persona_templates(
@@ -242,6 +255,7 @@ def _copy_persona_templates(
     out_root: Path,
     wrote: list[str],
     warnings: list[str],
+    writer: OutputWriter,
 ) -> None:
     """Copy persona template files for each persona with include_templates=True."""
     for persona in spec.team.personas:
@@ -272,7 +286,7 @@ def _copy_persona_templates(
             warnings.append(f"Persona '{persona.id}' has no template files")
             continue
 
-        _copy_directory_files(src_dir, dest_dir, out_root, wrote, warnings)
+        _copy_directory_files(src_dir, dest_dir, out_root, wrote, warnings, writer)
 
 
 def _select_dev_loop_stack(spec: CompositionSpec) -> str | None:
@@ -297,6 +311,7 @@ def _copy_commands(
     out_root: Path,
     wrote: list[str],
     warnings: list[str],
+    writer: OutputWriter,
 ) -> None:
     """Copy ``claude/commands/`` to ``.claude/commands/`` with selection rules.
 
@@ -312,7 +327,7 @@ def _copy_commands(
         return
 
     dest_root = out_root / ".claude" / "commands"
-    dest_root.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(dest_root)
 
     for src_entry in sorted(src_root.iterdir()):
         if src_entry.is_symlink():
@@ -330,7 +345,9 @@ def _copy_commands(
                     f"Dev-loop stack '{dev_loop_stack}' has no directory at {stack_dir}"
                 )
                 continue
-            _copy_directory_files(stack_dir, dest_root, out_root, wrote, warnings)
+            _copy_directory_files(
+                stack_dir, dest_root, out_root, wrote, warnings, writer,
+            )
             continue
 
         # Other subdirectories: recurse normally.
@@ -339,6 +356,7 @@ def _copy_commands(
                 continue
             _copy_directory_files(
                 src_entry, dest_root / src_entry.name, out_root, wrote, warnings,
+                writer,
             )
             continue
 
@@ -354,7 +372,9 @@ def _copy_commands(
             )
             continue
 
-        _copy_one_file(src_entry, dest_root / src_entry.name, out_root, wrote, warnings)
+        _copy_one_file(
+            src_entry, dest_root / src_entry.name, out_root, wrote, warnings, writer,
+        )
 
 
 def _copy_skills(
@@ -364,6 +384,7 @@ def _copy_skills(
     out_root: Path,
     wrote: list[str],
     warnings: list[str],
+    writer: OutputWriter,
 ) -> None:
     """Copy skills to ``.claude/skills/`` with governance gating.
 
@@ -439,7 +460,7 @@ def _copy_skills(
     if not sources:
         return
 
-    dest_root.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(dest_root)
 
     for skill_id in sorted(sources):
         src_entry = sources[skill_id]
@@ -455,11 +476,14 @@ def _copy_skills(
         if src_entry.is_dir():
             _copy_directory_files(
                 src_entry, dest_root / src_entry.name, out_root, wrote, warnings,
+                writer,
             )
             continue
 
         if src_entry.is_file():
-            _copy_one_file(src_entry, dest_root / src_entry.name, out_root, wrote, warnings)
+            _copy_one_file(
+                src_entry, dest_root / src_entry.name, out_root, wrote, warnings, writer,
+            )
 
 
 def _copy_one_file(
@@ -468,20 +492,21 @@ def _copy_one_file(
     out_root: Path,
     wrote: list[str],
     warnings: list[str],
+    writer: OutputWriter,
 ) -> None:
     """Copy a single file overlay-safe (skip identical, warn on conflict)."""
-    dest_file.parent.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(dest_file.parent)
     rel_path = str(dest_file.relative_to(out_root))
 
-    if dest_file.exists():
-        if filecmp.cmp(str(src_file), str(dest_file), shallow=False):
+    if writer.exists(dest_file):
+        if writer.same_content(dest_file, src_file):
             logger.debug("File already exists (identical), skipping: %s", rel_path)
         else:
             warnings.append(f"File already exists with different content: {rel_path}")
             logger.warning("File conflict, skipping: %s", rel_path)
         return
 
-    shutil.copy2(src_file, dest_file)
+    writer.copy_file(src_file, dest_file)
     wrote.append(rel_path)
     logger.info("Copied asset: %s", rel_path)
 
@@ -492,6 +517,7 @@ def _copy_selected_hooks(
     out_root: Path,
     wrote: list[str],
     warnings: list[str],
+    writer: OutputWriter,
 ) -> None:
     """Copy hook files matching enabled hook packs, plus all hook scripts.
 
@@ -509,7 +535,7 @@ def _copy_selected_hooks(
         return
 
     dest_dir = out_root / ".claude" / "hooks"
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(dest_dir)
 
     for src_entry in sorted(src_dir.iterdir()):
         if src_entry.is_symlink():
@@ -526,15 +552,15 @@ def _copy_selected_hooks(
         dest_file = dest_dir / src_entry.name
         rel_path = str(dest_file.relative_to(out_root))
 
-        if dest_file.exists():
-            if filecmp.cmp(str(src_entry), str(dest_file), shallow=False):
+        if writer.exists(dest_file):
+            if writer.same_content(dest_file, src_entry):
                 logger.debug("File already exists (identical), skipping: %s", rel_path)
             else:
                 warnings.append(f"File already exists with different content: {rel_path}")
                 logger.warning("File conflict, skipping: %s", rel_path)
             continue
 
-        shutil.copy2(src_entry, dest_file)
+        writer.copy_file(src_entry, dest_file)
         wrote.append(rel_path)
         logger.info("Copied hook: %s", rel_path)
 
@@ -545,6 +571,7 @@ def _copy_directory_files(
     out_root: Path,
     wrote: list[str],
     warnings: list[str],
+    writer: OutputWriter,
 ) -> None:
     """Copy all files from src_dir to dest_dir recursively, overlay-safe.
 
@@ -555,7 +582,7 @@ def _copy_directory_files(
         logger.debug("Source directory does not exist, skipping: %s", src_dir)
         return
 
-    dest_dir.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(dest_dir)
 
     for src_entry in sorted(src_dir.iterdir()):
         if src_entry.is_symlink():
@@ -572,6 +599,7 @@ def _copy_directory_files(
                 out_root,
                 wrote,
                 warnings,
+                writer,
             )
             continue
 
@@ -581,14 +609,14 @@ def _copy_directory_files(
         dest_file = dest_dir / src_entry.name
         rel_path = str(dest_file.relative_to(out_root))
 
-        if dest_file.exists():
-            if filecmp.cmp(str(src_entry), str(dest_file), shallow=False):
+        if writer.exists(dest_file):
+            if writer.same_content(dest_file, src_entry):
                 logger.debug("File already exists (identical), skipping: %s", rel_path)
             else:
                 warnings.append(f"File already exists with different content: {rel_path}")
                 logger.warning("File conflict, skipping: %s", rel_path)
             continue
 
-        shutil.copy2(src_entry, dest_file)
+        writer.copy_file(src_entry, dest_file)
         wrote.append(rel_path)
         logger.info("Copied asset: %s", rel_path)
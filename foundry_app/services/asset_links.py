@@ -0,0 +1,150 @@
+"""Asset links — materialize library assets by link instead of by copy.
+
+The asset copier places hundreds of unchanged library files (commands,
+skills, hooks, settings, process files) in every generated project. With
+``GenerationOptions.link_mode`` other than ``copy``, an ``AssetLinker``
+puts them there instead:
+
+- ``hardlink`` and ``symlink`` link to a content-addressed asset store,
+  ``<cache dir>/assets/<sha[:2]>/<sha256>-<mode>``. The store is written
+  once per distinct file and never changes afterwards, so a project's
+  links keep their content when the library moves on — the store is the
+  versioned snapshot — and every project on the host shares one copy.
+- ``reflink`` clones the library file copy-on-write (Linux ``FICLONE``,
+  e.g. on Btrfs and XFS); projects share blocks until a file is edited.
+
+A hardlinked or symlinked asset shares its content with every project
+that links it: edit one by replacing the file (as editors and git do),
+not by writing into it in place.
+
+When a link cannot be made — no cache directory, another filesystem, no
+reflink support — the linker logs why, copies that file and every later
+one, and reports ``copy`` as its ``mode``.
+"""
+
+from __future__ import annotations
+
+import errno
+import hashlib
+import logging
+import os
+import shutil
+import stat
+import tempfile
+import threading
+from pathlib import Path
+
+from foundry_app.core.models import LinkMode
+
+logger = logging.getLogger(__name__)
+
+# Subdirectory of the cache directory holding the asset store.
+ASSET_STORE_DIRNAME = "assets"
+
+# ioctl request number of Linux FICLONE (_IOW(0x94, 9, int)).
+_FICLONE = 0x40049409
+
+
+def _reflink(src: Path, dest: Path) -> None:
+    """Clone *src* to *dest* copy-on-write; raises OSError when unsupported."""
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        raise OSError(errno.EOPNOTSUPP, "reflink is not supported here") from None
+    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    shutil.copystat(src, dest)
+
+
+def detach(path: Path) -> None:
+    """Remove *path* if it is a symlink or a hardlink shared with other paths.
+
+    Writers call this before writing a file in place, so rewriting a
+    linked asset (e.g. merging hooks into a linked settings.json) replaces
+    this project's file instead of changing the shared content.
+    """
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return
+    if stat.S_ISLNK(st.st_mode) or (stat.S_ISREG(st.st_mode) and st.st_nlink > 1):
+        os.unlink(path)
+
+
+class AssetLinker:
+    """Place library files in generated projects according to a ``LinkMode``.
+
+    Thread-safe: the pipeline's stages and the ``VirtualTree`` flush pool
+    may share one linker.
+    """
+
+    def __init__(self, link_mode: LinkMode, store_dir: str | Path | None = None) -> None:
+        self.requested = LinkMode(link_mode)
+        self.store_dir = Path(store_dir) if store_dir is not None else None
+        self.fallback: str | None = None
+        self._lock = threading.Lock()
+        self._mode = self.requested
+        if self._mode in (LinkMode.HARDLINK, LinkMode.SYMLINK) and self.store_dir is None:
+            self._fall_back("no cache directory for the asset store")
+
+    @property
+    def mode(self) -> LinkMode:
+        """The mode files are being placed with: the requested one, or ``copy``."""
+        return self._mode
+
+    def _fall_back(self, reason: str) -> None:
+        with self._lock:
+            if self._mode is LinkMode.COPY:
+                return
+            self.fallback = f"link_mode '{self.requested.value}' fell back to copy: {reason}"
+            self._mode = LinkMode.COPY
+        logger.warning("%s", self.fallback)
+
+    def _stored(self, src: Path) -> Path:
+        """Return the store entry holding *src*'s bytes and mode, adding it if new."""
+        data = src.read_bytes()
+        mode = stat.S_IMODE(src.stat().st_mode)
+        sha = hashlib.sha256(data).hexdigest()
+        entry = self.store_dir / sha[:2] / f"{sha}-{mode:o}"
+        if not entry.is_file():
+            entry.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=entry.name, suffix=".tmp", dir=entry.parent)
+            try:
+                with os.fdopen(fd, "wb") as fh:
+                    fh.write(data)
+                os.chmod(tmp_name, mode)
+                os.replace(tmp_name, entry)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        return entry
+
+    def _link(self, mode: LinkMode, src: Path, tmp: Path) -> None:
+        if mode is LinkMode.REFLINK:
+            _reflink(src, tmp)
+        elif mode is LinkMode.HARDLINK:
+            os.link(self._stored(src), tmp)
+        else:
+            os.symlink(self._stored(src), tmp)
+
+    def place(self, src: Path, dest: Path) -> None:
+        """Put library file *src* at *dest*, replacing what is there.
+
+        Raises:
+            OSError: If *src* cannot be read or *dest* cannot be written.
+        """
+        mode = self._mode
+        if mode is not LinkMode.COPY:
+            tmp = dest.with_name(f".{dest.name}.foundry-link")
+            tmp.unlink(missing_ok=True)
+            try:
+                self._link(mode, src, tmp)
+                os.replace(tmp, dest)
+                # rename() is a no-op when both names are links to one file.
+                tmp.unlink(missing_ok=True)
+                return
+            except OSError as exc:
+                tmp.unlink(missing_ok=True)
+                self._fall_back(exc.strerror or str(exc))
+        detach(dest)
+        shutil.copy2(src, dest)
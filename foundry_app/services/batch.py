@@ -0,0 +1,308 @@
+"""Batch generation — regenerate many compositions against one library.
+
+``generate_project`` indexes the library and asks git for its version on
+every call. ``generate_batch`` does both once in the parent process and hands
+the results to a pool of worker processes through the pool initializer, so
+each worker receives the shared ``LibraryIndex`` a single time and then only
+runs pipelines. Every project still gets its own
+``manifest.json`` (when the composition enables it); the returned
+``BatchSummary`` records the outcome of each composition in input order.
+"""
+
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import NamedTuple
+
+from foundry_app.core.models import (
+    BatchItemResult,
+    BatchSummary,
+    CompositionSpec,
+    LibraryIndex,
+    Strictness,
+)
+from foundry_app.io.composition_io import load_composition
+from foundry_app.services.generator import _get_library_version, generate_project
+from foundry_app.services.library_cache import load_library_index
+from foundry_app.services.library_indexer import build_library_index
+
+logger = logging.getLogger(__name__)
+
+_COMPOSITION_SUFFIXES = (".yml", ".yaml")
+
+BatchItemCallback = Callable[[BatchItemResult], None]
+
+
+class _BatchOptions(NamedTuple):
+    """Per-run settings shipped to every worker alongside each composition."""
+
+    library_root: str
+    output_root: str | None
+    strictness: Strictness
+    overlay: bool
+    force: bool
+    stage_workers: int
+    cache_dir: str | None
+    force_rebuild: bool
+
+
+# Set once per worker process by ``_init_worker``.
+_shared_library: LibraryIndex | None = None
+_shared_version: str = ""
+
+
+def discover_compositions(sources: Iterable[str | Path]) -> list[Path]:
+    """Expand directories, glob patterns, and file paths into composition files.
+
+    A directory contributes its ``*.yml`` / ``*.yaml`` files (non-recursive);
+    a pattern is expanded with ``glob``; anything else must be an existing
+    file. Results keep the order of *sources*, sorted within each source,
+    with duplicates dropped.
+
+    Raises:
+        FileNotFoundError: If a source matches no composition files.
+    """
+    found: list[Path] = []
+    seen: set[Path] = set()
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            matches = sorted(
+                p for p in path.iterdir()
+                if p.is_file() and p.suffix in _COMPOSITION_SUFFIXES
+            )
+        elif glob.has_magic(str(source)):
+            matches = sorted(
+                Path(p) for p in glob.glob(str(source)) if Path(p).is_file()
+            )
+        elif path.is_file():
+            matches = [path]
+        else:
+            matches = []
+        if not matches:
+            raise FileNotFoundError(f"No composition files match: {source}")
+        for match in matches:
+            key = match.resolve()
+            if key not in seen:
+                seen.add(key)
+                found.append(match)
+    return found
+
+
+def _init_worker(library: LibraryIndex, library_version: str) -> None:
+    """Pool initializer: keep the parent's index for every task in this worker."""
+    global _shared_library, _shared_version
+    _shared_library = library
+    _shared_version = library_version
+
+
+def _output_dir(composition: CompositionSpec, output_root: str | Path | None) -> Path:
+    """Where *composition* is generated, mirroring ``generate_project``."""
+    base = output_root if output_root is not None else composition.project.output_root
+    return Path(base) / composition.project.resolved_output_folder
+
+
+def _load_item(
+    path: str,
+    output_root: str | Path | None,
+    claimed: dict[Path, str],
+) -> tuple[CompositionSpec | None, BatchItemResult]:
+    """Load one composition and claim its output directory.
+
+    Returns the spec (``None`` when it cannot be generated) and the result
+    record to fill in. Two compositions that resolve to the same output
+    directory would overwrite each other mid-run, so the later one is
+    rejected.
+    """
+    result = BatchItemResult(composition=path, status="invalid")
+    try:
+        composition = load_composition(path)
+    except Exception as exc:
+        result.errors = [f"Error loading composition: {exc}"]
+        return None, result
+
+    output_dir = _output_dir(composition, output_root)
+    result.project_name = composition.project.name
+    result.output_dir = str(output_dir)
+    owner = claimed.setdefault(output_dir.resolve(), path)
+    if owner != path:
+        result.errors = [f"Output directory {output_dir} is already generated by {owner}"]
+        return None, result
+    return composition, result
+
+
+def _generate_one(
+    composition: CompositionSpec,
+    result: BatchItemResult,
+    options: _BatchOptions,
+) -> BatchItemResult:
+    """Generate one composition against the worker's shared index."""
+    start = time.perf_counter()
+    output_dir = Path(result.output_dir)
+    try:
+        manifest, validation, _plan = generate_project(
+            composition=composition,
+            library_root=options.library_root,
+            output_root=output_dir if options.output_root is not None else None,
+            strictness=options.strictness,
+            overlay=options.overlay,
+            force=options.force,
+            stage_workers=options.stage_workers,
+            cache_dir=options.cache_dir,
+            library_index=_shared_library,
+            library_version=_shared_version,
+            force_rebuild=options.force_rebuild,
+        )
+    except Exception as exc:
+        logger.exception("Batch generation failed for %s", result.composition)
+        result.status = "error"
+        result.errors = [str(exc)]
+        result.elapsed_seconds = time.perf_counter() - start
+        return result
+
+    result.run_id = manifest.run_id
+    result.warnings = manifest.all_warnings
+    if not validation.is_valid and not options.force:
+        result.status = "invalid"
+        result.errors = [f"[{m.code}] {m.message}" for m in validation.errors]
+    else:
+        result.status = "ok"
+        result.up_to_date = manifest.up_to_date
+        result.files_written = manifest.total_files_written
+        manifest_path = output_dir / "manifest.json"
+        if composition.generation.write_manifest and manifest_path.is_file():
+            result.manifest_path = str(manifest_path)
+    result.elapsed_seconds = time.perf_counter() - start
+    return result
+
+
+def generate_batch(
+    compositions: Iterable[str | Path],
+    library_root: str | Path,
+    output_root: str | Path | None = None,
+    strictness: Strictness = Strictness.STANDARD,
+    overlay: bool = False,
+    force: bool = False,
+    jobs: int | None = None,
+    cache_dir: str | Path | None = None,
+    stage_workers: int = 1,
+    item_callback: BatchItemCallback | None = None,
+    force_rebuild: bool = False,
+) -> BatchSummary:
+    """Generate every composition in *compositions* against one library index.
+
+    Args:
+        compositions: Composition YAML paths (see ``discover_compositions``).
+        library_root: Path to the ai-team-library directory.
+        output_root: Parent directory for the generated projects; each lands
+            in ``output_root / project.resolved_output_folder``. ``None``
+            uses each composition's own ``project.output_root``.
+        strictness: Validation strictness level for every composition.
+        overlay: Use two-phase overlay mode for each project.
+        force: Generate even when validation produces errors.
+        jobs: Worker processes. ``None`` uses the CPU count; ``1`` generates
+            in this process without a pool. Never more than the number of
+            compositions.
+        cache_dir: Directory for Foundry's persistent caches: the library
+            index cache for the batch's one index build, and the compile
+            cache shared by every generation. ``None`` indexes and compiles
+            from scratch.
+        stage_workers: Pipeline stage threads inside each generation. The
+            pool already runs whole projects in parallel, so this defaults
+            to serial stages.
+        item_callback: Called in this process with each result as it
+            completes (completion order, not input order).
+        force_rebuild: Regenerate projects whose inputs are unchanged
+            instead of reporting them ``up_to_date``.
+
+    Returns:
+        A BatchSummary whose items follow the input order. Compositions
+        that fail to load, or that target an output directory an earlier
+        composition already claimed, are reported as ``invalid`` without
+        being generated.
+    """
+    paths = [str(p) for p in compositions]
+    library_path = Path(library_root)
+
+    if cache_dir is not None:
+        library = load_library_index(library_path, cache_dir)
+    else:
+        library = build_library_index(library_path)
+    library_version = _get_library_version(library_path)
+
+    workers = jobs if jobs is not None else (os.cpu_count() or 1)
+    workers = max(1, min(workers, len(paths)))
+    summary = BatchSummary(
+        library_root=str(library_path),
+        library_version=library_version,
+        jobs=workers,
+    )
+    if not paths:
+        return summary
+
+    options = _BatchOptions(
+        library_root=str(library_path),
+        output_root=str(output_root) if output_root is not None else None,
+        strictness=strictness,
+        overlay=overlay,
+        force=force,
+        stage_workers=stage_workers,
+        cache_dir=str(cache_dir) if cache_dir is not None else None,
+        force_rebuild=force_rebuild,
+    )
+    logger.info(
+        "Batch generating %d compositions with %d worker(s)", len(paths), workers,
+    )
+
+    results: list[BatchItemResult | None] = [None] * len(paths)
+    pending: list[tuple[int, CompositionSpec, BatchItemResult]] = []
+    claimed: dict[Path, str] = {}
+    for i, path in enumerate(paths):
+        composition, result = _load_item(path, output_root, claimed)
+        if composition is None:
+            results[i] = result
+            if item_callback is not None:
+                item_callback(result)
+        else:
+            pending.append((i, composition, result))
+
+    if workers == 1 or len(pending) <= 1:
+        _init_worker(library, library_version)
+        for i, composition, result in pending:
+            results[i] = _generate_one(composition, result, options)
+            if item_callback is not None:
+                item_callback(results[i])
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(pending)),
+            initializer=_init_worker,
+            initargs=(library, library_version),
+        ) as pool:
+            futures = {
+                pool.submit(_generate_one, composition, result, options): (i, result)
+                for i, composition, result in pending
+            }
+            for future in as_completed(futures):
+                i, submitted = futures[future]
+                try:
+                    results[i] = future.result()
+                except Exception as exc:
+                    # The worker process itself died (e.g. BrokenProcessPool).
+                    submitted.status = "error"
+                    submitted.errors = [str(exc)]
+                    results[i] = submitted
+                if item_callback is not None:
+                    item_callback(results[i])
+
+    summary.items = [r for r in results if r is not None]
+    logger.info(
+        "Batch complete: %d succeeded, %d failed",
+        len(summary.succeeded), len(summary.failed),
+    )
+    return summary
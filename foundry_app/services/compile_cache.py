@@ -0,0 +1,110 @@
+"""Content-addressed cache for compiled member and expertise sections.
+
+``compile_agnostic_outputs`` turns library sources into the bodies of
+``ai/generated/members/*.md`` and ``ai/generated/expertise/*.md`` by
+substituting placeholders, extracting expertise highlights, and filtering
+persona references against the selected team. A section's body depends
+only on its source file bytes and those compile inputs, so this module
+stores finished bodies under a SHA-256 of exactly that. After a library
+edit only the sections whose sources changed are recompiled.
+
+Entries live one file per key under ``<cache_dir>/compile/`` and are
+written atomically, so concurrent batch workers can share a cache. A
+Foundry upgrade changes every key.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from foundry_app import __version__
+from foundry_app.core.models import CacheStats
+
+logger = logging.getLogger(__name__)
+
+# Bump when the stored entry shape or the key recipe changes.
+_COMPILE_CACHE_SCHEMA = 1
+
+
+def _feed(digest: Any, part: Any) -> None:
+    """Add one length-prefixed, type-tagged key part to *digest*."""
+    if isinstance(part, bytes):
+        tag, data = b"b", part
+    else:
+        tag, data = b"j", json.dumps(part, sort_keys=True).encode("utf-8")
+    digest.update(tag + len(data).to_bytes(8, "big"))
+    digest.update(data)
+
+
+def read_source(path: Path) -> bytes | None:
+    """Return *path*'s bytes for a cache key, or None when it doesn't exist."""
+    try:
+        return path.read_bytes()
+    except OSError:
+        return None
+
+
+class CompileCache:
+    """Lookup and storage of compiled sections, counting hits and misses.
+
+    With ``cache_dir=None`` the cache is disabled: every lookup misses,
+    nothing is stored, and ``stats`` is None.
+    """
+
+    def __init__(self, cache_dir: str | Path | None) -> None:
+        self._dir = Path(cache_dir) / "compile" if cache_dir is not None else None
+        self._stats = CacheStats()
+
+    @property
+    def enabled(self) -> bool:
+        return self._dir is not None
+
+    @property
+    def stats(self) -> CacheStats | None:
+        return self._stats.model_copy() if self.enabled else None
+
+    def key(self, kind: str, *parts: Any) -> str:
+        """Hash *kind* and *parts* (bytes, or JSON-serializable values)."""
+        digest = hashlib.sha256()
+        for part in (_COMPILE_CACHE_SCHEMA, __version__, kind, *parts):
+            _feed(digest, part)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self._dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        """Return the stored entry for *key*, or None (counted as a miss)."""
+        if self._dir is None:
+            return None
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            entry = None
+        if not isinstance(entry, dict):
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        return entry
+
+    def put(self, key: str, entry: dict) -> None:
+        """Store *entry* atomically; failures only cost a later recompile."""
+        if self._dir is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                prefix=path.name, suffix=".tmp", dir=path.parent,
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                json.dump(entry, fh)
+            os.replace(tmp_name, path)
+        except OSError as exc:
+            logger.warning("Cannot write compile cache entry %s: %s", path, exc)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Callable, Mapping
 from pathlib import Path
 from typing import NamedTuple
 
@@ -11,97 +12,50 @@ from foundry_app.core.models import (
     CompositionSpec,
     ExpertiseInfo,
     LibraryIndex,
+    PersonaAliases,
     PersonaSelection,
     StageResult,
     _persona_dirname,
 )
+from foundry_app.services.compile_cache import CompileCache, read_source
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
+from foundry_app.services.persona_documents import PersonaDocuments
+from foundry_app.services.persona_names import (
+    _canonicalize_persona_header,
+    _display_name_from_id,
+    persona_aliases,
+)
+from foundry_app.services.placeholders import (
+    PlaceholderTemplate,
+    compile_template,
+    load_template,
+    unresolved_placeholders,
+)
+from foundry_app.services.provenance import SourceMap
 
 logger = logging.getLogger(__name__)
 
-# Template variable pattern: {{ var }} or {{ var | filter }}
-_PLACEHOLDER_RE = re.compile(r"\{\{\s*(.+?)\s*\}\}")
-
-# Pattern for extracting persona display name from "# Persona: <Name>" header
-_PERSONA_HEADER_RE = re.compile(r"^#\s+Persona:\s*(.+)", re.MULTILINE)
-
 # Pattern for "(defer to X)" or "(defer to X; extra text)" parentheticals
-_DEFER_TO_RE = re.compile(r"\s*\(defer to ([^;)]+)(?:;[^)]+)?\)")
-
-# Acronyms that should be uppercased when rendering display names derived
-# from kebab-case identifiers (e.g. ``tech-qa`` -> ``Tech QA``). Extend when
-# a new acronym-bearing persona or expertise id is introduced.
-_ACRONYMS: frozenset[str] = frozenset({
-    "qa", "ui", "ux", "api", "sre", "ml", "ai", "ba",
-    "sql", "dba", "aws", "gcp", "ci", "cd",
-})
-
-
-def _display_name_from_id(identifier: str) -> str:
-    """Convert a kebab-case id into a human-readable display name.
-
-    Acronyms listed in ``_ACRONYMS`` are uppercased; other segments are
-    title-cased. Consecutive acronym segments collapse with ``/`` so that
-    ``ux-ui-designer`` renders as ``UX/UI Designer`` rather than
-    ``Ux Ui Designer``.
-    """
-    parts = identifier.split("-")
-    words: list[str] = []
-    run: list[str] = []
-
-    def _flush() -> None:
-        if run:
-            words.append("/".join(run))
-            run.clear()
-
-    for part in parts:
-        if part.lower() in _ACRONYMS:
-            run.append(part.upper())
-        else:
-            _flush()
-            words.append(part.capitalize())
-    _flush()
-    return " ".join(words)
-
-
-def _canonicalize_persona_header(name: str) -> str:
-    """Trim a ``# Persona: <Name>`` header down to its short display form.
-
-    Rules applied in order:
-
-    1. Remove trailing parenthetical annotations (``Business Analyst (BA)``
-       -> ``Business Analyst``).
-    2. Split on `` / ``. Merge consecutive segments whose adjoining tokens
-       are short (<= 3 char) all-upper acronyms using ``/`` — this turns
-       ``UX / UI Designer`` into ``UX/UI Designer``. Otherwise keep only
-       the first segment (``Tech-QA / Test Engineer`` -> ``Tech-QA``).
-    """
-    name = re.sub(r"\s*\([^)]+\)\s*", "", name).strip()
-    if " / " not in name:
-        return name
-
-    segments = [s.strip() for s in name.split(" / ") if s.strip()]
-    merged = [segments[0]]
-    for seg in segments[1:]:
-        prev_tokens = merged[-1].split()
-        cur_tokens = seg.split()
-        if not prev_tokens or not cur_tokens:
-            break
-        prev_last = prev_tokens[-1]
-        cur_first = cur_tokens[0]
-        if (
-            prev_last.isupper() and len(prev_last) <= 3
-            and cur_first.isupper() and len(cur_first) <= 3
-        ):
-            merged[-1] = f"{merged[-1]}/{cur_first}"
-            rest = cur_tokens[1:]
-            if rest:
-                merged.append(" ".join(rest))
-        else:
-            break
-    return " ".join(merged)
+_DEFER_TO_RE = re.compile(r"\s*\(defer to (?P<defer>[^;)]+)(?:;[^)]+)?\)")
+
+# A "## Collaboration ..." heading, optional blank lines, then a markdown
+# table: header row, separator row, and any data rows.
+_COLLABORATION_TABLE_RE = re.compile(
+    r"(?P<table>^##[^\S\n]+Collaboration[^\n]*\n(?:[^\S\n]*\n)*"
+    r"\|[^\n]*\n\|[^\n]*(?:\n\|[^\n]*)*\n?)",
+    re.MULTILINE,
+)
 
+# Either kind of persona reference, so one scan finds both.
+_PERSONA_REFERENCE_RE = re.compile(
+    f"{_COLLABORATION_TABLE_RE.pattern}|{_DEFER_TO_RE.pattern}", re.MULTILINE,
+)
 
-def _persona_display_name(persona_id: str, index: LibraryIndex) -> str:
+def _persona_display_name(
+    persona_id: str,
+    index: LibraryIndex,
+    persona_docs: PersonaDocuments | None = None,
+) -> str:
     """Return the display name for a persona.
 
     Prefers the persona's own ``# Persona: <Name>`` header (canonicalized),
@@ -109,47 +63,20 @@ def _persona_display_name(persona_id: str, index: LibraryIndex) -> str:
     The fallback strips any ADR-014 ``extended/`` tier prefix so the rendered
     name is purely role-based, not tier-based.
     """
-    persona_info = index.persona_by_id(persona_id)
-    if persona_info is not None:
-        persona_md = _read_file(Path(persona_info.path) / "persona.md")
-        if persona_md is not None:
-            match = _PERSONA_HEADER_RE.search(persona_md)
-            if match:
-                return _canonicalize_persona_header(match.group(1).strip())
+    if persona_docs is None:
+        persona_docs = PersonaDocuments(index)
+    doc = persona_docs.get(persona_id)
+    if doc is not None and doc.header:
+        return _canonicalize_persona_header(doc.header)
     return _display_name_from_id(_persona_dirname(persona_id))
 
 
-def _resolve_placeholder(match: re.Match[str], context: dict[str, str]) -> str:
-    """Resolve a single {{ ... }} placeholder against the context dict.
-
-    Supports:
-    - Simple variables: ``{{ project_name }}``
-    - join filter: ``{{ expertise | join(", ") }}``
+def _substitute(text: str, context: dict[str, str]) -> str:
+    """Replace all ``{{ ... }}`` placeholders in *text* using *context*.
 
-    Returns the original placeholder text if the variable is not in context.
+    See ``foundry_app.services.placeholders`` for the supported forms.
     """
-    expr = match.group(1).strip()
-
-    # Handle join filter:  varname | join("sep")
-    join_match = re.match(r"(\w+)\s*\|\s*join\(\s*\"([^\"]*)\"\s*\)", expr)
-    if join_match:
-        var_name = join_match.group(1)
-        separator = join_match.group(2)
-        value = context.get(var_name)
-        if value is None:
-            return match.group(0)  # leave unresolved
-        return separator.join(v.strip() for v in value.split(","))
-
-    # Simple variable lookup
-    value = context.get(expr)
-    if value is None:
-        return match.group(0)  # leave unresolved
-    return value
-
-
-def _substitute(text: str, context: dict[str, str]) -> str:
-    """Replace all ``{{ ... }}`` placeholders in *text* using *context*."""
-    return _PLACEHOLDER_RE.sub(lambda m: _resolve_placeholder(m, context), text)
+    return compile_template(text).render(context)
 
 
 def _read_file(path: Path) -> str | None:
@@ -159,6 +86,16 @@ def _read_file(path: Path) -> str | None:
     return None
 
 
+def _read_template(
+    path: Path,
+    prepare: Callable[[str], str] | None = None,
+) -> PlaceholderTemplate | None:
+    """Return the compiled template of a file, or None if it doesn't exist."""
+    if path.is_file():
+        return load_template(path, prepare)
+    return None
+
+
 def _expertise_applies_to(
     persona_id: str,
     expertise_info: ExpertiseInfo,
@@ -212,6 +149,11 @@ def _strip_frontmatter(text: str) -> str:
     return text[end + 5:].lstrip("\n")
 
 
+def _conventions_body(text: str) -> str:
+    """An expertise conventions file without its frontmatter, trimmed."""
+    return _strip_frontmatter(text).strip()
+
+
 def _expertise_entry_file(expertise_dir: Path) -> Path | None:
     """Resolve the entry file for an expertise pack.
 
@@ -271,45 +213,137 @@ def _build_persona_context(
     return ctx
 
 
-def _build_persona_name_map(index: LibraryIndex) -> dict[str, str]:
+def _build_persona_name_map(
+    index: LibraryIndex,
+    persona_docs: PersonaDocuments | None = None,
+) -> dict[str, str]:
     """Build a mapping of persona display names to IDs from the library.
 
-    Reads the ``# Persona: <Name>`` header from each persona.md to extract
-    display names.  Returns a dict mapping display name -> persona ID.
+    Uses the ``# Persona: <Name>`` header the indexer recorded as each
+    persona's ``title``; for personas of a hand-built index (``title`` None)
+    the header is read from persona.md. Returns a dict mapping display
+    name -> persona ID.
     """
     name_map: dict[str, str] = {}
     for persona_info in index.personas:
-        persona_md = _read_file(Path(persona_info.path) / "persona.md")
-        if persona_md is None:
-            continue
-        match = _PERSONA_HEADER_RE.search(persona_md)
-        if match:
-            name_map[match.group(1).strip()] = persona_info.id
+        title = persona_info.title
+        if title is None:
+            if persona_docs is None:
+                persona_docs = PersonaDocuments(index)
+            doc = persona_docs.get(persona_info.id)
+            title = doc.header if doc is not None else None
+        if title:
+            name_map[title] = persona_info.id
     return name_map
 
 
+def _persona_aliases(
+    index: LibraryIndex,
+    persona_docs: PersonaDocuments | None = None,
+) -> PersonaAliases:
+    """Return the alias map persona references are resolved with.
+
+    Indexes built by the indexer carry it precomputed
+    (``LibraryIndex.persona_aliases``); for hand-built ones it is derived
+    here from the persona.md headers, the same way.
+    """
+    if all(info.title is not None for info in index.personas):
+        return index.persona_aliases()
+    name_map = _build_persona_name_map(index, persona_docs)
+    return PersonaAliases(
+        name_map.items(),
+        (
+            (alias, pid) for title, pid in name_map.items()
+            for alias in persona_aliases(title, _persona_dirname(pid))
+        ),
+    )
+
+
+def _as_aliases(name_to_id: Mapping[str, str]) -> PersonaAliases:
+    if isinstance(name_to_id, PersonaAliases):
+        return name_to_id
+    return PersonaAliases(name_to_id.items())
+
+
 def _resolve_persona_name(
     name: str,
-    name_to_id: dict[str, str],
+    name_to_id: Mapping[str, str],
 ) -> str | None:
     """Resolve a display name to a persona ID.
 
-    Handles exact matches and short-form names (e.g., ``"Technical Writer"``
-    matching ``"Technical Writer / Doc Owner"``).
+    *name_to_id* is a ``PersonaAliases`` map, or a plain display name -> ID
+    mapping that is expanded into one. Handles exact matches and short-form
+    names (e.g., ``"Technical Writer"`` matching
+    ``"Technical Writer / Doc Owner"``).
     """
-    name = name.strip()
-    if name in name_to_id:
-        return name_to_id[name]
-    for canonical, pid in name_to_id.items():
-        if canonical.startswith(name + " / "):
-            return pid
-    return None
+    return _as_aliases(name_to_id).resolve(name)
+
+
+def _filter_table(table: str, unselected: Callable[[str], bool]) -> str:
+    """Drop the rows of one matched Collaboration table naming *unselected* personas.
+
+    Rows for unknown entities (e.g., ``"Stakeholders"``) are kept. Returns
+    '' when no data row survives, so the whole section goes.
+    """
+    body = table[:-1] if table.endswith("\n") else table
+    lines = body.split("\n")
+    header = next(i for i, line in enumerate(lines) if line.startswith("|"))
+    rows = [
+        row for row in lines[header + 2:]
+        if len(cells := row.split("|")) < 3 or not unselected(cells[1].strip())
+    ]
+    if not rows:
+        return ""
+    return "\n".join(lines[:header + 2] + rows) + table[len(body):]
+
+
+def _filter_references(
+    text: str,
+    pattern: re.Pattern[str],
+    selected_ids: set[str],
+    name_to_id: Mapping[str, str],
+) -> str:
+    """Remove the references *pattern* finds to personas not in *selected_ids*.
+
+    *pattern* matches Collaboration tables (group ``table``), ``(defer to
+    X)`` parentheticals (group ``defer``), or either; the text is scanned
+    once. Defer references inside a kept table are filtered too.
+    """
+    aliases = _as_aliases(name_to_id)
+
+    def unselected(name: str) -> bool:
+        pid = aliases.resolve(name)
+        return pid is not None and pid not in selected_ids
+
+    def defer(match: re.Match[str]) -> str:
+        return "" if unselected(match.group("defer")) else match.group(0)
+
+    out: list[str] = []
+    pos = 0
+    for match in pattern.finditer(text):
+        out.append(text[pos:match.start()])
+        pos = match.end()
+        table = match.groupdict().get("table")
+        if table is None:
+            out.append(defer(match))
+            continue
+        kept = _filter_table(table, unselected)
+        if kept:
+            if "defer" in pattern.groupindex:
+                kept = _DEFER_TO_RE.sub(defer, kept)
+            out.append(kept)
+        elif not table.endswith("\n"):
+            # The section ran to the end of the text: its line break goes too.
+            head = "".join(out)
+            out = [head[:-1] if head.endswith("\n") else head]
+    out.append(text[pos:])
+    return "".join(out)
 
 
 def _filter_collaboration_table(
     text: str,
     selected_ids: set[str],
-    name_to_id: dict[str, str],
+    name_to_id: Mapping[str, str],
 ) -> str:
     """Filter Collaboration & Handoffs table to only include selected personas.
 
@@ -318,92 +352,31 @@ def _filter_collaboration_table(
     If all data rows are removed, the entire section (heading + table) is
     dropped.
     """
-    lines = text.split("\n")
-    result: list[str] = []
-    i = 0
-
-    while i < len(lines):
-        line = lines[i]
-
-        if re.match(r"^##\s+Collaboration", line):
-            # Collect the heading and any blank lines before the table
-            section_lines: list[str] = [line]
-            i += 1
-            while i < len(lines) and lines[i].strip() == "":
-                section_lines.append(lines[i])
-                i += 1
-
-            # Collect table header row
-            if i < len(lines) and lines[i].startswith("|"):
-                section_lines.append(lines[i])
-                i += 1
-            else:
-                result.extend(section_lines)
-                continue
-
-            # Collect separator row
-            if i < len(lines) and lines[i].startswith("|"):
-                section_lines.append(lines[i])
-                i += 1
-            else:
-                result.extend(section_lines)
-                continue
-
-            # Collect and filter data rows
-            data_rows: list[str] = []
-            while i < len(lines) and lines[i].startswith("|"):
-                cells = lines[i].split("|")
-                if len(cells) >= 3:
-                    collaborator = cells[1].strip()
-                    pid = _resolve_persona_name(collaborator, name_to_id)
-                    if pid is None or pid in selected_ids:
-                        data_rows.append(lines[i])
-                else:
-                    data_rows.append(lines[i])
-                i += 1
-
-            if data_rows:
-                result.extend(section_lines)
-                result.extend(data_rows)
-            # else: empty table after filtering — drop the entire section
-            continue
-
-        result.append(line)
-        i += 1
-
-    return "\n".join(result)
+    return _filter_references(text, _COLLABORATION_TABLE_RE, selected_ids, name_to_id)
 
 
 def _filter_defer_references(
     text: str,
     selected_ids: set[str],
-    name_to_id: dict[str, str],
+    name_to_id: Mapping[str, str],
 ) -> str:
     """Remove ``(defer to X)`` parentheticals when *X* is not selected."""
-
-    def _replace(match: re.Match[str]) -> str:
-        persona_name = match.group(1).strip()
-        pid = _resolve_persona_name(persona_name, name_to_id)
-        if pid is None or pid in selected_ids:
-            return match.group(0)
-        return ""
-
-    return _DEFER_TO_RE.sub(_replace, text)
+    return _filter_references(text, _DEFER_TO_RE, selected_ids, name_to_id)
 
 
 def _filter_persona_references(
     text: str,
     selected_ids: set[str],
-    name_to_id: dict[str, str],
+    name_to_id: Mapping[str, str],
 ) -> str:
     """Remove references to non-selected personas from compiled content.
 
     1. Filters the Collaboration & Handoffs table.
     2. Strips ``(defer to X)`` parentheticals for non-selected personas.
+
+    Both are found in a single scan of *text*.
     """
-    text = _filter_collaboration_table(text, selected_ids, name_to_id)
-    text = _filter_defer_references(text, selected_ids, name_to_id)
-    return text
+    return _filter_references(text, _PERSONA_REFERENCE_RE, selected_ids, name_to_id)
 
 
 def _compile_persona_section(
@@ -413,6 +386,7 @@ def _compile_persona_section(
     context: dict[str, str],
     warnings: list[str],
     spec: CompositionSpec | None = None,
+    persona_docs: PersonaDocuments | None = None,
 ) -> str | None:
     """Compile the section for a single persona.
 
@@ -425,6 +399,9 @@ def _compile_persona_section(
     True contributes. This is a forward-compat guard: if and when this
     function starts inlining expertise, it must filter through that helper.
 
+    *persona_docs* supplies the parsed persona.md; without it the file is
+    read here.
+
     Returns the assembled markdown text, or None if the persona directory
     is missing from the library.
     """
@@ -444,23 +421,25 @@ def _compile_persona_section(
     files_read = 0
 
     # Read persona.md (primary — defines the role)
-    persona_md = _read_file(persona_dir / "persona.md")
+    if persona_docs is None:
+        persona_docs = PersonaDocuments(index)
+    persona_md = persona_docs.get(persona_id).body
     if persona_md is not None:
-        parts.append(_substitute(persona_md.strip(), context))
+        parts.append(persona_md.render(context))
         files_read += 1
     else:
         warnings.append(f"Persona '{persona_id}' missing persona.md")
 
     # Read outputs.md
-    outputs_md = _read_file(persona_dir / "outputs.md")
+    outputs_md = _read_template(persona_dir / "outputs.md", str.strip)
     if outputs_md is not None:
-        parts.append(_substitute(outputs_md.strip(), context))
+        parts.append(outputs_md.render(context))
         files_read += 1
 
     # Read prompts.md
-    prompts_md = _read_file(persona_dir / "prompts.md")
+    prompts_md = _read_template(persona_dir / "prompts.md", str.strip)
     if prompts_md is not None:
-        parts.append(_substitute(prompts_md.strip(), context))
+        parts.append(prompts_md.render(context))
         files_read += 1
 
     # SPEC-012: member prompts carry their persona-relevant expertise —
@@ -484,7 +463,7 @@ def _compile_persona_section(
             if entry is None:
                 continue
             highlights = _extract_expertise_highlights(
-                _substitute(entry.read_text(encoding="utf-8"), context)
+                load_template(entry).render(context)
             )
             block = [f"### {_display_name_from_id(sel.id)}"]
             if highlights:
@@ -505,6 +484,27 @@ def _compile_persona_section(
     return "\n\n".join(parts)
 
 
+def _compile_member_section(
+    persona_id: str,
+    library_root: Path,
+    index: LibraryIndex,
+    context: dict[str, str],
+    warnings: list[str],
+    spec: CompositionSpec,
+    selected_ids: set[str],
+    name_to_id: dict[str, str],
+    persona_docs: PersonaDocuments | None = None,
+) -> str | None:
+    """Compile a persona section and filter it down to the selected team."""
+    section = _compile_persona_section(
+        persona_id, library_root, index, context, warnings, spec=spec,
+        persona_docs=persona_docs,
+    )
+    if section is None:
+        return None
+    return _filter_persona_references(section, selected_ids, name_to_id)
+
+
 def _compile_expertise_section(
     expertise_id: str,
     library_root: Path,
@@ -528,9 +528,9 @@ def _compile_expertise_section(
     # from ALL their .md files (sorted) so authored content is never silently
     # dropped (SPEC-003). Packs with conventions.md keep entry-only emission
     # to preserve the established token profile.
-    conventions = _read_file(expertise_dir / "conventions.md")
+    conventions = _read_template(expertise_dir / "conventions.md", _conventions_body)
     if conventions is not None:
-        return _substitute(_strip_frontmatter(conventions).strip(), context)
+        return conventions.render(context)
 
     sibling_files = sorted(expertise_dir.glob("*.md"))
     if sibling_files:
@@ -549,6 +549,98 @@ def _compile_expertise_section(
     return None
 
 
+def _persona_section_files(
+    persona_id: str,
+    index: LibraryIndex,
+    spec: CompositionSpec,
+) -> list[tuple[str, Path]]:
+    """Every file ``_compile_persona_section`` reads, as (name, path) pairs.
+
+    The persona's own three files (present or not), then each applicable
+    expertise entry file in spec order, named by expertise id.
+    """
+    persona_dir = Path(index.persona_by_id(persona_id).path)
+    files = [
+        (name, persona_dir / name) for name in ("persona.md", "outputs.md", "prompts.md")
+    ]
+    for sel in sorted(spec.expertise, key=lambda s: (s.order, s.id)):
+        info = index.expertise_by_id(sel.id)
+        if info is None or not _expertise_applies_to(persona_id, info):
+            continue
+        entry = _expertise_entry_file(Path(info.path))
+        if entry is not None:
+            files.append((sel.id, entry))
+    return files
+
+
+def _persona_section_sources(
+    persona_id: str,
+    index: LibraryIndex,
+    spec: CompositionSpec,
+    persona_docs: PersonaDocuments | None = None,
+) -> list[str | bytes | None]:
+    """List every source ``_compile_persona_section`` reads, for a cache key.
+
+    Names alternate with file bytes (None for a missing file).
+    """
+    if persona_docs is None:
+        persona_docs = PersonaDocuments(index)
+    sources: list[str | bytes | None] = []
+    for name, path in _persona_section_files(persona_id, index, spec):
+        if name == "persona.md":
+            data = persona_docs.get(persona_id).data
+        else:
+            data = read_source(path)
+        sources += [name, data]
+    return sources
+
+
+def _expertise_section_files(info: ExpertiseInfo) -> list[Path]:
+    """Every file ``_compile_expertise_section`` reads."""
+    expertise_dir = Path(info.path)
+    conventions = expertise_dir / "conventions.md"
+    return [conventions] if conventions.is_file() else sorted(expertise_dir.glob("*.md"))
+
+
+def _expertise_section_sources(info: ExpertiseInfo) -> list[str | bytes | None]:
+    """List every source ``_compile_expertise_section`` reads, for a cache key."""
+    sources: list[str | bytes | None] = []
+    for path in _expertise_section_files(info):
+        sources += [path.name, read_source(path)]
+    return sources
+
+
+def _cached_section(
+    cache: CompileCache,
+    key: str | None,
+    warnings: list[str],
+    compile_section: Callable[[list[str]], str | None],
+) -> str | None:
+    """Return a compiled section body from *cache*, compiling it on a miss.
+
+    The warnings raised while compiling are stored with the body and
+    replayed into *warnings* on a hit. A None *key* bypasses the cache.
+    """
+    if key is not None:
+        entry = cache.get(key)
+        if entry is not None:
+            warnings.extend(entry.get("warnings", []))
+            return entry.get("body")
+    section_warnings: list[str] = []
+    body = compile_section(section_warnings)
+    warnings.extend(section_warnings)
+    if key is not None:
+        cache.put(key, {"body": body, "warnings": section_warnings})
+    return body
+
+
+def _check_placeholders(path: Path, text: str, unresolved: dict[Path, list[str]]) -> None:
+    """Record the placeholders left in *text*, about to be written to *path*."""
+    found = unresolved_placeholders(text)
+    if found:
+        unresolved[path] = found
+
+
 def _extract_first_sentence(text: str) -> str:
     """Extract the first meaningful sentence from markdown text."""
     for line in text.strip().splitlines():
@@ -876,12 +968,15 @@ def compile_agnostic_outputs(
     library_index: LibraryIndex,
     library_root: str | Path,
     output_dir: str | Path,
+    cache_dir: str | Path | None = None,
+    writer: OutputWriter | None = None,
+    persona_docs: PersonaDocuments | None = None,
 ) -> AgnosticCompileResult:
     """Compile the harness-agnostic outputs of the compile stage.
 
     Writes the full persona prompts to ``ai/generated/members/`` and the
-    expertise conventions to ``ai/generated/expertise/``, then checks the
-    generated tree for unresolved placeholders. These files are consumed by
+    expertise conventions to ``ai/generated/expertise/``, checking each
+    file's text for unresolved placeholders before it is written. These files are consumed by
     any harness (IMP-08) — nothing Claude-specific is emitted here.
 
     Args:
@@ -889,6 +984,15 @@ def compile_agnostic_outputs(
         library_index: Index of available library components.
         library_root: Path to the root of the library directory.
         output_dir: Root directory for the generated project.
+        cache_dir: Directory for Foundry's persistent caches. When set,
+            finished member and expertise bodies are reused from the
+            content-addressed compile cache (``compile_cache``) and the
+            StageResult carries the hit/miss counts. ``None`` compiles
+            every section.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
+        persona_docs: The run's parsed persona.md files, shared with the
+            agent writer; built here when omitted.
 
     Returns:
         An AgnosticCompileResult with the StageResult plus the persona
@@ -897,8 +1001,15 @@ def compile_agnostic_outputs(
     """
     root = Path(output_dir)
     lib_root = Path(library_root)
+    if writer is None:
+        writer = DirectoryWriter(root)
     wrote: list[str] = []
     warnings: list[str] = []
+    cache = CompileCache(cache_dir)
+    sources = SourceMap(root, lib_root)
+    unresolved: dict[Path, list[str]] = {}
+    if persona_docs is None:
+        persona_docs = PersonaDocuments(library_index)
 
     # Determine which expertise will actually be emitted so persona templates
     # don't substitute {{ expertise | join(...) }} with missing-source IDs.
@@ -906,41 +1017,59 @@ def compile_agnostic_outputs(
     context = _build_context(spec, emitted_expertise_ids)
 
     # Build persona name map and selected IDs for reference filtering
-    name_to_id = _build_persona_name_map(library_index)
+    name_to_id = _persona_aliases(library_index, persona_docs)
     selected_ids = {ps.id for ps in spec.team.personas}
 
     # --- Compile and write full persona files to ai/generated/members/ ---
     persona_descriptions: list[tuple[str, str, str]] = []
     if spec.team.personas:
         members_dir = root / "ai" / "generated" / "members"
-        members_dir.mkdir(parents=True, exist_ok=True)
+        writer.mkdir(members_dir)
 
         for persona_sel in spec.team.personas:
             persona_ctx = _build_persona_context(
                 spec, persona_sel, emitted_expertise_ids,
             )
-            persona_section = _compile_persona_section(
-                persona_sel.id, lib_root, library_index, persona_ctx, warnings,
-                spec=spec,
+            key = None
+            if cache.enabled and library_index.persona_by_id(persona_sel.id):
+                key = cache.key(
+                    "member", persona_sel.id, persona_ctx, sorted(selected_ids),
+                    name_to_id,
+                    *_persona_section_sources(
+                        persona_sel.id, library_index, spec, persona_docs,
+                    ),
+                )
+
+            persona_section = _cached_section(
+                cache, key, warnings,
+                lambda section_warnings: _compile_member_section(
+                    persona_sel.id, lib_root, library_index, persona_ctx,
+                    section_warnings, spec, selected_ids, name_to_id,
+                    persona_docs,
+                ),
             )
             if persona_section is not None:
-                persona_section = _filter_persona_references(
-                    persona_section, selected_ids, name_to_id,
-                )
                 # Write full content to separate file. Strip any ``extended/``
                 # tier prefix from the id (ADR-014) so the on-disk filename
                 # stays a flat leaf name.
                 member_path = (
                     members_dir / f"{_persona_dirname(persona_sel.id)}.md"
                 )
-                member_path.write_text(persona_section + "\n", encoding="utf-8")
+                _check_placeholders(member_path, persona_section, unresolved)
+                writer.write_text(member_path, persona_section + "\n")
                 rel = str(member_path.relative_to(root))
                 wrote.append(rel)
+                sources.add(member_path, [
+                    path for _name, path in
+                    _persona_section_files(persona_sel.id, library_index, spec)
+                ])
                 logger.info("Wrote: %s", member_path)
 
                 # Extract one-line description for CLAUDE.md team table
                 desc = _extract_first_sentence(persona_section)
-                display = _persona_display_name(persona_sel.id, library_index)
+                display = _persona_display_name(
+                    persona_sel.id, library_index, persona_docs,
+                )
                 persona_descriptions.append((persona_sel.id, display, desc))
 
     # --- Compile and write full expertise files to ai/generated/expertise/ ---
@@ -951,33 +1080,51 @@ def compile_agnostic_outputs(
     sorted_expertise = sorted(spec.expertise, key=lambda s: (s.order, s.id))
     if sorted_expertise:
         expertise_dir = root / "ai" / "generated" / "expertise"
-        expertise_dir.mkdir(parents=True, exist_ok=True)
+        writer.mkdir(expertise_dir)
 
         for expertise_sel in sorted_expertise:
-            expertise_section = _compile_expertise_section(
-                expertise_sel.id, lib_root, library_index, context, warnings,
+            info = library_index.expertise_by_id(expertise_sel.id)
+            key = None
+            if cache.enabled and info is not None:
+                key = cache.key(
+                    "expertise", expertise_sel.id, context,
+                    *_expertise_section_sources(info),
+                )
+            expertise_section = _cached_section(
+                cache, key, warnings,
+                lambda section_warnings: _compile_expertise_section(
+                    expertise_sel.id, lib_root, library_index, context,
+                    section_warnings,
+                ),
             )
             if expertise_section is not None:
                 exp_path = expertise_dir / f"{expertise_sel.id}.md"
-                exp_path.write_text(expertise_section + "\n", encoding="utf-8")
+                _check_placeholders(exp_path, expertise_section, unresolved)
+                writer.write_text(exp_path, expertise_section + "\n")
                 rel = str(exp_path.relative_to(root))
                 wrote.append(rel)
+                sources.add(exp_path, _expertise_section_files(info))
                 logger.info("Wrote: %s", exp_path)
 
-    # Check for unresolved placeholders in member/expertise files
-    generated_dir = root / "ai" / "generated"
-    for fpath in generated_dir.rglob("*.md") if generated_dir.exists() else []:
-        file_content = fpath.read_text(encoding="utf-8")
-        unresolved = _PLACEHOLDER_RE.findall(file_content)
-        if unresolved:
-            unique = sorted(set(unresolved))
-            rel = str(fpath.relative_to(root))
-            warnings.append(
-                f"Unresolved placeholders in {rel}: {', '.join(unique)}"
-            )
+    # Report unresolved placeholders in the member/expertise files this run
+    # wrote, in path order.
+    for fpath in sorted(unresolved):
+        rel = str(fpath.relative_to(root))
+        warnings.append(
+            f"Unresolved placeholders in {rel}: {', '.join(unresolved[fpath])}"
+        )
+
+    if cache.enabled:
+        stats = cache.stats
+        logger.info(
+            "Compile cache: %d hits, %d misses", stats.hits, stats.misses,
+        )
 
     return AgnosticCompileResult(
-        result=StageResult(wrote=wrote, warnings=warnings),
+        result=StageResult(
+            wrote=wrote, warnings=warnings, cache=cache.stats,
+            sources=sources.as_dict(),
+        ),
         persona_descriptions=persona_descriptions,
         emitted_expertise_ids=emitted_expertise_ids,
     )
@@ -988,6 +1135,7 @@ def compile_claude_outputs(
     output_dir: str | Path,
     persona_descriptions: list[tuple[str, str, str]],
     emitted_expertise_ids: list[str],
+    writer: OutputWriter | None = None,
 ) -> StageResult:
     """Compile the Claude-specific outputs of the compile stage.
 
@@ -1011,11 +1159,15 @@ def compile_claude_outputs(
             tuples produced by ``compile_agnostic_outputs``.
         emitted_expertise_ids: Expertise IDs whose source was actually
             written, so the generated CLAUDE.md never carries broken links.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
 
     Returns:
         A StageResult listing written files and any warnings.
     """
     root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(root)
     wrote: list[str] = []
     warnings: list[str] = []
     local_profile = spec.generation.harness_profile == "local-model"
@@ -1036,17 +1188,15 @@ def compile_claude_outputs(
         )
 
     claude_md_path = root / "CLAUDE.md"
-    claude_md_path.parent.mkdir(parents=True, exist_ok=True)
-    claude_md_path.write_text(content, encoding="utf-8")
+    writer.mkdir(claude_md_path.parent)
+    writer.write_text(claude_md_path, content)
     wrote.append("CLAUDE.md")
     logger.info("Wrote: %s", claude_md_path)
 
     if local_profile:
         clearances_path = root / "ai" / "team" / "model-clearances.md"
-        clearances_path.parent.mkdir(parents=True, exist_ok=True)
-        clearances_path.write_text(
-            _build_model_clearances_md(spec), encoding="utf-8",
-        )
+        writer.mkdir(clearances_path.parent)
+        writer.write_text(clearances_path, _build_model_clearances_md(spec))
         wrote.append(str(clearances_path.relative_to(root)))
         logger.info("Wrote: %s", clearances_path)
 
@@ -1058,6 +1208,9 @@ def compile_project(
     library_index: LibraryIndex,
     library_root: str | Path,
     output_dir: str | Path,
+    cache_dir: str | Path | None = None,
+    writer: OutputWriter | None = None,
+    persona_docs: PersonaDocuments | None = None,
 ) -> StageResult:
     """Compile CLAUDE.md and persona/expertise files from library components.
 
@@ -1073,27 +1226,47 @@ def compile_project(
         library_index: Index of available library components.
         library_root: Path to the root of the library directory.
         output_dir: Root directory for the generated project.
+        cache_dir: Directory for Foundry's persistent caches; enables the
+            compile cache (see ``compile_agnostic_outputs``).
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
+        persona_docs: The run's parsed persona.md files (see
+            ``compile_agnostic_outputs``).
 
     Returns:
         A StageResult listing written files and any warnings.
     """
     agnostic = compile_agnostic_outputs(
-        spec, library_index, library_root, output_dir,
+        spec, library_index, library_root, output_dir, cache_dir=cache_dir,
+        writer=writer, persona_docs=persona_docs,
     )
     claude = compile_claude_outputs(
         spec,
         output_dir,
         agnostic.persona_descriptions,
         agnostic.emitted_expertise_ids,
+        writer=writer,
     )
 
     wrote = list(agnostic.result.wrote) + list(claude.wrote)
     warnings = list(agnostic.result.warnings) + list(claude.warnings)
 
+    # CLAUDE.md's team table quotes each compiled member section.
+    sources = dict(agnostic.result.sources or {})
+    member_sources = {
+        src for out, srcs in sources.items()
+        if out.startswith("ai/generated/members/") for src in srcs
+    }
+    if member_sources:
+        sources["CLAUDE.md"] = sorted(member_sources)
+
     logger.info(
         "Compile complete: %d files written, %d warnings",
         len(wrote),
         len(warnings),
     )
 
-    return StageResult(wrote=wrote, warnings=warnings)
+    return StageResult(
+        wrote=wrote, warnings=warnings, cache=agnostic.result.cache,
+        sources=sources or None,
+    )
@@ -7,11 +7,16 @@ from datetime import datetime
 from pathlib import Path
 
 from foundry_app.core.models import OverlayPlan, StageResult
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
 
 logger = logging.getLogger(__name__)
 
 
-def write_diff_report(plan: OverlayPlan, output_dir: str | Path) -> StageResult:
+def write_diff_report(
+    plan: OverlayPlan,
+    output_dir: str | Path,
+    writer: OutputWriter | None = None,
+) -> StageResult:
     """Generate a human-readable ``diff-report.md`` summarising overlay changes.
 
     The report groups file actions by type (creates, updates, deletes, skips)
@@ -20,11 +25,15 @@ def write_diff_report(plan: OverlayPlan, output_dir: str | Path) -> StageResult:
     Args:
         plan: The overlay plan computed by the generator.
         output_dir: Root directory of the generated project.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
 
     Returns:
         A StageResult listing the report file and any warnings.
     """
     root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(root)
     wrote: list[str] = []
     warnings: list[str] = []
 
@@ -83,7 +92,7 @@ def write_diff_report(plan: OverlayPlan, output_dir: str | Path) -> StageResult:
         lines.append("")
 
     report_path = root / "diff-report.md"
-    report_path.write_text("\n".join(lines), encoding="utf-8")
+    writer.write_text(report_path, "\n".join(lines))
 
     rel_path = str(report_path.relative_to(root))
     wrote.append(rel_path)
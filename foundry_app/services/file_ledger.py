@@ -0,0 +1,121 @@
+"""Content-hash ledger of the files Foundry last wrote into a project.
+
+Overlay re-generation has to decide, for every generated file, whether the
+target copy differs, and which target files Foundry previously generated
+but no longer does. Without a record that means reading every target file
+and walking the whole target tree, including large user-owned subtrees such
+as ``ai/beans`` histories.
+
+The ledger (``.foundry/file-hashes.json`` in the project) maps each file
+Foundry wrote to its SHA-256, size, and mtime. When a target file's size
+and mtime still match its entry, its recorded hash stands in for reading
+it, and delete candidates come from the ledger instead of a tree walk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Iterable
+from pathlib import Path
+from typing import NamedTuple
+
+logger = logging.getLogger(__name__)
+
+LEDGER_PATH = Path(".foundry") / "file-hashes.json"
+
+# Bump when the ledger layout changes; older ledgers are then ignored.
+_LEDGER_SCHEMA = 1
+
+
+class LedgerEntry(NamedTuple):
+    """What a file looked like right after Foundry wrote it."""
+
+    sha256: str
+    size: int
+    mtime_ns: int
+
+
+def hash_file(path: Path) -> str:
+    """Return the hex SHA-256 of *path*'s contents."""
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def hash_tree(root: Path) -> dict[str, str]:
+    """Hash every regular file under *root*, keyed by relative path.
+
+    Symlinks are skipped, matching the overlay planner. Keys follow sorted
+    path order.
+    """
+    hashes: dict[str, str] = {}
+    for path in sorted(root.rglob("*")):
+        if path.is_symlink() or path.is_dir():
+            continue
+        hashes[str(path.relative_to(root))] = hash_file(path)
+    return hashes
+
+
+def current_hash(path: Path, entry: LedgerEntry | None) -> str:
+    """Return *path*'s hash, trusting *entry* when size and mtime still match."""
+    if entry is not None:
+        st = path.stat()
+        if st.st_size == entry.size and st.st_mtime_ns == entry.mtime_ns:
+            return entry.sha256
+    return hash_file(path)
+
+
+def read_ledger(project_dir: Path) -> dict[str, LedgerEntry] | None:
+    """Load the project's ledger, or None when it is missing or unreadable."""
+    path = Path(project_dir) / LEDGER_PATH
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or data.get("schema") != _LEDGER_SCHEMA:
+        return None
+    try:
+        return {rel: LedgerEntry(*entry) for rel, entry in data["files"].items()}
+    except (KeyError, TypeError, AttributeError):
+        return None
+
+
+def write_ledger(
+    project_dir: Path,
+    files: Iterable[str],
+    hashes: dict[str, str] | None = None,
+    previous: dict[str, LedgerEntry] | None = None,
+) -> None:
+    """Record the current state of *files* (relative paths) in the ledger.
+
+    Hashes found in *hashes* are reused, as are those of *previous* ledger
+    entries whose file size and mtime still match; other files are read
+    and hashed. Paths that are not regular files are skipped. Write
+    failures are logged and only cost the next overlay run a full
+    comparison.
+    """
+    project_dir = Path(project_dir)
+    hashes = hashes or {}
+    previous = previous or {}
+    entries: dict[str, list] = {}
+    for rel in sorted(set(files)):
+        path = project_dir / rel
+        if path.is_symlink() or not path.is_file():
+            continue
+        st = path.stat()
+        sha = hashes.get(rel) or current_hash(path, previous.get(rel))
+        entries[rel] = list(LedgerEntry(sha, st.st_size, st.st_mtime_ns))
+
+    ledger_path = project_dir / LEDGER_PATH
+    try:
+        ledger_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=ledger_path.name, suffix=".tmp", dir=ledger_path.parent,
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump({"schema": _LEDGER_SCHEMA, "files": entries}, fh, indent=0)
+        os.replace(tmp_name, ledger_path)
+    except OSError as exc:
+        logger.warning("Cannot write file ledger %s: %s", ledger_path, exc)
@@ -7,8 +7,10 @@ import shutil
 import subprocess
 import tempfile
 from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import datetime
 from pathlib import Path
+from typing import NamedTuple
 
 from foundry_app.core.models import (
     CompositionSpec,
@@ -16,6 +18,7 @@ from foundry_app.core.models import (
     FileActionType,
     GenerationManifest,
     LibraryIndex,
+    LinkMode,
     OverlayPlan,
     PersonaInfo,
     PersonaSelection,
@@ -27,13 +30,26 @@ from foundry_app.core.models import (
 )
 from foundry_app.services.agent_writer import write_agents
 from foundry_app.services.asset_copier import copy_assets
+from foundry_app.services.asset_links import ASSET_STORE_DIRNAME, AssetLinker
 from foundry_app.services.compiler import compile_project
 from foundry_app.services.diff_reporter import write_diff_report
+from foundry_app.services.file_ledger import (
+    LedgerEntry,
+    current_hash,
+    hash_tree,
+    read_ledger,
+    write_ledger,
+)
+from foundry_app.services.library_cache import load_library_index
 from foundry_app.services.library_indexer import build_library_index
 from foundry_app.services.mcp_writer import write_mcp_config
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter, VirtualTree
+from foundry_app.services.persona_documents import PersonaDocuments
+from foundry_app.services.run_fingerprint import input_fingerprint, up_to_date_manifest
 from foundry_app.services.safety_writer import write_permissions, write_safety
 from foundry_app.services.scaffold import scaffold_project
 from foundry_app.services.seeder import seed_tasks
+from foundry_app.services.stage_metrics import measure_stage
 from foundry_app.services.subtree_setup import setup_subtree
 from foundry_app.services.validator import (
     _apply_strictness,
@@ -43,7 +59,8 @@ from foundry_app.services.validator import (
 
 logger = logging.getLogger(__name__)
 
-# Callback type: (stage_key, status, file_count) — status is "running" or "done"
+# Callback type: (stage_key, status, file_count) — status is "running", "done",
+# or "skipped"
 StageCallback = Callable[[str, str, int], None]
 
 
@@ -192,20 +209,44 @@ def _run_contract_graph_check(
     return demoted, stage
 
 
-def _compare_trees(source: Path, target: Path) -> OverlayPlan:
+def _compare_trees(
+    source: Path,
+    target: Path,
+    ledger: dict[str, LedgerEntry] | None = None,
+    source_hashes: dict[str, str] | None = None,
+) -> OverlayPlan:
     """Compare a freshly-generated tree against an existing target directory.
 
+    *ledger* is the target's file ledger (``file_ledger.read_ledger``). With
+    it, a target file whose size and mtime match its entry is not read, and
+    only files the ledger records are delete candidates — the rest of the
+    target tree (user-owned content) is never walked. Without a ledger every
+    target file is compared and any target file missing from *source* is a
+    delete. *source_hashes* (from ``hash_tree(source)``) avoids re-hashing
+    a source tree the caller already hashed.
+
     Returns an OverlayPlan describing what actions would be taken.
     """
+    if source_hashes is None:
+        source_hashes = hash_tree(source)
+    return _plan_overlay(source_hashes, target, ledger)
+
+
+def _plan_overlay(
+    source_hashes: dict[str, str],
+    target: Path,
+    ledger: dict[str, LedgerEntry] | None = None,
+) -> OverlayPlan:
+    """Plan an overlay of generated files, given as relative path -> SHA-256.
+
+    The comparison behind ``_compare_trees``; streamed overlay generation
+    calls it with the hashes of the files a ``VirtualTree`` collected.
+    """
     actions: list[FileAction] = []
+    entries = ledger or {}
 
-    # Walk the source tree to find creates and updates
-    for src_file in sorted(source.rglob("*")):
-        if src_file.is_symlink():
-            continue
-        if src_file.is_dir():
-            continue
-        rel = str(src_file.relative_to(source))
+    # Creates and updates: every generated file
+    for rel, src_hash in source_hashes.items():
         tgt_file = target / rel
 
         if not tgt_file.exists():
@@ -214,32 +255,40 @@ def _compare_trees(source: Path, target: Path) -> OverlayPlan:
                 action=FileActionType.CREATE,
                 reason="New file not present in target",
             ))
+        elif current_hash(tgt_file, entries.get(rel)) != src_hash:
+            actions.append(FileAction(
+                path=rel,
+                action=FileActionType.UPDATE,
+                reason="File content differs",
+            ))
         else:
-            src_content = src_file.read_bytes()
-            tgt_content = tgt_file.read_bytes()
-            if src_content != tgt_content:
-                actions.append(FileAction(
-                    path=rel,
-                    action=FileActionType.UPDATE,
-                    reason="File content differs",
-                ))
-            else:
-                actions.append(FileAction(
-                    path=rel,
-                    action=FileActionType.SKIP,
-                    reason="File unchanged",
-                ))
+            actions.append(FileAction(
+                path=rel,
+                action=FileActionType.SKIP,
+                reason="File unchanged",
+            ))
 
-    # Walk the target tree to find deletes (files in target but not in source)
-    if target.exists():
+    # Deletes: previously generated files the new generation no longer has
+    if ledger is not None:
+        for rel in sorted(ledger):
+            tgt_file = target / rel
+            if rel in source_hashes or tgt_file.is_symlink() or not tgt_file.is_file():
+                continue
+            actions.append(FileAction(
+                path=rel,
+                action=FileActionType.DELETE,
+                reason="Previously generated file not in new generation",
+            ))
+    elif target.exists():
+        # No ledger (project generated before ledgers existed): any target
+        # file missing from the new generation is a delete.
         for tgt_file in sorted(target.rglob("*")):
             if tgt_file.is_symlink():
                 continue
             if tgt_file.is_dir():
                 continue
             rel = str(tgt_file.relative_to(target))
-            src_file = source / rel
-            if not src_file.exists():
+            if rel not in source_hashes:
                 actions.append(FileAction(
                     path=rel,
                     action=FileActionType.DELETE,
@@ -285,6 +334,162 @@ def _apply_overlay_plan(plan: OverlayPlan, source: Path, target: Path) -> StageR
 # ---------------------------------------------------------------------------
 
 
+# ---------------------------------------------------------------------------
+# Stage graph
+# ---------------------------------------------------------------------------
+
+# Default thread count for running independent pipeline stages concurrently.
+DEFAULT_STAGE_WORKERS = 4
+
+# Output paths (relative to the project root, POSIX) the asset copier owns.
+# ``claude/settings`` lands directly in ``.claude/``, so its two files are
+# named individually to keep ``.claude/agents`` independent of the copier.
+_COPY_ASSETS_WRITES = (
+    ".claude/commands",
+    ".claude/skills",
+    ".claude/hooks",
+    ".claude/settings.json",
+    ".claude/settings.local.json",
+    "ai/beans",
+    "ai/context",
+    "ai/outputs",
+)
+
+
+class _Stage(NamedTuple):
+    """One pipeline stage and the output paths it touches.
+
+    ``reads`` and ``writes`` are paths relative to the project root; a
+    directory covers everything beneath it and ``""`` means the whole tree.
+    A stage waits for every earlier stage whose writes overlap its reads or
+    writes (or whose reads overlap its writes). ``func=None`` marks a stage
+    disabled by the composition — it only reports ``skipped``.
+    """
+
+    key: str
+    func: Callable[..., StageResult] | None
+    args: tuple = ()
+    kwargs: dict | None = None
+    reads: tuple[str, ...] = ()
+    writes: tuple[str, ...] = ()
+
+
+def _paths_overlap(a: str, b: str) -> bool:
+    if not a or not b or a == b:
+        return True
+    return a.startswith(b + "/") or b.startswith(a + "/")
+
+
+def _stages_conflict(earlier: _Stage, later: _Stage) -> bool:
+    """True when *later* must wait for *earlier* to finish."""
+    if earlier.func is None or later.func is None:
+        return False
+    return any(
+        _paths_overlap(w, p)
+        for w in earlier.writes for p in later.reads + later.writes
+    ) or any(
+        _paths_overlap(w, p) for w in later.writes for p in earlier.reads
+    )
+
+
+def _stage_dependencies(stages: list[_Stage]) -> dict[str, set[str]]:
+    """Map each stage key to the keys of the earlier stages it must follow."""
+    return {
+        stage.key: {
+            prev.key for prev in stages[:i] if _stages_conflict(prev, stage)
+        }
+        for i, stage in enumerate(stages)
+    }
+
+
+def _pipeline_stages(
+    spec: CompositionSpec,
+    library: LibraryIndex,
+    library_root: Path,
+    output_dir: Path,
+    overlay_plan: OverlayPlan | None,
+    claude_kit_root: Path | None,
+    cache_dir: Path | None = None,
+    writer: OutputWriter | None = None,
+) -> list[_Stage]:
+    """Declare the pipeline stages in their canonical (serial) order.
+
+    A *writer* is handed to every stage; without one, stages write to disk.
+    The compile and agent-writer stages share one ``PersonaDocuments``, so
+    each persona.md is read once per run.
+    """
+    out = {"writer": writer} if writer is not None else {}
+    persona_docs = PersonaDocuments(library)
+    stages = [
+        # Scaffold creates the tree everything else writes into.
+        _Stage(
+            "scaffold", scaffold_project,
+            (spec, output_dir, library_root, library), out, writes=("",),
+        ),
+        _Stage(
+            "compile", compile_project,
+            (spec, library, library_root, output_dir),
+            {"cache_dir": cache_dir, "persona_docs": persona_docs, **out},
+            writes=(
+                "ai/generated/members", "ai/generated/expertise",
+                "CLAUDE.md", "ai/team/model-clearances.md",
+            ),
+        ),
+        _Stage(
+            "agent_writer", write_agents,
+            (spec, library, library_root, output_dir),
+            {"persona_docs": persona_docs, **out},
+            writes=(".claude/agents",),
+        ),
+        _Stage(
+            "copy_assets", copy_assets,
+            (spec, library, library_root, output_dir),
+            {"claude_kit_root": claude_kit_root, **out},
+            writes=_COPY_ASSETS_WRITES,
+        ),
+    ]
+    if spec.generation.claude_kit_url:
+        # git init / add -A / subtree add touch the whole tree.
+        stages.append(_Stage(
+            "subtree_setup", setup_subtree,
+            (spec.generation.claude_kit_url, output_dir),
+            reads=("",), writes=("",),
+        ))
+    stages.append(_Stage(
+        "mcp_config", write_mcp_config, (spec, library_root, output_dir), out,
+        writes=(".mcp.json",),
+    ))
+    stages.append(
+        _Stage(
+            "seed_tasks", seed_tasks, (spec, output_dir), out,
+            reads=("ai/context/project-charter.md",),
+            writes=("ai/beans",),
+        ) if spec.generation.seed_tasks else _Stage("seed_tasks", None)
+    )
+    stages += [
+        # Safety merges hooks over the settings.json the asset copier wrote
+        # and checks the copied hook scripts exist.
+        _Stage(
+            "safety", write_safety, (spec, output_dir, library), out,
+            reads=(".claude/hooks",),
+            writes=(".claude/settings.json", ".claude/secret-scan.json"),
+        ),
+        _Stage(
+            "permissions", write_permissions, (spec, output_dir, library), out,
+            writes=(".claude/settings.local.json",),
+        ),
+    ]
+    if spec.generation.write_diff_report:
+        plan = overlay_plan if overlay_plan is not None else OverlayPlan()
+        stages.append(_Stage(
+            "diff_report", write_diff_report, (plan, output_dir), out,
+            writes=("diff-report.md",),
+        ))
+    else:
+        stages.append(_Stage("diff_report", None))
+    return stages
+
+
 def _run_pipeline(
     spec: CompositionSpec,
     library: LibraryIndex,
@@ -293,72 +498,119 @@ def _run_pipeline(
     overlay_plan: OverlayPlan | None = None,
     stage_callback: StageCallback | None = None,
     claude_kit_root: Path | None = None,
+    stage_workers: int = 1,
+    cache_dir: Path | None = None,
+    writer: OutputWriter | None = None,
 ) -> dict[str, StageResult]:
-    """Execute all pipeline stages in order and return per-stage results."""
-    stages: dict[str, StageResult] = {}
-
-    def _run_stage(key: str, func, *args, **kwargs) -> None:
-        if stage_callback:
-            stage_callback(key, "running", 0)
-        result = func(*args, **kwargs)
-        stages[key] = result
-        if stage_callback:
-            stage_callback(key, "done", len(result.wrote))
-
-    # Stage 1: Scaffold
-    _run_stage(
-        "scaffold",
-        scaffold_project,
-        spec,
-        output_dir,
-        library_root,
-        library,
-    )
-
-    # Stage 2: Compile member prompts
-    _run_stage("compile", compile_project, spec, library, library_root, output_dir)
-
-    # Stage 3: Write agent files
-    _run_stage("agent_writer", write_agents, spec, library, library_root, output_dir)
-
-    # Stage 4: Copy assets
-    _run_stage(
-        "copy_assets",
-        copy_assets,
-        spec,
-        library,
-        library_root,
-        output_dir,
-        claude_kit_root=claude_kit_root,
+    """Execute all pipeline stages and return per-stage results.
+
+    With ``stage_workers > 1`` stages whose declared outputs don't overlap
+    run concurrently on a thread pool; dependent stages still run in their
+    declared order. Callbacks are always issued from the calling thread,
+    ``running`` before ``done`` for each stage, and the returned dict keeps
+    the declared stage order either way. Every result carries the stage's
+    ``StageMetrics`` (see ``stage_metrics``). *cache_dir* enables the
+    compile stage's section cache; *writer* redirects stage output (see
+    ``output_writer``).
+    """
+    stages = _pipeline_stages(
+        spec, library, library_root, output_dir, overlay_plan, claude_kit_root,
+        cache_dir, writer,
     )
 
-    # Stage 4b: Subtree setup (when claude_kit_url is configured)
-    if spec.generation.claude_kit_url:
-        _run_stage(
-            "subtree_setup", setup_subtree, spec.generation.claude_kit_url, output_dir,
-        )
+    def _notify(key: str, status: str, count: int) -> None:
+        if stage_callback:
+            stage_callback(key, status, count)
 
-    # Stage 5: Write MCP config
-    _run_stage("mcp_config", write_mcp_config, spec, library_root, output_dir)
+    results: dict[str, StageResult] = {}
 
-    # Stage 6: Seed tasks (only if enabled)
-    if spec.generation.seed_tasks:
-        _run_stage("seed_tasks", seed_tasks, spec, output_dir)
-    elif stage_callback:
-        stage_callback("seed_tasks", "skipped", 0)
+    if stage_workers <= 1:
+        for stage in stages:
+            if stage.func is None:
+                _notify(stage.key, "skipped", 0)
+                continue
+            _notify(stage.key, "running", 0)
+            results[stage.key] = measure_stage(
+                stage.func, *stage.args, **(stage.kwargs or {}),
+            )
+            _notify(stage.key, "done", len(results[stage.key].wrote))
+        return results
+
+    deps = _stage_dependencies(stages)
+    pending = list(stages)
+    finished: set[str] = set()
+    running: dict[Future, _Stage] = {}
+    failure: BaseException | None = None
+
+    with ThreadPoolExecutor(
+        max_workers=stage_workers, thread_name_prefix="foundry-stage",
+    ) as pool:
+        while pending or running:
+            if failure is None:
+                for stage in [s for s in pending if deps[s.key] <= finished]:
+                    pending.remove(stage)
+                    if stage.func is None:
+                        _notify(stage.key, "skipped", 0)
+                        finished.add(stage.key)
+                        continue
+                    _notify(stage.key, "running", 0)
+                    future = pool.submit(
+                        measure_stage, stage.func, *stage.args,
+                        **(stage.kwargs or {}),
+                    )
+                    running[future] = stage
+            else:
+                pending.clear()
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: stages.index(running[f])):
+                stage = running.pop(future)
+                try:
+                    results[stage.key] = future.result()
+                except BaseException as exc:  # re-raised once in-flight stages end
+                    failure = failure or exc
+                    continue
+                finished.add(stage.key)
+                _notify(stage.key, "done", len(results[stage.key].wrote))
+
+    if failure is not None:
+        raise failure
+    return {s.key: results[s.key] for s in stages if s.key in results}
+
+
+def validate_composition(
+    composition: CompositionSpec,
+    library: LibraryIndex,
+    strictness: Strictness = Strictness.STANDARD,
+    overlay: bool = False,
+) -> tuple[ValidationResult, StageResult | None]:
+    """Run every check ``generate_project`` makes before writing anything.
 
-    # Stage 7: Write safety config (hooks) + posture-derived permissions
-    _run_stage("safety", write_safety, spec, output_dir, library)
-    _run_stage("permissions", write_permissions, spec, output_dir, library)
+    Applies the default team to *composition* in place, then joins the
+    contract-graph findings with pre-generation validation. Returns the
+    combined ``ValidationResult`` and, in overlay mode, the
+    ``contract_validation`` stage result for the manifest.
+    """
+    # Default team — if the composition supplies no personas, adopt the
+    # core tier from the library (ADR-014).
+    _apply_default_team(composition, library)
 
-    # Stage 8: Diff report (only if enabled)
-    if spec.generation.write_diff_report:
-        plan = overlay_plan if overlay_plan is not None else OverlayPlan()
-        _run_stage("diff_report", write_diff_report, plan, output_dir)
-    elif stage_callback:
-        stage_callback("diff_report", "skipped", 0)
+    # Contract-graph validation (BEAN-274). Runs between default-team and
+    # pre-generation validation so missing-producer findings can join the
+    # same ``ValidationResult`` and ride the existing ``is_valid`` gate. In
+    # overlay mode the same check yields warnings (errors demoted) plus a
+    # stage result the caller attaches to the manifest.
+    contract_messages, contract_stage = _run_contract_graph_check(
+        composition, library, overlay, strictness,
+    )
 
-    return stages
+    validation = run_pre_generation_validation(composition, library, strictness)
+    if contract_messages:
+        validation = ValidationResult(
+            messages=list(validation.messages) + contract_messages,
+        )
+    return validation, contract_stage
 
 
 def generate_project(
@@ -371,6 +623,13 @@ def generate_project(
     force: bool = False,
     stage_callback: StageCallback | None = None,
     claude_kit_root: str | Path | None = None,
+    cache_dir: str | Path | None = None,
+    index_workers: int | None = None,
+    stage_workers: int = DEFAULT_STAGE_WORKERS,
+    library_index: LibraryIndex | None = None,
+    library_version: str | None = None,
+    force_rebuild: bool = False,
+    archive: str | Path | None = None,
 ) -> tuple[GenerationManifest, ValidationResult, OverlayPlan | None]:
     """Orchestrate the full project generation pipeline.
 
@@ -389,6 +648,34 @@ def generate_project(
             mode.  When ``None``, ``copy_assets`` derives a default from the
             foundry repo's bundled ``.claude/shared/`` submodule.  Subtree-mode
             generations ignore this — the subtree itself supplies the kit.
+        cache_dir: Directory for Foundry's persistent caches. When set, the
+            library is indexed through the on-disk index cache so unchanged
+            personas, expertise, and hook packs are not re-parsed, and the
+            compile stage reuses member and expertise bodies whose sources
+            are unchanged. ``None`` indexes and compiles from scratch.
+        index_workers: Thread-pool size for parsing library entries while
+            indexing. ``None`` or ``1`` indexes serially.
+        stage_workers: Thread count for running independent pipeline stages
+            concurrently (see ``_pipeline_stages``). ``1`` runs every stage
+            serially in declaration order.
+        library_index: A pre-built index of *library_root*. When given, the
+            library is not indexed again (``index_workers`` is ignored and
+            ``cache_dir`` only feeds the compile cache); batch runs share one
+            index across compositions.
+        library_version: The library's git short-hash, when already known.
+            ``None`` runs ``git rev-parse`` in *library_root*.
+        force_rebuild: Run the pipeline even when the output is up to date.
+            Otherwise, when ``manifest.json`` records this run's input
+            fingerprint (see ``run_fingerprint``) and the generated files are
+            untouched, nothing is written and the returned manifest has
+            ``up_to_date`` set and no stages.
+        archive: Write the generated project to this zip file instead of
+            the output directory. The pipeline runs into a ``VirtualTree``
+            addressed as the output directory, which is not touched; the
+            archive holds the tree under the output folder's name, with
+            ``manifest.json`` when enabled. Cannot be combined with
+            *overlay* or a ``claude_kit_url`` (subtree setup needs a real
+            working tree).
 
     Returns:
         A tuple of:
@@ -396,8 +683,13 @@ def generate_project(
         - ValidationResult: pre-generation validation findings
         - OverlayPlan | None: overlay plan (only when overlay=True)
     """
+    if archive is not None and (overlay or composition.generation.claude_kit_url):
+        raise ValueError(
+            "An archive cannot be generated in overlay mode or with a claude_kit_url."
+        )
     library_path = Path(library_root)
     kit_root = Path(claude_kit_root) if claude_kit_root is not None else None
+    cache_path = Path(cache_dir) if cache_dir is not None else None
 
     # Resolve output directory
     if output_root is not None:
@@ -421,36 +713,43 @@ def generate_project(
             f"({containment_base}). Refusing to generate."
         )
 
-    # Step 1: Index the library
-    library = build_library_index(library_path)
+    # Step 0: Input fingerprint. When the last run's manifest records the
+    # same fingerprint and the files it wrote are untouched, the pipeline
+    # would rewrite identical bytes, so it is skipped once validation has
+    # passed. Subtree generations pull a kit we cannot fingerprint.
+    fingerprint = ""
+    previous: GenerationManifest | None = None
+    if composition.generation.write_manifest:
+        fingerprint = input_fingerprint(composition, library_path, strictness, kit_root)
+        if not force_rebuild and not composition.generation.claude_kit_url and archive is None:
+            previous = up_to_date_manifest(output_dir, fingerprint)
 
-    # Step 1a: Default team — if the composition supplies no personas,
-    # adopt the core tier from the library (ADR-014).
-    _apply_default_team(composition, library)
+    # Step 1: Index the library
+    if library_index is not None:
+        library = library_index
+    elif cache_dir is not None:
+        library = load_library_index(library_path, cache_dir, index_workers)
+    else:
+        library = build_library_index(library_path, index_workers)
 
-    # Step 1b: Contract-graph validation (BEAN-274). Runs between default-
-    # team and pre-generation validation so missing-producer findings can
-    # join the same ``ValidationResult`` and ride the existing ``is_valid``
-    # gate. In overlay mode the same check yields warnings (errors demoted)
-    # plus a stage result we attach to the manifest below.
-    contract_messages, contract_stage = _run_contract_graph_check(
-        composition, library, overlay, strictness,
+    # Step 2: Validate (default team, contract graph, pre-generation checks)
+    validation, contract_stage = validate_composition(
+        composition, library, strictness, overlay,
     )
 
-    # Step 2: Validate
-    validation = run_pre_generation_validation(composition, library, strictness)
-    if contract_messages:
-        validation = ValidationResult(
-            messages=list(validation.messages) + contract_messages,
-        )
-
     # Build base manifest
     run_id = _make_run_id()
-    lib_version = _get_library_version(library_path)
+    if library_version is not None:
+        lib_version = library_version
+    elif previous is not None:
+        lib_version = previous.library_version
+    else:
+        lib_version = _get_library_version(library_path)
     manifest = GenerationManifest(
         run_id=run_id,
         library_version=lib_version,
         composition_snapshot=composition.model_dump(mode="json"),
+        input_fingerprint=fingerprint,
     )
     if contract_stage is not None:
         manifest.stages["contract_validation"] = contract_stage
@@ -463,35 +762,103 @@ def generate_project(
         )
         return manifest, validation, None
 
+    if previous is not None:
+        manifest.up_to_date = True
+        overlay_plan = None
+        if overlay:
+            overlay_plan = OverlayPlan(
+                actions=[
+                    FileAction(path=rel, action=FileActionType.SKIP)
+                    for rel in read_ledger(output_dir) or {}
+                ],
+                dry_run=dry_run,
+            )
+        logger.info(
+            "Inputs unchanged since run %s — %s is up to date",
+            previous.run_id, output_dir,
+        )
+        return manifest, validation, overlay_plan
+
     # Step 3: Run the pipeline
     overlay_plan: OverlayPlan | None = None
 
+    # Linked assets go into the cache's asset store. Subtree projects commit
+    # their tree to git and archives hold bytes, so both always copy.
+    linker: AssetLinker | None = None
+    link_mode = composition.generation.link_mode
+    if (
+        link_mode is not LinkMode.COPY
+        and not composition.generation.claude_kit_url
+        and archive is None
+    ):
+        store = cache_path / ASSET_STORE_DIRNAME if cache_path is not None else None
+        linker = AssetLinker(link_mode, store)
+
     if overlay:
-        # Two-phase overlay mode
-        with tempfile.TemporaryDirectory(prefix="foundry-gen-") as tmp_dir:
-            tmp_path = Path(tmp_dir)
+        # Two-phase overlay mode. The file ledger is Foundry bookkeeping
+        # like manifest.json, so it follows write_manifest.
+        keep_ledger = composition.generation.write_manifest
+        ledger = read_ledger(output_dir) if keep_ledger else None
+
+        if composition.generation.claude_kit_url:
+            # Subtree setup runs git against a real working tree, so this
+            # path still generates into a temp directory first.
+            with tempfile.TemporaryDirectory(prefix="foundry-gen-") as tmp_dir:
+                tmp_path = Path(tmp_dir)
+
+                # Phase 1: Generate into temp directory
+                stages = _run_pipeline(
+                    composition, library, library_path, tmp_path,
+                    stage_callback=stage_callback,
+                    claude_kit_root=kit_root,
+                    stage_workers=stage_workers,
+                    cache_dir=cache_path,
+                )
+                manifest.stages.update(stages)
+
+                # Phase 2: Compare against target
+                source_hashes = hash_tree(tmp_path)
+                overlay_plan = _compare_trees(
+                    tmp_path, output_dir, ledger=ledger, source_hashes=source_hashes,
+                )
+                overlay_plan.dry_run = dry_run
 
-            # Phase 1: Generate into temp directory
+                # Phase 3: Apply the overlay plan
+                if not dry_run:
+                    manifest.stages["overlay_apply"] = measure_stage(
+                        _apply_overlay_plan, overlay_plan, tmp_path, output_dir,
+                    )
+        else:
+            # Phase 1: Generate into memory, addressed as the target tree
+            writer = VirtualTree(output_dir, linker)
             stages = _run_pipeline(
-                composition, library, library_path, tmp_path,
+                composition, library, library_path, output_dir,
                 stage_callback=stage_callback,
                 claude_kit_root=kit_root,
+                stage_workers=stage_workers,
+                cache_dir=cache_path,
+                writer=writer,
             )
             manifest.stages.update(stages)
 
             # Phase 2: Compare against target
-            overlay_plan = _compare_trees(tmp_path, output_dir)
+            source_hashes = writer.hashes()
+            overlay_plan = _plan_overlay(source_hashes, output_dir, ledger)
             overlay_plan.dry_run = dry_run
 
+            # Phase 3: Write only the creates and updates
             if not dry_run:
-                # Phase 3: Apply the overlay plan
-                apply_result = _apply_overlay_plan(overlay_plan, tmp_path, output_dir)
-                manifest.stages["overlay_apply"] = apply_result
+                manifest.stages["overlay_apply"] = measure_stage(
+                    writer.apply, overlay_plan,
+                )
+
+        if keep_ledger and not dry_run:
+            write_ledger(output_dir, source_hashes, source_hashes)
 
         # Write diff report to output dir (needs overlay plan)
         if composition.generation.write_diff_report and not dry_run:
-            manifest.stages["diff_report"] = write_diff_report(
-                overlay_plan, output_dir,
+            manifest.stages["diff_report"] = measure_stage(
+                write_diff_report, overlay_plan, output_dir,
             )
 
         logger.info(
@@ -501,17 +868,55 @@ def generate_project(
             len(overlay_plan.deletes),
             len(overlay_plan.skips),
         )
+    elif archive is not None:
+        # Generate into memory, then pack the tree; output_dir is untouched.
+        tree = VirtualTree(output_dir)
+        stages = _run_pipeline(
+            composition, library, library_path, output_dir,
+            stage_callback=stage_callback,
+            claude_kit_root=kit_root,
+            stage_workers=stage_workers,
+            cache_dir=cache_path,
+            writer=tree,
+        )
+        manifest.stages.update(stages)
+        if composition.generation.write_manifest:
+            from foundry_app.io.composition_io import dump_manifest
+
+            tree.write_text(output_dir / "manifest.json", dump_manifest(manifest))
+        manifest.stages["archive"] = measure_stage(tree.write_zip, archive)
+        logger.info("Wrote archive: %s", archive)
     else:
         # Standard mode: write directly to output
         stages = _run_pipeline(
             composition, library, library_path, output_dir,
             stage_callback=stage_callback,
             claude_kit_root=kit_root,
+            stage_workers=stage_workers,
+            cache_dir=cache_path,
+            writer=DirectoryWriter(output_dir, linker) if linker is not None else None,
         )
         manifest.stages.update(stages)
+        if composition.generation.write_manifest:
+            # Stages leave files that already exist in place, so ``wrote``
+            # misses most of a re-run's output. Record the identical copies
+            # the copiers skipped (they are in ``sources``) and keep every
+            # file the previous ledger tracked: standard mode never deletes,
+            # so those are still Foundry's for a later overlay to remove.
+            previous = read_ledger(output_dir) or {}
+            produced = set(previous)
+            for stage in stages.values():
+                produced.update(stage.wrote)
+                produced.update(stage.sources or {})
+            write_ledger(output_dir, produced, previous=previous)
+
+    if linker is not None:
+        manifest.link_mode = linker.mode
+        if linker.fallback and "copy_assets" in manifest.stages:
+            manifest.stages["copy_assets"].warnings.append(linker.fallback)
 
     # Write manifest file if enabled
-    if composition.generation.write_manifest and not dry_run:
+    if composition.generation.write_manifest and not dry_run and archive is None:
         _write_manifest_file(manifest, output_dir)
 
     logger.info(
@@ -0,0 +1,281 @@
+"""Persistent library index cache — re-parses only library entries that changed.
+
+``build_library_index`` reads and parses every persona, expertise pack, and
+hook pack on each call. This module keeps the parsed entries on disk next to
+a stat fingerprint (file names, mtimes, sizes) of the files each entry was
+parsed from. ``load_library_index`` revalidates the cache with a stat-only
+walk and re-parses just the entries whose fingerprint moved; everything else
+is restored from the cache file.
+
+The artifact-type registry feeds persona contract validation, so a change to
+``contracts/artifact-types.yml`` (or a Foundry upgrade) discards the whole
+cache. Cross-entry checks (expertise ``applies_to`` validation, dangling
+producers) always re-run against the assembled index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TypeVar
+
+from pydantic import BaseModel
+
+from foundry_app import __version__
+from foundry_app.core.models import (
+    ArtifactTypeInfo,
+    ExpertiseInfo,
+    HookPackInfo,
+    LibraryIndex,
+    PersonaInfo,
+)
+from foundry_app.services.library_indexer import (
+    _assemble_index,
+    _expertise_entries,
+    _hook_pack_entries,
+    _index_entries,
+    _index_expertise,
+    _index_hook_pack,
+    _index_persona,
+    _load_artifact_type_registry,
+    _persona_entries,
+    _scan_pool,
+)
+
+logger = logging.getLogger(__name__)
+
+# Bump when the cache file layout or the parsed entry shape changes.
+_CACHE_SCHEMA = 2
+
+Fingerprint = list[list]
+_Info = TypeVar("_Info", bound=BaseModel)
+
+
+def default_cache_dir() -> Path:
+    """Return the directory for Foundry's persistent caches.
+
+    ``FOUNDRY_CACHE_DIR`` wins; otherwise ``$XDG_CACHE_HOME/foundry`` or
+    ``~/.cache/foundry``.
+    """
+    override = os.environ.get("FOUNDRY_CACHE_DIR")
+    if override:
+        return Path(override)
+    xdg = os.environ.get("XDG_CACHE_HOME")
+    base = Path(xdg) if xdg else Path.home() / ".cache"
+    return base / "foundry"
+
+
+def _cache_file(cache_dir: Path, root: Path) -> Path:
+    """One cache file per library root, named by a hash of the resolved path."""
+    digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"library-index-{digest}.json"
+
+
+def _stat_entry(path: Path, name: str) -> list:
+    try:
+        st = path.stat()
+    except OSError:
+        return [name, None, None]
+    return [name, st.st_mtime_ns, st.st_size]
+
+
+def _dir_fingerprint(directory: Path, subdirs: tuple[str, ...] = ()) -> Fingerprint:
+    """Fingerprint the regular files directly inside *directory*.
+
+    Files inside the named *subdirs* are included with a ``<subdir>/`` prefix
+    (personas list their ``templates/`` contents).
+    """
+    fingerprint: Fingerprint = []
+    prefixes = [("", directory)] + [(f"{s}/", directory / s) for s in subdirs]
+    for prefix, folder in prefixes:
+        try:
+            with os.scandir(folder) as it:
+                files = sorted(
+                    (e for e in it if e.is_file()), key=lambda e: e.name,
+                )
+                for e in files:
+                    st = e.stat()
+                    fingerprint.append(
+                        [prefix + e.name, st.st_mtime_ns, st.st_size],
+                    )
+        except OSError:
+            continue
+    return fingerprint
+
+
+def library_fingerprint(library_root: str | Path) -> str:
+    """Return a digest of every file's path, mtime and size under *library_root*.
+
+    A stat-only walk: cheap enough to run before each request in a
+    long-lived process, and it moves whenever any library file is added,
+    removed, or rewritten — including files the index does not parse
+    (templates, the MCP registry).
+    """
+    root = Path(library_root)
+    digest = hashlib.sha256()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        rel_dir = Path(dirpath).relative_to(root).as_posix()
+        for name in sorted(filenames):
+            try:
+                st = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            digest.update(
+                f"{rel_dir}/{name}\0{st.st_mtime_ns}\0{st.st_size}\n".encode(),
+            )
+    return digest.hexdigest()
+
+
+def _read_cache(path: Path, root: Path, registry_fp: list) -> dict | None:
+    """Load the cache file, or None when it is missing, corrupt, or stale."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    if (
+        data.get("schema") != _CACHE_SCHEMA
+        or data.get("foundry_version") != __version__
+        or data.get("library_root") != str(root)
+        or data.get("registry") != registry_fp
+    ):
+        return None
+    return data
+
+
+def _write_cache(path: Path, data: dict) -> None:
+    """Write the cache atomically; failures only cost the next run a re-parse."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(
+            prefix=path.name, suffix=".tmp", dir=path.parent,
+        )
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp_name, path)
+    except OSError as exc:
+        logger.warning("Cannot write library index cache %s: %s", path, exc)
+
+
+def _restore_section(
+    root: Path,
+    cached_section: dict[str, dict],
+    entries: list,
+    fingerprint_of: Callable[[Path], Fingerprint],
+    parse: Callable,
+    model: type[_Info],
+    pool: ThreadPoolExecutor | None,
+) -> tuple[list[_Info], dict[str, dict], int]:
+    """Restore unchanged entries from *cached_section* and parse the rest.
+
+    *entries* are what the indexer's directory walkers return (paths, or
+    ``(tier, path)`` pairs for personas). Returns the infos in entry order,
+    the refreshed cache section, and how many entries were parsed.
+    """
+    keyed: list[tuple[str, Fingerprint, dict | None]] = []
+    misses: list = []
+    for item in entries:
+        entry = item[1] if isinstance(item, tuple) else item
+        key = entry.relative_to(root).as_posix()
+        fingerprint = fingerprint_of(entry)
+        hit = cached_section.get(key)
+        if hit is None or hit.get("fingerprint") != fingerprint:
+            hit = None
+            misses.append(item)
+        keyed.append((key, fingerprint, hit))
+
+    fresh = iter(_index_entries(parse, misses, pool))
+    infos: list[_Info] = []
+    section: dict[str, dict] = {}
+    for key, fingerprint, hit in keyed:
+        info = model.model_validate(hit["info"]) if hit else next(fresh)
+        infos.append(info)
+        section[key] = {
+            "fingerprint": fingerprint,
+            "info": hit["info"] if hit else info.model_dump(mode="json"),
+        }
+    return infos, section, len(misses)
+
+
+def load_library_index(
+    library_root: str | Path,
+    cache_dir: str | Path,
+    workers: int | None = None,
+) -> LibraryIndex:
+    """Return the LibraryIndex for *library_root*, reusing cached entries.
+
+    Produces the same index as ``build_library_index``; entries whose files
+    are unchanged since the last call are restored from the cache under
+    *cache_dir* instead of being re-read and re-parsed. Parse warnings for
+    restored entries were logged when they were first parsed. *workers*
+    parses the changed entries on a thread pool, as in ``build_library_index``.
+    """
+    root = Path(library_root).resolve()
+    if not root.is_dir():
+        logger.warning("Library root does not exist: %s", root)
+        return LibraryIndex(library_root=str(root))
+
+    cache_path = _cache_file(Path(cache_dir), root)
+    registry_file = root / "contracts" / "artifact-types.yml"
+    registry_fp = _stat_entry(registry_file, registry_file.name)
+    cached = _read_cache(cache_path, root, registry_fp)
+
+    if cached is not None:
+        artifact_types = [
+            ArtifactTypeInfo.model_validate(a) for a in cached["artifact_types"]
+        ]
+    else:
+        artifact_types = _load_artifact_type_registry(root / "contracts")
+        cached = {}
+    known_artifact_names = {a.name for a in artifact_types}
+
+    with _scan_pool(workers) as pool:
+        personas, persona_section, persona_misses = _restore_section(
+            root, cached.get("personas", {}), _persona_entries(root / "personas"),
+            lambda entry: _dir_fingerprint(entry, ("templates",)),
+            lambda item: _index_persona(item[1], item[0], known_artifact_names),
+            PersonaInfo, pool,
+        )
+        expertise, expertise_section, expertise_misses = _restore_section(
+            root, cached.get("expertise", {}), _expertise_entries(root / "expertise"),
+            _dir_fingerprint, _index_expertise, ExpertiseInfo, pool,
+        )
+        hook_packs, hook_section, hook_misses = _restore_section(
+            root, cached.get("hook_packs", {}),
+            _hook_pack_entries(root / "claude" / "hooks"),
+            lambda entry: [_stat_entry(entry, entry.name)],
+            _index_hook_pack, HookPackInfo, pool,
+        )
+
+    parsed = persona_misses + expertise_misses + hook_misses
+    reused = len(personas) + len(expertise) + len(hook_packs) - parsed
+    logger.info(
+        "Library index cache: %d entries reused, %d re-parsed (%s)",
+        reused, parsed, cache_path,
+    )
+
+    sections = {
+        "personas": persona_section,
+        "expertise": expertise_section,
+        "hook_packs": hook_section,
+    }
+    # Rewrite when anything was re-parsed or entries were added/removed.
+    if parsed or any(set(cached.get(k, {})) != set(v) for k, v in sections.items()):
+        _write_cache(cache_path, {
+            "schema": _CACHE_SCHEMA,
+            "foundry_version": __version__,
+            "library_root": str(root),
+            "registry": registry_fp,
+            "artifact_types": [a.model_dump(mode="json") for a in artifact_types],
+            **sections,
+        })
+
+    return _assemble_index(root, artifact_types, personas, expertise, hook_packs)
@@ -3,7 +3,13 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
+from typing import NamedTuple, TypeVar
 
 import yaml
 
@@ -14,26 +20,101 @@ from foundry_app.core.models import (
     LibraryIndex,
     PersonaInfo,
 )
+from foundry_app.services.persona_names import persona_aliases, persona_title
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+_E = TypeVar("_E")
+
 # Artifact-type registry fields (kebab-case in YAML, snake_case on the model).
 _REGISTRY_REQUIRED_FIELDS = ("name", "description", "format", "required-fields")
 
 
-def _parse_persona_category(path: Path) -> str:
-    """Extract the category from a persona markdown file.
+class _MarkdownMetadata(NamedTuple):
+    """Everything the indexer reads from one markdown file, gathered in one pass.
 
-    Looks for a ``## Category`` heading followed by the category value on the next line.
-    Returns empty string if not found.
+    ``headings`` lists every ``## `` heading as ``(line index, lower-cased
+    stripped text)`` so the section parsers below can slice ``lines``
+    without re-scanning or re-reading the file.
+    """
+
+    lines: list[str]
+    headings: list[tuple[int, str]]
+    frontmatter: dict
+
+    def sections(self, heading: str) -> list[list[str]]:
+        """Return the body lines of every section titled *heading*, in order.
+
+        A body runs from the line after the heading up to the next ``## ``
+        heading (or end of file).
+        """
+        bodies: list[list[str]] = []
+        for pos, (idx, text) in enumerate(self.headings):
+            if text != heading:
+                continue
+            end = (
+                self.headings[pos + 1][0] if pos + 1 < len(self.headings)
+                else len(self.lines)
+            )
+            bodies.append(self.lines[idx + 1:end])
+        return bodies
+
+    def section(self, heading: str) -> list[str]:
+        """Return the body lines of the first section titled *heading*."""
+        bodies = self.sections(heading)
+        return bodies[0] if bodies else []
+
+
+_NO_METADATA = _MarkdownMetadata(lines=[], headings=[], frontmatter={})
+
+
+def _read_markdown_metadata(
+    path: Path | None,
+    *,
+    frontmatter: bool = False,
+) -> _MarkdownMetadata:
+    """Read *path* once and collect its headings (and frontmatter if asked).
+
+    Frontmatter is the YAML block between a leading ``---`` line and the
+    next ``---`` line; it is parsed at most once per file. Unreadable or
+    missing files yield empty metadata.
     """
+    if path is None:
+        return _NO_METADATA
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
+        text = path.read_text(encoding="utf-8")
     except OSError:
-        return ""
+        return _NO_METADATA
+
+    lines = text.splitlines()
+    headings: list[tuple[int, str]] = []
     for i, line in enumerate(lines):
-        if line.strip().lower() == "## category" and i + 1 < len(lines):
-            cat = lines[i + 1].strip()
+        stripped = line.strip().lower()
+        if stripped.startswith("## "):
+            headings.append((i, stripped))
+
+    data: dict = {}
+    if frontmatter and text.startswith("---\n"):
+        end = text.find("\n---\n", 4)
+        if end >= 0:
+            try:
+                parsed = yaml.safe_load(text[4:end])
+                data = parsed if isinstance(parsed, dict) else {}
+            except Exception:
+                logger.warning("Malformed expertise frontmatter in %s", path)
+    return _MarkdownMetadata(lines=lines, headings=headings, frontmatter=data)
+
+
+def _parse_category(meta: _MarkdownMetadata) -> str:
+    """Extract the category from a ``## Category`` heading.
+
+    The category value is the line right after the heading. Returns empty
+    string if not found.
+    """
+    for idx, text in meta.headings:
+        if text == "## category" and idx + 1 < len(meta.lines):
+            cat = meta.lines[idx + 1].strip()
             if cat:
                 return cat
     return ""
@@ -272,22 +353,78 @@ def format_unknown_persona_error(
     )
 
 
-def _scan_personas(
-    personas_dir: Path,
-    known_artifact_names: set[str],
-) -> list[PersonaInfo]:
-    """Scan ``personas/core/`` and ``personas/extended/`` per ADR-014.
+# -- Parallel scanning -------------------------------------------------------
+#
+# With ``workers > 1`` the per-entry parsers run on a thread pool. Records
+# this module logs on a worker thread are held back and replayed on the
+# calling thread in entry order, so the log output matches a serial scan.
 
-    Each subdirectory contributes one ``PersonaInfo`` whose ``id`` is the
-    composition.yml reference form (bare for core, ``extended/<name>`` for
-    extended) and whose ``tier`` is set accordingly. Missing tier dirs are
-    treated as empty (matches the existing missing-``personas/`` behavior).
+_capture = threading.local()
+
+
+class _CaptureFilter(logging.Filter):
+    """Divert records to the current thread's capture buffer, if any."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        records = getattr(_capture, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+
+
+logger.addFilter(_CaptureFilter())
+
+
+def _captured(func: Callable[[_E], _T], item: _E) -> tuple[_T, list[logging.LogRecord]]:
+    """Run ``func(item)`` and return its result with the records it logged."""
+    _capture.records = records = []
+    try:
+        return func(item), records
+    finally:
+        _capture.records = None
+
+
+@contextmanager
+def _scan_pool(workers: int | None) -> Iterator[ThreadPoolExecutor | None]:
+    """Yield a bounded thread pool, or None for a serial scan."""
+    if workers is None or workers <= 1:
+        yield None
+        return
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="library-index",
+    ) as pool:
+        yield pool
+
+
+def _index_entries(
+    parse: Callable[[_E], _T],
+    entries: Sequence[_E],
+    pool: ThreadPoolExecutor | None,
+) -> list[_T]:
+    """Apply *parse* to every entry and return the results in entry order."""
+    if pool is None:
+        return [parse(entry) for entry in entries]
+    results: list[_T] = []
+    for value, records in pool.map(_captured, repeat(parse), entries):
+        for record in records:
+            logger.handle(record)
+        results.append(value)
+    return results
+
+
+def _persona_entries(personas_dir: Path) -> list[tuple[str, Path]]:
+    """List ``(tier, directory)`` pairs under ``personas/core`` and ``personas/extended``.
+
+    Only touches directory entries (no file contents), so the persistent
+    index cache can call it on every revalidation. Missing directories are
+    logged and treated as empty, exactly as ``_scan_personas`` reports them.
     """
     if not personas_dir.is_dir():
         logger.warning("Personas directory not found: %s", personas_dir)
         return []
 
-    personas: list[PersonaInfo] = []
+    entries: list[tuple[str, Path]] = []
     for tier in ("core", "extended"):
         tier_dir = personas_dir / tier
         if not tier_dir.is_dir():
@@ -297,37 +434,64 @@ def _scan_personas(
             )
             continue
         for entry in sorted(tier_dir.iterdir()):
-            if not entry.is_dir():
-                continue
+            if entry.is_dir():
+                entries.append((tier, entry))
+    return entries
 
-            templates: list[str] = []
-            templates_dir = entry / "templates"
-            if templates_dir.is_dir():
-                templates = sorted(
-                    f.name for f in templates_dir.iterdir() if f.is_file()
-                )
 
-            persona_md = entry / "persona.md"
-            produces, consumes = _load_persona_contracts(
-                entry, known_artifact_names,
-            )
-            persona_id = entry.name if tier == "core" else f"extended/{entry.name}"
-            personas.append(
-                PersonaInfo(
-                    id=persona_id,
-                    path=str(entry),
-                    tier=tier,
-                    has_persona_md=persona_md.is_file(),
-                    has_outputs_md=(entry / "outputs.md").is_file(),
-                    has_prompts_md=(entry / "prompts.md").is_file(),
-                    templates=templates,
-                    category=_parse_persona_category(persona_md),
-                    produces=produces,
-                    consumes=consumes,
-                )
-            )
+def _index_persona(
+    entry: Path,
+    tier: str,
+    known_artifact_names: set[str],
+) -> PersonaInfo:
+    """Parse one persona directory into a ``PersonaInfo``."""
+    templates: list[str] = []
+    templates_dir = entry / "templates"
+    if templates_dir.is_dir():
+        templates = sorted(
+            f.name for f in templates_dir.iterdir() if f.is_file()
+        )
 
-    return personas
+    persona_md = entry / "persona.md"
+    meta = _read_markdown_metadata(persona_md)
+    produces, consumes = _load_persona_contracts(
+        entry, known_artifact_names,
+    )
+    persona_id = entry.name if tier == "core" else f"extended/{entry.name}"
+    title = persona_title("\n".join(meta.lines))
+    return PersonaInfo(
+        id=persona_id,
+        path=str(entry),
+        tier=tier,
+        has_persona_md=persona_md.is_file(),
+        has_outputs_md=(entry / "outputs.md").is_file(),
+        has_prompts_md=(entry / "prompts.md").is_file(),
+        templates=templates,
+        category=_parse_category(meta),
+        title=title,
+        aliases=persona_aliases(title, entry.name),
+        produces=produces,
+        consumes=consumes,
+    )
+
+
+def _scan_personas(
+    personas_dir: Path,
+    known_artifact_names: set[str],
+    pool: ThreadPoolExecutor | None = None,
+) -> list[PersonaInfo]:
+    """Scan ``personas/core/`` and ``personas/extended/`` per ADR-014.
+
+    Each subdirectory contributes one ``PersonaInfo`` whose ``id`` is the
+    composition.yml reference form (bare for core, ``extended/<name>`` for
+    extended) and whose ``tier`` is set accordingly. Missing tier dirs are
+    treated as empty (matches the existing missing-``personas/`` behavior).
+    """
+    def parse(item: tuple[str, Path]) -> PersonaInfo:
+        tier, entry = item
+        return _index_persona(entry, tier, known_artifact_names)
+
+    return _index_entries(parse, _persona_entries(personas_dir), pool)
 
 
 def _expertise_entry_file(expertise_dir: Path) -> Path | None:
@@ -339,62 +503,20 @@ def _expertise_entry_file(expertise_dir: Path) -> Path | None:
     return md_files[0] if md_files else None
 
 
-def _parse_expertise_frontmatter(expertise_dir: Path) -> dict:
-    """Parse YAML frontmatter from the pack's entry file (SPEC-019).
-
-    Frontmatter is the canonical metadata source (category, applies_to,
-    last-reviewed); the heading-scrape parsers below remain as fallback for
-    packs that haven't adopted it. Returns {} when absent or malformed.
-    """
-    target = _expertise_entry_file(expertise_dir)
-    if target is None:
-        return {}
-    try:
-        text = target.read_text(encoding="utf-8")
-    except OSError:
-        return {}
-    if not text.startswith("---\n"):
-        return {}
-    end = text.find("\n---\n", 4)
-    if end < 0:
-        return {}
-    try:
-        import yaml
-
-        data = yaml.safe_load(text[4:end])
-        return data if isinstance(data, dict) else {}
-    except Exception:
-        logger.warning("Malformed expertise frontmatter in %s", target)
-        return {}
-
-
-def _parse_expertise_category(expertise_dir: Path) -> str:
-    """Extract the category from an expertise directory's primary markdown file.
+def _parse_expertise_category(meta: _MarkdownMetadata) -> str:
+    """Extract the category from an expertise pack's entry file metadata.
 
     Prefers frontmatter ``category:`` (SPEC-019); falls back to a
     ``## Category`` heading followed by the category value on the next line.
     Returns empty string if not found.
     """
-    fm = _parse_expertise_frontmatter(expertise_dir)
+    fm = meta.frontmatter
     if isinstance(fm.get("category"), str) and fm["category"].strip():
         return fm["category"].strip()
-
-    target = _expertise_entry_file(expertise_dir)
-    if target is None:
-        return ""
-    try:
-        lines = target.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return ""
-    for i, line in enumerate(lines):
-        if line.strip().lower() == "## category" and i + 1 < len(lines):
-            cat = lines[i + 1].strip()
-            if cat:
-                return cat
-    return ""
+    return _parse_category(meta)
 
 
-def _parse_expertise_applies_to(expertise_dir: Path) -> list[str]:
+def _parse_expertise_applies_to(meta: _MarkdownMetadata) -> list[str]:
     """Extract persona IDs from an expertise's ``## Applies To`` section.
 
     Mirrors ``_parse_hook_conflicts``: scans the primary markdown file
@@ -409,31 +531,17 @@ def _parse_expertise_applies_to(expertise_dir: Path) -> list[str]:
     ``compiler._expertise_applies_to``, not here.
 
     Frontmatter ``applies_to:`` (SPEC-019) wins over the heading scrape.
+    Frontmatter is the canonical metadata source (category, applies_to,
+    last-reviewed); the heading scrape remains as fallback for packs that
+    haven't adopted it.
     """
-    fm = _parse_expertise_frontmatter(expertise_dir)
+    fm = meta.frontmatter
     if isinstance(fm.get("applies_to"), list):
         return [str(x).strip("` ") for x in fm["applies_to"] if str(x).strip()]
 
-    target = _expertise_entry_file(expertise_dir)
-    if target is None:
-        return []
-    try:
-        lines = target.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return []
-
     ids: list[str] = []
-    in_section = False
-    for line in lines:
+    for line in meta.section("## applies to"):
         stripped = line.strip()
-        if stripped.lower().startswith("## "):
-            if in_section:
-                # Hit the next heading — stop collecting.
-                break
-            in_section = stripped.lower() == "## applies to"
-            continue
-        if not in_section:
-            continue
         # Markdown horizontal rules (``---``, ``----``, etc.) start with ``-``
         # but aren't list items. Skip lines that are all dashes/asterisks.
         if stripped and set(stripped) <= {"-", "*", " "}:
@@ -455,29 +563,37 @@ def _parse_expertise_applies_to(expertise_dir: Path) -> list[str]:
     return ids
 
 
-def _scan_expertise(expertise_dir: Path) -> list[ExpertiseInfo]:
-    """Scan the expertise/ directory and return ExpertiseInfo for each subdirectory."""
+def _expertise_entries(expertise_dir: Path) -> list[Path]:
+    """List the expertise pack directories, sorted by name."""
     if not expertise_dir.is_dir():
         logger.warning("Expertise directory not found: %s", expertise_dir)
         return []
+    return [entry for entry in sorted(expertise_dir.iterdir()) if entry.is_dir()]
 
-    items: list[ExpertiseInfo] = []
-    for entry in sorted(expertise_dir.iterdir()):
-        if not entry.is_dir():
-            continue
 
-        files = sorted(f.name for f in entry.iterdir() if f.is_file())
-        items.append(
-            ExpertiseInfo(
-                id=entry.name,
-                path=str(entry),
-                files=files,
-                category=_parse_expertise_category(entry),
-                applies_to=_parse_expertise_applies_to(entry),
-            )
-        )
+def _index_expertise(entry: Path) -> ExpertiseInfo:
+    """Parse one expertise directory into an ``ExpertiseInfo``.
 
-    return items
+    ``applies_to`` is returned as declared; unknown persona ids are dropped
+    later by ``_validate_expertise_applies_to`` once the persona set is known.
+    """
+    files = sorted(f.name for f in entry.iterdir() if f.is_file())
+    meta = _read_markdown_metadata(_expertise_entry_file(entry), frontmatter=True)
+    return ExpertiseInfo(
+        id=entry.name,
+        path=str(entry),
+        files=files,
+        category=_parse_expertise_category(meta),
+        applies_to=_parse_expertise_applies_to(meta),
+    )
+
+
+def _scan_expertise(
+    expertise_dir: Path,
+    pool: ThreadPoolExecutor | None = None,
+) -> list[ExpertiseInfo]:
+    """Scan the expertise/ directory and return ExpertiseInfo for each subdirectory."""
+    return _index_entries(_index_expertise, _expertise_entries(expertise_dir), pool)
 
 
 def _validate_expertise_applies_to(
@@ -510,56 +626,31 @@ def _validate_expertise_applies_to(
     return cleaned
 
 
-def _parse_hook_category(path: Path) -> str:
-    """Extract the category from a hook pack markdown file.
-
-    Looks for a ``## Category`` heading followed by the category value on the next line.
-    Returns empty string if not found.
-    """
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return ""
-    for i, line in enumerate(lines):
-        if line.strip().lower() == "## category" and i + 1 < len(lines):
-            cat = lines[i + 1].strip()
-            if cat:
-                return cat
-    return ""
-
-
-def _parse_hook_conflicts(path: Path) -> list[str]:
-    """Extract conflicting pack ids from a ``## Conflicts With`` section.
+def _parse_hook_conflicts(meta: _MarkdownMetadata) -> list[str]:
+    """Extract conflicting pack ids from ``## Conflicts With`` sections.
 
     Each bullet line's first backticked token is taken as a pack id, e.g.:
     ``- `az-limited-ops` — the read-only guard ...`` → ``az-limited-ops``.
     Returns an empty list if the section is missing or malformed.
     """
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return []
     ids: list[str] = []
-    in_section = False
-    for line in lines:
-        stripped = line.strip()
-        if stripped.lower().startswith("## "):
-            in_section = stripped.lower() == "## conflicts with"
-            continue
-        if not in_section:
-            continue
-        if stripped.startswith(("-", "*")):
-            body = stripped[1:].strip()
-            if body.startswith("`"):
-                end = body.find("`", 1)
-                if end > 1:
-                    pack_id = body[1:end].strip()
-                    if pack_id and pack_id not in ids:
-                        ids.append(pack_id)
+    for body_lines in meta.sections("## conflicts with"):
+        for line in body_lines:
+            stripped = line.strip()
+            if stripped.startswith(("-", "*")):
+                body = stripped[1:].strip()
+                if body.startswith("`"):
+                    end = body.find("`", 1)
+                    if end > 1:
+                        pack_id = body[1:end].strip()
+                        if pack_id and pack_id not in ids:
+                            ids.append(pack_id)
     return ids
 
 
-def _parse_hook_posture_compatibility(path: Path) -> dict[str, dict[str, str]]:
+def _parse_hook_posture_compatibility(
+    meta: _MarkdownMetadata,
+) -> dict[str, dict[str, str]]:
     """Extract the ``## Posture Compatibility`` table as structured metadata.
 
     Returns a dict keyed by lower-cased posture name. Each value is a dict
@@ -569,27 +660,12 @@ def _parse_hook_posture_compatibility(path: Path) -> dict[str, dict[str, str]]:
     in backticks (``` `baseline` ```) are accepted. Returns an empty dict if
     the section or a well-formed table is missing.
     """
-    try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except OSError:
-        return {}
-
     result: dict[str, dict[str, str]] = {}
-    in_section = False
     header_seen = False
     separator_seen = False
-    for line in lines:
+    for line in meta.section("## posture compatibility"):
         stripped = line.strip()
-        if stripped.lower().startswith("## "):
-            if in_section:
-                break
-            in_section = stripped.lower() == "## posture compatibility"
-            header_seen = False
-            separator_seen = False
-            continue
-        if not in_section or not stripped:
-            continue
-        if not stripped.startswith("|"):
+        if not stripped or not stripped.startswith("|"):
             continue
         cells = [c.strip() for c in stripped.strip("|").split("|")]
         if not header_seen:
@@ -612,54 +688,53 @@ def _parse_hook_posture_compatibility(path: Path) -> dict[str, dict[str, str]]:
     return result
 
 
-def _scan_hook_packs(hooks_dir: Path) -> list[HookPackInfo]:
-    """Scan the claude/hooks/ directory and return HookPackInfo for each .md file."""
+def _hook_pack_entries(hooks_dir: Path) -> list[Path]:
+    """List the hook pack markdown files, sorted by name."""
     if not hooks_dir.is_dir():
         logger.warning("Hooks directory not found: %s", hooks_dir)
         return []
+    return [
+        entry for entry in sorted(hooks_dir.iterdir())
+        if entry.is_file() and entry.suffix == ".md"
+    ]
+
+
+def _index_hook_pack(entry: Path) -> HookPackInfo:
+    """Parse one hook pack markdown file into a ``HookPackInfo``."""
+    meta = _read_markdown_metadata(entry)
+    return HookPackInfo(
+        id=entry.stem,
+        path=str(entry),
+        files=[entry.name],
+        category=_parse_category(meta),
+        conflicts_with=_parse_hook_conflicts(meta),
+        posture_compatibility=_parse_hook_posture_compatibility(meta),
+    )
 
-    packs: list[HookPackInfo] = []
-    for entry in sorted(hooks_dir.iterdir()):
-        if not entry.is_file() or entry.suffix != ".md":
-            continue
-
-        packs.append(
-            HookPackInfo(
-                id=entry.stem,
-                path=str(entry),
-                files=[entry.name],
-                category=_parse_hook_category(entry),
-                conflicts_with=_parse_hook_conflicts(entry),
-                posture_compatibility=_parse_hook_posture_compatibility(entry),
-            )
-        )
-
-    return packs
 
+def _scan_hook_packs(
+    hooks_dir: Path,
+    pool: ThreadPoolExecutor | None = None,
+) -> list[HookPackInfo]:
+    """Scan the claude/hooks/ directory and return HookPackInfo for each .md file."""
+    return _index_entries(_index_hook_pack, _hook_pack_entries(hooks_dir), pool)
 
-def build_library_index(library_root: str | Path) -> LibraryIndex:
-    """Scan a library directory and return a structured LibraryIndex.
 
-    Args:
-        library_root: Path to the root of an ai-team-library directory.
+def _assemble_index(
+    root: Path,
+    artifact_types: list[ArtifactTypeInfo],
+    personas: list[PersonaInfo],
+    expertise: list[ExpertiseInfo],
+    hook_packs: list[HookPackInfo],
+) -> LibraryIndex:
+    """Run the cross-entry checks and wrap the scanned entries in a LibraryIndex.
 
-    Returns:
-        A LibraryIndex containing all discovered personas, expertise, and hook packs.
+    Shared by ``build_library_index`` and the persistent index cache so that
+    cached and freshly parsed entries go through the same validation.
     """
-    root = Path(library_root).resolve()
-    if not root.is_dir():
-        logger.warning("Library root does not exist: %s", root)
-        return LibraryIndex(library_root=str(root))
-
-    artifact_types = _load_artifact_type_registry(root / "contracts")
-    known_artifact_names = {a.name for a in artifact_types}
-
-    personas = _scan_personas(root / "personas", known_artifact_names)
-    expertise = _scan_expertise(root / "expertise")
     expertise = _validate_expertise_applies_to(
         expertise, {p.id for p in personas},
     )
-    hook_packs = _scan_hook_packs(root / "claude" / "hooks")
 
     # Dangling-producer pass — INFO log per ADR-013 ambiguity resolution.
     _log_dangling_producers(personas)
@@ -679,3 +754,34 @@ def build_library_index(library_root: str | Path) -> LibraryIndex:
         hook_packs=hook_packs,
         artifact_types=artifact_types,
     )
+
+
+def build_library_index(
+    library_root: str | Path,
+    workers: int | None = None,
+) -> LibraryIndex:
+    """Scan a library directory and return a structured LibraryIndex.
+
+    Args:
+        library_root: Path to the root of an ai-team-library directory.
+        workers: Parse persona, expertise, and hook pack entries on a thread
+            pool of this size. ``None`` or ``1`` scans serially. The result
+            and the emitted log records are the same either way.
+
+    Returns:
+        A LibraryIndex containing all discovered personas, expertise, and hook packs.
+    """
+    root = Path(library_root).resolve()
+    if not root.is_dir():
+        logger.warning("Library root does not exist: %s", root)
+        return LibraryIndex(library_root=str(root))
+
+    artifact_types = _load_artifact_type_registry(root / "contracts")
+    known_artifact_names = {a.name for a in artifact_types}
+
+    with _scan_pool(workers) as pool:
+        personas = _scan_personas(root / "personas", known_artifact_names, pool)
+        expertise = _scan_expertise(root / "expertise", pool)
+        hook_packs = _scan_hook_packs(root / "claude" / "hooks", pool)
+
+    return _assemble_index(root, artifact_types, personas, expertise, hook_packs)
@@ -4,12 +4,13 @@ from __future__ import annotations
 
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from foundry_app.core.models import CompositionSpec, StageResult
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
+from foundry_app.services.provenance import SourceMap
 
 logger = logging.getLogger(__name__)
 
@@ -19,8 +20,21 @@ _EMITTED_FIELDS = ("type", "command", "args", "env")
 
 
 def _load_registry(library_root: Path) -> dict[str, Any]:
-    """Load and minimally validate the vetted MCP registry YAML."""
+    """Load and minimally validate the vetted MCP registry YAML.
+
+    The parsed registry is kept per (path, mtime, size), so a long-lived
+    process re-reads the file only after it changes. Callers must treat the
+    returned mapping as read-only.
+    """
     registry_path = library_root / REGISTRY_RELPATH
+    st = registry_path.stat()
+    return _parse_registry(registry_path, st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_registry(registry_path: Path, mtime_ns: int, size: int) -> dict[str, Any]:
+    import yaml
+
     data = yaml.safe_load(registry_path.read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         raise ValueError(f"MCP registry must be a mapping: {registry_path}")
@@ -75,6 +89,7 @@ def write_mcp_config(
     spec: CompositionSpec,
     library_root: str | Path,
     output_dir: str | Path,
+    writer: OutputWriter | None = None,
 ) -> StageResult:
     """Generate .claude/mcp.json for the project from the vetted registry.
 
@@ -87,12 +102,16 @@ def write_mcp_config(
         spec: The composition spec describing the project.
         library_root: Root of the ai-team-library directory.
         output_dir: Root directory of the generated project.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
 
     Returns:
         A StageResult listing files written and any warnings.
     """
     lib_root = Path(library_root)
     out_root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(out_root)
     wrote: list[str] = []
     warnings: list[str] = []
 
@@ -152,14 +171,13 @@ def write_mcp_config(
     # Root .mcp.json — the location Claude Code actually reads
     # (.claude/mcp.json was never loaded; SPEC-022).
     mcp_path = out_root / ".mcp.json"
-    mcp_path.parent.mkdir(parents=True, exist_ok=True)
-    mcp_path.write_text(
-        json.dumps(mcp_config, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    writer.mkdir(mcp_path.parent)
+    writer.write_text(mcp_path, json.dumps(mcp_config, indent=2) + "\n")
+    sources = SourceMap(out_root, lib_root)
+    sources.add(mcp_path, [lib_root / REGISTRY_RELPATH])
 
     rel_path = str(mcp_path.relative_to(out_root))
     wrote.append(rel_path)
     logger.info("Wrote MCP config: %s (%d servers)", rel_path, len(servers))
 
-    return StageResult(wrote=wrote, warnings=warnings)
+    return StageResult(wrote=wrote, warnings=warnings, sources=sources.as_dict())
@@ -0,0 +1,294 @@
+"""Output writers — where pipeline stages put the files they generate.
+
+Stages address files by absolute path under the project root, exactly as
+they would on disk, and route every read-back, existence check, and write
+of *generated* output through an ``OutputWriter``:
+
+- ``DirectoryWriter`` writes straight to disk (standard generation).
+- ``VirtualTree`` keeps this run's output in memory, as path -> bytes plus
+  permission bits. Reads and existence checks see only what the run itself
+  produced — the same view an empty temp directory gives — so stages
+  behave identically. After the pipeline one backend takes the tree:
+  ``flush()`` writes it to disk on a thread pool, ``apply()`` writes an
+  overlay plan's creates and updates into the target, ``write_zip()``
+  packs it into an archive, and a dry run simply drops it.
+
+Library sources are still read directly from the library; only the output
+tree goes through the writer. Either writer can take an ``AssetLinker``,
+which places copied library files by link instead (see ``asset_links``).
+"""
+
+from __future__ import annotations
+
+import abc
+import filecmp
+import hashlib
+import os
+import shutil
+import stat
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import NamedTuple
+
+from foundry_app.core.models import FileActionType, OverlayPlan, StageResult
+from foundry_app.services.asset_links import AssetLinker, detach
+
+
+class OutputWriter(abc.ABC):
+    """Interface shared by the writers; paths are absolute, under ``root``."""
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+
+    @abc.abstractmethod
+    def exists(self, path: Path) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def is_file(self, path: Path) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def read_bytes(self, path: Path) -> bytes:
+        ...
+
+    def read_text(self, path: Path) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    @abc.abstractmethod
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        ...
+
+    def write_text(self, path: Path, text: str) -> None:
+        self.write_bytes(path, text.encode("utf-8"))
+
+    @abc.abstractmethod
+    def copy_file(self, src: Path, dest: Path) -> None:
+        """Copy library file *src* to *dest*, keeping its permission bits."""
+
+    def same_content(self, path: Path, src: Path) -> bool:
+        """Whether generated file *path* has the same bytes as library file *src*."""
+        return self.read_bytes(path) == src.read_bytes()
+
+    @abc.abstractmethod
+    def mkdir(self, path: Path) -> None:
+        """Create *path* and its parents; no-op when it exists."""
+
+    @abc.abstractmethod
+    def files_under(self, path: Path) -> list[Path]:
+        """Regular files below directory *path*, in sorted order."""
+
+
+class DirectoryWriter(OutputWriter):
+    """Write generated files directly to disk under ``root``."""
+
+    def __init__(self, root: str | Path, linker: AssetLinker | None = None) -> None:
+        super().__init__(root)
+        self.linker = linker
+
+    def exists(self, path: Path) -> bool:
+        return path.exists()
+
+    def is_file(self, path: Path) -> bool:
+        return path.is_file()
+
+    def read_bytes(self, path: Path) -> bytes:
+        return path.read_bytes()
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        detach(path)
+        path.write_bytes(data)
+
+    def copy_file(self, src: Path, dest: Path) -> None:
+        if self.linker is not None:
+            self.linker.place(src, dest)
+            return
+        detach(dest)
+        shutil.copy2(src, dest)
+
+    def same_content(self, path: Path, src: Path) -> bool:
+        return filecmp.cmp(str(src), str(path), shallow=False)
+
+    def mkdir(self, path: Path) -> None:
+        path.mkdir(parents=True, exist_ok=True)
+
+    def files_under(self, path: Path) -> list[Path]:
+        if not path.is_dir():
+            return []
+        return [p for p in sorted(path.rglob("*")) if p.is_file()]
+
+
+# Threads ``VirtualTree.flush`` writes files on.
+DEFAULT_FLUSH_WORKERS = 8
+
+# Timestamp of every archive entry, so equal trees give equal archives.
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class _Pending(NamedTuple):
+    data: bytes
+    mode: int | None  # permission bits to apply, for copied files
+    source: Path | None = None  # the library file a copied file came from
+
+
+class VirtualTree(OutputWriter):
+    """Collect generated files in memory, addressed as if under ``root``.
+
+    Thread-safe, so concurrently scheduled stages can share one tree.
+    """
+
+    def __init__(self, root: str | Path, linker: AssetLinker | None = None) -> None:
+        super().__init__(root)
+        self.linker = linker
+        self._files: dict[str, _Pending] = {}
+        # The project root "exists" from the start, as the temp dir did.
+        self._dirs: set[str] = {"."}
+        self._lock = threading.Lock()
+
+    def _rel(self, path: Path) -> str:
+        return PurePosixPath(Path(path).relative_to(self.root)).as_posix()
+
+    def exists(self, path: Path) -> bool:
+        rel = self._rel(path)
+        with self._lock:
+            return rel in self._files or rel in self._dirs
+
+    def is_file(self, path: Path) -> bool:
+        rel = self._rel(path)
+        with self._lock:
+            return rel in self._files
+
+    def read_bytes(self, path: Path) -> bytes:
+        rel = self._rel(path)
+        with self._lock:
+            pending = self._files.get(rel)
+        if pending is None:
+            raise FileNotFoundError(path)
+        return pending.data
+
+    def _store(self, path: Path, pending: _Pending) -> None:
+        rel = self._rel(path)
+        with self._lock:
+            self._files[rel] = pending
+            self._dirs.update(str(p) for p in PurePosixPath(rel).parents)
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        self._store(path, _Pending(bytes(data), None))
+
+    def copy_file(self, src: Path, dest: Path) -> None:
+        self._store(dest, _Pending(src.read_bytes(), stat.S_IMODE(src.stat().st_mode), src))
+
+    def mkdir(self, path: Path) -> None:
+        rel = PurePosixPath(self._rel(path))
+        with self._lock:
+            self._dirs.add(str(rel))
+            self._dirs.update(str(p) for p in rel.parents)
+
+    def files_under(self, path: Path) -> list[Path]:
+        rel = self._rel(path)
+        prefix = "" if rel == "." else rel + "/"
+        with self._lock:
+            found = [r for r in self._files if r.startswith(prefix)]
+        return [self.root / r for r in sorted(found, key=lambda r: PurePosixPath(r).parts)]
+
+    def hashes(self) -> dict[str, str]:
+        """SHA-256 of every collected file, keyed like ``file_ledger.hash_tree``."""
+        return {
+            rel: hashlib.sha256(pending.data).hexdigest()
+            for rel, pending in self._sorted_files().items()
+        }
+
+    def _sorted_files(self) -> dict[str, _Pending]:
+        with self._lock:
+            files = dict(self._files)
+        return {rel: files[rel] for rel in sorted(files, key=lambda r: PurePosixPath(r).parts)}
+
+    def _write_file(self, rel: str) -> None:
+        pending = self._files[rel]
+        path = self.root / rel
+        if self.linker is not None and pending.source is not None:
+            self.linker.place(pending.source, path)
+            return
+        detach(path)
+        path.write_bytes(pending.data)
+        if pending.mode is not None:
+            os.chmod(path, pending.mode)
+
+    def _write_files(self, rels: list[str], workers: int) -> None:
+        """Write the files *rels* under ``root``, creating their directories first."""
+        parents = {str(PurePosixPath(rel).parent) for rel in rels}
+        for parent in sorted(parents):
+            (self.root / parent).mkdir(parents=True, exist_ok=True)
+        if workers <= 1 or len(rels) <= 1:
+            for rel in rels:
+                self._write_file(rel)
+            return
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="foundry-flush",
+        ) as pool:
+            # list() re-raises the first write error.
+            list(pool.map(self._write_file, rels))
+
+    def flush(self, workers: int = DEFAULT_FLUSH_WORKERS) -> StageResult:
+        """Write the whole tree, directories included, to disk under ``root``.
+
+        Files are written on *workers* threads; ``1`` writes them serially.
+        """
+        with self._lock:
+            dirs = sorted(self._dirs, key=lambda r: PurePosixPath(r).parts)
+        for rel in dirs:
+            (self.root / rel).mkdir(parents=True, exist_ok=True)
+        wrote = list(self._sorted_files())
+        self._write_files(wrote, workers)
+        return StageResult(wrote=wrote)
+
+    def apply(
+        self, plan: OverlayPlan, workers: int = DEFAULT_FLUSH_WORKERS,
+    ) -> StageResult:
+        """Write the plan's creates and updates, and remove its deletes."""
+        wrote: list[str] = []
+        warnings: list[str] = []
+        writes: list[str] = []
+        for action in plan.actions:
+            tgt_file = self.root / action.path
+            if action.action in (FileActionType.CREATE, FileActionType.UPDATE):
+                writes.append(self._rel(tgt_file))
+                wrote.append(action.path)
+            elif action.action == FileActionType.DELETE:
+                if tgt_file.exists():
+                    tgt_file.unlink()
+                    wrote.append(action.path)
+                else:
+                    warnings.append(f"File already removed: {action.path}")
+        self._write_files(writes, workers)
+        return StageResult(wrote=wrote, warnings=warnings)
+
+    def write_zip(self, archive: str | Path) -> StageResult:
+        """Pack the tree into the zip file *archive*, under a ``root.name`` folder.
+
+        Entries are stored in path order with a fixed timestamp, so the
+        same tree always gives the same archive. Empty directories are kept.
+        """
+        archive = Path(archive)
+        prefix = PurePosixPath(self.root.name)
+        files = self._sorted_files()
+        with self._lock:
+            dirs = {rel for rel in self._dirs if rel != "."}
+        # Directories that hold files get their entries implicitly.
+        for rel in files:
+            dirs.difference_update(str(p) for p in PurePosixPath(rel).parents)
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            for rel in sorted(dirs, key=lambda r: PurePosixPath(r).parts):
+                info = zipfile.ZipInfo(f"{prefix / rel}/", _ZIP_DATE_TIME)
+                info.external_attr = (stat.S_IFDIR | 0o755) << 16
+                zf.writestr(info, b"")
+            for rel, pending in files.items():
+                info = zipfile.ZipInfo(str(prefix / rel), _ZIP_DATE_TIME)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                mode = pending.mode if pending.mode is not None else 0o644
+                info.external_attr = (stat.S_IFREG | mode) << 16
+                zf.writestr(info, pending.data)
+        return StageResult(wrote=[str(archive)])
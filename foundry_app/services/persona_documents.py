@@ -0,0 +1,80 @@
+"""Persona documents — each persona.md read and parsed once per generation.
+
+The compile stage needs every library persona's ``# Persona:`` header (for
+the name map that filters references to unselected personas), each selected
+persona's display name and text, and the bytes of its persona.md for the
+compile-cache key; the agent writer needs the text again. ``PersonaDocuments``
+builds one ``PersonaDocument`` per persona on first use and hands the same
+object to every stage of the run, so persona.md is read once.
+
+The generator creates one ``PersonaDocuments`` per run and passes it to the
+stages; stages called on their own build a private one.
+"""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from foundry_app.core.models import LibraryIndex
+from foundry_app.services.persona_names import persona_title
+from foundry_app.services.placeholders import PlaceholderTemplate, compile_template
+
+
+class PersonaDocument:
+    """A persona's persona.md, read and parsed once.
+
+    ``data`` and ``text`` are None when the persona has no persona.md.
+    ``text`` is decoded as ``Path.read_text`` would (universal newlines).
+    """
+
+    __slots__ = ("persona_id", "path", "category", "data", "text", "header")
+
+    def __init__(self, persona_id: str, persona_dir: Path, category: str = "") -> None:
+        self.persona_id = persona_id
+        self.path = persona_dir / "persona.md"
+        self.category = category
+        try:
+            self.data: bytes | None = self.path.read_bytes()
+        except OSError:
+            self.data = None
+        self.text: str | None = None
+        self.header: str | None = None
+        if self.data is not None:
+            self.text = self.data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+            self.header = persona_title(self.text) or None
+
+    @property
+    def template(self) -> PlaceholderTemplate | None:
+        """The persona.md text as a placeholder template."""
+        return None if self.text is None else compile_template(self.text)
+
+    @property
+    def body(self) -> PlaceholderTemplate | None:
+        """The trimmed persona.md text, as the member section embeds it."""
+        return None if self.text is None else compile_template(self.text.strip())
+
+
+class PersonaDocuments:
+    """The persona documents of one generation, keyed by persona id.
+
+    Thread-safe: concurrently running stages may share one instance.
+    """
+
+    def __init__(self, library_index: LibraryIndex) -> None:
+        self._index = library_index
+        self._docs: dict[str, PersonaDocument | None] = {}
+        self._lock = threading.Lock()
+        self.reads = 0
+
+    def get(self, persona_id: str) -> PersonaDocument | None:
+        """Return *persona_id*'s document, or None if it is not in the library."""
+        with self._lock:
+            if persona_id not in self._docs:
+                info = self._index.persona_by_id(persona_id)
+                doc = None
+                if info is not None:
+                    doc = PersonaDocument(info.id, Path(info.path), info.category)
+                    self.reads += 1
+                self._docs[persona_id] = doc
+            return self._docs[persona_id]
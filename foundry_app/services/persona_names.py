@@ -0,0 +1,126 @@
+"""Persona names — display names and the aliases persona references use.
+
+Persona files refer to each other by name: ``| Technical Writer | ... |``
+rows in Collaboration tables and ``(defer to Architect)`` parentheticals.
+The names come in several forms — the full ``# Persona:`` header, its
+short display form, the kebab-case id rendered as a name — and
+``persona_aliases`` lists the forms beyond the header itself, so the
+indexer can record them once per persona.
+"""
+
+from __future__ import annotations
+
+import re
+
+# Pattern for extracting persona display name from "# Persona: <Name>" header
+_PERSONA_HEADER_RE = re.compile(r"^#\s+Persona:\s*(.+)", re.MULTILINE)
+
+# Acronyms that should be uppercased when rendering display names derived
+# from kebab-case identifiers (e.g. ``tech-qa`` -> ``Tech QA``). Extend when
+# a new acronym-bearing persona or expertise id is introduced.
+_ACRONYMS: frozenset[str] = frozenset({
+    "qa", "ui", "ux", "api", "sre", "ml", "ai", "ba",
+    "sql", "dba", "aws", "gcp", "ci", "cd",
+})
+
+
+def _display_name_from_id(identifier: str) -> str:
+    """Convert a kebab-case id into a human-readable display name.
+
+    Acronyms listed in ``_ACRONYMS`` are uppercased; other segments are
+    title-cased. Consecutive acronym segments collapse with ``/`` so that
+    ``ux-ui-designer`` renders as ``UX/UI Designer`` rather than
+    ``Ux Ui Designer``.
+    """
+    parts = identifier.split("-")
+    words: list[str] = []
+    run: list[str] = []
+
+    def _flush() -> None:
+        if run:
+            words.append("/".join(run))
+            run.clear()
+
+    for part in parts:
+        if part.lower() in _ACRONYMS:
+            run.append(part.upper())
+        else:
+            _flush()
+            words.append(part.capitalize())
+    _flush()
+    return " ".join(words)
+
+
+def _canonicalize_persona_header(name: str) -> str:
+    """Trim a ``# Persona: <Name>`` header down to its short display form.
+
+    Rules applied in order:
+
+    1. Remove trailing parenthetical annotations (``Business Analyst (BA)``
+       -> ``Business Analyst``).
+    2. Split on `` / ``. Merge consecutive segments whose adjoining tokens
+       are short (<= 3 char) all-upper acronyms using ``/`` — this turns
+       ``UX / UI Designer`` into ``UX/UI Designer``. Otherwise keep only
+       the first segment (``Tech-QA / Test Engineer`` -> ``Tech-QA``).
+    """
+    name = re.sub(r"\s*\([^)]+\)\s*", "", name).strip()
+    if " / " not in name:
+        return name
+
+    segments = [s.strip() for s in name.split(" / ") if s.strip()]
+    merged = [segments[0]]
+    for seg in segments[1:]:
+        prev_tokens = merged[-1].split()
+        cur_tokens = seg.split()
+        if not prev_tokens or not cur_tokens:
+            break
+        prev_last = prev_tokens[-1]
+        cur_first = cur_tokens[0]
+        if (
+            prev_last.isupper() and len(prev_last) <= 3
+            and cur_first.isupper() and len(cur_first) <= 3
+        ):
+            merged[-1] = f"{merged[-1]}/{cur_first}"
+            rest = cur_tokens[1:]
+            if rest:
+                merged.append(" ".join(rest))
+        else:
+            break
+    return " ".join(merged)
+
+
+def persona_title(text: str) -> str:
+    """The name in *text*'s ``# Persona: <Name>`` header, or '' if it has none."""
+    match = _PERSONA_HEADER_RE.search(text)
+    return match.group(1).strip() if match else ""
+
+
+_PAREN_RE = re.compile(r"\(([^)]+)\)")
+
+
+def persona_aliases(title: str | None, dirname: str) -> list[str]:
+    """Other names a persona titled *title* (its ``# Persona:`` header) goes by.
+
+    Returns, in order and without duplicates or the title itself: the
+    header's short display form (``_canonicalize_persona_header``), any
+    parenthetical acronym (``BA`` in ``Business Analyst (BA)``), the title
+    with tight and spaced slashes swapped (``UX/UI`` <-> ``UX / UI``), and
+    the display name of the directory name (``Tech QA`` for ``tech-qa``).
+    Leading parts of a slashed title are not listed here; ``PersonaAliases``
+    derives those itself.
+    """
+    forms: list[str] = []
+    if title:
+        forms.append(_canonicalize_persona_header(title))
+        forms += [m.group(1).strip() for m in _PAREN_RE.finditer(title)]
+        if " / " in title:
+            forms.append(title.replace(" / ", "/"))
+        elif "/" in title:
+            forms.append(re.sub(r"\s*/\s*", " / ", title))
+    forms.append(_display_name_from_id(dirname))
+
+    aliases: list[str] = []
+    for form in forms:
+        if form and form != title and form not in aliases:
+            aliases.append(form)
+    return aliases
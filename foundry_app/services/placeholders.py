@@ -0,0 +1,137 @@
+"""Placeholder templates — ``{{ var }}`` substitution compiled once per source.
+
+Library sources use two placeholder forms:
+
+- ``{{ project_name }}`` — replaced by ``context["project_name"]``.
+- ``{{ expertise | join(", ") }}`` — the context value is split on commas,
+  each item stripped, and the items joined with the separator.
+
+A placeholder whose variable is not in the context is left as written.
+
+``PlaceholderTemplate`` scans its source once, into literal runs and
+placeholder slots, so rendering it against many contexts (one per persona)
+is a concatenation with no regex work. ``compile_template`` keeps compiled
+templates per source text; ``load_template`` keeps them per (path, mtime,
+size), so a long-lived process re-reads a library file only after it
+changes. ``unresolved_placeholders`` checks rendered text before it is
+written, so stages never read their own output back to verify it.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+# Template variable pattern: {{ var }} or {{ var | filter }}
+_PLACEHOLDER_RE = re.compile(r"\{\{\s*(.+?)\s*\}\}")
+
+# join filter:  varname | join("sep")
+_JOIN_RE = re.compile(r"(\w+)\s*\|\s*join\(\s*\"([^\"]*)\"\s*\)")
+
+
+class _Slot(NamedTuple):
+    """One placeholder: the variable, the join separator (None for a plain
+    variable), the expression, and the placeholder's original text."""
+
+    name: str
+    separator: str | None
+    expression: str
+    original: str
+
+
+class PlaceholderTemplate:
+    """A source text split into literal runs and placeholder slots.
+
+    ``render`` returns the same text the regex substitution would, for any
+    context. Instances are immutable and shared between threads.
+    """
+
+    __slots__ = ("source", "_literals", "_slots")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        literals: list[str] = []
+        slots: list[_Slot] = []
+        pos = 0
+        for match in _PLACEHOLDER_RE.finditer(source):
+            literals.append(source[pos:match.start()])
+            raw, original = match.group(1), match.group(0)
+            expr = raw.strip()
+            join_match = _JOIN_RE.match(expr)
+            if join_match:
+                name, separator = join_match.group(1), join_match.group(2)
+            else:
+                name, separator = expr, None
+            slots.append(_Slot(name, separator, raw, original))
+            pos = match.end()
+        literals.append(source[pos:])
+        self._literals = tuple(literals)
+        self._slots = tuple(slots)
+
+    @property
+    def placeholders(self) -> list[str]:
+        """The placeholder expressions in order, as ``_PLACEHOLDER_RE.findall`` gives."""
+        return [slot.expression for slot in self._slots]
+
+    def render(self, context: dict[str, str]) -> str:
+        """Substitute *context* into the template."""
+        if not self._slots:
+            return self.source
+        literals = self._literals
+        parts = [literals[0]]
+        for i, slot in enumerate(self._slots, 1):
+            value = context.get(slot.name)
+            if value is None:
+                parts.append(slot.original)
+            elif slot.separator is None:
+                parts.append(value)
+            else:
+                parts.append(slot.separator.join(v.strip() for v in value.split(",")))
+            parts.append(literals[i])
+        return "".join(parts)
+
+
+def unresolved_placeholders(text: str) -> list[str]:
+    """The distinct placeholder expressions left in rendered *text*, sorted."""
+    if "{{" not in text:
+        return []
+    return sorted(set(_PLACEHOLDER_RE.findall(text)))
+
+
+@lru_cache(maxsize=2048)
+def compile_template(text: str) -> PlaceholderTemplate:
+    """Return the compiled template for *text*, reusing one compiled earlier."""
+    return PlaceholderTemplate(text)
+
+
+def load_template(
+    path: Path,
+    prepare: Callable[[str], str] | None = None,
+) -> PlaceholderTemplate:
+    """Return the compiled template for the file at *path*.
+
+    *prepare*, if given, transforms the file's text before it is compiled
+    (e.g. ``str.strip``); it must be a module-level function so the cache
+    can key on it. The template is cached per (path, mtime, size, prepare).
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    st = path.stat()
+    return _load_template(path, st.st_mtime_ns, st.st_size, prepare)
+
+
+@lru_cache(maxsize=1024)
+def _load_template(
+    path: Path,
+    mtime_ns: int,
+    size: int,
+    prepare: Callable[[str], str] | None,
+) -> PlaceholderTemplate:
+    text = path.read_text(encoding="utf-8")
+    if prepare is not None:
+        text = prepare(text)
+    return compile_template(text)
@@ -0,0 +1,104 @@
+"""Provenance — which library files each generated file was built from.
+
+Stages that turn library content into output record, per output file, the
+library files they read (``SourceMap``) and return them as
+``StageResult.sources``; ``GenerationManifest.provenance`` merges the
+stages. Paths are POSIX: outputs relative to the project root, sources
+relative to the library root (files outside the library, such as ClaudeKit
+skills, keep their absolute path).
+
+The asset copier wraps its writer in a ``RecordingWriter``, which records
+every ``copy_file`` without the copy helpers knowing.
+
+The map errs towards listing too much: a source that might have shaped an
+output is recorded even when the output happened not to change.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable
+from pathlib import Path, PurePosixPath
+
+from foundry_app.services.output_writer import OutputWriter
+
+
+def source_key(path: str | Path, library_root: str | Path) -> str:
+    """Library-relative POSIX path of *path*, or its absolute path if outside."""
+    resolved = Path(path).resolve()
+    try:
+        return PurePosixPath(resolved.relative_to(Path(library_root).resolve())).as_posix()
+    except ValueError:
+        return resolved.as_posix()
+
+
+class SourceMap:
+    """Output file -> library sources, collected during one stage."""
+
+    def __init__(self, output_root: str | Path, library_root: str | Path) -> None:
+        self._output_root = Path(output_root)
+        self._library_root = Path(library_root).resolve()
+        self._sources: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, output: str | Path, sources: Iterable[str | Path]) -> None:
+        """Record that *output* (absolute, or relative to the project) read *sources*."""
+        output = Path(output)
+        if output.is_absolute():
+            output = output.relative_to(self._output_root)
+        keys = {source_key(s, self._library_root) for s in sources}
+        with self._lock:
+            self._sources.setdefault(PurePosixPath(output).as_posix(), set()).update(keys)
+
+    def sources_of(self, output: str | Path) -> set[str]:
+        """Sources recorded so far for *output* (relative to the project)."""
+        with self._lock:
+            return set(self._sources.get(PurePosixPath(output).as_posix(), ()))
+
+    def as_dict(self) -> dict[str, list[str]] | None:
+        """Sorted mapping for ``StageResult.sources``; None when empty."""
+        with self._lock:
+            if not self._sources:
+                return None
+            return {out: sorted(src) for out, src in sorted(self._sources.items())}
+
+
+class RecordingWriter(OutputWriter):
+    """Delegate to *inner*, recording each ``copy_file`` in *sources*.
+
+    A destination found already identical to its source (the copiers'
+    overlay-safe skip) is recorded too: the file still comes from there.
+    """
+
+    def __init__(self, inner: OutputWriter, sources: SourceMap) -> None:
+        super().__init__(inner.root)
+        self._inner = inner
+        self._sources = sources
+
+    def exists(self, path: Path) -> bool:
+        return self._inner.exists(path)
+
+    def is_file(self, path: Path) -> bool:
+        return self._inner.is_file(path)
+
+    def read_bytes(self, path: Path) -> bytes:
+        return self._inner.read_bytes(path)
+
+    def write_bytes(self, path: Path, data: bytes) -> None:
+        self._inner.write_bytes(path, data)
+
+    def copy_file(self, src: Path, dest: Path) -> None:
+        self._inner.copy_file(src, dest)
+        self._sources.add(dest, [src])
+
+    def same_content(self, path: Path, src: Path) -> bool:
+        same = self._inner.same_content(path, src)
+        if same:
+            self._sources.add(path, [src])
+        return same
+
+    def mkdir(self, path: Path) -> None:
+        self._inner.mkdir(path)
+
+    def files_under(self, path: Path) -> list[Path]:
+        return self._inner.files_under(path)
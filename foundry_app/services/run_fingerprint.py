@@ -0,0 +1,109 @@
+"""Whole-run input fingerprint — lets an unchanged regeneration be skipped.
+
+A generation's output is determined by the composition, the library's
+contents, the Foundry version, and (in library-copy mode) the ClaudeKit
+skills it copies. ``input_fingerprint`` hashes all four; the generator
+records the result in ``manifest.json`` as ``input_fingerprint``.
+
+On the next run, ``up_to_date_manifest`` returns the previous manifest when
+its fingerprint matches and every file the file ledger recorded is still on
+disk with the size and mtime Foundry left it with. The generator then skips
+the pipeline entirely. Editing Foundry's own code without a version bump is
+not seen; ``--force-rebuild`` regenerates regardless.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from foundry_app import __version__
+from foundry_app.core.models import CompositionSpec, GenerationManifest, Strictness
+from foundry_app.services.asset_copier import (
+    _default_claude_kit_root,
+    _kit_distributed_skills,
+)
+from foundry_app.services.file_ledger import hash_tree, read_ledger
+
+logger = logging.getLogger(__name__)
+
+# Bump when the set of fingerprinted inputs changes.
+_FINGERPRINT_SCHEMA = 1
+
+
+def _feed_tree(digest, root: Path) -> None:
+    if not root.is_dir():
+        return
+    for rel, sha in hash_tree(root).items():
+        digest.update(f"{rel}\0{sha}\n".encode())
+
+
+def input_fingerprint(
+    composition: CompositionSpec,
+    library_root: str | Path,
+    strictness: Strictness,
+    claude_kit_root: str | Path | None = None,
+) -> str:
+    """Return a SHA-256 over everything a generation's output depends on.
+
+    Hashes the normalized composition, the content of every library file,
+    the Foundry version, the strictness, and the resolved kit root with the
+    content of the kit-distributed skills copied from it.
+    """
+    kit_root = (
+        Path(claude_kit_root) if claude_kit_root is not None
+        else _default_claude_kit_root()
+    )
+    digest = hashlib.sha256()
+    digest.update(f"schema={_FINGERPRINT_SCHEMA}\0foundry={__version__}\n".encode())
+    digest.update(f"strictness={strictness.value}\n".encode())
+    spec = json.dumps(composition.model_dump(mode="json"), sort_keys=True)
+    digest.update(spec.encode("utf-8") + b"\n")
+
+    digest.update(b"library\n")
+    _feed_tree(digest, Path(library_root))
+
+    digest.update(f"kit={kit_root.resolve()}\n".encode())
+    for skill in _kit_distributed_skills(kit_root):
+        digest.update(f"skill={skill}\n".encode())
+        _feed_tree(digest, kit_root / "skills" / skill)
+    return digest.hexdigest()
+
+
+def _ledger_intact(output_dir: Path) -> bool:
+    """True when every file in the project's ledger is unchanged on disk."""
+    ledger = read_ledger(output_dir)
+    if not ledger:
+        return False
+    for rel, entry in ledger.items():
+        try:
+            st = (output_dir / rel).stat()
+        except OSError:
+            return False
+        if st.st_size != entry.size or st.st_mtime_ns != entry.mtime_ns:
+            return False
+    return True
+
+
+def up_to_date_manifest(output_dir: str | Path, fingerprint: str) -> GenerationManifest | None:
+    """Return the project's last manifest if regenerating would change nothing.
+
+    That is the case when ``manifest.json`` carries *fingerprint* and the
+    files recorded in the ledger are untouched. Anything missing, unreadable,
+    or different returns None.
+    """
+    from foundry_app.io.composition_io import load_manifest
+
+    output_dir = Path(output_dir)
+    try:
+        manifest = load_manifest(output_dir / "manifest.json")
+    except (OSError, ValueError):
+        return None
+    if manifest.input_fingerprint != fingerprint:
+        return None
+    if not _ledger_intact(output_dir):
+        logger.info("Inputs unchanged but the output tree was modified: %s", output_dir)
+        return None
+    return manifest
@@ -23,6 +23,7 @@ from foundry_app.core.models import (
     Posture,
     StageResult,
 )
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
 
 logger = logging.getLogger(__name__)
 
@@ -39,6 +40,12 @@ def _hook_entry(matcher: str, command: str) -> dict[str, Any]:
     }
 
 
+# The security-scan pack's hook and the pattern file it reads, written from
+# the composition's SecretPolicy.
+SECRET_SCAN_SCRIPT = "secret-scan.py"
+SECRET_SCAN_CONFIG = "secret-scan.json"
+
+
 # Registry: pack id → (pre_tool_use entries, post_tool_use entries)
 # Each value is a tuple of (list[dict], list[dict]).
 _HOOK_PACK_REGISTRY: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]] = {
@@ -70,42 +77,15 @@ _HOOK_PACK_REGISTRY: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]
     ),
     "pre-commit-lint": (
         [],
-        [_hook_entry(
-            "Edit|Write",
-            "ruff check --quiet . 2>/dev/null || echo 'WARNING: Lint issues detected. "
-            "Run ruff check --fix before committing.'",
-        )],
+        [_hook_entry("Edit|Write", "python3 .claude/hooks/lint-python.py")],
     ),
     "pre-commit-lint-js": (
         [],
-        [_hook_entry(
-            "Edit|Write",
-            (
-                "npx --no-install prettier --check . 2>/dev/null "
-                "|| echo 'WARNING: Prettier formatting issues detected. "
-                "Run prettier --write before committing.'; "
-                "npx --no-install eslint . 2>/dev/null "
-                "|| echo 'WARNING: ESLint issues detected. "
-                "Run eslint --fix before committing.'; "
-                "npx --no-install tsc --noEmit 2>/dev/null "
-                "|| echo 'WARNING: TypeScript errors detected. "
-                "Run tsc --noEmit to investigate.'"
-            ),
-        )],
+        [_hook_entry("Edit|Write", "python3 .claude/hooks/lint-js.py")],
     ),
     "security-scan": (
         [],
-        [_hook_entry(
-            "Edit|Write",
-            (
-                "git diff --name-only 2>/dev/null "
-                "| xargs grep -lE "
-                "'(?i)(api[_-]?key|secret[_-]?key|password\\s*=|token\\s*=|"
-                "BEGIN (RSA |EC )?PRIVATE KEY)' 2>/dev/null "
-                "&& echo 'WARNING: Potential secrets detected in changed files.' "
-                "|| true"
-            ),
-        )],
+        [_hook_entry("Edit|Write", f"python3 .claude/hooks/{SECRET_SCAN_SCRIPT}")],
     ),
     "post-task-qa": (
         [],
@@ -225,6 +205,18 @@ _HOOK_PACK_REGISTRY: dict[str, tuple[list[dict[str, Any]], list[dict[str, Any]]]
     "git-merge-to-prod": ([], []),
 }
 
+# Registry: pack id → Stop entries, for packs that defer work to the end
+# of the agent's turn. The lint packs check only the edited file per edit
+# and lint the whole project here, debounced (see lint_changed.py).
+_HOOK_PACK_STOP_REGISTRY: dict[str, list[dict[str, Any]]] = {
+    "pre-commit-lint": [
+        {"hooks": [{"type": "command", "command": "python3 .claude/hooks/lint-python.py"}]},
+    ],
+    "pre-commit-lint-js": [
+        {"hooks": [{"type": "command", "command": "python3 .claude/hooks/lint-js.py"}]},
+    ],
+}
+
 
 # ---------------------------------------------------------------------------
 # Posture taxonomy — see ai/context/hook-posture.md (intent) and
@@ -448,6 +440,7 @@ def _build_hooks(
     """Build the native Claude Code hooks structure from the composition spec."""
     pre_tool_use: list[dict[str, Any]] = []
     post_tool_use: list[dict[str, Any]] = []
+    stop: list[dict[str, Any]] = []
 
     packs, warnings = _resolve_packs(spec, library)
 
@@ -476,18 +469,21 @@ def _build_hooks(
         pre_entries, post_entries = registry_entry
         _add(pre_tool_use, pre_entries)
         _add(post_tool_use, post_entries)
+        _add(stop, _HOOK_PACK_STOP_REGISTRY.get(pack.id, []))
 
-    settings = {
+    settings: dict[str, Any] = {
         "hooks": {
             "PreToolUse": pre_tool_use,
             "PostToolUse": post_tool_use,
         },
     }
+    if stop:
+        settings["hooks"]["Stop"] = stop
     return settings, warnings
 
 
 def _merge_settings(
-    settings_path: Path, new_settings: dict[str, Any],
+    settings_path: Path, new_settings: dict[str, Any], writer: OutputWriter,
 ) -> dict[str, Any]:
     """Merge registry-derived hooks into an existing settings.json.
 
@@ -495,10 +491,10 @@ def _merge_settings(
     unioned per event with dedup on the full entry (matcher + commands).
     Returns ``new_settings`` unchanged when no existing file is readable.
     """
-    if not settings_path.is_file():
+    if not writer.is_file(settings_path):
         return new_settings
     try:
-        existing = json.loads(settings_path.read_text(encoding="utf-8"))
+        existing = json.loads(writer.read_text(settings_path))
     except (json.JSONDecodeError, OSError):
         return new_settings
     if not isinstance(existing, dict):
@@ -522,14 +518,95 @@ def _merge_settings(
 _HOOK_SCRIPT_RE = re.compile(r"\.claude/hooks/([\w.-]+\.\w+)")
 
 
-def _missing_hook_scripts(root: Path, settings: dict[str, Any]) -> list[str]:
+# ---------------------------------------------------------------------------
+# Hook dispatcher — one process per event instead of one per script
+# ---------------------------------------------------------------------------
+
+DISPATCHER_SCRIPT = "foundry-hooks.py"
+
+_DISPATCHER_COMMAND = f"python3 .claude/hooks/{DISPATCHER_SCRIPT}"
+
+# A plain script hook, or a dispatcher entry running several of them.
+_SCRIPT_COMMAND_RE = re.compile(
+    r"python3 \.claude/hooks/([\w.-]+\.py)( --daemon)?((?: [\w.-]+\.py)*)"
+)
+
+
+def _dispatched_scripts(entry: dict[str, Any]) -> list[str] | None:
+    """Return the hook scripts *entry* runs, or None if it cannot be folded.
+
+    Foldable entries hold exactly one hook of the plain
+    ``{"type": "command", "command": "python3 .claude/hooks/<script>.py"}``
+    shape (or an earlier dispatcher entry); anything else — shell
+    commands, timeouts, extra keys — keeps its own entry.
+    """
+    if set(entry) - {"matcher", "hooks"} or len(entry.get("hooks") or []) != 1:
+        return None
+    hook = entry["hooks"][0]
+    if set(hook) != {"type", "command"} or hook["type"] != "command":
+        return None
+    match = _SCRIPT_COMMAND_RE.fullmatch(hook["command"])
+    if match is None:
+        return None
+    if match.group(1) == DISPATCHER_SCRIPT:
+        return match.group(3).split()
+    if match.group(2) or match.group(3):
+        return None
+    return [match.group(1)]
+
+
+def _dispatch_hook_scripts(settings: dict[str, Any], daemon: bool = False) -> dict[str, Any]:
+    """Fold each event's script hooks into one dispatcher entry per matcher.
+
+    Entries running ``python3 .claude/hooks/<script>.py`` under the same
+    event and matcher become one ``foundry-hooks.py`` entry running the
+    scripts in their original order, placed where the first of them was.
+    A lone script keeps its direct command, unless *daemon* is set: then
+    every entry goes through the dispatcher's ``--daemon`` client.
+    Re-running over an already folded file yields the same file.
+    """
+    dispatcher = f"{_DISPATCHER_COMMAND} --daemon" if daemon else _DISPATCHER_COMMAND
+    hooks: dict[str, Any] = {}
+    for event, entries in settings.get("hooks", {}).items():
+        folded: list[dict[str, Any] | None] = []
+        groups: dict[str | None, tuple[int, list[str]]] = {}
+        for entry in entries:
+            scripts = _dispatched_scripts(entry)
+            if scripts is None:
+                folded.append(entry)
+                continue
+            matcher = entry.get("matcher")
+            if matcher not in groups:
+                groups[matcher] = (len(folded), [])
+                folded.append(None)
+            group = groups[matcher][1]
+            group.extend(s for s in scripts if s not in group)
+        for matcher, (index, scripts) in groups.items():
+            if len(scripts) == 1 and not daemon:
+                command = f"python3 .claude/hooks/{scripts[0]}"
+            else:
+                command = " ".join([dispatcher, *scripts])
+            entry = {} if matcher is None else {"matcher": matcher}
+            entry["hooks"] = [{"type": "command", "command": command}]
+            folded[index] = entry
+        hooks[event] = folded
+    return {**settings, "hooks": hooks}
+
+
+def _missing_hook_scripts(
+    root: Path, settings: dict[str, Any], writer: OutputWriter,
+) -> list[str]:
     """Warn for every hook command referencing a script absent on disk."""
     missing: list[str] = []
     for entries in settings.get("hooks", {}).values():
         for entry in entries:
             for hook in entry.get("hooks", []):
-                for script in _HOOK_SCRIPT_RE.findall(hook.get("command", "")):
-                    if not (root / ".claude" / "hooks" / script).is_file():
+                command = hook.get("command", "")
+                scripts = _HOOK_SCRIPT_RE.findall(command)
+                if command.startswith(_DISPATCHER_COMMAND + " "):
+                    scripts += [arg for arg in command.split()[2:] if arg != "--daemon"]
+                for script in scripts:
+                    if not writer.is_file(root / ".claude" / "hooks" / script):
                         msg = (
                             f"Hook command references .claude/hooks/{script} "
                             f"but the script is not present in the generated "
@@ -540,6 +617,27 @@ def _missing_hook_scripts(root: Path, settings: dict[str, Any]) -> list[str]:
     return missing
 
 
+def _uses_script(settings: dict[str, Any], script: str) -> bool:
+    """True if any hook command in *settings* runs .claude/hooks/*script*."""
+    return any(
+        script in _HOOK_SCRIPT_RE.findall(hook.get("command", ""))
+        or script in hook.get("command", "").split()
+        for entries in settings.get("hooks", {}).values()
+        for entry in entries
+        for hook in entry.get("hooks", [])
+    )
+
+
+def _secret_scan_config(spec: CompositionSpec) -> str:
+    """The pattern file ``secret-scan.py`` compiles, from the effective SecretPolicy.
+
+    The script's built-in patterns always apply; ``patterns`` extends them.
+    """
+    secrets = spec.effective_safety().secrets
+    config = {"scan": secrets.scan_for_secrets, "patterns": secrets.secret_patterns}
+    return json.dumps(config, indent=2) + "\n"
+
+
 # ---------------------------------------------------------------------------
 # Permissions from SafetyConfig (SPEC-016)
 #
@@ -608,6 +706,7 @@ def write_permissions(
     spec: CompositionSpec,
     output_dir: str | Path,
     library: LibraryIndex | None = None,
+    writer: OutputWriter | None = None,
 ) -> StageResult:
     """Render ``.claude/settings.local.json`` from the effective SafetyConfig.
 
@@ -618,14 +717,16 @@ def write_permissions(
     file for every project (SPEC-016).
     """
     root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(root)
     settings_dir = root / ".claude"
-    settings_dir.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(settings_dir)
     path = settings_dir / "settings.local.json"
 
     base: dict[str, Any] = {}
-    if path.is_file():
+    if writer.is_file(path):
         try:
-            loaded = json.loads(path.read_text(encoding="utf-8"))
+            loaded = json.loads(writer.read_text(path))
             if isinstance(loaded, dict):
                 base = loaded
         except (json.JSONDecodeError, OSError):
@@ -642,7 +743,7 @@ def write_permissions(
                 seen.add(rule)
         perms[key] = existing
 
-    path.write_text(json.dumps(base, indent=2) + "\n", encoding="utf-8")
+    writer.write_text(path, json.dumps(base, indent=2) + "\n")
     rel = str(path.relative_to(root))
     logger.info(
         "Permissions written: posture=%s, allow=%d, deny=%d",
@@ -660,12 +761,18 @@ def write_safety(
     spec: CompositionSpec,
     output_dir: str | Path,
     library: LibraryIndex | None = None,
+    writer: OutputWriter | None = None,
 ) -> StageResult:
     """Generate ``.claude/settings.json`` with native Claude Code hooks.
 
     Maps the spec's hook pack selections (or stack-aware defaults derived
     from posture, expertise, and cloud providers) to concrete ``PreToolUse``
     / ``PostToolUse`` hook definitions in the Claude Code native format.
+    Unless ``spec.hooks.dispatch`` is off, hook scripts sharing an event
+    and matcher are registered as one ``foundry-hooks.py`` dispatcher
+    entry, so an edit starts one Python process per event; with
+    ``spec.hooks.daemon`` that process hands the run to a per-project
+    hook daemon.
 
     Args:
         spec: The composition spec describing the project.
@@ -674,6 +781,8 @@ def write_safety(
             declared posture compatibility excludes the composition's
             posture are filtered out with a warning — a defensive
             complement to pre-generation validation.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
 
     Returns:
         A StageResult listing files written and any warnings (e.g., explicit
@@ -681,10 +790,12 @@ def write_safety(
         filtered for posture incompatibility).
     """
     root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(root)
     wrote: list[str] = []
 
     settings_dir = root / ".claude"
-    settings_dir.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(settings_dir)
 
     settings, warnings = _build_hooks(spec, library)
 
@@ -692,16 +803,22 @@ def write_safety(
     # Merge with any settings.json already placed by the asset copier
     # (the library ships hook wiring there); overwriting it silently
     # discarded those hooks pre-SPEC-004.
-    settings = _merge_settings(settings_path, settings)
-    warnings.extend(_missing_hook_scripts(root, settings))
-    settings_path.write_text(
-        json.dumps(settings, indent=2) + "\n",
-        encoding="utf-8",
-    )
+    settings = _merge_settings(settings_path, settings, writer)
+    # Fold only when the dispatcher shipped — a claude-kit subtree brings
+    # its own .claude/hooks/ and may not have it.
+    if spec.hooks.dispatch and writer.is_file(settings_dir / "hooks" / DISPATCHER_SCRIPT):
+        settings = _dispatch_hook_scripts(settings, daemon=spec.hooks.daemon)
+    warnings.extend(_missing_hook_scripts(root, settings, writer))
+    writer.write_text(settings_path, json.dumps(settings, indent=2) + "\n")
 
     rel_path = str(settings_path.relative_to(root))
     wrote.append(rel_path)
 
+    if _uses_script(settings, SECRET_SCAN_SCRIPT):
+        config_path = settings_dir / SECRET_SCAN_CONFIG
+        writer.write_text(config_path, _secret_scan_config(spec))
+        wrote.append(str(config_path.relative_to(root)))
+
     pack_count = len(settings["hooks"]["PreToolUse"]) + len(settings["hooks"]["PostToolUse"])
     logger.info(
         "Hooks written: posture=%s, hook_entries=%d, path=%s",
@@ -4,10 +4,9 @@ from __future__ import annotations
 
 import logging
 from datetime import date
+from functools import lru_cache
 from pathlib import Path
 
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
-
 from foundry_app import __version__ as _FOUNDRY_VERSION
 from foundry_app.core.models import (
     CompositionSpec,
@@ -15,7 +14,9 @@ from foundry_app.core.models import (
     StageResult,
     _persona_dirname,
 )
-from foundry_app.io.composition_io import save_composition
+from foundry_app.io.composition_io import dump_composition
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
+from foundry_app.services.provenance import SourceMap
 
 logger = logging.getLogger(__name__)
 
@@ -302,12 +303,29 @@ def _render_project_charter(spec: CompositionSpec) -> str:
     )
 
 
+@lru_cache(maxsize=8)
+def _media_environment(templates_dir: Path):
+    """Jinja environment for one media templates directory.
+
+    Kept per directory so compiled templates survive between generations in
+    one process; Jinja's auto-reload recompiles a template whose file changed.
+    """
+    from jinja2 import Environment, FileSystemLoader
+
+    return Environment(
+        loader=FileSystemLoader(str(templates_dir)),
+        keep_trailing_newline=True,
+    )
+
+
 def _render_media_plans(
     spec: CompositionSpec,
     library_root: Path,
     root: Path,
     created: list[str],
     warnings: list[str],
+    writer: OutputWriter,
+    sources: SourceMap,
 ) -> None:
     """Stamp IMAGE-PLAN.md and NARRATION-PLAN.md at the project root.
 
@@ -323,15 +341,14 @@ def _render_media_plans(
         )
         return
 
-    env = Environment(
-        loader=FileSystemLoader(str(templates_dir)),
-        keep_trailing_newline=True,
-    )
+    from jinja2 import TemplateNotFound
+
+    env = _media_environment(templates_dir)
     context = {"project_name": spec.project.name}
 
     for template_name, output_name in _MEDIA_PLAN_FILES:
         dest = root / output_name
-        if dest.exists():
+        if writer.exists(dest):
             logger.info("Media plan already present, not overwriting: %s", dest)
             continue
         try:
@@ -339,8 +356,9 @@ def _render_media_plans(
         except TemplateNotFound:
             warnings.append(f"Media plan template missing: {template_name}")
             continue
-        dest.write_text(template.render(**context), encoding="utf-8")
+        writer.write_text(dest, template.render(**context))
         created.append(output_name)
+        sources.add(dest, [templates_dir / template_name])
         logger.info("Wrote media plan: %s", dest)
 
 
@@ -349,6 +367,7 @@ def scaffold_project(
     output_dir: str | Path,
     library_root: str | Path | None = None,
     library_index: LibraryIndex | None = None,
+    writer: OutputWriter | None = None,
 ) -> StageResult:
     """Create the directory skeleton for a generated Claude Code project.
 
@@ -369,13 +388,21 @@ def scaffold_project(
             the generated ``composition.yml`` is augmented with a
             ``contracts:`` block sourced from per-persona ``contracts.yml``
             files and the artifact-type registry. See ADR-013.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
 
     Returns:
         A StageResult listing all directories that were created.
     """
     root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(root)
     created: list[str] = []
     warnings: list[str] = []
+    source_root = library_root
+    if source_root is None:
+        source_root = library_index.library_root if library_index is not None else root
+    sources = SourceMap(root, source_root)
 
     # Collect all directories to create
     dirs_to_create: list[Path] = []
@@ -399,11 +426,11 @@ def scaffold_project(
         )
 
     # Track which directories already exist so we know what we actually created
-    existing = {d for d in dirs_to_create if d.exists()}
+    existing = {d for d in dirs_to_create if writer.exists(d)}
 
     # Create all directories
     for dir_path in dirs_to_create:
-        dir_path.mkdir(parents=True, exist_ok=True)
+        writer.mkdir(dir_path)
         if dir_path not in existing:
             rel = str(dir_path.relative_to(root))
             if dir_path == root:
@@ -420,11 +447,10 @@ def scaffold_project(
     # second scaffold pass over an unchanged spec is a true no-op.
     composition_path = root / "ai" / "team" / "composition.yml"
     previous_composition = (
-        composition_path.read_text(encoding="utf-8")
-        if composition_path.exists()
+        writer.read_text(composition_path)
+        if writer.exists(composition_path)
         else None
     )
-    save_composition(spec, composition_path)
     # Append the static orchestration policy block so tooling and
     # cold-start agents can read the team model from composition.yml
     # directly. This is policy, not input — it is identical across
@@ -434,37 +460,41 @@ def scaffold_project(
         if library_index is not None
         else ""
     )
-    composition_path.write_text(
-        composition_path.read_text(encoding="utf-8")
-        + _ORCHESTRATION_YAML_BLOCK
-        + contracts_block,
-        encoding="utf-8",
+    composition_text = (
+        dump_composition(spec) + _ORCHESTRATION_YAML_BLOCK + contracts_block
     )
-    if previous_composition != composition_path.read_text(encoding="utf-8"):
+    writer.write_text(composition_path, composition_text)
+    if contracts_block:
+        sources.add(composition_path, [
+            Path(info.path) / "contracts.yml"
+            for info in map(library_index.persona_by_id, (p.id for p in spec.team.personas))
+            if info is not None
+        ] + [Path(library_index.library_root) / "contracts" / "artifact-types.yml"])
+    if previous_composition != composition_text:
         created.append(str(composition_path.relative_to(root)))
         logger.info("Wrote composition snapshot: %s", composition_path)
 
     # Emit a starter README.md at the project root. Overlay-safe: do not
     # overwrite an existing README the user has customized.
     readme_path = root / "README.md"
-    if not readme_path.exists():
-        readme_path.write_text(_render_readme(spec), encoding="utf-8")
+    if not writer.exists(readme_path):
+        writer.write_text(readme_path, _render_readme(spec))
         created.append("README.md")
         logger.info("Wrote starter README: %s", readme_path)
 
     # Emit a starter project charter under ai/context/. Overlay-safe so a
     # filled-in charter is never clobbered. See ADR-003 / BEAN-252.
     charter_path = root / "ai" / "context" / "project-charter.md"
-    if not charter_path.exists():
-        charter_path.write_text(_render_project_charter(spec), encoding="utf-8")
+    if not writer.exists(charter_path):
+        writer.write_text(charter_path, _render_project_charter(spec))
         created.append(str(charter_path.relative_to(root)))
         logger.info("Wrote starter project charter: %s", charter_path)
 
     # MEMORY.md — durable lessons the retro step appends to (SPEC-009).
     # Overlay-safe: never clobber accumulated memory.
     memory_path = root / "MEMORY.md"
-    if not memory_path.exists():
-        memory_path.write_text(_MEMORY_SCAFFOLD, encoding="utf-8")
+    if not writer.exists(memory_path):
+        writer.write_text(memory_path, _MEMORY_SCAFFOLD)
         created.append("MEMORY.md")
         logger.info("Wrote MEMORY.md scaffold: %s", memory_path)
 
@@ -477,7 +507,7 @@ def scaffold_project(
             )
         else:
             _render_media_plans(
-                spec, Path(library_root), root, created, warnings,
+                spec, Path(library_root), root, created, warnings, writer, sources,
             )
 
     logger.info(
@@ -486,4 +516,4 @@ def scaffold_project(
         len(warnings),
     )
 
-    return StageResult(wrote=created, warnings=warnings)
+    return StageResult(wrote=created, warnings=warnings, sources=sources.as_dict())
@@ -13,6 +13,7 @@ from foundry_app.core.models import (
     StageResult,
     _persona_dirname,
 )
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter
 
 logger = logging.getLogger(__name__)
 
@@ -287,27 +288,31 @@ def _index_row() -> str:
     )
 
 
-def _upsert_index(index_path: Path) -> bool:
+def _upsert_index(index_path: Path, writer: OutputWriter) -> bool:
     """Append the starter bean row to _index.md, or create the file.
 
     Returns True if the file was created or modified, False if the row was
     already present (idempotent re-runs produce no change).
     """
     row = _index_row()
-    if not index_path.exists():
-        index_path.parent.mkdir(parents=True, exist_ok=True)
-        index_path.write_text(_INDEX_HEADER + row, encoding="utf-8")
+    if not writer.exists(index_path):
+        writer.mkdir(index_path.parent)
+        writer.write_text(index_path, _INDEX_HEADER + row)
         return True
 
-    existing = index_path.read_text(encoding="utf-8")
+    existing = writer.read_text(index_path)
     if _STARTER_BEAN_ID in existing:
         return False
     updated = existing.rstrip() + "\n" + row
-    index_path.write_text(updated, encoding="utf-8")
+    writer.write_text(index_path, updated)
     return True
 
 
-def seed_tasks(spec: CompositionSpec, output_dir: str | Path) -> StageResult:
+def seed_tasks(
+    spec: CompositionSpec,
+    output_dir: str | Path,
+    writer: OutputWriter | None = None,
+) -> StageResult:
     """Emit the starter BEAN-001-bootstrap bean for a freshly generated project.
 
     Writes:
@@ -323,24 +328,26 @@ def seed_tasks(spec: CompositionSpec, output_dir: str | Path) -> StageResult:
     Args:
         spec: The composition spec describing the project.
         output_dir: Root directory of the generated project.
+        writer: Where generated output goes; defaults to writing straight
+            to disk under *output_dir*.
 
     Returns:
         A StageResult listing files written and any warnings.
     """
     root = Path(output_dir)
+    if writer is None:
+        writer = DirectoryWriter(root)
     wrote: list[str] = []
     warnings: list[str] = []
 
     bean_dir = root / "ai" / "beans" / _STARTER_BEAN_DIR
     tasks_dir = bean_dir / "tasks"
-    tasks_dir.mkdir(parents=True, exist_ok=True)
+    writer.mkdir(tasks_dir)
 
-    charter_present = (root / _CHARTER_REL_PATH).exists()
+    charter_present = writer.exists(root / _CHARTER_REL_PATH)
 
     bean_md_path = bean_dir / "bean.md"
-    bean_md_path.write_text(
-        _render_bean_md(spec, charter_present), encoding="utf-8"
-    )
+    writer.write_text(bean_md_path, _render_bean_md(spec, charter_present))
     wrote.append(str(bean_md_path.relative_to(root)))
 
     templates = _get_task_templates(spec.generation.seed_mode)
@@ -367,15 +374,14 @@ def seed_tasks(spec: CompositionSpec, output_dir: str | Path) -> StageResult:
             slug = _slugify(task_desc)
             filename = f"{task_num:02d}-{leaf}-{slug}.md"
             task_path = tasks_dir / filename
-            task_path.write_text(
-                _render_task_md(task_num, persona_id, task_desc),
-                encoding="utf-8",
+            writer.write_text(
+                task_path, _render_task_md(task_num, persona_id, task_desc),
             )
             wrote.append(str(task_path.relative_to(root)))
             task_num += 1
 
     index_path = root / "ai" / "beans" / "_index.md"
-    if _upsert_index(index_path):
+    if _upsert_index(index_path, writer):
         wrote.append(str(index_path.relative_to(root)))
 
     logger.info(
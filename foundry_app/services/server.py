@@ -0,0 +1,351 @@
+"""Generation server — keeps the library warm across many generations.
+
+Every ``foundry-cli generate`` process pays interpreter start-up, a library
+index (or a cache revalidation) and a ``git rev-parse`` before it writes a
+file. ``GenerationService`` holds the ``LibraryIndex`` and library version
+in memory instead, and revalidates them before each request with a
+stat-only walk of the library (``library_fingerprint``): adding, removing,
+or rewriting any library file re-indexes on the next request. Compiled
+Jinja templates and the parsed MCP registry are kept warm by the stages
+themselves and follow their files' mtimes.
+
+``make_server`` exposes the service as a small JSON protocol over
+localhost HTTP or a Unix socket:
+
+- ``GET /health`` — library root, version, and entry counts.
+- ``POST /validate`` — body is a ``GenerationRequest``; replies
+  ``{"valid", "validation"}``.
+- ``POST /generate`` — same body; replies ``{"valid", "manifest",
+  "validation", "overlay_plan"}``.
+- ``POST /reload`` — re-index now, whatever the fingerprint says.
+
+Malformed requests get 400 and generation failures 500, both with an
+``{"error": ...}`` body. A POST whose ``Content-Type`` is not
+``application/json`` gets 415. Over TCP, a request whose ``Host`` header is
+not ``127.0.0.1:<port>`` or ``localhost:<port>`` gets 403, so a web page
+cannot reach the server through DNS rebinding. Each request runs on its own thread. The warm
+library is replaced under a lock and never mutated once published, and
+generations into the same output directory run one at a time.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socketserver
+import threading
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from pydantic import ValidationError
+
+from foundry_app.core.models import (
+    CompositionSpec,
+    GenerationManifest,
+    GenerationRequest,
+    LibraryIndex,
+    OverlayPlan,
+    ValidationResult,
+)
+from foundry_app.io.composition_io import load_composition
+from foundry_app.services.generator import (
+    DEFAULT_STAGE_WORKERS,
+    _get_library_version,
+    generate_project,
+    validate_composition,
+)
+from foundry_app.services.library_cache import library_fingerprint, load_library_index
+from foundry_app.services.library_indexer import build_library_index
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 8765
+
+# Request bodies larger than this are refused rather than read.
+_MAX_BODY_BYTES = 4 * 1024 * 1024
+
+
+class RequestError(ValueError):
+    """A request the server cannot act on; reported to the client as 400."""
+
+
+class WarmLibrary(NamedTuple):
+    """One published snapshot of the library: index, version, fingerprint."""
+
+    index: LibraryIndex
+    version: str
+    fingerprint: str
+
+
+class GenerationService:
+    """Generate and validate compositions against an in-memory library.
+
+    Thread-safe: any number of threads may call ``validate`` and
+    ``generate`` concurrently.
+    """
+
+    def __init__(
+        self,
+        library_root: str | Path,
+        cache_dir: str | Path | None = None,
+        stage_workers: int = DEFAULT_STAGE_WORKERS,
+    ) -> None:
+        self.library_root = Path(library_root)
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.stage_workers = stage_workers
+        self.loads = 0
+        self._warm: WarmLibrary | None = None
+        self._warm_lock = threading.Lock()
+        self._output_locks: dict[Path, threading.Lock] = {}
+        self._output_locks_guard = threading.Lock()
+
+    # -- warm library -------------------------------------------------------
+
+    def _load(self, fingerprint: str) -> WarmLibrary:
+        if self.cache_dir is not None:
+            index = load_library_index(self.library_root, self.cache_dir)
+        else:
+            index = build_library_index(self.library_root)
+        # Build the id lookup maps now, before the index is shared between
+        # request threads.
+        index.persona_by_id("")
+        index.expertise_by_id("")
+        index.hook_pack_by_id("")
+        index.artifact_type_by_name("")
+        self.loads += 1
+        logger.info(
+            "Loaded library %s (%d personas, %d expertise, %d hook packs)",
+            self.library_root, len(index.personas), len(index.expertise),
+            len(index.hook_packs),
+        )
+        return WarmLibrary(index, _get_library_version(self.library_root), fingerprint)
+
+    def library(self) -> WarmLibrary:
+        """Return the warm library, re-indexing first if any file changed."""
+        fingerprint = library_fingerprint(self.library_root)
+        with self._warm_lock:
+            if self._warm is None or self._warm.fingerprint != fingerprint:
+                self._warm = self._load(fingerprint)
+            return self._warm
+
+    def reload(self) -> WarmLibrary:
+        """Re-index the library unconditionally."""
+        fingerprint = library_fingerprint(self.library_root)
+        with self._warm_lock:
+            self._warm = self._load(fingerprint)
+            return self._warm
+
+    def health(self) -> dict[str, Any]:
+        warm = self.library()
+        return {
+            "status": "ok",
+            "library_root": str(self.library_root),
+            "library_version": warm.version,
+            "personas": len(warm.index.personas),
+            "expertise": len(warm.index.expertise),
+            "hook_packs": len(warm.index.hook_packs),
+            "loads": self.loads,
+        }
+
+    # -- requests -----------------------------------------------------------
+
+    @staticmethod
+    def _composition(request: GenerationRequest) -> CompositionSpec:
+        if (request.composition is None) == (request.composition_path is None):
+            raise RequestError(
+                "Give exactly one of 'composition' or 'composition_path'"
+            )
+        if request.composition is not None:
+            # Validation fills in the default team, so work on a copy.
+            return request.composition.model_copy(deep=True)
+        path = Path(request.composition_path)
+        if not path.is_file():
+            raise RequestError(f"Composition file not found: {path}")
+        try:
+            return load_composition(path)
+        except Exception as exc:
+            raise RequestError(f"Error loading composition: {exc}") from exc
+
+    def _output_lock(self, composition: CompositionSpec, output_root: str | None):
+        if output_root is not None:
+            output_dir = Path(output_root)
+        else:
+            output_dir = (
+                Path(composition.project.output_root)
+                / composition.project.resolved_output_folder
+            )
+        key = output_dir.resolve()
+        with self._output_locks_guard:
+            return self._output_locks.setdefault(key, threading.Lock())
+
+    def validate(self, request: GenerationRequest) -> ValidationResult:
+        """Run pre-generation validation without writing anything."""
+        composition = self._composition(request)
+        validation, _stage = validate_composition(
+            composition, self.library().index, request.strictness, request.overlay,
+        )
+        return validation
+
+    def generate(
+        self, request: GenerationRequest,
+    ) -> tuple[GenerationManifest, ValidationResult, OverlayPlan | None]:
+        """Generate the requested project; returns what ``generate_project`` does."""
+        if request.dry_run and not request.overlay:
+            raise RequestError("dry_run requires overlay")
+        composition = self._composition(request)
+        warm = self.library()
+        with self._output_lock(composition, request.output_root):
+            return generate_project(
+                composition=composition,
+                library_root=self.library_root,
+                output_root=request.output_root,
+                strictness=request.strictness,
+                overlay=request.overlay,
+                dry_run=request.dry_run,
+                force=request.force,
+                cache_dir=self.cache_dir,
+                stage_workers=self.stage_workers,
+                library_index=warm.index,
+                library_version=warm.version,
+                force_rebuild=request.force_rebuild,
+            )
+
+
+# ---------------------------------------------------------------------------
+# HTTP transport
+# ---------------------------------------------------------------------------
+
+
+def _dump(model) -> Any:
+    return None if model is None else model.model_dump(mode="json")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "foundry-serve"
+
+    def log_message(self, format: str, *args: Any) -> None:
+        # The default writes to stderr and reads a client address, which
+        # Unix-socket connections don't have.
+        logger.debug("%s", format % args)
+
+    def _reply(self, status: int, payload: dict[str, Any]) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _host_allowed(self) -> bool:
+        if isinstance(self.server, _UnixHTTPServer):
+            return True
+        port = self.server.server_address[1]
+        host = self.headers.get("Host", "").strip().lower()
+        return host in (f"127.0.0.1:{port}", f"localhost:{port}")
+
+    def _refuse_host(self) -> bool:
+        """Reply 403 and return True when the Host header is not this server."""
+        if self._host_allowed():
+            return False
+        self._reply(
+            HTTPStatus.FORBIDDEN, {"error": f"Host not allowed: {self.headers.get('Host')}"},
+        )
+        return True
+
+    def _request(self) -> GenerationRequest:
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError as exc:
+            raise RequestError("Invalid Content-Length") from exc
+        if length > _MAX_BODY_BYTES:
+            raise RequestError("Request body too large")
+        raw = self.rfile.read(length) if length > 0 else b"{}"
+        try:
+            return GenerationRequest.model_validate_json(raw)
+        except ValidationError as exc:
+            raise RequestError(str(exc)) from exc
+
+    def do_GET(self) -> None:
+        if self._refuse_host():
+            return
+        if self.path != "/health":
+            self._reply(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+            return
+        self._reply(HTTPStatus.OK, self.server.service.health())
+
+    def do_POST(self) -> None:
+        if self._refuse_host():
+            return
+        content_type = self.headers.get("Content-Type", "")
+        if content_type.split(";", 1)[0].strip().lower() != "application/json":
+            self._reply(
+                HTTPStatus.UNSUPPORTED_MEDIA_TYPE,
+                {"error": f"Content-Type must be application/json, got {content_type!r}"},
+            )
+            return
+        service: GenerationService = self.server.service
+        try:
+            if self.path == "/reload":
+                service.reload()
+                payload = service.health()
+            elif self.path == "/validate":
+                validation = service.validate(self._request())
+                payload = {"valid": validation.is_valid, "validation": _dump(validation)}
+            elif self.path == "/generate":
+                manifest, validation, plan = service.generate(self._request())
+                payload = {
+                    "valid": validation.is_valid,
+                    "manifest": _dump(manifest),
+                    "validation": _dump(validation),
+                    "overlay_plan": _dump(plan),
+                }
+            else:
+                self._reply(HTTPStatus.NOT_FOUND, {"error": f"Unknown path: {self.path}"})
+                return
+        except RequestError as exc:
+            self._reply(HTTPStatus.BAD_REQUEST, {"error": str(exc)})
+            return
+        except Exception as exc:
+            logger.exception("Request %s failed", self.path)
+            self._reply(HTTPStatus.INTERNAL_SERVER_ERROR, {"error": str(exc)})
+            return
+        self._reply(HTTPStatus.OK, payload)
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(
+    service: GenerationService,
+    host: str = "127.0.0.1",
+    port: int = DEFAULT_PORT,
+    socket_path: str | Path | None = None,
+) -> socketserver.BaseServer:
+    """Bind a threaded JSON server for *service*; the caller runs ``serve_forever``.
+
+    With *socket_path* the server listens on that Unix socket (a stale
+    socket file is replaced); otherwise on *host*:*port*, where port 0
+    picks a free port.
+    """
+    if socket_path is not None:
+        path = Path(socket_path)
+        if path.is_socket():
+            path.unlink()
+        server: socketserver.BaseServer = _UnixHTTPServer(str(path), _Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    server.service = service
+    return server
+
+
+def remove_socket(server: socketserver.BaseServer) -> None:
+    """Delete the socket file of a Unix-socket server after it has closed."""
+    if isinstance(server, _UnixHTTPServer):
+        try:
+            os.unlink(server.server_address)
+        except OSError:
+            pass
@@ -0,0 +1,92 @@
+"""Per-stage timing and I/O measurement for the generation pipeline.
+
+``measure_stage`` runs one stage function and attaches a ``StageMetrics``
+to its result. Everything is measured on the calling thread, so stages
+running concurrently on the generator's thread pool are not charged for
+each other's work:
+
+- wall time (``time.perf_counter``) and CPU time (``time.thread_time``);
+- bytes read and written, from the thread's ``rchar``/``wchar`` counters
+  in ``/proc/thread-self/io`` (Linux). These count every read and write
+  syscall, library reads included; output a ``VirtualTree`` holds in
+  memory is not I/O and is not counted;
+- the growth of the process's peak RSS (``ru_maxrss``). This one is
+  process-wide: a stage overlapping another may be charged for its
+  neighbour's peak.
+
+Work done in child processes (the ``git`` calls behind subtree setup) is
+not counted.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from foundry_app.core.models import StageMetrics, StageResult
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+_THREAD_IO = Path("/proc/thread-self/io")
+
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+_RSS_DIVISOR = 1024 if sys.platform == "darwin" else 1
+
+
+def _thread_io() -> tuple[int, int] | None:
+    """Return this thread's (bytes read, bytes written), or None if unknown."""
+    try:
+        text = _THREAD_IO.read_text(encoding="ascii")
+    except OSError:
+        return None
+    counters = dict(line.split(": ", 1) for line in text.splitlines() if ": " in line)
+    try:
+        return int(counters["rchar"]), int(counters["wchar"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss // _RSS_DIVISOR
+
+
+def measure_stage(
+    func: Callable[..., StageResult], *args, **kwargs,
+) -> StageResult:
+    """Call ``func(*args, **kwargs)`` and return its result with metrics set."""
+    rss_before = _peak_rss_kb()
+    io_before = _thread_io()
+    cpu_start = time.thread_time()
+    wall_start = time.perf_counter()
+
+    result = func(*args, **kwargs)
+
+    wall = time.perf_counter() - wall_start
+    cpu = time.thread_time() - cpu_start
+    io_after = _thread_io()
+    rss_after = _peak_rss_kb()
+
+    bytes_read = bytes_written = None
+    if io_before is not None and io_after is not None:
+        bytes_read = io_after[0] - io_before[0]
+        bytes_written = io_after[1] - io_before[1]
+    rss_delta = None
+    if rss_before is not None and rss_after is not None:
+        rss_delta = rss_after - rss_before
+
+    metrics = StageMetrics(
+        wall_seconds=wall,
+        cpu_seconds=cpu,
+        bytes_read=bytes_read,
+        bytes_written=bytes_written,
+        files=len(result.wrote),
+        peak_rss_delta_kb=rss_delta,
+    )
+    return result.model_copy(update={"metrics": metrics})
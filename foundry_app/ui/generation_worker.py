@@ -36,12 +36,17 @@ class GenerationWorker(QThread):
     def run(self) -> None:
         """Execute generation (runs on the worker thread)."""
         from foundry_app.services.generator import generate_project
+        from foundry_app.services.library_cache import default_cache_dir
 
         try:
             manifest, validation, _overlay = generate_project(
                 composition=self._spec,
                 library_root=self._library_root,
                 stage_callback=self._on_stage,
+                cache_dir=default_cache_dir(),
+                # Generate is an explicit request from the user: always run
+                # the pipeline rather than report the project up to date.
+                force_rebuild=True,
             )
 
             if not validation.is_valid:
@@ -405,12 +405,15 @@ class MainWindow(QMainWindow):
         """Index the library and load it into the builder wizard."""
         from pathlib import Path
 
-        from foundry_app.services.library_indexer import build_library_index
+        from foundry_app.services.library_cache import (
+            default_cache_dir,
+            load_library_index,
+        )
 
         lib_path = Path(path)
         if lib_path.is_dir():
             try:
-                index = build_library_index(lib_path)
+                index = load_library_index(lib_path, default_cache_dir())
                 self._builder_screen.set_library_index(index)
             except Exception:
                 logger.warning("Failed to index library at %s", path, exc_info=True)
@@ -0,0 +1,151 @@
+"""Time the hooks one agent edit fires: one process per script, the dispatcher, its daemon.
+
+Copies the library hook scripts into a throwaway git project, builds the
+``hook-policy`` settings three ways with ``write_safety`` (dispatch off,
+dispatch on, dispatch through the hook daemon), and runs every
+PreToolUse and PostToolUse command matching an Edit,
+as Claude Code would, for a plain file edit and for a bean Done
+transition. Prints the best per-edit latency over the rounds and checks
+all wirings agree on whether the edit is blocked. The daemon is started
+by a warm-up edit and stopped at the end.
+
+Run with::
+
+    uv run python scripts/bench_hooks.py [--rounds 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+# Make `foundry_app` importable when invoked as a plain script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from foundry_app.core.models import (  # noqa: E402
+    CompositionSpec,
+    HookPackSelection,
+    HooksConfig,
+    ProjectIdentity,
+)
+from foundry_app.services.safety_writer import write_safety  # noqa: E402
+
+HOOKS_SOURCE = _REPO_ROOT / "ai-team-library" / "claude" / "hooks"
+SETTINGS_SOURCE = _REPO_ROOT / "ai-team-library" / "claude" / "settings" / "settings.json"
+
+
+def _project(root: Path, **options: bool) -> list[str]:
+    """Generate hooks into *root*; return the Edit hook commands in run order."""
+    hooks = root / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    for script in HOOKS_SOURCE.glob("*.py"):
+        shutil.copy2(script, hooks / script.name)
+    shutil.copy2(SETTINGS_SOURCE, root / ".claude" / "settings.json")
+    spec = CompositionSpec(
+        project=ProjectIdentity(name="Bench", slug="bench"),
+        hooks=HooksConfig(
+            packs=[HookPackSelection(id="hook-policy")],
+            **options,
+        ),
+    )
+    write_safety(spec, root)
+    settings = json.loads((root / ".claude" / "settings.json").read_text(encoding="utf-8"))
+    return [
+        hook["command"]
+        for event in ("PreToolUse", "PostToolUse")
+        for entry in settings["hooks"][event]
+        if re.fullmatch(entry.get("matcher", ".*"), "Edit")
+        for hook in entry["hooks"]
+    ]
+
+
+def _git_project(root: Path) -> None:
+    subprocess.run(["git", "init", "-q", "-b", "feature/bench", str(root)], check=True)
+    bean = root / "ai" / "beans" / "BEAN-042-bench" / "bean.md"
+    bean.parent.mkdir(parents=True)
+    bean.write_text("| **Status** | In Progress |\n", encoding="utf-8")
+
+
+def _payloads(root: Path) -> dict[str, str]:
+    bean = root / "ai" / "beans" / "BEAN-042-bench" / "bean.md"
+    return {
+        "plain edit": json.dumps({"tool_name": "Edit", "tool_input": {
+            "file_path": str(root / "README.md"), "old_string": "a", "new_string": "b",
+        }}),
+        "bean -> Done": json.dumps({"tool_name": "Edit", "tool_input": {
+            "file_path": str(bean),
+            "old_string": "| **Status** | In Progress |",
+            "new_string": "| **Status** | Done |",
+        }}),
+    }
+
+
+def _fire(commands: list[str], payload: str, cwd: Path) -> list[int]:
+    return [
+        subprocess.run(
+            ["bash", "-c", command], input=payload, cwd=cwd,
+            capture_output=True, text=True,
+        ).returncode
+        for command in commands
+    ]
+
+
+def _time(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    with ExitStack() as stack:
+        tmp = stack.enter_context(tempfile.TemporaryDirectory())
+        wirings = {}
+        for label, hooks in (
+            ("Per-script", {"dispatch": False}),
+            ("Dispatcher", {}),
+            ("Daemon", {"daemon": True}),
+        ):
+            root = Path(tmp) / label
+            _git_project(root)
+            wirings[label] = (root, _project(root, **hooks))
+
+        daemon_root = wirings["Daemon"][0]
+        stack.callback(
+            subprocess.run,
+            [sys.executable, str(daemon_root / ".claude" / "hooks" / "foundry-hooks.py"), "--stop"],
+        )
+        _fire(wirings["Daemon"][1], _payloads(daemon_root)["plain edit"], daemon_root)
+        time.sleep(0.5)  # let the daemon the warm-up edit started come up
+
+        for label, (root, commands) in wirings.items():
+            print(f"{label}: {len(commands)} hook processes per Edit")
+        for case in _payloads(Path(tmp)):
+            print(f"\n{case}")
+            blocked = set()
+            for label, (root, commands) in wirings.items():
+                payload = _payloads(root)[case]
+                blocked.add(2 in _fire(commands, payload, root))
+                elapsed = _time(lambda: _fire(commands, payload, root), args.rounds)
+                print(f"  {label:12} {elapsed * 1000:8.1f} ms")
+            assert len(blocked) == 1, f"wirings disagree on blocking for {case}"
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
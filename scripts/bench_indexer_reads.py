@@ -0,0 +1,81 @@
+"""Count file reads and YAML parses performed by ``build_library_index``.
+
+Indexes the real ai-team-library once with ``Path.read_text`` and
+``yaml.safe_load`` instrumented, then reports per-kind totals and the worst
+file (most reads / parses of a single path). The one-pass markdown metadata
+extractor in ``library_indexer`` should keep both at one per file.
+
+Run with::
+
+    uv run python scripts/bench_indexer_reads.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+
+# Make `foundry_app` importable when invoked as a plain script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+import yaml  # noqa: E402
+
+from foundry_app.services.library_indexer import build_library_index  # noqa: E402
+
+LIBRARY_ROOT = _REPO_ROOT / "ai-team-library"
+
+
+def _kind(path: Path) -> str:
+    rel = path.relative_to(LIBRARY_ROOT).parts
+    return rel[0] if rel[0] != "claude" else "/".join(rel[:2])
+
+
+def main() -> int:
+    reads: Counter[Path] = Counter()
+    parses = 0
+    real_read_text = Path.read_text
+    real_safe_load = yaml.safe_load
+
+    def counting_read_text(self, *args, **kwargs):
+        reads[self] += 1
+        return real_read_text(self, *args, **kwargs)
+
+    def counting_safe_load(stream):
+        nonlocal parses
+        parses += 1
+        return real_safe_load(stream)
+
+    with (
+        patch.object(Path, "read_text", counting_read_text),
+        patch.object(yaml, "safe_load", counting_safe_load),
+    ):
+        start = time.perf_counter()
+        index = build_library_index(LIBRARY_ROOT)
+        elapsed = time.perf_counter() - start
+
+    by_kind: Counter[str] = Counter()
+    files_by_kind: Counter[str] = Counter()
+    for path, count in reads.items():
+        by_kind[_kind(path)] += count
+        files_by_kind[_kind(path)] += 1
+
+    print(
+        f"Indexed {len(index.personas)} personas, {len(index.expertise)} expertise, "
+        f"{len(index.hook_packs)} hook packs in {elapsed * 1000:.1f} ms"
+    )
+    print(f"{'kind':<16}{'files':>8}{'reads':>8}")
+    for kind in sorted(by_kind):
+        print(f"{kind:<16}{files_by_kind[kind]:>8}{by_kind[kind]:>8}")
+    worst, worst_count = reads.most_common(1)[0] if reads else (None, 0)
+    print(f"Total reads: {sum(reads.values())} across {len(reads)} files")
+    print(f"Max reads of one file: {worst_count} ({worst})")
+    print(f"YAML parses: {parses}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
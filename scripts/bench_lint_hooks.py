@@ -0,0 +1,127 @@
+"""Time the pre-commit-lint hook per edit: whole-project ruff versus the edited file only.
+
+Builds a throwaway git project of ``--files`` Python modules, copies the
+library hook scripts into it, and fires the PostToolUse lint hook for one
+edit the way Claude Code would — first the command the pack used to
+register (``ruff check --quiet .``), then the generated one
+(``lint-python.py``, which lints only ``tool_input.file_path``), on its
+own and as the generator wires it: folded into the ``foundry-hooks.py``
+dispatcher entry that already runs the library's PostToolUse scripts, so
+its cost there is what it adds to that entry. Also times the debounced
+project pass the new hook runs at Stop. Prints the best latency over the
+rounds; ruff's cache is warm for every wiring.
+
+Run with::
+
+    uv run python scripts/bench_lint_hooks.py [--files 2000] [--rounds 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+HOOKS_SOURCE = _REPO_ROOT / "ai-team-library" / "claude" / "hooks"
+
+# The pre-commit-lint command before hooks linted only the edited file.
+WHOLE_PROJECT = (
+    "ruff check --quiet . 2>/dev/null || echo 'WARNING: Lint issues detected. "
+    "Run ruff check --fix before committing.'"
+)
+EDITED_FILE = "python3 .claude/hooks/lint-python.py"
+
+# The library's PostToolUse entry, without and with the lint script folded in.
+DISPATCHED = "python3 .claude/hooks/foundry-hooks.py telemetry-stamp.py format-on-save.py"
+DISPATCHED_LINT = f"{DISPATCHED} lint-python.py"
+
+_MODULE = '''"""Module {n}."""
+
+from __future__ import annotations
+
+import os
+
+
+def handler_{n}(items: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {{}}
+    for item in items:
+        key = os.path.basename(item)
+        counts[key] = counts.get(key, 0) + 1
+    return counts
+'''
+
+
+def _project(root: Path, files: int) -> Path:
+    """Create the project; return the file the benchmark edits."""
+    subprocess.run(["git", "init", "-q", str(root)], check=True)
+    for n in range(files):
+        package = root / "src" / f"pkg{n // 100}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"mod{n}.py").write_text(_MODULE.format(n=n), encoding="utf-8")
+    hooks = root / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    for script in HOOKS_SOURCE.glob("*.py"):
+        shutil.copy2(script, hooks / script.name)
+    return root / "src" / "pkg0" / "mod0.py"
+
+
+def _fire(command: str, payload: str, cwd: Path) -> None:
+    subprocess.run(["bash", "-c", command], input=payload, cwd=cwd, capture_output=True, text=True)
+
+
+def _time(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    if shutil.which("ruff") is None:
+        print("ruff is not on PATH", file=sys.stderr)
+        return 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        edited = _project(root, args.files)
+        edit = json.dumps({"hook_event_name": "PostToolUse", "tool_name": "Edit",
+                           "tool_input": {"file_path": str(edited)}})
+        stop = json.dumps({"hook_event_name": "Stop"})
+        state = root / ".git" / "foundry-lint-state.json"
+
+        def stop_pass() -> None:
+            # Due, and outside the debounce window, as after a turn of edits.
+            state.write_text(json.dumps({"python": {"due": True, "last_pass": 0}}))
+            _fire(EDITED_FILE, stop, root)
+
+        _fire(WHOLE_PROJECT, edit, root)  # warm ruff's cache
+        print(f"{args.files} Python files, best of {args.rounds}")
+        for label, fn in (
+            ("per edit, whole project", lambda: _fire(WHOLE_PROJECT, edit, root)),
+            ("per edit, edited file", lambda: _fire(EDITED_FILE, edit, root)),
+        ):
+            print(f"  {label:32} {_time(fn, args.rounds) * 1000:8.1f} ms")
+        added = (
+            _time(lambda: _fire(DISPATCHED_LINT, edit, root), args.rounds)
+            - _time(lambda: _fire(DISPATCHED, edit, root), args.rounds)
+        )
+        print(f"  {'per edit, edited file dispatched':32} {added * 1000:8.1f} ms added")
+        print(f"  {'at Stop, project pass':32} {_time(stop_pass, args.rounds) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Time ``--overlay --dry-run`` planning against a project with a large bean history.
+
+Generates ``examples/small-python-team.yml`` into a temp directory, adds
+``--beans`` user-owned bean folders under ``ai/beans``, then times a dry-run
+overlay re-generation twice: once with the file ledger Foundry writes
+(``.foundry/file-hashes.json``), and once with it removed. Without the
+ledger, planning reads every target file and walks the whole target tree.
+
+Run with::
+
+    uv run python scripts/bench_overlay_plan.py [--beans 5000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Make `foundry_app` importable when invoked as a plain script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from foundry_app.io.composition_io import load_composition  # noqa: E402
+from foundry_app.services.file_ledger import LEDGER_PATH  # noqa: E402
+from foundry_app.services.generator import generate_project  # noqa: E402
+from foundry_app.services.library_indexer import build_library_index  # noqa: E402
+
+LIBRARY_ROOT = _REPO_ROOT / "ai-team-library"
+COMPOSITION = _REPO_ROOT / "examples" / "small-python-team.yml"
+
+
+def _dry_run(project: Path, library) -> tuple[float, int]:
+    spec = load_composition(COMPOSITION)
+    start = time.perf_counter()
+    _, _, plan = generate_project(
+        spec, LIBRARY_ROOT, output_root=project, overlay=True, dry_run=True,
+        library_index=library, library_version="",
+    )
+    return time.perf_counter() - start, len(plan.actions)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--beans", type=int, default=5000)
+    args = parser.parse_args(argv)
+    logging.disable(logging.WARNING)
+
+    library = build_library_index(LIBRARY_ROOT)
+    with tempfile.TemporaryDirectory(prefix="foundry-bench-") as tmp:
+        project = Path(tmp) / "project"
+        generate_project(
+            load_composition(COMPOSITION), LIBRARY_ROOT, output_root=project,
+            library_index=library, library_version="",
+        )
+        beans = project / "ai" / "beans"
+        body = "# Bean\n\n" + "Notes line.\n" * 200
+        for i in range(args.beans):
+            bean = beans / f"BEAN-{i + 1000:05d}-history"
+            bean.mkdir(parents=True)
+            (bean / "bean.md").write_text(body, encoding="utf-8")
+
+        with_ledger, actions = _dry_run(project, library)
+        (project / LEDGER_PATH).unlink()
+        without_ledger, legacy_actions = _dry_run(project, library)
+
+    print(f"User-owned bean files: {args.beans}")
+    print(f"With ledger:    {with_ledger * 1000:8.1f} ms ({actions} actions)")
+    print(f"Without ledger: {without_ledger * 1000:8.1f} ms ({legacy_actions} actions)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
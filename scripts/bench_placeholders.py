@@ -0,0 +1,118 @@
+"""Time placeholder substitution over the real library: regex callback vs compiled templates.
+
+Collects every persona and expertise ``.md`` file in ``ai-team-library``
+and substitutes each against one context per core persona — the shape of
+a generation, where the same expertise entry file is rendered once per
+team member. Times the previous per-match regex callback, a cold compile
+plus render, and a warm render, and checks all three produce the same
+text.
+
+Run with::
+
+    uv run python scripts/bench_placeholders.py [--rounds 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+# Make `foundry_app` importable when invoked as a plain script.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_REPO_ROOT))
+
+from foundry_app.services.placeholders import (  # noqa: E402
+    _PLACEHOLDER_RE,
+    PlaceholderTemplate,
+    compile_template,
+)
+
+LIBRARY_ROOT = _REPO_ROOT / "ai-team-library"
+
+
+def _regex_substitute(text: str, context: dict[str, str]) -> str:
+    """The substitution the compiler used before compiled templates."""
+
+    def resolve(match: re.Match[str]) -> str:
+        expr = match.group(1).strip()
+        join_match = re.match(r"(\w+)\s*\|\s*join\(\s*\"([^\"]*)\"\s*\)", expr)
+        if join_match:
+            value = context.get(join_match.group(1))
+            if value is None:
+                return match.group(0)
+            return join_match.group(2).join(v.strip() for v in value.split(","))
+        value = context.get(expr)
+        return match.group(0) if value is None else value
+
+    return _PLACEHOLDER_RE.sub(resolve, text)
+
+
+def _contexts() -> list[dict[str, str]]:
+    personas = sorted(p.name for p in (LIBRARY_ROOT / "personas" / "core").iterdir())
+    return [
+        {
+            "project_name": "Bench Project",
+            "expertise": "python, react, postgresql",
+            "team": ", ".join(personas),
+            "persona": persona,
+            "strictness": "standard",
+        }
+        for persona in personas
+    ]
+
+
+def _time(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    paths = sorted(
+        [*(LIBRARY_ROOT / "personas").rglob("*.md"), *(LIBRARY_ROOT / "expertise").rglob("*.md")]
+    )
+    texts = [p.read_text(encoding="utf-8") for p in paths]
+    contexts = _contexts()
+
+    expected = [_regex_substitute(t, c) for t in texts for c in contexts]
+    templates = [compile_template(t) for t in texts]
+    assert [tpl.render(c) for tpl in templates for c in contexts] == expected
+    placeholders = sum(len(tpl.placeholders) for tpl in templates)
+
+    def regex() -> None:
+        for text in texts:
+            for context in contexts:
+                _regex_substitute(text, context)
+
+    def cold() -> None:
+        for text in texts:
+            template = PlaceholderTemplate(text)
+            for context in contexts:
+                template.render(context)
+
+    def warm() -> None:
+        for template in templates:
+            for context in contexts:
+                template.render(context)
+
+    renders = len(texts) * len(contexts)
+    print(f"Library files: {len(texts)} ({placeholders} placeholders), contexts: "
+          f"{len(contexts)}, renders per round: {renders}")
+    for label, fn in (("Regex callback", regex), ("Compile+render", cold),
+                      ("Warm render", warm)):
+        print(f"{label:15} {_time(fn, args.rounds) * 1000:8.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""Time the security-scan hook per edit as the branch touches more files.
+
+Builds a throwaway git project, modifies ``N`` tracked files (the files a
+long-running bean has touched), and fires the PostToolUse secret scan for
+one edit the way Claude Code would — first the command the pack used to
+register (grep over ``git diff --name-only``), then the generated one
+(``secret-scan.py``, which scans the edit's text from the payload). Prints
+the best latency over the rounds for each ``N``.
+
+Run with::
+
+    uv run python scripts/bench_secret_scan.py [--touched 10 200 1000] [--rounds 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+HOOKS_SOURCE = _REPO_ROOT / "ai-team-library" / "claude" / "hooks"
+
+# The security-scan command before the hook scanned only the edit.
+CHANGED_FILES = (
+    "git diff --name-only 2>/dev/null "
+    "| xargs grep -lE "
+    "'(?i)(api[_-]?key|secret[_-]?key|password\\s*=|token\\s*=|"
+    "BEGIN (RSA |EC )?PRIVATE KEY)' 2>/dev/null "
+    "&& echo 'WARNING: Potential secrets detected in changed files.' "
+    "|| true"
+)
+EDITED_TEXT = "python3 .claude/hooks/secret-scan.py"
+
+_MODULE = "def handler_{n}(items):\n    return [item.strip() for item in items]\n" * 20
+
+
+def _project(root: Path, touched: int) -> None:
+    git = ["git", "-C", str(root), "-c", "user.name=b", "-c", "user.email=b@b"]
+    subprocess.run(["git", "init", "-q", str(root)], check=True)
+    for n in range(touched):
+        (root / f"mod{n}.py").write_text(_MODULE.format(n=n), encoding="utf-8")
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+    for n in range(touched):
+        with (root / f"mod{n}.py").open("a", encoding="utf-8") as fh:
+            fh.write(f"VALUE_{n} = {n}\n")
+    hooks = root / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    for script in ("secret-scan.py", "hook_state.py"):
+        shutil.copy2(HOOKS_SOURCE / script, hooks / script)
+
+
+def _fire(command: str, payload: str, cwd: Path) -> None:
+    subprocess.run(["bash", "-c", command], input=payload, cwd=cwd,
+                   capture_output=True, text=True)
+
+
+def _time(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--touched", type=int, nargs="+", default=[10, 200, 1000])
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    header = f"{'touched files':>14} {'changed files':>14} {'edited text':>12}"
+    print(f"{header}  (best of {args.rounds})")
+    for touched in args.touched:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _project(root, touched)
+            payload = json.dumps({"tool_name": "Edit", "tool_input": {
+                "file_path": str(root / "mod0.py"),
+                "old_string": "VALUE_0 = 0", "new_string": "VALUE_0 = 1",
+            }})
+            old = _time(lambda: _fire(CHANGED_FILES, payload, root), args.rounds)
+            new = _time(lambda: _fire(EDITED_TEXT, payload, root), args.rounds)
+            print(f"{touched:>14} {old * 1000:>11.1f} ms {new * 1000:>9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
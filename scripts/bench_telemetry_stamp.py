@@ -0,0 +1,128 @@
+"""Time the telemetry-stamp hook on the edits it sees: mostly not bean files.
+
+Copies the library hook scripts into a throwaway git project on a feature
+branch and runs ``telemetry-stamp.py`` as Claude Code would for a plain
+source edit (the common path, rejected from the raw payload), a bean edit
+with nothing to stamp, and a bean Done transition (branch start from git
+the first time, from the per-branch cache after). A bare interpreter
+start is printed as the floor. Prints the best latency over the rounds
+and how many git processes one run of each case starts (counted through
+a logging ``git`` shim on PATH), which is steadier than the timings on a
+busy machine.
+
+Run with::
+
+    uv run python scripts/bench_telemetry_stamp.py [--rounds 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+HOOKS_SOURCE = _REPO_ROOT / "ai-team-library" / "claude" / "hooks"
+
+HOOK = [sys.executable, ".claude/hooks/telemetry-stamp.py"]
+
+_BEAN = """\
+| Field | Value |
+|-------|-------|
+| **Status** | {status} |
+| **Started** | 2026-01-01 09:00 |
+| **Completed** | — |
+| **Duration** | — |
+"""
+
+
+def _project(root: Path) -> Path:
+    """Create the project; return its bean file."""
+    git = ["git", "-C", str(root), "-c", "user.name=b", "-c", "user.email=b@b"]
+    subprocess.run(["git", "init", "-q", "-b", "main", str(root)], check=True)
+    (root / "README.md").write_text("bench\n", encoding="utf-8")
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "init"], check=True)
+    subprocess.run([*git, "checkout", "-q", "-b", "bean/bench"], check=True)
+    bean = root / "ai" / "beans" / "BEAN-042-bench" / "bean.md"
+    bean.parent.mkdir(parents=True)
+    bean.write_text(_BEAN.format(status="In Progress"), encoding="utf-8")
+    subprocess.run([*git, "add", "."], check=True)
+    subprocess.run([*git, "commit", "-q", "-m", "bean"], check=True)
+    hooks = root / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    for script in ("telemetry-stamp.py", "hook_state.py"):
+        shutil.copy2(HOOKS_SOURCE / script, hooks / script)
+    return bean
+
+
+def _git_shim(shim_dir: Path, log: Path) -> dict[str, str]:
+    """Environment whose ``git`` logs each call to *log*, then runs the real git."""
+    real = shutil.which("git")
+    shim = shim_dir / "git"
+    shim.write_text(f'#!/bin/sh\necho git >> "{log}"\nexec "{real}" "$@"\n')
+    shim.chmod(0o755)
+    return {**os.environ, "PATH": f"{shim_dir}{os.pathsep}{os.environ['PATH']}"}
+
+
+def _fire(command: list[str], payload: str, cwd: Path, env: dict[str, str] | None = None) -> None:
+    subprocess.run(command, input=payload, cwd=cwd, capture_output=True, text=True, env=env)
+
+
+def _time(fn, rounds: int) -> float:
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        bean = _project(root)
+        cache = root / ".git" / "foundry-branch-start.json"
+        shim_dir = Path(tempfile.mkdtemp(dir=tmp))
+        log = shim_dir / "calls.log"
+        env = _git_shim(shim_dir, log)
+
+        def edit(path: Path) -> str:
+            return json.dumps({"tool_name": "Edit", "tool_input": {"file_path": str(path)}})
+
+        def done(cached: bool) -> None:
+            bean.write_text(_BEAN.format(status="Done"), encoding="utf-8")
+            if not cached:
+                cache.unlink(missing_ok=True)
+            _fire(HOOK, edit(bean), root, env)
+
+        def git_calls(fn) -> int:
+            log.unlink(missing_ok=True)
+            fn()
+            return len(log.read_text().splitlines()) if log.exists() else 0
+
+        print(f"telemetry-stamp.py, best of {args.rounds}")
+        for label, fn in (
+            ("interpreter start (floor)", lambda: _fire([sys.executable, "-c", ""], "", root)),
+            ("non-bean edit", lambda: _fire(HOOK, edit(root / "src" / "app.py"), root, env)),
+            ("bean edit, nothing to stamp", lambda: _fire(HOOK, edit(bean), root, env)),
+            ("bean -> Done, git", lambda: done(cached=False)),
+            ("bean -> Done, cached start", lambda: done(cached=True)),
+        ):
+            elapsed = _time(fn, args.rounds)
+            print(f"  {label:28} {elapsed * 1000:8.1f} ms  {git_calls(fn)} git")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,3 +14,9 @@ def qapp():
     """Session-scoped QApplication instance."""
     app = QApplication.instance() or QApplication([])
     yield app
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache_dir(tmp_path_factory, monkeypatch):
+    """Keep Foundry's persistent caches out of the user's home during tests."""
+    monkeypatch.setenv("FOUNDRY_CACHE_DIR", str(tmp_path_factory.mktemp("foundry-cache")))
@@ -0,0 +1,101 @@
+"""Tests for foundry_app.services.affected — projects reached by a library change."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from foundry_app.core.models import AffectedProject, GenerationManifest, StageResult
+from foundry_app.io.composition_io import save_manifest
+from foundry_app.services.affected import find_affected, regenerate_affected
+
+
+def _write_project(root: Path, name: str, sources: dict[str, list[str]] | None) -> Path:
+    project = root / name
+    manifest = GenerationManifest(
+        run_id="run-1",
+        stages={"compile": StageResult(wrote=list(sources or {}), sources=sources)},
+    )
+    save_manifest(manifest, project / "manifest.json")
+    return project
+
+
+@pytest.fixture
+def projects(tmp_path: Path) -> Path:
+    root = tmp_path / "projects"
+    _write_project(root, "python-app", {
+        "ai/generated/expertise/python.md": ["expertise/python/conventions.md"],
+        "CLAUDE.md": ["personas/core/developer/persona.md"],
+    })
+    _write_project(root, "react-app", {
+        "ai/generated/expertise/react.md": ["expertise/react/conventions.md"],
+    })
+    return root
+
+
+# ---------------------------------------------------------------------------
+# find_affected
+# ---------------------------------------------------------------------------
+
+
+class TestFindAffected:
+
+    def test_only_dependent_projects_and_files(self, tmp_path: Path, projects: Path):
+        lib = tmp_path / "library"
+        affected = find_affected(
+            [lib / "expertise" / "python" / "conventions.md"], projects, lib,
+        )
+
+        assert [Path(p.project_dir).name for p in affected] == ["python-app"]
+        assert affected[0].files == ["ai/generated/expertise/python.md"]
+        assert affected[0].composition.endswith("ai/team/composition.yml")
+        assert not affected[0].provenance_missing
+
+    def test_library_relative_paths(self, tmp_path: Path, projects: Path):
+        affected = find_affected(
+            ["expertise/react/conventions.md"], projects, tmp_path / "library",
+        )
+        assert [Path(p.project_dir).name for p in affected] == ["react-app"]
+
+    def test_directory_matches_everything_below_it(self, tmp_path: Path, projects: Path):
+        affected = find_affected(["expertise/"], projects, tmp_path / "library")
+        assert [Path(p.project_dir).name for p in affected] == ["python-app", "react-app"]
+
+    def test_prefix_is_not_a_directory_match(self, tmp_path: Path, projects: Path):
+        assert find_affected(["expertise/py"], projects, tmp_path / "library") == []
+
+    def test_manifest_without_provenance_is_always_affected(
+        self, tmp_path: Path, projects: Path,
+    ):
+        _write_project(projects, "legacy-app", None)
+        affected = find_affected(["workflows/x.yaml"], projects, tmp_path / "library")
+        assert [Path(p.project_dir).name for p in affected] == ["legacy-app"]
+        assert affected[0].provenance_missing
+
+    def test_unreadable_manifest_is_skipped(self, tmp_path: Path, projects: Path):
+        (projects / "broken").mkdir()
+        (projects / "broken" / "manifest.json").write_text("{")
+        affected = find_affected(["expertise"], projects, tmp_path / "library")
+        assert "broken" not in [Path(p.project_dir).name for p in affected]
+
+
+# ---------------------------------------------------------------------------
+# regenerate_affected
+# ---------------------------------------------------------------------------
+
+
+class TestRegenerateAffected:
+
+    def test_refuses_a_snapshot_for_another_folder(self, tmp_path: Path):
+        project = tmp_path / "projects" / "renamed"
+        composition = project / "ai" / "team" / "composition.yml"
+        composition.parent.mkdir(parents=True)
+        composition.write_text(yaml.dump({"project": {"name": "Demo", "slug": "demo"}}))
+
+        with pytest.raises(ValueError, match="generates into 'demo'"):
+            regenerate_affected(
+                [AffectedProject(project_dir=str(project), composition=str(composition))],
+                tmp_path / "library",
+            )
@@ -458,6 +458,28 @@ class TestAgentPlaceholderRendering:
             for w in result.warnings
         ), f"Expected unresolved-placeholder warning; got: {result.warnings}"
 
+    def test_stale_agent_files_not_checked(self, tmp_path: Path):
+        """Only the agent files this run writes are checked for placeholders."""
+        lib_root = tmp_path / "library"
+        persona_dir = lib_root / "personas" / "developer"
+        persona_dir.mkdir(parents=True)
+        (persona_dir / "persona.md").write_text(
+            "# Persona: Developer\n\n## Mission\n\nBuild {{ project_name }}.\n",
+            encoding="utf-8",
+        )
+        index = LibraryIndex(
+            library_root=str(lib_root),
+            personas=[PersonaInfo(id="developer", name="Developer", path=str(persona_dir))],
+        )
+        output = tmp_path / "output"
+        stale = output / ".claude" / "agents" / "retired.md"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("Leftover {{ old_var }}\n", encoding="utf-8")
+
+        result = write_agents(_make_spec(), index, lib_root, output)
+
+        assert not any("Unresolved" in w for w in result.warnings), result.warnings
+
 
 # ---------------------------------------------------------------------------
 # Team agent verification — real library, multiple personas
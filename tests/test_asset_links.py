@@ -0,0 +1,149 @@
+"""Tests for foundry_app.services.asset_links — linked asset materialization."""
+
+from __future__ import annotations
+
+import os
+import stat
+from pathlib import Path
+
+from foundry_app.core.models import LinkMode
+from foundry_app.services.asset_links import AssetLinker, detach
+from foundry_app.services.output_writer import DirectoryWriter
+
+
+def _source(tmp_path: Path, name: str = "guard.py", mode: int = 0o755) -> Path:
+    src = tmp_path / "library" / name
+    src.parent.mkdir(parents=True, exist_ok=True)
+    src.write_text("print('guard')\n")
+    src.chmod(mode)
+    return src
+
+
+def _dest(tmp_path: Path, project: str = "project") -> Path:
+    dest = tmp_path / project / ".claude" / "hooks" / "guard.py"
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    return dest
+
+
+# ---------------------------------------------------------------------------
+# AssetLinker
+# ---------------------------------------------------------------------------
+
+
+class TestAssetLinker:
+
+    def test_hardlinks_share_one_store_entry(self, tmp_path: Path):
+        src = _source(tmp_path)
+        linker = AssetLinker(LinkMode.HARDLINK, tmp_path / "store")
+        first, second = _dest(tmp_path, "a"), _dest(tmp_path, "b")
+
+        linker.place(src, first)
+        linker.place(src, second)
+
+        assert linker.mode is LinkMode.HARDLINK
+        assert os.path.samefile(first, second)
+        assert not os.path.samefile(first, src)
+        assert first.stat().st_nlink == 3  # the store entry plus two projects
+        assert stat.S_IMODE(first.stat().st_mode) == 0o755
+
+    def test_symlinks_point_into_store(self, tmp_path: Path):
+        src = _source(tmp_path)
+        store = tmp_path / "store"
+        dest = _dest(tmp_path)
+
+        AssetLinker(LinkMode.SYMLINK, store).place(src, dest)
+
+        assert dest.is_symlink()
+        assert Path(os.readlink(dest)).is_relative_to(store)
+        assert dest.read_text() == src.read_text()
+
+    def test_store_keeps_content_when_library_changes(self, tmp_path: Path):
+        src = _source(tmp_path)
+        dest = _dest(tmp_path)
+        AssetLinker(LinkMode.HARDLINK, tmp_path / "store").place(src, dest)
+
+        src.write_text("changed\n")
+
+        assert dest.read_text() == "print('guard')\n"
+
+    def test_replaces_existing_file(self, tmp_path: Path):
+        src = _source(tmp_path)
+        dest = _dest(tmp_path)
+        dest.write_text("old")
+        linker = AssetLinker(LinkMode.HARDLINK, tmp_path / "store")
+
+        linker.place(src, dest)
+        linker.place(src, dest)
+
+        assert dest.read_text() == src.read_text()
+        assert sorted(p.name for p in dest.parent.iterdir()) == ["guard.py"]
+
+    def test_no_store_falls_back_to_copy(self, tmp_path: Path):
+        src = _source(tmp_path)
+        dest = _dest(tmp_path)
+        linker = AssetLinker(LinkMode.SYMLINK)
+
+        linker.place(src, dest)
+
+        assert linker.mode is LinkMode.COPY
+        assert "no cache directory" in linker.fallback
+        assert not dest.is_symlink()
+        assert dest.stat().st_nlink == 1
+
+    def test_link_failure_falls_back_to_copy(self, tmp_path: Path, monkeypatch):
+        def cross_device(src, dst):
+            raise OSError(18, "Invalid cross-device link")
+
+        monkeypatch.setattr(os, "link", cross_device)
+        src = _source(tmp_path)
+        dest = _dest(tmp_path)
+        linker = AssetLinker(LinkMode.HARDLINK, tmp_path / "store")
+
+        linker.place(src, dest)
+
+        assert linker.mode is LinkMode.COPY
+        assert "cross-device" in linker.fallback
+        assert dest.read_text() == src.read_text()
+        assert stat.S_IMODE(dest.stat().st_mode) == 0o755
+
+    def test_reflink_clones_or_copies(self, tmp_path: Path):
+        src = _source(tmp_path)
+        dest = _dest(tmp_path)
+        linker = AssetLinker(LinkMode.REFLINK)
+
+        linker.place(src, dest)
+
+        # Most test filesystems cannot clone; either way the bytes land.
+        assert linker.mode in (LinkMode.REFLINK, LinkMode.COPY)
+        assert dest.read_bytes() == src.read_bytes()
+        assert not os.path.samefile(dest, src)
+
+
+# ---------------------------------------------------------------------------
+# Writing over linked files
+# ---------------------------------------------------------------------------
+
+
+class TestDetach:
+
+    def test_rewriting_a_linked_file_leaves_the_store_alone(self, tmp_path: Path):
+        src = _source(tmp_path, "settings.json", 0o644)
+        root = tmp_path / "project"
+        dest = root / ".claude" / "settings.json"
+        dest.parent.mkdir(parents=True)
+        writer = DirectoryWriter(root, AssetLinker(LinkMode.HARDLINK, tmp_path / "store"))
+        writer.copy_file(src, dest)
+        other = _dest(tmp_path, "other").with_name("settings.json")
+        os.link(dest, other)
+
+        writer.write_text(dest, "{}")
+
+        assert dest.read_text() == "{}"
+        assert other.read_text() == src.read_text()
+
+    def test_plain_files_are_kept(self, tmp_path: Path):
+        path = tmp_path / "plain.md"
+        path.write_text("x")
+        detach(path)
+        detach(tmp_path / "missing.md")
+        assert path.exists()
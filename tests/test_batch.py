@@ -0,0 +1,208 @@
+"""Tests for foundry_app.services.batch — multi-composition generation."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from foundry_app.core.models import BatchSummary
+from foundry_app.services import batch
+from foundry_app.services.batch import discover_compositions, generate_batch
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_library_dir(tmp_path: Path) -> Path:
+    """Create a minimal library directory on disk and return its path."""
+    lib_root = tmp_path / "library"
+    persona_dir = lib_root / "personas" / "core" / "developer"
+    persona_dir.mkdir(parents=True)
+    (persona_dir / "persona.md").write_text("# Developer persona")
+    expertise_dir = lib_root / "expertise" / "python"
+    expertise_dir.mkdir(parents=True)
+    (expertise_dir / "conventions.md").write_text("# Python conventions")
+    workflows = lib_root / "workflows"
+    workflows.mkdir()
+    (workflows / "mcp-registry.yaml").write_text(
+        "servers: {}\nbaseline: []\nby_expertise: {}\n"
+    )
+    return lib_root
+
+
+def _write_composition(directory: Path, slug: str, **overrides) -> Path:
+    """Write a minimal composition YAML named after *slug*."""
+    data = {
+        "project": {"name": slug.title(), "slug": slug},
+        "expertise": [{"id": "python"}],
+        "team": {"personas": [{"id": "developer"}]},
+    }
+    data.update(overrides)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{slug}.yml"
+    path.write_text(yaml.dump(data), encoding="utf-8")
+    return path
+
+
+# ---------------------------------------------------------------------------
+# discover_compositions
+# ---------------------------------------------------------------------------
+
+
+class TestDiscoverCompositions:
+
+    def test_directory_lists_yaml_files_sorted(self, tmp_path: Path):
+        comps = tmp_path / "comps"
+        _write_composition(comps, "beta")
+        _write_composition(comps, "alpha")
+        (comps / "notes.txt").write_text("ignored")
+        (comps / "gamma.yaml").write_text("project: {}")
+        found = discover_compositions([comps])
+        assert [p.name for p in found] == ["alpha.yml", "beta.yml", "gamma.yaml"]
+
+    def test_glob_pattern(self, tmp_path: Path):
+        comps = tmp_path / "comps"
+        _write_composition(comps, "one")
+        _write_composition(comps, "two")
+        found = discover_compositions([str(comps / "t*.yml")])
+        assert [p.name for p in found] == ["two.yml"]
+
+    def test_duplicates_dropped_in_source_order(self, tmp_path: Path):
+        comps = tmp_path / "comps"
+        two = _write_composition(comps, "two")
+        _write_composition(comps, "one")
+        found = discover_compositions([two, comps])
+        assert [p.name for p in found] == ["two.yml", "one.yml"]
+
+    def test_unmatched_source_raises(self, tmp_path: Path):
+        with pytest.raises(FileNotFoundError, match="No composition files"):
+            discover_compositions([str(tmp_path / "*.yml")])
+
+    def test_repo_examples(self):
+        examples = Path(__file__).resolve().parent.parent / "examples"
+        found = discover_compositions([str(examples / "*.yml")])
+        assert found == sorted(examples.glob("*.yml"))
+
+
+# ---------------------------------------------------------------------------
+# generate_batch
+# ---------------------------------------------------------------------------
+
+
+class TestGenerateBatch:
+
+    def test_generates_each_project_with_manifest(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        comps = [
+            _write_composition(tmp_path / "comps", "alpha"),
+            _write_composition(tmp_path / "comps", "beta"),
+        ]
+        out = tmp_path / "out"
+        summary = generate_batch(comps, lib, output_root=out, jobs=1)
+
+        assert isinstance(summary, BatchSummary)
+        assert [i.status for i in summary.items] == ["ok", "ok"]
+        assert [i.project_name for i in summary.items] == ["Alpha", "Beta"]
+        for item, slug in zip(summary.items, ("alpha", "beta")):
+            assert item.output_dir == str(out / slug)
+            assert item.files_written > 0
+            manifest = json.loads(Path(item.manifest_path).read_text())
+            assert manifest["run_id"] == item.run_id
+            assert manifest["library_version"] == summary.library_version
+
+    def test_library_indexed_once(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        comps = [
+            _write_composition(tmp_path / "comps", slug) for slug in ("a", "b", "c")
+        ]
+        with (
+            patch.object(
+                batch, "build_library_index", wraps=batch.build_library_index,
+            ) as build,
+            patch.object(
+                batch, "_get_library_version", return_value="abc1234",
+            ) as version,
+            patch(
+                "foundry_app.services.generator.build_library_index",
+            ) as per_project_build,
+            patch(
+                "foundry_app.services.generator._get_library_version",
+            ) as per_project_version,
+        ):
+            summary = generate_batch(comps, lib, output_root=tmp_path / "out", jobs=1)
+
+        assert len(summary.succeeded) == 3
+        assert build.call_count == 1
+        assert version.call_count == 1
+        per_project_build.assert_not_called()
+        per_project_version.assert_not_called()
+        assert summary.library_version == "abc1234"
+
+    def test_process_pool_matches_in_process(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        comps = [
+            _write_composition(tmp_path / "comps", slug) for slug in ("a", "b", "c")
+        ]
+        serial = generate_batch(comps, lib, output_root=tmp_path / "serial", jobs=1)
+        pooled = generate_batch(comps, lib, output_root=tmp_path / "pooled", jobs=2)
+
+        assert pooled.jobs == 2
+        assert [i.status for i in pooled.items] == ["ok", "ok", "ok"]
+        assert [i.composition for i in pooled.items] == [str(c) for c in comps]
+        assert [i.files_written for i in pooled.items] == [
+            i.files_written for i in serial.items
+        ]
+
+    def test_bad_composition_reported_not_raised(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        good = _write_composition(tmp_path / "comps", "good")
+        bad = tmp_path / "comps" / "bad.yml"
+        bad.write_text("project: {name: 1\n", encoding="utf-8")
+        summary = generate_batch([bad, good], lib, output_root=tmp_path / "out", jobs=1)
+
+        assert [i.status for i in summary.items] == ["invalid", "ok"]
+        assert "Error loading composition" in summary.items[0].errors[0]
+
+    def test_validation_errors_mark_item_invalid(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        comp = _write_composition(
+            tmp_path / "comps", "ghost", team={"personas": [{"id": "ghost"}]},
+        )
+        summary = generate_batch([comp], lib, output_root=tmp_path / "out", jobs=1)
+
+        (item,) = summary.items
+        assert item.status == "invalid"
+        assert any("ghost" in e for e in item.errors)
+        assert item.manifest_path == ""
+
+    def test_shared_output_directory_rejected(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        first = _write_composition(tmp_path / "a", "same")
+        second = _write_composition(tmp_path / "b", "same")
+        summary = generate_batch(
+            [first, second], lib, output_root=tmp_path / "out", jobs=2,
+        )
+
+        assert [i.status for i in summary.items] == ["ok", "invalid"]
+        assert "already generated by" in summary.items[1].errors[0]
+
+    def test_item_callback_sees_every_result(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        comps = [_write_composition(tmp_path / "comps", s) for s in ("a", "b")]
+        seen = []
+        generate_batch(
+            comps, lib, output_root=tmp_path / "out", jobs=1,
+            item_callback=seen.append,
+        )
+        assert sorted(i.project_name for i in seen) == ["A", "B"]
+
+    def test_empty_batch(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        summary = generate_batch([], lib, jobs=4)
+        assert summary.items == []
+        assert summary.jobs == 1
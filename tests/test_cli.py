@@ -1,5 +1,6 @@
 """Tests for foundry_app.cli — command-line interface."""
 
+import json
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -9,9 +10,9 @@ import yaml
 
 @pytest.fixture(autouse=True)
 def _isolate_logging(tmp_path):
-    """Prevent setup_logging from creating dirs via unmocked QStandardPaths."""
+    """Keep setup_logging from creating log dirs under the real home."""
     with patch(
-        "foundry_app.core.logging_config.QStandardPaths.writableLocation",
+        "foundry_app.core.logging_config._app_data_dir",
         return_value=str(tmp_path),
     ):
         yield
@@ -24,6 +25,8 @@ from foundry_app.cli import (
     main,
 )
 from foundry_app.core.models import (
+    BatchItemResult,
+    BatchSummary,
     GenerationManifest,
     OverlayPlan,
     Severity,
@@ -115,6 +118,47 @@ class TestParser:
         args = parser.parse_args(["generate", "comp.yml", "--force"])
         assert args.force is True
 
+    def test_link_mode_flag(self):
+        parser = _build_parser()
+        assert parser.parse_args(["generate", "c.yml"]).link_mode is None
+        args = parser.parse_args(["generate", "c.yml", "--link-mode", "hardlink"])
+        assert args.link_mode == "hardlink"
+
+    def test_force_rebuild_flag(self):
+        parser = _build_parser()
+        assert parser.parse_args(["generate", "c.yml"]).force_rebuild is False
+        assert parser.parse_args(["generate", "c.yml", "--force-rebuild"]).force_rebuild
+        assert parser.parse_args(["generate-batch", "c.yml", "--force-rebuild"]).force_rebuild
+
+    def test_no_cache_flag(self):
+        parser = _build_parser()
+        assert parser.parse_args(["generate", "comp.yml"]).no_cache is False
+        args = parser.parse_args(["generate", "comp.yml", "--no-cache"])
+        assert args.no_cache is True
+
+    def test_index_workers(self):
+        parser = _build_parser()
+        assert parser.parse_args(["generate", "comp.yml"]).index_workers is None
+        args = parser.parse_args(["generate", "comp.yml", "--index-workers", "8"])
+        assert args.index_workers == 8
+
+    def test_stage_workers(self):
+        parser = _build_parser()
+        assert parser.parse_args(["generate", "comp.yml"]).stage_workers is None
+        args = parser.parse_args(["generate", "comp.yml", "--stage-workers", "1"])
+        assert args.stage_workers == 1
+
+    def test_profile_flags(self):
+        parser = _build_parser()
+        args = parser.parse_args(["generate", "comp.yml"])
+        assert args.profile is False
+        assert args.profile_out is None
+        args = parser.parse_args([
+            "generate", "comp.yml", "--profile", "--profile-out", "run.pstats",
+        ])
+        assert args.profile is True
+        assert args.profile_out == "run.pstats"
+
     def test_strictness_choices(self):
         parser = _build_parser()
         for level in ["light", "standard", "strict"]:
@@ -131,6 +175,43 @@ class TestParser:
         args = parser.parse_args(["generate", "comp.yml", "--output", "/out"])
         assert args.output == "/out"
 
+    def test_generate_batch_subcommand(self):
+        parser = _build_parser()
+        args = parser.parse_args(["generate-batch", "a.yml", "examples/"])
+        assert args.command == "generate-batch"
+        assert args.compositions == ["a.yml", "examples/"]
+        assert args.jobs is None
+        assert args.output_root is None
+        args = parser.parse_args(["generate-batch", "a.yml", "-j", "3", "--summary", "s.json"])
+        assert args.jobs == 3
+        assert args.summary == "s.json"
+
+    def test_affected_subcommand(self):
+        parser = _build_parser()
+        args = parser.parse_args(["affected", "expertise/python", "workflows"])
+        assert args.command == "affected"
+        assert args.changed == ["expertise/python", "workflows"]
+        assert args.projects_root == "generated-projects"
+        assert args.regenerate is False
+        args = parser.parse_args([
+            "affected", "x.md", "--projects-root", "out", "--regenerate", "-j", "2",
+        ])
+        assert args.projects_root == "out"
+        assert args.regenerate is True
+        assert args.jobs == 2
+
+    def test_serve_subcommand(self):
+        parser = _build_parser()
+        args = parser.parse_args(["serve"])
+        assert args.command == "serve"
+        assert args.port is None
+        assert args.socket is None
+        args = parser.parse_args(["serve", "--socket", "/tmp/foundry.sock", "--no-cache"])
+        assert args.socket == "/tmp/foundry.sock"
+        assert args.no_cache is True
+        with pytest.raises(SystemExit):
+            parser.parse_args(["serve", "--port", "1", "--socket", "s"])
+
 
 # ---------------------------------------------------------------------------
 # main() entry point
@@ -189,6 +270,54 @@ class TestGenerate:
         captured = capsys.readouterr()
         assert "Generation complete" in captured.out
 
+    @patch("foundry_app.services.generator.generate_project")
+    @patch("foundry_app.io.composition_io.load_composition")
+    def test_up_to_date_reported(self, mock_load, mock_gen, tmp_path: Path, capsys):
+        comp = _write_composition(tmp_path)
+        lib = _make_library(tmp_path)
+
+        mock_load.return_value = MagicMock()
+        mock_load.return_value.project.name = "Test"
+        manifest = GenerationManifest(run_id="20260207-120000", up_to_date=True)
+        mock_gen.return_value = (manifest, ValidationResult(), None)
+
+        result = main([
+            "generate", str(comp),
+            "--library", str(lib),
+            "--force-rebuild",
+        ])
+        assert result == EXIT_SUCCESS
+        assert mock_gen.call_args.kwargs["force_rebuild"] is True
+        captured = capsys.readouterr()
+        assert "Up to date" in captured.out
+        assert "Generation complete" not in captured.out
+
+    @patch("foundry_app.services.generator.generate_project")
+    @patch("foundry_app.io.composition_io.load_composition")
+    def test_archive_passed_through(self, mock_load, mock_gen, tmp_path: Path, capsys):
+        comp = _write_composition(tmp_path)
+        lib = _make_library(tmp_path)
+
+        mock_load.return_value = MagicMock()
+        mock_load.return_value.project.name = "Test"
+        mock_gen.return_value = _mock_generate_result()
+
+        archive = str(tmp_path / "project.zip")
+        result = main([
+            "generate", str(comp),
+            "--library", str(lib),
+            "--archive", archive,
+        ])
+        assert result == EXIT_SUCCESS
+        assert mock_gen.call_args.kwargs["archive"] == archive
+        assert f"Archive: {archive}" in capsys.readouterr().out
+
+    def test_archive_with_overlay_rejected(self, tmp_path: Path, capsys):
+        comp = _write_composition(tmp_path)
+        result = main(["generate", str(comp), "--archive", "p.zip", "--overlay"])
+        assert result == EXIT_VALIDATION_ERROR
+        assert "--archive cannot be combined with --overlay" in capsys.readouterr().err
+
     @patch("foundry_app.services.generator.generate_project")
     @patch("foundry_app.io.composition_io.load_composition")
     def test_validation_errors_abort(self, mock_load, mock_gen, tmp_path: Path, capsys):
@@ -321,6 +450,54 @@ class TestGenerate:
         captured = capsys.readouterr()
         assert "Validation warnings" in captured.out
 
+    @patch("foundry_app.services.generator.generate_project")
+    @patch("foundry_app.io.composition_io.load_composition")
+    def test_profile_prints_stage_table(self, mock_load, mock_gen, tmp_path: Path, capsys):
+        from foundry_app.core.models import StageMetrics
+
+        comp = _write_composition(tmp_path)
+        lib = _make_library(tmp_path)
+        mock_load.return_value = MagicMock()
+        mock_load.return_value.project.name = "Test"
+        manifest, validation, plan = _mock_generate_result(files=3)
+        manifest.stages["scaffold"].metrics = StageMetrics(
+            wall_seconds=0.25, cpu_seconds=0.125, bytes_read=2048,
+            bytes_written=None, files=3, peak_rss_delta_kb=64,
+        )
+        mock_gen.return_value = (manifest, validation, plan)
+
+        result = main(["generate", str(comp), "--library", str(lib), "--profile"])
+
+        assert result == EXIT_SUCCESS
+        out = capsys.readouterr().out
+        assert "Stage profile:" in out
+        row = next(line for line in out.splitlines() if line.strip().startswith("scaffold"))
+        assert row.split() == ["scaffold", "250.0", "125.0", "2.0", "-", "3", "64"]
+
+    @patch("foundry_app.services.generator.generate_project")
+    @patch("foundry_app.io.composition_io.load_composition")
+    def test_profile_out_writes_stats_serially(
+        self, mock_load, mock_gen, tmp_path: Path, capsys,
+    ):
+        import pstats
+
+        comp = _write_composition(tmp_path)
+        lib = _make_library(tmp_path)
+        mock_load.return_value = MagicMock()
+        mock_load.return_value.project.name = "Test"
+        mock_gen.return_value = _mock_generate_result()
+        stats_path = tmp_path / "run.pstats"
+
+        result = main([
+            "generate", str(comp), "--library", str(lib),
+            "--stage-workers", "4", "--profile-out", str(stats_path),
+        ])
+
+        assert result == EXIT_SUCCESS
+        assert mock_gen.call_args.kwargs["stage_workers"] == 1
+        pstats.Stats(str(stats_path))
+        assert "Stage profile:" in capsys.readouterr().out
+
     def test_invalid_yaml_composition(self, tmp_path: Path, capsys):
         lib = _make_library(tmp_path)
         comp = tmp_path / "bad.yml"
@@ -335,6 +512,109 @@ class TestGenerate:
         assert "Error loading composition" in captured.err
 
 
+# ---------------------------------------------------------------------------
+# Generate-batch command
+# ---------------------------------------------------------------------------
+
+
+def _batch_summary(*statuses: str) -> BatchSummary:
+    return BatchSummary(
+        library_root="library",
+        items=[
+            BatchItemResult(composition=f"c{i}.yml", project_name=f"P{i}", status=s)
+            for i, s in enumerate(statuses)
+        ],
+    )
+
+
+class TestGenerateBatchCommand:
+
+    @patch("foundry_app.services.batch.generate_batch")
+    def test_success_writes_summary(self, mock_batch, tmp_path: Path, capsys):
+        comp = _write_composition(tmp_path)
+        lib = _make_library(tmp_path)
+        mock_batch.return_value = _batch_summary("ok")
+        summary_path = tmp_path / "reports" / "batch.json"
+
+        result = main([
+            "generate-batch", str(tmp_path / "*.yml"),
+            "--library", str(lib),
+            "--jobs", "2",
+            "--summary", str(summary_path),
+        ])
+
+        assert result == EXIT_SUCCESS
+        assert mock_batch.call_args.args[0] == [comp]
+        assert mock_batch.call_args.kwargs["jobs"] == 2
+        data = json.loads(summary_path.read_text(encoding="utf-8"))
+        assert data["items"][0]["status"] == "ok"
+        assert "1 succeeded, 0 failed" in capsys.readouterr().out
+
+    @patch("foundry_app.services.batch.generate_batch")
+    def test_exit_codes(self, mock_batch, tmp_path: Path):
+        comp = _write_composition(tmp_path)
+        lib = _make_library(tmp_path)
+        argv = ["generate-batch", str(comp), "--library", str(lib)]
+
+        mock_batch.return_value = _batch_summary("ok", "invalid")
+        assert main(argv) == EXIT_VALIDATION_ERROR
+        mock_batch.return_value = _batch_summary("invalid", "error")
+        assert main(argv) == EXIT_GENERATION_ERROR
+
+    def test_no_matching_compositions(self, tmp_path: Path, capsys):
+        lib = _make_library(tmp_path)
+        result = main([
+            "generate-batch", str(tmp_path / "*.yml"), "--library", str(lib),
+        ])
+        assert result == EXIT_VALIDATION_ERROR
+        assert "No composition files match" in capsys.readouterr().err
+
+    def test_rejects_zero_jobs(self, tmp_path: Path, capsys):
+        comp = _write_composition(tmp_path)
+        result = main(["generate-batch", str(comp), "--jobs", "0"])
+        assert result == EXIT_VALIDATION_ERROR
+        assert "--jobs" in capsys.readouterr().err
+
+
+class TestAffectedCommand:
+
+    def _projects(self, tmp_path: Path) -> Path:
+        from foundry_app.core.models import StageResult
+        from foundry_app.io.composition_io import save_manifest
+
+        root = tmp_path / "projects"
+        manifest = GenerationManifest(
+            run_id="20260207-120000",
+            stages={"compile": StageResult(sources={
+                "ai/generated/expertise/python.md": ["expertise/python/conventions.md"],
+            })},
+        )
+        save_manifest(manifest, root / "python-app" / "manifest.json")
+        return root
+
+    def test_lists_affected_files(self, tmp_path: Path, capsys):
+        root = self._projects(tmp_path)
+        result = main([
+            "affected", "expertise/python/conventions.md",
+            "--projects-root", str(root),
+        ])
+        assert result == EXIT_SUCCESS
+        out = capsys.readouterr().out
+        assert "Affected projects (1)" in out
+        assert "ai/generated/expertise/python.md" in out
+
+    def test_nothing_affected(self, tmp_path: Path, capsys):
+        root = self._projects(tmp_path)
+        result = main(["affected", "workflows", "--projects-root", str(root)])
+        assert result == EXIT_SUCCESS
+        assert "No generated projects depend" in capsys.readouterr().out
+
+    def test_missing_projects_root(self, tmp_path: Path, capsys):
+        result = main(["affected", "x.md", "--projects-root", str(tmp_path / "nope")])
+        assert result == EXIT_VALIDATION_ERROR
+        assert "projects root not found" in capsys.readouterr().err
+
+
 # ---------------------------------------------------------------------------
 # CLI integration (real composition loading, only generator mocked)
 # ---------------------------------------------------------------------------
@@ -379,3 +659,16 @@ class TestCLIIntegration:
         assert result == EXIT_SUCCESS
         call_args = mock_gen.call_args
         assert call_args.kwargs["output_root"] == str(out_dir)
+
+    @patch("foundry_app.services.generator.generate_project")
+    def test_index_cache_enabled_by_default(self, mock_gen, tmp_path: Path, monkeypatch):
+        comp = _write_composition(tmp_path)
+        lib = _make_library(tmp_path)
+        monkeypatch.setenv("FOUNDRY_CACHE_DIR", str(tmp_path / "cache"))
+        mock_gen.return_value = _mock_generate_result()
+
+        main(["generate", str(comp), "--library", str(lib)])
+        assert mock_gen.call_args.kwargs["cache_dir"] == tmp_path / "cache"
+
+        main(["generate", str(comp), "--library", str(lib), "--no-cache"])
+        assert mock_gen.call_args.kwargs["cache_dir"] is None
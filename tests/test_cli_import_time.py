@@ -0,0 +1,92 @@
+"""Cold-start guards for the headless CLI: import-time budget and no Qt.
+
+Each check runs in a fresh interpreter so modules already imported by the
+test session don't hide the real cost.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Cumulative ``-X importtime`` budgets in microseconds. Measured on a
+# developer machine: foundry_app.cli ~25 ms, the generate path ~260 ms.
+# Pulling pydantic models back into cli.py, or PySide6 into the generate
+# path, blows through these.
+CLI_IMPORT_BUDGET_US = 100_000
+GENERATE_IMPORT_BUDGET_US = 800_000
+
+
+def _run_python(*args: str, env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        cwd=REPO_ROOT,
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+
+def _cumulative_import_us(module: str) -> int:
+    """Import *module* with ``-X importtime`` and return its cumulative time."""
+    proc = _run_python("-X", "importtime", "-c", f"import {module}")
+    assert proc.returncode == 0, proc.stderr
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split(":", 1)[1].split("|")
+        if name.strip() == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+class TestImportBudget:
+
+    def test_cli_module_within_budget(self):
+        assert _cumulative_import_us("foundry_app.cli") < CLI_IMPORT_BUDGET_US
+
+    def test_generate_path_within_budget(self):
+        elapsed = _cumulative_import_us("foundry_app.services.generator")
+        assert elapsed < GENERATE_IMPORT_BUDGET_US
+
+
+class TestHeadlessGenerate:
+
+    def test_generate_runs_without_pyside6(self, tmp_path: Path):
+        # ``sys.modules[name] = None`` makes any import of PySide6 fail, as
+        # on an image without the Qt libraries.
+        script = (
+            "import sys\n"
+            "sys.modules['PySide6'] = None\n"
+            "from foundry_app.cli import main\n"
+            "sys.exit(main(sys.argv[1:]))\n"
+        )
+        proc = _run_python(
+            "-c", script,
+            "generate", "examples/small-python-team.yml",
+            "--output", str(tmp_path / "out"),
+            env={
+                "XDG_DATA_HOME": str(tmp_path / "data"),
+                "FOUNDRY_CACHE_DIR": str(tmp_path / "cache"),
+            },
+        )
+
+        assert proc.returncode == 0, proc.stdout + proc.stderr
+        assert (tmp_path / "out" / "CLAUDE.md").is_file()
+        assert (tmp_path / "data" / "logs" / "foundry.log").is_file()
+
+    def test_cli_import_loads_no_heavy_modules(self):
+        script = (
+            "import sys\n"
+            "import foundry_app.cli\n"
+            "heavy = {'PySide6', 'pydantic', 'jinja2', 'yaml'} & set(sys.modules)\n"
+            "print(sorted(heavy))\n"
+        )
+        proc = _run_python("-c", script)
+        assert proc.returncode == 0, proc.stderr
+        assert proc.stdout.strip() == "[]"
@@ -0,0 +1,231 @@
+"""Tests for foundry_app.services.compile_cache — compiled section cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from foundry_app.core.models import (
+    CompositionSpec,
+    ExpertiseInfo,
+    ExpertiseSelection,
+    LibraryIndex,
+    PersonaInfo,
+    PersonaSelection,
+    ProjectIdentity,
+    TeamConfig,
+)
+from foundry_app.io.composition_io import load_composition
+from foundry_app.services.compile_cache import CompileCache
+from foundry_app.services.compiler import compile_agnostic_outputs
+from foundry_app.services.generator import generate_project
+from foundry_app.services.library_indexer import build_library_index
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LIBRARY_ROOT = REPO_ROOT / "ai-team-library"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_library(tmp_path: Path) -> LibraryIndex:
+    """Two personas and two expertise packs; ``sql`` applies only to developer."""
+    lib_root = tmp_path / "library"
+    personas = {
+        "developer": "# Persona: Developer\n\nBuilds {{ project_name }}.\n\n"
+        "## Collaboration & Handoffs\n\n| Collaborator | Why |\n|---|---|\n"
+        "| Reviewer | review |\n",
+        "reviewer": "# Persona: Reviewer\n\nReviews code (defer to Developer).\n",
+    }
+    persona_infos = []
+    for pid, text in personas.items():
+        pdir = lib_root / "personas" / "core" / pid
+        pdir.mkdir(parents=True)
+        (pdir / "persona.md").write_text(text, encoding="utf-8")
+        persona_infos.append(PersonaInfo(id=pid, path=str(pdir), has_persona_md=True))
+
+    expertise_infos = []
+    for eid, files, applies_to in (
+        ("python", {"conventions.md": "# Python\n\n## Defaults\n- use ruff\n"}, []),
+        ("sql", {"queries.md": "# SQL\n\nParameterize.\n"}, ["developer"]),
+    ):
+        edir = lib_root / "expertise" / eid
+        edir.mkdir(parents=True)
+        for name, text in files.items():
+            (edir / name).write_text(text, encoding="utf-8")
+        expertise_infos.append(ExpertiseInfo(
+            id=eid, path=str(edir), files=list(files), applies_to=applies_to,
+        ))
+    return LibraryIndex(
+        library_root=str(lib_root), personas=persona_infos, expertise=expertise_infos,
+    )
+
+
+def _make_spec(personas=("developer", "reviewer")) -> CompositionSpec:
+    return CompositionSpec(
+        project=ProjectIdentity(name="Cache Test", slug="cache-test"),
+        expertise=[ExpertiseSelection(id="python"), ExpertiseSelection(id="sql")],
+        team=TeamConfig(personas=[PersonaSelection(id=p) for p in personas]),
+    )
+
+
+def _compile(spec, index, out: Path, cache_dir: Path | None):
+    return compile_agnostic_outputs(
+        spec, index, index.library_root, out, cache_dir=cache_dir,
+    ).result
+
+
+def _generated(out: Path) -> dict[str, str]:
+    gen = out / "ai" / "generated"
+    return {
+        str(p.relative_to(gen)): p.read_text(encoding="utf-8")
+        for p in sorted(gen.rglob("*.md"))
+    }
+
+
+# ---------------------------------------------------------------------------
+# Hits and misses
+# ---------------------------------------------------------------------------
+
+
+class TestCompileCacheHits:
+
+    def test_cold_then_warm(self, tmp_path: Path):
+        index = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        cold = _compile(_make_spec(), index, tmp_path / "a", cache)
+        warm = _compile(_make_spec(), index, tmp_path / "b", cache)
+
+        assert (cold.cache.hits, cold.cache.misses) == (0, 4)
+        assert (warm.cache.hits, warm.cache.misses) == (4, 0)
+        assert warm.wrote == cold.wrote
+        assert warm.warnings == cold.warnings
+        assert _generated(tmp_path / "b") == _generated(tmp_path / "a")
+
+    def test_output_matches_uncached_compile(self, tmp_path: Path):
+        index = _make_library(tmp_path)
+        uncached = _compile(_make_spec(), index, tmp_path / "plain", None)
+        _compile(_make_spec(), index, tmp_path / "cold", tmp_path / "cache")
+        _compile(_make_spec(), index, tmp_path / "warm", tmp_path / "cache")
+
+        assert uncached.cache is None
+        assert _generated(tmp_path / "warm") == _generated(tmp_path / "plain")
+
+    def test_persona_edit_recompiles_only_that_member(self, tmp_path: Path):
+        index = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        _compile(_make_spec(), index, tmp_path / "a", cache)
+        reviewer_md = Path(index.persona_by_id("reviewer").path) / "persona.md"
+        reviewer_md.write_text("# Persona: Reviewer\n\nReviews carefully.\n")
+
+        result = _compile(_make_spec(), index, tmp_path / "b", cache)
+
+        assert (result.cache.hits, result.cache.misses) == (3, 1)
+        members = _generated(tmp_path / "b")
+        assert "Reviews carefully." in members["members/reviewer.md"]
+
+    def test_expertise_edit_recompiles_dependent_members(self, tmp_path: Path):
+        index = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        _compile(_make_spec(), index, tmp_path / "a", cache)
+        queries = Path(index.expertise_by_id("sql").path) / "queries.md"
+        queries.write_text("# SQL\n\nUse prepared statements.\n")
+
+        result = _compile(_make_spec(), index, tmp_path / "b", cache)
+
+        # sql's own section and the developer member (sql applies to it)
+        # miss; python and the reviewer member are reused.
+        assert (result.cache.hits, result.cache.misses) == (2, 2)
+        assert "prepared statements" in _generated(tmp_path / "b")["expertise/sql.md"]
+
+    def test_team_change_invalidates_members_only(self, tmp_path: Path):
+        index = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        _compile(_make_spec(), index, tmp_path / "a", cache)
+
+        result = _compile(_make_spec(("developer",)), index, tmp_path / "b", cache)
+
+        assert (result.cache.hits, result.cache.misses) == (2, 1)
+        # The reviewer row is filtered out of the developer's collaboration table.
+        assert "Reviewer" not in _generated(tmp_path / "b")["members/developer.md"]
+
+    def test_warnings_replayed_on_hit(self, tmp_path: Path):
+        index = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        cold = _compile(_make_spec(), index, tmp_path / "a", cache)
+        warm = _compile(_make_spec(), index, tmp_path / "b", cache)
+
+        assert any("no conventions.md" in w for w in cold.warnings)
+        assert warm.warnings == cold.warnings
+
+    def test_corrupt_entry_is_recompiled(self, tmp_path: Path):
+        index = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        _compile(_make_spec(), index, tmp_path / "a", cache)
+        for entry in (cache / "compile").rglob("*.json"):
+            entry.write_text("{truncated", encoding="utf-8")
+
+        result = _compile(_make_spec(), index, tmp_path / "b", cache)
+
+        assert result.cache.misses == 4
+        assert _generated(tmp_path / "b") == _generated(tmp_path / "a")
+
+
+# ---------------------------------------------------------------------------
+# CompileCache
+# ---------------------------------------------------------------------------
+
+
+class TestCompileCache:
+
+    def test_disabled_cache(self, tmp_path: Path):
+        cache = CompileCache(None)
+        key = cache.key("member", "developer")
+        cache.put(key, {"body": "x"})
+        assert cache.get(key) is None
+        assert cache.stats is None
+        assert not cache.enabled
+
+    def test_key_distinguishes_bytes_from_json(self, tmp_path: Path):
+        cache = CompileCache(tmp_path)
+        assert cache.key("k", b"null") != cache.key("k", None)
+        assert cache.key("k", b"ab", b"c") != cache.key("k", b"a", b"bc")
+
+
+# ---------------------------------------------------------------------------
+# Manifest integration
+# ---------------------------------------------------------------------------
+
+
+class TestManifestCacheStats:
+
+    def test_real_library_stats_in_manifest(self, tmp_path: Path):
+        spec = load_composition(REPO_ROOT / "examples" / "small-python-team.yml")
+        library = build_library_index(LIBRARY_ROOT)
+        kwargs = dict(library_index=library, library_version="", stage_workers=1)
+        cache = tmp_path / "cache"
+
+        cold, _, _ = generate_project(
+            spec.model_copy(deep=True), LIBRARY_ROOT, tmp_path / "a",
+            cache_dir=cache, **kwargs,
+        )
+        warm, _, _ = generate_project(
+            spec.model_copy(deep=True), LIBRARY_ROOT, tmp_path / "b",
+            cache_dir=cache, **kwargs,
+        )
+
+        assert cold.stages["compile"].cache.hits == 0
+        assert warm.stages["compile"].cache.misses == 0
+        assert warm.stages["compile"].cache.hits == cold.stages["compile"].cache.misses
+        on_disk = json.loads((tmp_path / "b" / "manifest.json").read_text())
+        assert on_disk["stages"]["compile"]["cache"]["hits"] > 0
+        assert "cache" not in on_disk["stages"]["scaffold"]
+        assert _generated(tmp_path / "b") == _generated(tmp_path / "a")
+
+    def test_no_cache_key_without_cache_dir(self, tmp_path: Path):
+        spec = load_composition(REPO_ROOT / "examples" / "small-python-team.yml")
+        generate_project(spec, LIBRARY_ROOT, tmp_path / "out", stage_workers=1)
+        on_disk = json.loads((tmp_path / "out" / "manifest.json").read_text())
+        assert "cache" not in on_disk["stages"]["compile"]
@@ -36,6 +36,7 @@ from foundry_app.services.compiler import (
     compile_project,
 )
 from foundry_app.services.library_indexer import build_library_index
+from foundry_app.services.output_writer import DirectoryWriter
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -901,6 +902,34 @@ class TestCompileWarnings:
         result = compile_project(spec, index, lib_root, output)
         assert any("Unresolved" in w for w in result.warnings)
 
+    def test_stale_generated_files_not_checked(self, tmp_path: Path):
+        output = tmp_path / "project"
+        stale = output / "ai" / "generated" / "members" / "retired.md"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("Leftover {{ old_var }}\n", encoding="utf-8")
+        index, lib_root = _make_library(tmp_path, personas={
+            "developer": {"persona.md": "# Dev for {{ project_name }}"},
+        })
+        result = compile_project(_make_spec(), index, lib_root, output)
+        assert not any("Unresolved" in w for w in result.warnings)
+
+    def test_placeholders_checked_without_reading_output(self, tmp_path: Path):
+        class WriteOnly(DirectoryWriter):
+            def read_bytes(self, path: Path) -> bytes:
+                raise AssertionError(f"read back {path}")
+
+        output = tmp_path / "project"
+        index, lib_root = _make_library(tmp_path, personas={
+            "developer": {"persona.md": "Use {{ custom_var }} here"},
+        })
+        result = compile_agnostic_outputs(
+            _make_spec(), index, lib_root, output, writer=WriteOnly(output),
+        ).result
+        assert (
+            "Unresolved placeholders in ai/generated/members/developer.md: custom_var"
+            in result.warnings
+        )
+
     def test_no_warnings_for_clean_compilation(self, tmp_path: Path):
         output = tmp_path / "project"
         index, lib_root = _make_library(
@@ -0,0 +1,93 @@
+"""Tests for foundry_app.services.file_ledger — per-project content-hash ledger."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from foundry_app.services.file_ledger import (
+    LEDGER_PATH,
+    LedgerEntry,
+    current_hash,
+    hash_tree,
+    read_ledger,
+    write_ledger,
+)
+
+
+def _sha(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class TestHashTree:
+
+    def test_relative_keys_in_sorted_order(self, tmp_path: Path):
+        (tmp_path / "b").mkdir()
+        (tmp_path / "b" / "x.md").write_bytes(b"x")
+        (tmp_path / "a.md").write_bytes(b"a")
+        assert hash_tree(tmp_path) == {"a.md": _sha(b"a"), "b/x.md": _sha(b"x")}
+
+    def test_skips_symlinks(self, tmp_path: Path):
+        (tmp_path / "real.md").write_bytes(b"r")
+        (tmp_path / "link.md").symlink_to(tmp_path / "real.md")
+        assert list(hash_tree(tmp_path)) == ["real.md"]
+
+
+class TestReadWriteLedger:
+
+    def test_round_trip(self, tmp_path: Path):
+        (tmp_path / "ai").mkdir()
+        (tmp_path / "ai" / "a.md").write_bytes(b"alpha")
+        write_ledger(tmp_path, ["ai/a.md", "ai", "missing.md"])
+
+        ledger = read_ledger(tmp_path)
+        st = (tmp_path / "ai" / "a.md").stat()
+        assert ledger == {
+            "ai/a.md": LedgerEntry(_sha(b"alpha"), st.st_size, st.st_mtime_ns),
+        }
+
+    def test_supplied_hashes_are_reused(self, tmp_path: Path):
+        (tmp_path / "a.md").write_bytes(b"alpha")
+        write_ledger(tmp_path, ["a.md"], {"a.md": "precomputed"})
+        assert read_ledger(tmp_path)["a.md"].sha256 == "precomputed"
+
+    def test_previous_entries_are_reused_while_unchanged(self, tmp_path: Path):
+        (tmp_path / "a.md").write_bytes(b"alpha")
+        (tmp_path / "b.md").write_bytes(b"beta")
+        write_ledger(tmp_path, ["a.md", "b.md"], {"a.md": "recorded", "b.md": "recorded"})
+        previous = read_ledger(tmp_path)
+        (tmp_path / "b.md").write_bytes(b"beta, edited")
+
+        write_ledger(tmp_path, ["a.md", "b.md"], previous=previous)
+
+        ledger = read_ledger(tmp_path)
+        assert ledger["a.md"].sha256 == "recorded"
+        assert ledger["b.md"].sha256 == _sha(b"beta, edited")
+
+    def test_missing_or_corrupt_ledger(self, tmp_path: Path):
+        assert read_ledger(tmp_path) is None
+        (tmp_path / LEDGER_PATH).parent.mkdir()
+        (tmp_path / LEDGER_PATH).write_text("{oops", encoding="utf-8")
+        assert read_ledger(tmp_path) is None
+        (tmp_path / LEDGER_PATH).write_text('{"schema": 99, "files": {}}')
+        assert read_ledger(tmp_path) is None
+
+
+class TestCurrentHash:
+
+    def test_trusts_matching_stat(self, tmp_path: Path):
+        path = tmp_path / "a.md"
+        path.write_bytes(b"alpha")
+        st = path.stat()
+        entry = LedgerEntry("recorded", st.st_size, st.st_mtime_ns)
+        assert current_hash(path, entry) == "recorded"
+
+    def test_rehashes_when_stat_moved(self, tmp_path: Path):
+        path = tmp_path / "a.md"
+        path.write_bytes(b"alpha")
+        st = path.stat()
+        entry = LedgerEntry("recorded", st.st_size, st.st_mtime_ns)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert current_hash(path, entry) == _sha(b"alpha")
+        assert current_hash(path, None) == _sha(b"alpha")
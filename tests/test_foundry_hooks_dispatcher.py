@@ -0,0 +1,230 @@
+"""Tests for the foundry-hooks dispatcher (one process runs several hook scripts).
+
+Run as a subprocess with JSON on stdin, exactly as Claude Code invokes it,
+and compared against running each script as its own hook.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+_LIBRARY_HOOKS = (
+    Path(__file__).resolve().parent.parent / "ai-team-library" / "claude" / "hooks"
+)
+_DISPATCHER = _LIBRARY_HOOKS / "foundry-hooks.py"
+
+
+def _run(command: list[str], payload: dict, cwd: Path,
+         env: dict[str, str] | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *command],
+        input=json.dumps(payload), capture_output=True, text=True, timeout=30, cwd=cwd,
+        env=env,
+    )
+
+
+def _hooks_dir(tmp_path: Path, scripts: dict[str, str]) -> Path:
+    hooks = tmp_path / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    shutil.copy2(_DISPATCHER, hooks / _DISPATCHER.name)
+    for name, body in scripts.items():
+        (hooks / name).write_text(body, encoding="utf-8")
+    return hooks
+
+
+# ---------------------------------------------------------------------------
+# Exit codes and output
+# ---------------------------------------------------------------------------
+
+
+class TestDispatch:
+
+    def test_runs_scripts_in_order_on_the_same_input(self, tmp_path: Path):
+        echo = (
+            "import json, sys\n"
+            "print(sys.argv[0].rsplit('/', 1)[-1], json.load(sys.stdin)['tool_name'])\n"
+        )
+        hooks = _hooks_dir(tmp_path, {"a.py": echo, "b.py": echo})
+
+        result = _run([str(hooks / "foundry-hooks.py"), "a.py", "b.py"],
+                      {"tool_name": "Edit"}, tmp_path)
+
+        assert result.returncode == 0
+        assert result.stdout == "a.py Edit\nb.py Edit\n"
+        assert not (hooks / "__pycache__").exists()
+
+    def test_block_wins_and_later_scripts_still_run(self, tmp_path: Path):
+        hooks = _hooks_dir(tmp_path, {
+            "warn.py": "import sys\nsys.exit(1)\n",
+            "block.py": "import sys\nprint('BLOCKED: no', file=sys.stderr)\nsys.exit(2)\n",
+            "after.py": "print('after')\n",
+        })
+
+        result = _run([str(hooks / "foundry-hooks.py"), "warn.py", "block.py", "after.py"],
+                      {}, tmp_path)
+
+        assert result.returncode == 2
+        assert "BLOCKED: no" in result.stderr
+        assert result.stdout == "after\n"
+
+    def test_first_non_blocking_error_is_kept(self, tmp_path: Path):
+        hooks = _hooks_dir(tmp_path, {
+            "ok.py": "",
+            "three.py": "import sys\nsys.exit(3)\n",
+            "raises.py": "raise RuntimeError('boom')\n",
+        })
+
+        result = _run([str(hooks / "foundry-hooks.py"), "ok.py", "three.py", "raises.py"],
+                      {}, tmp_path)
+
+        assert result.returncode == 3
+        assert "RuntimeError: boom" in result.stderr
+
+    def test_missing_script_blocks_like_python(self, tmp_path: Path):
+        hooks = _hooks_dir(tmp_path, {})
+
+        result = _run([str(hooks / "foundry-hooks.py"), "gone.py"], {}, tmp_path)
+
+        assert result.returncode == 2
+        assert "gone.py" in result.stderr
+
+
+# ---------------------------------------------------------------------------
+# Same behaviour as separate hook processes
+# ---------------------------------------------------------------------------
+
+
+class TestMatchesSeparateProcesses:
+
+    _PRE = ["validate-task-inputs.py", "vdd-gate.py", "handoff-reminder.py"]
+
+    def _bean(self, tmp_path: Path) -> Path:
+        bean = tmp_path / "ai" / "beans" / "BEAN-042-example" / "bean.md"
+        bean.parent.mkdir(parents=True)
+        bean.write_text("| **Status** | In Progress |\n", encoding="utf-8")
+        return bean
+
+    def _separately(self, payload: dict, cwd: Path) -> tuple[int, str, str]:
+        codes, out, err = [], "", ""
+        for script in self._PRE:
+            result = _run([str(_LIBRARY_HOOKS / script)], payload, cwd)
+            codes.append(result.returncode)
+            out += result.stdout
+            err += result.stderr
+        code = 2 if 2 in codes else next((c for c in codes if c), 0)
+        return code, out, err
+
+    def test_blocked_done_transition(self, tmp_path: Path):
+        payload = {"tool_name": "Edit", "tool_input": {
+            "file_path": str(self._bean(tmp_path)),
+            "old_string": "| **Status** | In Progress |",
+            "new_string": "| **Status** | Done |",
+        }}
+
+        result = _run([str(_DISPATCHER), *self._PRE], payload, tmp_path)
+
+        assert (result.returncode, result.stdout, result.stderr) == (
+            self._separately(payload, tmp_path)
+        )
+        assert result.returncode == 2
+        assert "VDD report" in result.stderr
+        assert "handoff packet" in result.stderr
+
+    def test_unrelated_edit_passes(self, tmp_path: Path):
+        payload = {"tool_name": "Write", "tool_input": {
+            "file_path": str(tmp_path / "README.md"), "content": "hello",
+        }}
+
+        result = _run([str(_DISPATCHER), *self._PRE], payload, tmp_path)
+
+        assert (result.returncode, result.stdout, result.stderr) == (0, "", "")
+
+
+# ---------------------------------------------------------------------------
+# Daemon mode
+# ---------------------------------------------------------------------------
+
+
+_PID = (
+    "import json, os, sys\n"
+    "print(os.getpid(), os.getcwd(), os.environ.get('MARK'), json.load(sys.stdin)['n'])\n"
+)
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="needs Unix sockets")
+class TestDaemon:
+
+    @pytest.fixture()
+    def env(self):
+        # A short runtime dir: socket paths are limited to ~100 bytes.
+        runtime = tempfile.mkdtemp(prefix="fh")
+        yield {**os.environ, "XDG_RUNTIME_DIR": runtime, "MARK": "m1"}
+        shutil.rmtree(runtime, ignore_errors=True)
+
+    @pytest.fixture()
+    def hooks(self, tmp_path: Path, env):
+        hooks = _hooks_dir(tmp_path, {"pid.py": _PID})
+        (hooks / "hook_state.py").write_text("", encoding="utf-8")
+        yield hooks
+        subprocess.run([sys.executable, str(hooks / "foundry-hooks.py"), "--stop"],
+                       env=env, timeout=30)
+
+    def _call(self, hooks: Path, env: dict, n: int, cwd: Path) -> list[str]:
+        result = _run([str(hooks / "foundry-hooks.py"), "--daemon", "pid.py"],
+                      {"n": n}, cwd, env)
+        assert result.returncode == 0, result.stderr
+        return result.stdout.split()
+
+    def _wait_for_socket(self, env: dict) -> None:
+        runtime = Path(env["XDG_RUNTIME_DIR"])
+        for _ in range(100):
+            if list(runtime.glob("foundry-hooks-*/*.sock")):
+                time.sleep(0.05)
+                return
+            time.sleep(0.05)
+        pytest.fail("hook daemon did not start")
+
+    def test_first_call_in_process_then_daemon(self, hooks: Path, env: dict, tmp_path: Path):
+        first = self._call(hooks, env, 1, tmp_path)
+        self._wait_for_socket(env)
+        second = self._call(hooks, env, 2, tmp_path)
+        third = self._call(hooks, env, 3, tmp_path / ".claude")
+
+        assert first[0] != second[0]  # the daemon's pid, not the client's
+        assert second[0] == third[0]
+        assert second[1:] == [str(tmp_path), "m1", "2"]
+        assert third[1:] == [str(tmp_path / ".claude"), "m1", "3"]
+
+    def test_client_environment_is_used(self, hooks: Path, env: dict, tmp_path: Path):
+        self._call(hooks, env, 1, tmp_path)
+        self._wait_for_socket(env)
+        assert self._call(hooks, {**env, "MARK": "m2"}, 2, tmp_path)[2] == "m2"
+
+    def test_daemon_retires_when_hook_state_changes(
+        self, hooks: Path, env: dict, tmp_path: Path,
+    ):
+        self._call(hooks, env, 1, tmp_path)
+        self._wait_for_socket(env)
+        daemon_pid = self._call(hooks, env, 2, tmp_path)[0]
+
+        (hooks / "hook_state.py").write_text("# changed\n", encoding="utf-8")
+        stale = self._call(hooks, env, 3, tmp_path)
+        assert stale[0] != daemon_pid
+        assert stale[3] == "3"
+
+    def test_stop(self, hooks: Path, env: dict, tmp_path: Path):
+        self._call(hooks, env, 1, tmp_path)
+        self._wait_for_socket(env)
+        subprocess.run([sys.executable, str(hooks / "foundry-hooks.py"), "--stop"],
+                       env=env, timeout=30)
+        time.sleep(0.2)
+        assert not list(Path(env["XDG_RUNTIME_DIR"]).glob("foundry-hooks-*/*.sock"))
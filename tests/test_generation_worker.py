@@ -0,0 +1,34 @@
+"""Tests for foundry_app.ui.generation_worker."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from foundry_app.core.models import (
+    CompositionSpec,
+    GenerationManifest,
+    ProjectIdentity,
+    ValidationResult,
+)
+from foundry_app.ui.generation_worker import GenerationWorker
+
+
+class TestGenerationWorker:
+
+    def test_always_runs_the_pipeline(self, monkeypatch):
+        calls = []
+
+        def _generate(**kwargs):
+            calls.append(kwargs)
+            return GenerationManifest(run_id="r"), ValidationResult(), None
+
+        monkeypatch.setattr("foundry_app.services.generator.generate_project", _generate)
+        spec = CompositionSpec(project=ProjectIdentity(name="Test", slug="test"))
+        worker = GenerationWorker(spec=spec, library_root="/library")
+        finished = MagicMock()
+        monkeypatch.setattr(worker, "finished_ok", finished)
+
+        worker.run()
+
+        assert calls[0]["force_rebuild"] is True
+        finished.emit.assert_called_once()
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import json
+import os
 import re
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -14,6 +17,7 @@ from foundry_app.core.models import (
     ExpertiseSelection,
     GenerationOptions,
     LibraryIndex,
+    LinkMode,
     OverlayPlan,
     PersonaInfo,
     PersonaSelection,
@@ -22,15 +26,19 @@ from foundry_app.core.models import (
     TeamConfig,
     _persona_dirname,
 )
-from foundry_app.io.composition_io import load_composition
+from foundry_app.io.composition_io import load_composition, load_manifest
+from foundry_app.services.file_ledger import LEDGER_PATH, read_ledger, write_ledger
 from foundry_app.services.generator import (
     _apply_overlay_plan,
     _compare_trees,
     _get_library_version,
     _make_run_id,
+    _pipeline_stages,
     _run_pipeline,
+    _stage_dependencies,
     generate_project,
 )
+from foundry_app.services.output_writer import VirtualTree
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -295,6 +303,27 @@ class TestStandardGeneration:
 
         assert "diff_report" not in manifest.stages
 
+    def test_prebuilt_library_index_and_version_reused(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        library = _make_library(tmp_path / "unused")
+        library.library_root = str(lib_root)
+        output_dir = tmp_path / "output" / "test-project"
+
+        with (
+            patch("foundry_app.services.generator.build_library_index") as build,
+            patch("foundry_app.services.generator._get_library_version") as version,
+        ):
+            manifest, validation, _ = generate_project(
+                _make_spec(), lib_root, output_root=output_dir,
+                library_index=library, library_version="abc1234",
+            )
+
+        build.assert_not_called()
+        version.assert_not_called()
+        assert validation.is_valid
+        assert manifest.library_version == "abc1234"
+        assert manifest.total_files_written > 0
+
 
 # ---------------------------------------------------------------------------
 # Manifest file writing
@@ -596,6 +625,61 @@ class TestCompareTrees:
         assert "link.txt" not in paths
 
 
+class TestCompareTreesWithLedger:
+
+    def _generated_pair(self, tmp_path: Path) -> tuple[Path, Path]:
+        source = tmp_path / "source"
+        target = tmp_path / "target"
+        source.mkdir()
+        target.mkdir()
+        for name in ("keep.txt", "change.txt"):
+            (source / name).write_text("v1")
+            (target / name).write_text("v1")
+        (target / "dropped.txt").write_text("generated last time")
+        write_ledger(target, ["keep.txt", "change.txt", "dropped.txt"])
+        (source / "change.txt").write_text("v2")
+        return source, target
+
+    def test_user_files_are_never_deletes(self, tmp_path: Path):
+        source, target = self._generated_pair(tmp_path)
+        (target / "ai" / "beans" / "BEAN-001").mkdir(parents=True)
+        (target / "ai" / "beans" / "BEAN-001" / "bean.md").write_text("mine")
+
+        plan = _compare_trees(source, target, ledger=read_ledger(target))
+
+        assert [a.path for a in plan.deletes] == ["dropped.txt"]
+        assert [a.path for a in plan.updates] == ["change.txt"]
+        assert [a.path for a in plan.skips] == ["keep.txt"]
+
+    def test_same_plan_as_full_comparison(self, tmp_path: Path):
+        source, target = self._generated_pair(tmp_path)
+        with_ledger = _compare_trees(source, target, ledger=read_ledger(target))
+        without = _compare_trees(source, target)
+        # The full walk also sees the ledger itself.
+        assert [(a.path, a.action) for a in with_ledger.actions] == [
+            (a.path, a.action) for a in without.actions
+            if a.path != str(LEDGER_PATH)
+        ]
+
+    def test_unchanged_targets_are_not_read(self, tmp_path: Path):
+        source, target = self._generated_pair(tmp_path)
+        ledger = read_ledger(target)
+        with patch(
+            "foundry_app.services.file_ledger.hash_file",
+            side_effect=lambda p: "source-hash" if source in p.parents else "target",
+        ) as hashed:
+            _compare_trees(source, target, ledger=ledger)
+        target_reads = [c.args[0] for c in hashed.call_args_list if target in c.args[0].parents]
+        assert target_reads == []
+
+    def test_edited_target_is_rehashed(self, tmp_path: Path):
+        source, target = self._generated_pair(tmp_path)
+        ledger = read_ledger(target)
+        (target / "keep.txt").write_text("user edit!")
+        plan = _compare_trees(source, target, ledger=ledger)
+        assert "keep.txt" in [a.path for a in plan.updates]
+
+
 # ---------------------------------------------------------------------------
 # Apply overlay plan
 # ---------------------------------------------------------------------------
@@ -762,6 +846,371 @@ class TestOverlayGeneration:
         assert plan is not None
 
 
+class TestOverlayFileLedger:
+
+    def test_standard_generation_records_written_files(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        manifest, _, _ = generate_project(_make_spec(), lib_root, output_root=output_dir)
+
+        ledger = read_ledger(output_dir)
+        assert ledger is not None
+        assert "CLAUDE.md" in ledger
+        assert "manifest.json" not in ledger
+        written = {r for s in manifest.stages.values() for r in s.wrote}
+        assert set(ledger) <= written
+
+    def test_repeated_standard_run_keeps_the_full_ledger(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        first = read_ledger(output_dir)
+
+        # The copiers skip every identical file on the second run.
+        generate_project(_make_spec(), lib_root, output_root=output_dir, force_rebuild=True)
+
+        assert set(read_ledger(output_dir)) == set(first)
+
+    def test_overlay_after_repeated_standard_runs_deletes_dropped_files(
+        self, tmp_path: Path,
+    ):
+        lib_root = _make_library_dir(tmp_path)
+        reviewer = lib_root / "personas" / "core" / "reviewer" / "templates"
+        reviewer.mkdir(parents=True)
+        (reviewer.parent / "persona.md").write_text("# Reviewer persona")
+        (reviewer / "review.md").write_text("# Review")
+        output_dir = tmp_path / "output" / "test-project"
+        team = TeamConfig(personas=[
+            PersonaSelection(id="developer"), PersonaSelection(id="reviewer"),
+        ])
+        generate_project(_make_spec(team=team), lib_root, output_root=output_dir)
+        generate_project(
+            _make_spec(team=team), lib_root, output_root=output_dir, force_rebuild=True,
+        )
+
+        _, _, plan = generate_project(
+            _make_spec(), lib_root, output_root=output_dir, overlay=True, dry_run=True,
+        )
+
+        assert "ai/outputs/reviewer/review.md" in [a.path for a in plan.deletes]
+
+    def test_overlay_keeps_user_files(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        notes = output_dir / "ai" / "beans" / "BEAN-900-mine" / "bean.md"
+        notes.parent.mkdir(parents=True)
+        notes.write_text("user-owned")
+
+        _, _, plan = generate_project(
+            _make_spec(), lib_root, output_root=output_dir, overlay=True,
+        )
+
+        assert notes.read_text() == "user-owned"
+        assert plan.deletes == []
+        assert plan.updates == []
+
+    def test_overlay_without_ledger_falls_back_to_full_walk(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        (output_dir / LEDGER_PATH).unlink()
+        (output_dir / "stray.txt").write_text("x")
+
+        _, _, plan = generate_project(
+            _make_spec(), lib_root, output_root=output_dir, overlay=True, dry_run=True,
+        )
+
+        assert "stray.txt" in [a.path for a in plan.deletes]
+
+    def test_overlay_refreshes_ledger(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir, overlay=True)
+        first = read_ledger(output_dir)
+        (output_dir / "CLAUDE.md").write_text("hand edited")
+
+        generate_project(_make_spec(), lib_root, output_root=output_dir, overlay=True)
+
+        second = read_ledger(output_dir)
+        assert set(second) == set(first)
+        assert second["CLAUDE.md"].sha256 == first["CLAUDE.md"].sha256
+        assert (output_dir / "CLAUDE.md").read_text() != "hand edited"
+
+    def test_no_ledger_when_manifest_disabled(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        spec = _make_spec(generation=GenerationOptions(write_manifest=False))
+        generate_project(spec, lib_root, output_root=output_dir)
+        assert not (output_dir / LEDGER_PATH).exists()
+
+
+class TestStreamedOverlay:
+
+    def test_writer_collects_what_disk_generation_writes(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        lib_root = Path(lib.library_root)
+        spec = _make_spec(generation=GenerationOptions(
+            seed_tasks=True, write_diff_report=True,
+        ))
+        # Overlay runs used to start from an empty temp dir.
+        disk_dir = tmp_path / "disk"
+        disk_dir.mkdir()
+        disk = _run_pipeline(spec, lib, lib_root, disk_dir)
+        memory_dir = tmp_path / "memory"
+        writer = VirtualTree(memory_dir)
+        memory = _run_pipeline(spec, lib, lib_root, memory_dir, writer=writer)
+
+        assert not memory_dir.exists()
+        assert {k: r.wrote for k, r in memory.items()} == {
+            k: r.wrote for k, r in disk.items()
+        }
+        collected = {
+            str(p.relative_to(memory_dir)): writer.read_bytes(p)
+            for p in writer.files_under(memory_dir)
+        }
+        assert collected == _tree_bytes(disk_dir)
+
+    def test_overlay_output_matches_standard_generation(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        standard_dir = tmp_path / "standard"
+        overlay_dir = tmp_path / "overlay"
+        generate_project(_make_spec(), lib_root, output_root=standard_dir)
+        generate_project(_make_spec(), lib_root, output_root=overlay_dir, overlay=True)
+
+        standard = _tree_bytes(standard_dir)
+        overlay = _tree_bytes(overlay_dir)
+        assert set(overlay) == set(standard)
+        for rel in set(standard) - {str(LEDGER_PATH)}:
+            assert overlay[rel] == standard[rel], rel
+
+    def test_dry_run_touches_no_disk(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        (output_dir / "CLAUDE.md").write_text("hand edited")
+        before = _tree_bytes(output_dir)
+
+        with patch(
+            "foundry_app.services.generator.tempfile.TemporaryDirectory",
+            side_effect=AssertionError("no temp tree expected"),
+        ):
+            _, _, plan = generate_project(
+                _make_spec(), lib_root, output_root=output_dir,
+                overlay=True, dry_run=True,
+            )
+
+        assert [a.path for a in plan.updates] == ["CLAUDE.md"]
+        assert _tree_bytes(output_dir) == before
+
+    def test_only_changed_files_are_rewritten(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        (output_dir / "CLAUDE.md").write_text("hand edited")
+        agents = output_dir / ".claude" / "agents"
+        mtimes = {p: p.stat().st_mtime_ns for p in agents.iterdir()}
+
+        manifest, _, _ = generate_project(
+            _make_spec(), lib_root, output_root=output_dir, overlay=True,
+        )
+
+        assert manifest.stages["overlay_apply"].wrote == ["CLAUDE.md"]
+        assert {p: p.stat().st_mtime_ns for p in agents.iterdir()} == mtimes
+
+
+class TestArchiveGeneration:
+
+    def test_archive_matches_standard_generation(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        standard_dir = tmp_path / "standard" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=standard_dir)
+        archived_dir = tmp_path / "archived" / "test-project"
+        archive = tmp_path / "test-project.zip"
+
+        manifest, _, _ = generate_project(
+            _make_spec(), lib_root, output_root=archived_dir, archive=archive,
+        )
+
+        assert not archived_dir.exists()
+        assert manifest.stages["archive"].wrote == [str(archive)]
+        with zipfile.ZipFile(archive) as zf:
+            archived = {
+                name.removeprefix("test-project/"): zf.read(name)
+                for name in zf.namelist() if not name.endswith("/")
+            }
+        assert "manifest.json" in archived
+        standard = _tree_bytes(standard_dir)
+        del standard[str(LEDGER_PATH)]
+        archived.pop("manifest.json")
+        assert archived == standard
+
+    def test_archive_rejects_overlay(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        with pytest.raises(ValueError, match="archive"):
+            generate_project(
+                _make_spec(), lib_root, output_root=tmp_path / "out",
+                overlay=True, archive=tmp_path / "p.zip",
+            )
+
+
+class TestLinkMode:
+
+    def _library(self, tmp_path: Path) -> Path:
+        lib_root = _make_library_dir(tmp_path)
+        commands = lib_root / "claude" / "commands"
+        commands.mkdir(parents=True)
+        (commands / "review.md").write_text("# Review\n")
+        return lib_root
+
+    def _generate(self, lib_root: Path, output_dir: Path, cache_dir=None, **kwargs):
+        spec = _make_spec(generation=GenerationOptions(link_mode="hardlink"))
+        manifest, _, _ = generate_project(
+            spec, lib_root, output_root=output_dir, cache_dir=cache_dir, **kwargs,
+        )
+        return manifest
+
+    def test_projects_share_linked_assets(self, tmp_path: Path):
+        lib_root = self._library(tmp_path)
+        cache_dir = tmp_path / "cache"
+        first = self._generate(lib_root, tmp_path / "a" / "test-project", cache_dir)
+        self._generate(lib_root, tmp_path / "b" / "test-project", cache_dir)
+
+        rel = Path(".claude") / "commands" / "review.md"
+        a = tmp_path / "a" / "test-project" / rel
+        b = tmp_path / "b" / "test-project" / rel
+        assert os.path.samefile(a, b)
+        assert first.link_mode == LinkMode.HARDLINK
+        saved = json.loads((a.parents[2] / "manifest.json").read_text(encoding="utf-8"))
+        assert saved["link_mode"] == "hardlink"
+
+    def test_generated_files_are_not_linked(self, tmp_path: Path):
+        lib_root = self._library(tmp_path)
+        output_dir = tmp_path / "out" / "test-project"
+        self._generate(lib_root, output_dir, tmp_path / "cache")
+        assert (output_dir / "CLAUDE.md").stat().st_nlink == 1
+
+    def test_falls_back_to_copy_without_cache(self, tmp_path: Path):
+        lib_root = self._library(tmp_path)
+        output_dir = tmp_path / "out" / "test-project"
+        manifest = self._generate(lib_root, output_dir)
+
+        assert manifest.link_mode == LinkMode.COPY
+        assert any("fell back to copy" in w for w in manifest.stages["copy_assets"].warnings)
+        assert (output_dir / ".claude" / "commands" / "review.md").stat().st_nlink == 1
+
+    def test_overlay_links_created_assets(self, tmp_path: Path):
+        lib_root = self._library(tmp_path)
+        cache_dir = tmp_path / "cache"
+        output_dir = tmp_path / "out" / "test-project"
+        manifest = self._generate(lib_root, output_dir, cache_dir, overlay=True)
+
+        assert manifest.link_mode == LinkMode.HARDLINK
+        assert (output_dir / ".claude" / "commands" / "review.md").stat().st_nlink == 2
+
+
+# ---------------------------------------------------------------------------
+# Up-to-date short circuit
+# ---------------------------------------------------------------------------
+
+
+class TestUpToDateSkip:
+
+    def test_unchanged_regeneration_writes_nothing(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        first, _, _ = generate_project(_make_spec(), lib_root, output_root=output_dir)
+        before = {p: p.stat().st_mtime_ns for p in output_dir.rglob("*")}
+
+        with patch("foundry_app.services.generator._run_pipeline") as pipeline:
+            manifest, validation, plan = generate_project(
+                _make_spec(), lib_root, output_root=output_dir,
+            )
+
+        pipeline.assert_not_called()
+        assert validation.is_valid
+        assert plan is None
+        assert manifest.up_to_date
+        assert manifest.stages == {}
+        assert manifest.input_fingerprint == first.input_fingerprint != ""
+        assert {p: p.stat().st_mtime_ns for p in output_dir.rglob("*")} == before
+
+    def test_overlay_reports_every_file_skipped(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+
+        manifest, _, plan = generate_project(
+            _make_spec(), lib_root, output_root=output_dir, overlay=True, dry_run=True,
+        )
+
+        assert manifest.up_to_date
+        assert plan.dry_run
+        assert plan.creates == plan.updates == plan.deletes == []
+        assert set(a.path for a in plan.skips) == set(read_ledger(output_dir))
+
+    def test_library_change_regenerates(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        (lib_root / "expertise" / "python" / "conventions.md").write_text("# Changed")
+
+        manifest, _, _ = generate_project(_make_spec(), lib_root, output_root=output_dir)
+
+        assert not manifest.up_to_date
+        assert manifest.stages
+
+    def test_edited_output_regenerates(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        (output_dir / "CLAUDE.md").write_text("hand edited")
+
+        manifest, _, _ = generate_project(_make_spec(), lib_root, output_root=output_dir)
+
+        assert not manifest.up_to_date
+        assert (output_dir / "CLAUDE.md").read_text() != "hand edited"
+
+    def test_deleted_asset_after_repeated_run_regenerates(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        hooks = lib_root / "claude" / "hooks"
+        hooks.mkdir(parents=True)
+        (hooks / "session-start-context.py").write_text("print('context')\n")
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+        generate_project(_make_spec(), lib_root, output_root=output_dir, force_rebuild=True)
+        copied = output_dir / ".claude" / "hooks" / "session-start-context.py"
+        copied.unlink()
+
+        manifest, _, _ = generate_project(_make_spec(), lib_root, output_root=output_dir)
+
+        assert not manifest.up_to_date
+        assert copied.read_text() == "print('context')\n"
+
+    def test_force_rebuild_runs_the_pipeline(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        generate_project(_make_spec(), lib_root, output_root=output_dir)
+
+        manifest, _, _ = generate_project(
+            _make_spec(), lib_root, output_root=output_dir, force_rebuild=True,
+        )
+
+        assert not manifest.up_to_date
+        assert manifest.total_files_written > 0
+
+    def test_no_fingerprint_without_manifest(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+        spec = _make_spec(generation=GenerationOptions(write_manifest=False))
+        generate_project(spec, lib_root, output_root=output_dir)
+
+        manifest, _, _ = generate_project(spec, lib_root, output_root=output_dir)
+
+        assert manifest.input_fingerprint == ""
+        assert not manifest.up_to_date
+
+
 # ---------------------------------------------------------------------------
 # Dry-run mode
 # ---------------------------------------------------------------------------
@@ -880,6 +1329,127 @@ class TestPipelineExecution:
         assert ".claude/settings.json" in stages["safety"].wrote
 
 
+# ---------------------------------------------------------------------------
+# Stage graph and concurrent scheduling
+# ---------------------------------------------------------------------------
+
+
+def _tree_bytes(root: Path) -> dict[str, bytes]:
+    return {
+        str(p.relative_to(root)): p.read_bytes()
+        for p in sorted(root.rglob("*"))
+        if p.is_file() and p.name != "manifest.json"
+    }
+
+
+class TestStageGraph:
+
+    def _deps(self, tmp_path: Path, **generation) -> dict[str, set[str]]:
+        lib = _make_library(tmp_path)
+        spec = _make_spec(generation=GenerationOptions(**generation))
+        stages = _pipeline_stages(
+            spec, lib, Path(lib.library_root), tmp_path / "out", None, None,
+        )
+        return _stage_dependencies(stages)
+
+    def test_everything_follows_scaffold(self, tmp_path: Path):
+        deps = self._deps(tmp_path, seed_tasks=True, write_diff_report=True)
+        for key, after in deps.items():
+            if key != "scaffold":
+                assert "scaffold" in after, key
+
+    def test_safety_and_permissions_follow_asset_copier(self, tmp_path: Path):
+        deps = self._deps(tmp_path)
+        assert "copy_assets" in deps["safety"]
+        assert "copy_assets" in deps["permissions"]
+        assert "safety" not in deps["permissions"]
+
+    def test_seed_tasks_follows_asset_copier(self, tmp_path: Path):
+        deps = self._deps(tmp_path, seed_tasks=True)
+        assert deps["seed_tasks"] == {"scaffold", "copy_assets"}
+
+    def test_disjoint_stages_are_independent(self, tmp_path: Path):
+        deps = self._deps(tmp_path, seed_tasks=True)
+        assert deps["compile"] == {"scaffold"}
+        assert deps["agent_writer"] == {"scaffold"}
+        assert deps["copy_assets"] == {"scaffold"}
+        assert deps["mcp_config"] == {"scaffold"}
+
+    def test_subtree_setup_is_a_barrier(self, tmp_path: Path):
+        deps = self._deps(tmp_path, claude_kit_url="https://example.com/kit.git")
+        assert deps["subtree_setup"] == {
+            "scaffold", "compile", "agent_writer", "copy_assets",
+        }
+        assert "subtree_setup" in deps["mcp_config"]
+        assert "subtree_setup" in deps["safety"]
+
+
+class TestConcurrentPipeline:
+
+    def test_concurrent_output_matches_serial(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        lib_root = Path(lib.library_root)
+        spec = _make_spec(generation=GenerationOptions(
+            seed_tasks=True, write_diff_report=True,
+        ))
+        serial_dir = tmp_path / "serial"
+        concurrent_dir = tmp_path / "concurrent"
+        serial = _run_pipeline(spec, lib, lib_root, serial_dir, stage_workers=1)
+        concurrent = _run_pipeline(
+            spec, lib, lib_root, concurrent_dir, stage_workers=8,
+        )
+        assert list(concurrent) == list(serial)
+        assert _tree_bytes(concurrent_dir) == _tree_bytes(serial_dir)
+
+    def test_callbacks_well_formed_under_concurrency(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        spec = _make_spec(generation=GenerationOptions(
+            seed_tasks=False, write_diff_report=False,
+        ))
+        calls: list[tuple[str, str, int]] = []
+        generate_project(
+            spec, lib_root, output_root=tmp_path / "out", stage_workers=8,
+            stage_callback=lambda key, status, count: calls.append((key, status, count)),
+        )
+        seen: dict[str, list[str]] = {}
+        for key, status, _ in calls:
+            seen.setdefault(key, []).append(status)
+        assert seen.pop("seed_tasks") == ["skipped"]
+        assert seen.pop("diff_report") == ["skipped"]
+        for key, statuses in seen.items():
+            assert statuses == ["running", "done"], key
+        # A stage only starts after the stages it depends on are done.
+        order = [(k, s) for k, s, _ in calls]
+        assert order.index(("copy_assets", "done")) < order.index(("safety", "running"))
+
+    def test_serial_callbacks_keep_declared_order(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        calls: list[str] = []
+        generate_project(
+            _make_spec(), lib_root, output_root=tmp_path / "out", stage_workers=1,
+            stage_callback=lambda key, status, count: calls.append(f"{key}:{status}"),
+        )
+        assert calls[:4] == [
+            "scaffold:running", "scaffold:done", "compile:running", "compile:done",
+        ]
+        assert calls.index("safety:done") < calls.index("permissions:running")
+
+    def test_stage_failure_propagates(self, tmp_path: Path, monkeypatch):
+        lib = _make_library(tmp_path)
+
+        def boom(*args, **kwargs):
+            raise RuntimeError("mcp exploded")
+
+        monkeypatch.setattr(
+            "foundry_app.services.generator.write_mcp_config", boom,
+        )
+        with pytest.raises(RuntimeError, match="mcp exploded"):
+            _run_pipeline(
+                _make_spec(), lib, Path(lib.library_root), tmp_path / "out",
+                stage_workers=4,
+            )
+
+
 # ---------------------------------------------------------------------------
 # Manifest properties
 # ---------------------------------------------------------------------------
@@ -933,6 +1503,30 @@ class TestManifestProperties:
 
         assert manifest.generated_at is not None
 
+    def test_provenance_maps_outputs_to_library_sources(self, tmp_path: Path):
+        lib_root = _make_library_dir(tmp_path)
+        output_dir = tmp_path / "output" / "test-project"
+
+        manifest, _, _ = generate_project(_make_spec(), lib_root, output_root=output_dir)
+        provenance = manifest.provenance
+
+        assert provenance[".mcp.json"] == ["workflows/mcp-registry.yaml"]
+        assert provenance["ai/generated/expertise/python.md"] == [
+            "expertise/python/conventions.md",
+        ]
+        assert "personas/core/developer/persona.md" in provenance[
+            "ai/generated/members/developer.md"
+        ]
+        assert "personas/core/developer/persona.md" in provenance[
+            ".claude/agents/developer.md"
+        ]
+        assert set(provenance["ai/generated/members/developer.md"]) <= set(
+            provenance["CLAUDE.md"]
+        )
+
+        saved = load_manifest(output_dir / "manifest.json")
+        assert saved.provenance == provenance
+
 
 # ---------------------------------------------------------------------------
 # Edge cases
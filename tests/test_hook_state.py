@@ -0,0 +1,164 @@
+"""Tests for the hook scripts' shared state cache (ai-team-library/claude/hooks/hook_state.py)."""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import subprocess
+from pathlib import Path
+
+import pytest
+
+_HOOK_STATE = (
+    Path(__file__).resolve().parent.parent
+    / "ai-team-library" / "claude" / "hooks" / "hook_state.py"
+)
+_spec = importlib.util.spec_from_file_location("hook_state", _HOOK_STATE)
+hook_state = importlib.util.module_from_spec(_spec)
+assert _spec.loader is not None
+_spec.loader.exec_module(hook_state)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    hook_state.clear()
+    yield
+    hook_state.clear()
+
+
+def _git(repo: Path, *args: str) -> str:
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True,
+        env={**os.environ, "GIT_AUTHOR_NAME": "t", "GIT_AUTHOR_EMAIL": "t@t",
+             "GIT_COMMITTER_NAME": "t", "GIT_COMMITTER_EMAIL": "t@t"},
+    ).stdout.strip()
+
+
+@pytest.fixture()
+def repo(tmp_path: Path) -> Path:
+    _git(tmp_path, "init", "-q", "-b", "main")
+    (tmp_path / "README.md").write_text("x")
+    _git(tmp_path, "add", "README.md")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
+
+
+# ---------------------------------------------------------------------------
+# Git state
+# ---------------------------------------------------------------------------
+
+
+class TestCurrentBranch:
+
+    def test_matches_git(self, repo: Path):
+        assert hook_state.current_branch(repo) == "main"
+        _git(repo, "checkout", "-q", "-b", "feature/x")
+        assert hook_state.current_branch(repo) == "feature/x"
+        assert hook_state.current_branch(repo / "sub") == "feature/x"
+
+    def test_detached_head_is_empty(self, repo: Path):
+        _git(repo, "checkout", "-q", "--detach")
+        assert hook_state.current_branch(repo) == ""
+
+    def test_outside_a_repository_is_empty(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path))
+        monkeypatch.setattr(hook_state, "git_dir", lambda cwd=None: None)
+        assert hook_state.current_branch(tmp_path) == ""
+
+    def test_worktree(self, repo: Path, tmp_path_factory):
+        other = tmp_path_factory.mktemp("wt") / "tree"
+        _git(repo, "worktree", "add", "-q", "-b", "feature/wt", str(other))
+        assert hook_state.current_branch(other) == "feature/wt"
+        assert hook_state.current_branch(repo) == "main"
+
+
+class TestBranchStart:
+
+    def test_first_commit_since_base(self, repo: Path):
+        _git(repo, "checkout", "-q", "-b", "feature/x")
+        assert hook_state.branch_start("main", repo) is None
+        (repo / "a.md").write_text("a")
+        _git(repo, "add", "a.md")
+        _git(repo, "commit", "-q", "-m", "a")
+        first = _git(repo, "log", "-1", "--format=%aI")
+        assert hook_state.branch_start("main", repo) == first
+
+        (repo / "b.md").write_text("b")
+        _git(repo, "add", "b.md")
+        _git(repo, "commit", "-q", "-m", "b")
+        assert hook_state.branch_start("main", repo) == first
+
+    def test_none_on_base(self, repo: Path):
+        assert hook_state.branch_start("main", repo) is None
+
+    def test_cached_until_refs_move(self, repo: Path, monkeypatch):
+        _git(repo, "checkout", "-q", "-b", "feature/x")
+        (repo / "a.md").write_text("a")
+        _git(repo, "add", "a.md")
+        _git(repo, "commit", "-q", "-m", "a")
+        calls = []
+        real = hook_state._git
+        monkeypatch.setattr(hook_state, "_git", lambda *a, **k: calls.append(a) or real(*a, **k))
+
+        hook_state.branch_start("main", repo)
+        hook_state.branch_start("main", repo)
+        assert len(calls) == 1  # one git log
+
+        _git(repo, "checkout", "-q", "main")
+        _git(repo, "checkout", "-q", "-b", "feature/y")
+        assert hook_state.branch_start("main", repo) is None  # no commits of its own
+
+    def test_persisted_across_processes(self, repo: Path, monkeypatch):
+        _git(repo, "checkout", "-q", "-b", "feature/x")
+        (repo / "a.md").write_text("a")
+        _git(repo, "add", "a.md")
+        _git(repo, "commit", "-q", "-m", "a")
+        first = hook_state.branch_start("main", repo)
+        hook_state.clear()  # as in a fresh hook process
+        monkeypatch.setattr(hook_state, "_git", lambda *a, **k: pytest.fail("ran git"))
+        assert hook_state.branch_start("main", repo) == first
+
+    def test_persisted_start_follows_new_commits(self, repo: Path):
+        _git(repo, "checkout", "-q", "-b", "feature/x")
+        assert hook_state.branch_start("main", repo) is None
+        (repo / "a.md").write_text("a")
+        _git(repo, "add", "a.md")
+        _git(repo, "commit", "-q", "-m", "a")
+        _git(repo, "pack-refs", "--all")  # refs now only in packed-refs
+        hook_state.clear()
+        assert hook_state.branch_start("main", repo) == _git(repo, "log", "-1", "--format=%aI")
+
+
+# ---------------------------------------------------------------------------
+# Files and directories
+# ---------------------------------------------------------------------------
+
+
+class TestFileCaches:
+
+    def test_dir_entries_follow_directory_changes(self, tmp_path: Path):
+        qa = tmp_path / "ai" / "outputs" / "tech-qa"
+        assert hook_state.dir_entries(qa) == ()
+        qa.mkdir(parents=True)
+        (qa / "b.md").write_text("")
+        assert hook_state.dir_entries(qa) == ("b.md",)
+        (qa / "a.md").write_text("")
+        assert hook_state.dir_entries(qa) == ("a.md", "b.md")
+
+    def test_read_cached_parses_once_per_version(self, tmp_path: Path):
+        index = tmp_path / "_index.md"
+        index.write_text("one")
+        parsed = []
+
+        def parse(text: str) -> str:
+            parsed.append(text)
+            return text.upper()
+
+        assert hook_state.read_cached(index, parse) == "ONE"
+        assert hook_state.read_cached(index, parse) == "ONE"
+        index.write_text("three")
+        assert hook_state.read_cached(index, parse) == "THREE"
+        assert parsed == ["one", "three"]
+
+    def test_read_cached_missing_file(self, tmp_path: Path):
+        assert hook_state.read_cached(tmp_path / "missing.md", str.upper) is None
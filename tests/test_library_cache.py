@@ -0,0 +1,222 @@
+"""Tests for foundry_app.services.library_cache — persistent library index cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from foundry_app.core.models import LibraryIndex
+from foundry_app.services import library_cache
+from foundry_app.services.library_cache import default_cache_dir, load_library_index
+from foundry_app.services.library_indexer import build_library_index
+
+LIBRARY_ROOT = Path(__file__).resolve().parent.parent / "ai-team-library"
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_library(root: Path) -> Path:
+    """Create a small library with one persona per tier, one expertise, one hook pack."""
+    lib = root / "library"
+    (lib / "contracts").mkdir(parents=True)
+    (lib / "contracts" / "artifact-types.yml").write_text(
+        "types:\n"
+        "  - name: design-doc\n"
+        "    description: Design\n"
+        "    format: markdown\n"
+        "    required-fields: []\n",
+        encoding="utf-8",
+    )
+    for tier, name in (("core", "developer"), ("extended", "writer")):
+        pdir = lib / "personas" / tier / name
+        pdir.mkdir(parents=True)
+        (pdir / "persona.md").write_text(
+            f"# {name}\n\n## Category\nEngineering\n", encoding="utf-8",
+        )
+    (lib / "personas" / "core" / "developer" / "contracts.yml").write_text(
+        "produces:\n  - design-doc\n", encoding="utf-8",
+    )
+    edir = lib / "expertise" / "python"
+    edir.mkdir(parents=True)
+    (edir / "conventions.md").write_text(
+        "# Python\n\n## Applies To\n- developer\n", encoding="utf-8",
+    )
+    hooks = lib / "claude" / "hooks"
+    hooks.mkdir(parents=True)
+    (hooks / "lint.md").write_text("# Lint\n\n## Category\nQuality\n", encoding="utf-8")
+    return lib
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 5_000_000_000))
+
+
+def _count_parses():
+    """Patch the per-entry parsers and return the mocks (wrapping the real ones)."""
+    return (
+        patch.object(
+            library_cache, "_index_persona", wraps=library_cache._index_persona,
+        ),
+        patch.object(
+            library_cache, "_index_expertise", wraps=library_cache._index_expertise,
+        ),
+        patch.object(
+            library_cache, "_index_hook_pack", wraps=library_cache._index_hook_pack,
+        ),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Equivalence with build_library_index
+# ---------------------------------------------------------------------------
+
+
+class TestCachedIndexMatchesBuild:
+
+    def test_real_library_cold_and_warm(self, tmp_path: Path):
+        expected = build_library_index(LIBRARY_ROOT).model_dump()
+        cold = load_library_index(LIBRARY_ROOT, tmp_path)
+        warm = load_library_index(LIBRARY_ROOT, tmp_path)
+        assert cold.model_dump() == expected
+        assert warm.model_dump() == expected
+
+    def test_applies_to_validated_against_current_personas(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        # Removing the referenced persona must drop it from the cached
+        # expertise's applies_to even though the expertise itself is unchanged.
+        for f in (lib / "personas" / "core" / "developer").iterdir():
+            f.unlink()
+        (lib / "personas" / "core" / "developer").rmdir()
+        idx = load_library_index(lib, cache)
+        assert idx.persona_by_id("developer") is None
+        assert idx.expertise_by_id("python").applies_to == []
+        assert idx.model_dump() == build_library_index(lib).model_dump()
+
+    def test_nonexistent_root(self, tmp_path: Path):
+        idx = load_library_index(tmp_path / "missing", tmp_path / "cache")
+        assert isinstance(idx, LibraryIndex)
+        assert idx.personas == []
+        assert not (tmp_path / "cache").exists()
+
+
+# ---------------------------------------------------------------------------
+# Revalidation
+# ---------------------------------------------------------------------------
+
+
+class TestCacheRevalidation:
+
+    def test_warm_load_parses_nothing(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        p, e, h = _count_parses()
+        with p as persona, e as expertise, h as hook:
+            load_library_index(lib, cache)
+        assert persona.call_count == 0
+        assert expertise.call_count == 0
+        assert hook.call_count == 0
+
+    def test_only_changed_persona_is_reparsed(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        persona_md = lib / "personas" / "extended" / "writer" / "persona.md"
+        persona_md.write_text("# writer\n\n## Category\nDocs\n", encoding="utf-8")
+        _bump_mtime(persona_md)
+        p, e, h = _count_parses()
+        with p as persona, e as expertise, h as hook:
+            idx = load_library_index(lib, cache)
+        assert persona.call_count == 1
+        assert persona.call_args.args[0].name == "writer"
+        assert expertise.call_count == 0
+        assert hook.call_count == 0
+        assert idx.persona_by_id("extended/writer").category == "Docs"
+
+    def test_new_template_invalidates_persona(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        templates = lib / "personas" / "core" / "developer" / "templates"
+        templates.mkdir()
+        (templates / "adr.md").write_text("x", encoding="utf-8")
+        idx = load_library_index(lib, cache)
+        assert idx.persona_by_id("developer").templates == ["adr.md"]
+
+    def test_added_hook_pack_is_indexed(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        (lib / "claude" / "hooks" / "scan.md").write_text("# Scan\n", encoding="utf-8")
+        p, e, h = _count_parses()
+        with p, e, h as hook:
+            idx = load_library_index(lib, cache)
+        assert hook.call_count == 1
+        assert [pack.id for pack in idx.hook_packs] == ["lint", "scan"]
+
+    def test_registry_change_discards_cache(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        registry = lib / "contracts" / "artifact-types.yml"
+        registry.write_text("types: []\n", encoding="utf-8")
+        _bump_mtime(registry)
+        p, e, h = _count_parses()
+        with p as persona, e, h:
+            idx = load_library_index(lib, cache)
+        assert persona.call_count == 2
+        assert idx.artifact_types == []
+        assert idx.persona_by_id("developer").produces == []
+
+    def test_corrupt_cache_file_is_rebuilt(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        (cache_file,) = cache.glob("library-index-*.json")
+        cache_file.write_text("{not json", encoding="utf-8")
+        idx = load_library_index(lib, cache)
+        assert idx.model_dump() == build_library_index(lib).model_dump()
+
+    def test_foundry_upgrade_discards_cache(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        cache = tmp_path / "cache"
+        load_library_index(lib, cache)
+        p, e, h = _count_parses()
+        with patch.object(library_cache, "__version__", "999.0.0"), p as persona, e, h:
+            load_library_index(lib, cache)
+        assert persona.call_count == 2
+
+
+# ---------------------------------------------------------------------------
+# Cache location
+# ---------------------------------------------------------------------------
+
+
+class TestDefaultCacheDir:
+
+    def test_env_override(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setenv("FOUNDRY_CACHE_DIR", str(tmp_path / "c"))
+        assert default_cache_dir() == tmp_path / "c"
+
+    def test_xdg_cache_home(self, tmp_path: Path, monkeypatch):
+        monkeypatch.delenv("FOUNDRY_CACHE_DIR", raising=False)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+        assert default_cache_dir() == tmp_path / "foundry"
+
+
+# ---------------------------------------------------------------------------
+# Parallel re-parse
+# ---------------------------------------------------------------------------
+
+
+class TestCachedParallelScan:
+
+    def test_parallel_reparse_matches_serial(self, tmp_path: Path):
+        serial = build_library_index(LIBRARY_ROOT).model_dump()
+        assert load_library_index(LIBRARY_ROOT, tmp_path, workers=4).model_dump() == serial
+        assert load_library_index(LIBRARY_ROOT, tmp_path, workers=4).model_dump() == serial
@@ -982,3 +982,111 @@ class TestDataScientistPersonaRegression:
                 f"data-scientist must ship template {required!r}; "
                 f"found: {target.templates}"
             )
+
+
+# ---------------------------------------------------------------------------
+# One-pass metadata extraction — every library file is read (and its YAML
+# parsed) at most once per index build.
+# ---------------------------------------------------------------------------
+
+
+class TestSinglePassMetadata:
+
+    def test_each_file_read_at_most_once(self, monkeypatch):
+        from collections import Counter
+
+        reads: Counter = Counter()
+        real_read_text = Path.read_text
+
+        def counting_read_text(self, *args, **kwargs):
+            reads[self] += 1
+            return real_read_text(self, *args, **kwargs)
+
+        monkeypatch.setattr(Path, "read_text", counting_read_text)
+        build_library_index(LIBRARY_ROOT)
+        assert reads
+        assert max(reads.values()) == 1, reads.most_common(3)
+
+    def test_frontmatter_parsed_once_per_expertise(self, tmp_path: Path, monkeypatch):
+        import yaml
+
+        pack = tmp_path / "expertise" / "python"
+        pack.mkdir(parents=True)
+        (pack / "conventions.md").write_text(
+            "---\ncategory: Languages\napplies_to: [developer]\n---\n# Python\n",
+            encoding="utf-8",
+        )
+        calls = []
+        real_safe_load = yaml.safe_load
+        monkeypatch.setattr(
+            yaml, "safe_load", lambda s: calls.append(s) or real_safe_load(s),
+        )
+        idx = build_library_index(tmp_path)
+        assert len(calls) == 1
+        info = idx.expertise_by_id("python")
+        assert info.category == "Languages"
+
+    def test_hook_pack_sections_from_one_read(self, tmp_path: Path):
+        hooks = tmp_path / "claude" / "hooks"
+        hooks.mkdir(parents=True)
+        (hooks / "guard.md").write_text(
+            "# Guard\n\n"
+            "## Category\nGit\n\n"
+            "## Conflicts With\n- `other` — overlaps\n\n"
+            "## Posture Compatibility\n"
+            "| Posture | Included | Default Mode |\n"
+            "|---|---|---|\n"
+            "| baseline | Yes | enforcing |\n\n"
+            "## Conflicts With\n- `third`\n",
+            encoding="utf-8",
+        )
+        pack = build_library_index(tmp_path).hook_pack_by_id("guard")
+        assert pack.category == "Git"
+        assert pack.conflicts_with == ["other", "third"]
+        assert pack.posture_compatibility == {
+            "baseline": {"included": "Yes", "default_mode": "enforcing"},
+        }
+
+
+# ---------------------------------------------------------------------------
+# Parallel scanning — opt-in thread pool with deterministic output and logs
+# ---------------------------------------------------------------------------
+
+
+class TestParallelScan:
+
+    def test_real_library_matches_serial(self):
+        serial = build_library_index(LIBRARY_ROOT)
+        parallel = build_library_index(LIBRARY_ROOT, workers=8)
+        assert parallel.model_dump() == serial.model_dump()
+
+    def test_warnings_logged_in_serial_order(self, tmp_path: Path, caplog):
+        import logging
+
+        (tmp_path / "contracts").mkdir()
+        (tmp_path / "contracts" / "artifact-types.yml").write_text(
+            "types: []\n", encoding="utf-8",
+        )
+        for name in ("alpha", "bravo", "charlie", "delta", "echo"):
+            pdir = tmp_path / "personas" / "core" / name
+            pdir.mkdir(parents=True)
+            (pdir / "contracts.yml").write_text(
+                f"produces:\n  - {name}-doc\nconsumes:\n  - {name}-input\n",
+                encoding="utf-8",
+            )
+            edir = tmp_path / "expertise" / name
+            edir.mkdir(parents=True)
+            (edir / "conventions.md").write_text(
+                "---\n: bad: [yaml\n---\n", encoding="utf-8",
+            )
+
+        def messages(workers):
+            caplog.clear()
+            with caplog.at_level(logging.WARNING, logger="foundry_app"):
+                build_library_index(tmp_path, workers=workers)
+            return [r.getMessage() for r in caplog.records]
+
+        serial = messages(None)
+        assert len(serial) > 10
+        for _ in range(3):
+            assert messages(4) == serial
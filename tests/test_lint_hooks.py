@@ -0,0 +1,163 @@
+"""Tests for the lint hook packs' scripts (lint-python.py, lint-js.py).
+
+Run as subprocesses with JSON on stdin, as Claude Code invokes them, with
+fake ``ruff`` / ``npx`` executables on PATH that log their arguments.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_LIBRARY_HOOKS = (
+    Path(__file__).resolve().parent.parent / "ai-team-library" / "claude" / "hooks"
+)
+
+pytestmark = pytest.mark.skipif(os.name != "posix", reason="fake linters are shell scripts")
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    return tmp_path
+
+
+@pytest.fixture()
+def bin_dir(tmp_path_factory) -> Path:
+    """A PATH directory holding fake linters; ``FAIL`` makes them report findings."""
+    bin_dir = tmp_path_factory.mktemp("bin")
+    for tool in ("ruff", "npx"):
+        fake = bin_dir / tool
+        fake.write_text(
+            "#!/bin/sh\n"
+            f'echo "{tool} $*" >> "$LINT_LOG"\n'
+            '[ -z "$FAIL" ]\n'
+        )
+        fake.chmod(0o755)
+    return bin_dir
+
+
+def _hook(script: str, payload: dict, cwd: Path, bin_dir: Path,
+          fail: bool = False) -> tuple[str, list[str]]:
+    log = cwd / ".lint.log"
+    log.unlink(missing_ok=True)
+    env = {**os.environ, "PATH": f"{bin_dir}:/usr/bin:/bin", "LINT_LOG": str(log)}
+    env.pop("FAIL", None)
+    if fail:
+        env["FAIL"] = "1"
+    result = subprocess.run(
+        [sys.executable, str(_LIBRARY_HOOKS / script)],
+        input=json.dumps(payload), capture_output=True, text=True,
+        timeout=30, cwd=cwd, env=env,
+    )
+    assert result.returncode == 0, result.stderr
+    calls = log.read_text().splitlines() if log.exists() else []
+    return result.stdout, calls
+
+
+def _edit(path: Path) -> dict:
+    path.write_text("x = 1\n")
+    return {"hook_event_name": "PostToolUse", "tool_name": "Edit",
+            "tool_input": {"file_path": str(path)}}
+
+
+_STOP = {"hook_event_name": "Stop", "stop_hook_active": False}
+
+
+def _state(project: Path) -> dict:
+    return json.loads((project / ".git" / "foundry-lint-state.json").read_text())
+
+
+# ---------------------------------------------------------------------------
+# Per-edit pass
+# ---------------------------------------------------------------------------
+
+
+class TestEditedFileOnly:
+
+    def test_lints_the_edited_python_file(self, project: Path, bin_dir: Path):
+        target = project / "pkg" / "mod.py"
+        target.parent.mkdir()
+        out, calls = _hook("lint-python.py", _edit(target), project, bin_dir)
+
+        assert calls == [f"ruff check --quiet {target}"]
+        assert out == ""
+        assert _state(project)["python"]["due"] is True
+
+    def test_findings_warn_without_blocking(self, project: Path, bin_dir: Path):
+        out, _ = _hook("lint-python.py", _edit(project / "mod.py"), project, bin_dir,
+                       fail=True)
+        assert "WARNING: Lint issues detected in mod.py" in out
+
+    def test_other_files_are_ignored(self, project: Path, bin_dir: Path):
+        _, calls = _hook("lint-python.py", _edit(project / "README.md"), project, bin_dir)
+        assert calls == []
+        assert not (project / ".git" / "foundry-lint-state.json").exists()
+
+    def test_js_checks_follow_the_extension(self, project: Path, bin_dir: Path):
+        _, calls = _hook("lint-js.py", _edit(project / "app.ts"), project, bin_dir)
+        assert calls == [
+            f"npx --no-install prettier --check --ignore-unknown {project / 'app.ts'}",
+            f"npx --no-install eslint {project / 'app.ts'}",
+        ]
+        _, calls = _hook("lint-js.py", _edit(project / "package.json"), project, bin_dir)
+        assert [c.split()[2] for c in calls] == ["prettier"]
+
+    def test_missing_linter_is_skipped(self, project: Path, tmp_path_factory):
+        empty = tmp_path_factory.mktemp("empty")
+        out, calls = _hook("lint-python.py", _edit(project / "mod.py"), project, empty)
+        assert (out, calls) == ("", [])
+
+
+# ---------------------------------------------------------------------------
+# Debounced project pass at Stop
+# ---------------------------------------------------------------------------
+
+
+class TestProjectPassAtStop:
+
+    def test_runs_once_after_edits(self, project: Path, bin_dir: Path):
+        _hook("lint-python.py", _edit(project / "a.py"), project, bin_dir)
+        _hook("lint-python.py", _edit(project / "b.py"), project, bin_dir)
+
+        out, calls = _hook("lint-python.py", _STOP, project, bin_dir, fail=True)
+        assert calls == ["ruff check --quiet ."]
+        assert "WARNING: Lint issues detected in the project" in out
+
+        _, calls = _hook("lint-python.py", _STOP, project, bin_dir)
+        assert calls == []
+
+    def test_nothing_edited_nothing_run(self, project: Path, bin_dir: Path):
+        assert _hook("lint-js.py", _STOP, project, bin_dir)[1] == []
+
+    def test_debounced_until_the_window_passes(self, project: Path, bin_dir: Path):
+        _hook("lint-python.py", _edit(project / "a.py"), project, bin_dir)
+        _hook("lint-python.py", _STOP, project, bin_dir)
+        _hook("lint-python.py", _edit(project / "a.py"), project, bin_dir)
+
+        assert _hook("lint-python.py", _STOP, project, bin_dir)[1] == []
+        assert _state(project)["python"]["due"] is True
+
+        state = _state(project)
+        state["python"]["last_pass"] -= 3600
+        (project / ".git" / "foundry-lint-state.json").write_text(json.dumps(state))
+        assert _hook("lint-python.py", _STOP, project, bin_dir)[1] == ["ruff check --quiet ."]
+
+    def test_js_project_pass_includes_tsc(self, project: Path, bin_dir: Path):
+        _hook("lint-js.py", _edit(project / "app.tsx"), project, bin_dir)
+        _, calls = _hook("lint-js.py", _STOP, project, bin_dir)
+        assert calls == [
+            "npx --no-install prettier --check .",
+            "npx --no-install eslint .",
+            "npx --no-install tsc --noEmit",
+        ]
+
+    def test_packs_keep_separate_state(self, project: Path, bin_dir: Path):
+        _hook("lint-python.py", _edit(project / "a.py"), project, bin_dir)
+        assert _hook("lint-js.py", _STOP, project, bin_dir)[1] == []
+        assert _hook("lint-python.py", _STOP, project, bin_dir)[1] == ["ruff check --quiet ."]
@@ -4,6 +4,7 @@ import pytest
 from pydantic import ValidationError
 
 from foundry_app.core.models import (
+    ArtifactTypeInfo,
     CompositionSpec,
     DestructiveOpsPolicy,
     FileAction,
@@ -17,6 +18,7 @@ from foundry_app.core.models import (
     HookPackSelection,
     HooksConfig,
     LibraryIndex,
+    LinkMode,
     NetworkPolicy,
     OverlayPlan,
     PersonaInfo,
@@ -159,6 +161,18 @@ class TestHooksConfig:
         assert hp.enabled is True
         assert hp.mode == HookMode.ENFORCING
 
+    def test_dispatch_omitted_from_dump_when_on(self):
+        assert HooksConfig().dispatch is True
+        assert "dispatch" not in HooksConfig().model_dump(mode="json")
+        h = HooksConfig(dispatch=False)
+        assert h.model_dump(mode="json")["dispatch"] is False
+        assert HooksConfig.model_validate(h.model_dump(mode="json")) == h
+
+    def test_daemon_omitted_from_dump_when_off(self):
+        assert HooksConfig().daemon is False
+        assert "daemon" not in HooksConfig().model_dump(mode="json")
+        assert HooksConfig(daemon=True).model_dump(mode="json")["daemon"] is True
+
 
 # ---------------------------------------------------------------------------
 # Safety sub-policies
@@ -279,6 +293,17 @@ class TestGenerationOptions:
         with pytest.raises(ValidationError):
             GenerationOptions(harness_profile="pi")
 
+    def test_link_mode_omitted_from_dump_when_copy(self):
+        assert "link_mode" not in GenerationOptions().model_dump(mode="json")
+        g = GenerationOptions(link_mode="hardlink")
+        assert g.link_mode == LinkMode.HARDLINK
+        assert g.model_dump(mode="json")["link_mode"] == "hardlink"
+        assert GenerationOptions.model_validate(g.model_dump(mode="json")) == g
+
+    def test_unknown_link_mode_rejected(self):
+        with pytest.raises(ValidationError):
+            GenerationOptions(link_mode="clone")
+
 
 # ---------------------------------------------------------------------------
 # CompositionSpec
@@ -521,6 +546,83 @@ class TestLibraryIndex:
         idx = self._make_index()
         assert idx.hook_pack_by_id("nope") is None
 
+    def test_lookup_sees_appended_entries(self):
+        idx = self._make_index()
+        assert idx.persona_by_id("architect") is None
+        idx.personas.append(PersonaInfo(id="architect", path="/tmp/lib/a"))
+        assert idx.persona_by_id("architect").path == "/tmp/lib/a"
+
+    def test_lookup_sees_in_place_replacement(self):
+        idx = self._make_index()
+        assert idx.persona_by_id("developer") is not None
+        idx.personas[0] = PersonaInfo(id="developer", path="/tmp/lib/new")
+        assert idx.persona_by_id("developer").path == "/tmp/lib/new"
+
+    def test_lookup_sees_replacement_with_a_different_id(self):
+        idx = self._make_index()
+        assert idx.persona_by_id("c") is None
+        idx.personas[0] = PersonaInfo(id="c", path="/tmp/lib/c")
+        assert idx.persona_by_id("c").path == "/tmp/lib/c"
+        assert idx.persona_by_id("developer") is None
+
+    def test_lookup_sees_same_length_remove_then_append(self):
+        idx = self._make_index()
+        assert idx.expertise_by_id("python") is not None
+        del idx.expertise[0]
+        idx.expertise.append(ExpertiseInfo(id="rust", path="/tmp/lib/stacks/rust"))
+        assert idx.expertise_by_id("rust").path == "/tmp/lib/stacks/rust"
+        assert idx.expertise_by_id("python") is None
+        del idx.hook_packs[0]
+        idx.hook_packs.append(HookPackInfo(id="security-scan", path="/tmp/lib/s.md"))
+        assert idx.hook_pack_by_id("security-scan") is not None
+
+    def test_persona_aliases_follow_in_place_edits(self):
+        idx = self._make_index()
+        idx.persona_aliases()
+        idx.personas[0] = PersonaInfo(id="c", path="/tmp/lib/c", title="Chief Cook")
+        assert idx.persona_aliases().get("Chief Cook") == "c"
+        del idx.personas[0]
+        idx.personas.append(PersonaInfo(id="d", path="/tmp/lib/d", title="Deckhand"))
+        aliases = idx.persona_aliases()
+        assert aliases.get("Deckhand") == "d"
+        assert aliases.get("Chief Cook") is None
+
+    def test_lookup_returns_first_duplicate(self):
+        idx = self._make_index()
+        idx.personas.append(PersonaInfo(id="developer", path="/tmp/lib/dup"))
+        assert idx.persona_by_id("developer").path == "/tmp/lib/personas/developer"
+
+    def test_lookup_after_model_copy_update(self):
+        idx = self._make_index()
+        assert idx.expertise_by_id("python") is not None
+        copy = idx.model_copy(update={"expertise": [
+            ExpertiseInfo(id="rust", path="/tmp/lib/stacks/rust"),
+        ]})
+        assert copy.expertise_by_id("python") is None
+        assert copy.expertise_by_id("rust") is not None
+        # The original keeps its own lookup.
+        assert idx.expertise_by_id("python") is not None
+        assert idx.expertise_by_id("rust") is None
+
+    def test_lookup_after_serialization_round_trip(self):
+        import pickle
+
+        idx = self._make_index()
+        idx.persona_by_id("developer")
+        restored = LibraryIndex.model_validate_json(idx.model_dump_json())
+        assert restored.persona_by_id("tech-qa").has_outputs_md is True
+        assert "_lookups" not in idx.model_dump()
+        unpickled = pickle.loads(pickle.dumps(idx))
+        assert unpickled.persona_by_id("tech-qa") is unpickled.personas[1]
+
+    def test_artifact_type_by_name(self):
+        idx = self._make_index()
+        idx.artifact_types.append(ArtifactTypeInfo(
+            name="design-doc", description="d", format="markdown",
+        ))
+        assert idx.artifact_type_by_name("design-doc").format == "markdown"
+        assert idx.artifact_type_by_name("missing") is None
+
 
 # ---------------------------------------------------------------------------
 # Enum values
@@ -0,0 +1,227 @@
+"""Tests for foundry_app.services.output_writer — on-disk and in-memory writers."""
+
+from __future__ import annotations
+
+import os
+import stat
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from foundry_app.core.models import FileAction, FileActionType, OverlayPlan
+from foundry_app.services.file_ledger import hash_tree
+from foundry_app.services.output_writer import DirectoryWriter, OutputWriter, VirtualTree
+
+
+def _populate(writer, root: Path, src: Path) -> None:
+    # Stages create directories before writing into them.
+    for rel in ("ai/outputs", "ai/team", ".claude/hooks"):
+        writer.mkdir(root / rel)
+    writer.write_text(root / "CLAUDE.md", "# Project\n")
+    writer.write_text(root / "ai" / "team" / "composition.yml", "project: {}\n")
+    writer.copy_file(src, root / ".claude" / "hooks" / "guard.py")
+
+
+def _make_source(tmp_path: Path) -> Path:
+    src = tmp_path / "library" / "guard.py"
+    src.parent.mkdir(parents=True)
+    src.write_text("print('guard')\n")
+    src.chmod(0o755)
+    return src
+
+
+# ---------------------------------------------------------------------------
+# OutputWriter
+# ---------------------------------------------------------------------------
+
+
+class TestOutputWriter:
+
+    def test_is_abstract(self, tmp_path: Path):
+        with pytest.raises(TypeError):
+            OutputWriter(tmp_path)
+
+    def test_subclass_must_implement_every_primitive(self, tmp_path: Path):
+        class Partial(OutputWriter):
+            def exists(self, path: Path) -> bool:
+                return False
+
+        with pytest.raises(TypeError, match="files_under"):
+            Partial(tmp_path)
+
+
+# ---------------------------------------------------------------------------
+# VirtualTree
+# ---------------------------------------------------------------------------
+
+
+class TestVirtualTree:
+
+    def test_reads_back_only_its_own_output(self, tmp_path: Path):
+        root = tmp_path / "project"
+        root.mkdir()
+        (root / "README.md").write_text("already on disk")
+        writer = VirtualTree(root)
+        writer.write_text(root / "CLAUDE.md", "generated")
+
+        assert writer.read_text(root / "CLAUDE.md") == "generated"
+        assert writer.exists(root)
+        assert not writer.exists(root / "README.md")
+        assert not (root / "CLAUDE.md").exists()
+
+    def test_parents_of_written_files_exist(self, tmp_path: Path):
+        writer = VirtualTree(tmp_path)
+        writer.write_text(tmp_path / "ai" / "beans" / "_index.md", "x")
+        writer.mkdir(tmp_path / "ai" / "outputs" / "developer")
+
+        assert writer.exists(tmp_path / "ai" / "beans")
+        assert writer.exists(tmp_path / "ai" / "outputs")
+        assert writer.is_file(tmp_path / "ai" / "beans" / "_index.md")
+        assert not writer.is_file(tmp_path / "ai" / "beans")
+
+    def test_files_under_is_sorted_and_scoped(self, tmp_path: Path):
+        writer = VirtualTree(tmp_path)
+        for rel in ("ai/generated/b.md", "ai/generated/a/z.md", "ai/other.md"):
+            writer.write_text(tmp_path / rel, rel)
+
+        assert writer.files_under(tmp_path / "ai" / "generated") == [
+            tmp_path / "ai" / "generated" / "a" / "z.md",
+            tmp_path / "ai" / "generated" / "b.md",
+        ]
+        assert writer.files_under(tmp_path / "missing") == []
+
+    def test_hashes_match_the_same_tree_on_disk(self, tmp_path: Path):
+        src = _make_source(tmp_path)
+        disk_root = tmp_path / "disk"
+        _populate(DirectoryWriter(disk_root), disk_root, src)
+        writer = VirtualTree(tmp_path / "memory")
+        _populate(writer, tmp_path / "memory", src)
+
+        assert writer.hashes() == hash_tree(disk_root)
+        assert list(writer.hashes()) == list(hash_tree(disk_root))
+
+    def test_same_content_compares_generated_bytes(self, tmp_path: Path):
+        src = _make_source(tmp_path)
+        writer = VirtualTree(tmp_path / "project")
+        dest = tmp_path / "project" / "guard.py"
+        writer.copy_file(src, dest)
+        assert writer.same_content(dest, src)
+        writer.write_text(dest, "changed")
+        assert not writer.same_content(dest, src)
+
+
+class TestVirtualTreeApply:
+
+    def test_applies_creates_updates_and_deletes(self, tmp_path: Path):
+        root = tmp_path / "project"
+        (root / "ai").mkdir(parents=True)
+        (root / "CLAUDE.md").write_text("stale")
+        (root / "ai" / "old.md").write_text("gone soon")
+        writer = VirtualTree(root)
+        writer.write_text(root / "CLAUDE.md", "fresh")
+        writer.write_text(root / "ai" / "new" / "member.md", "member")
+        plan = OverlayPlan(actions=[
+            FileAction(path="CLAUDE.md", action=FileActionType.UPDATE),
+            FileAction(path="ai/new/member.md", action=FileActionType.CREATE),
+            FileAction(path="ai/old.md", action=FileActionType.DELETE),
+            FileAction(path="ai/missing.md", action=FileActionType.DELETE),
+        ])
+
+        result = writer.apply(plan)
+
+        assert (root / "CLAUDE.md").read_text() == "fresh"
+        assert (root / "ai" / "new" / "member.md").read_text() == "member"
+        assert not (root / "ai" / "old.md").exists()
+        assert result.wrote == ["CLAUDE.md", "ai/new/member.md", "ai/old.md"]
+        assert result.warnings == ["File already removed: ai/missing.md"]
+
+    def test_skips_are_not_written(self, tmp_path: Path):
+        root = tmp_path / "project"
+        root.mkdir()
+        (root / "CLAUDE.md").write_text("same")
+        before = (root / "CLAUDE.md").stat().st_mtime_ns
+        writer = VirtualTree(root)
+        writer.write_text(root / "CLAUDE.md", "same")
+
+        result = writer.apply(OverlayPlan(actions=[
+            FileAction(path="CLAUDE.md", action=FileActionType.SKIP),
+        ]))
+
+        assert result.wrote == []
+        assert (root / "CLAUDE.md").stat().st_mtime_ns == before
+
+    def test_copied_files_keep_permission_bits(self, tmp_path: Path):
+        src = _make_source(tmp_path)
+        root = tmp_path / "project"
+        writer = VirtualTree(root)
+        writer.copy_file(src, root / ".claude" / "hooks" / "guard.py")
+
+        writer.apply(OverlayPlan(actions=[
+            FileAction(path=".claude/hooks/guard.py", action=FileActionType.CREATE),
+        ]))
+
+        dest = root / ".claude" / "hooks" / "guard.py"
+        assert stat.S_IMODE(dest.stat().st_mode) == stat.S_IMODE(src.stat().st_mode)
+        assert os.access(dest, os.X_OK)
+
+
+class TestVirtualTreeFlush:
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_flush_matches_direct_writes(self, tmp_path: Path, workers: int):
+        src = _make_source(tmp_path)
+        disk_root = tmp_path / "disk"
+        _populate(DirectoryWriter(disk_root), disk_root, src)
+        root = tmp_path / "flushed"
+        tree = VirtualTree(root)
+        _populate(tree, root, src)
+
+        result = tree.flush(workers=workers)
+
+        assert hash_tree(root) == hash_tree(disk_root)
+        assert (root / "ai" / "outputs").is_dir()
+        assert os.access(root / ".claude" / "hooks" / "guard.py", os.X_OK)
+        assert result.wrote == list(tree.hashes())
+
+    def test_empty_tree_creates_root(self, tmp_path: Path):
+        root = tmp_path / "project"
+        assert VirtualTree(root).flush().wrote == []
+        assert root.is_dir()
+
+
+class TestVirtualTreeZip:
+
+    def test_archive_holds_tree_under_root_name(self, tmp_path: Path):
+        src = _make_source(tmp_path)
+        root = tmp_path / "project"
+        tree = VirtualTree(root)
+        _populate(tree, root, src)
+        archive = tmp_path / "out" / "project.zip"
+
+        result = tree.write_zip(archive)
+
+        assert result.wrote == [str(archive)]
+        assert not root.exists()
+        with zipfile.ZipFile(archive) as zf:
+            names = zf.namelist()
+            assert names == [
+                "project/ai/outputs/",
+                "project/.claude/hooks/guard.py",
+                "project/CLAUDE.md",
+                "project/ai/team/composition.yml",
+            ]
+            assert zf.read("project/CLAUDE.md") == b"# Project\n"
+            mode = zf.getinfo("project/.claude/hooks/guard.py").external_attr >> 16
+            assert stat.S_IMODE(mode) == stat.S_IMODE(src.stat().st_mode)
+
+    def test_same_tree_same_archive(self, tmp_path: Path):
+        src = _make_source(tmp_path)
+        archives = []
+        for name in ("a", "b"):
+            root = tmp_path / name / "project"
+            tree = VirtualTree(root)
+            _populate(tree, root, src)
+            archives.append(tree.write_zip(tmp_path / f"{name}.zip").wrote[0])
+        assert Path(archives[0]).read_bytes() == Path(archives[1]).read_bytes()
+
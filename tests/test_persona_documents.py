@@ -0,0 +1,108 @@
+"""Tests for foundry_app.services.persona_documents — persona.md parsed once per run."""
+
+from __future__ import annotations
+
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from unittest.mock import patch
+
+from foundry_app.core.models import (
+    CompositionSpec,
+    LibraryIndex,
+    PersonaInfo,
+    PersonaSelection,
+    ProjectIdentity,
+    TeamConfig,
+)
+from foundry_app.services.generator import _run_pipeline
+from foundry_app.services.persona_documents import PersonaDocument, PersonaDocuments
+
+
+def _library(tmp_path: Path, *persona_ids: str) -> LibraryIndex:
+    lib_root = tmp_path / "library"
+    personas = []
+    for pid in persona_ids:
+        persona_dir = lib_root / "personas" / "core" / pid
+        persona_dir.mkdir(parents=True)
+        (persona_dir / "persona.md").write_text(
+            f"# Persona: {pid.title()}\r\n\r\n## Mission\r\n\r\nShip {{{{ project_name }}}}.\r\n",
+            encoding="utf-8",
+            newline="",
+        )
+        personas.append(PersonaInfo(
+            id=pid, path=str(persona_dir), has_persona_md=True, category="core",
+        ))
+    (lib_root / "workflows").mkdir(parents=True)
+    (lib_root / "workflows" / "mcp-registry.yaml").write_text(
+        "servers: {}\nbaseline: []\nby_expertise: {}\n"
+    )
+    return LibraryIndex(library_root=str(lib_root), personas=personas)
+
+
+# ---------------------------------------------------------------------------
+# PersonaDocument
+# ---------------------------------------------------------------------------
+
+
+class TestPersonaDocument:
+
+    def test_parses_header_and_text(self, tmp_path: Path):
+        index = _library(tmp_path, "developer")
+        doc = PersonaDocument("developer", Path(index.personas[0].path), "core")
+
+        assert doc.header == "Developer"
+        assert doc.category == "core"
+        assert doc.text == Path(doc.path).read_text(encoding="utf-8")
+        assert doc.data == doc.path.read_bytes()
+        assert doc.body.render({"project_name": "Acme"}).endswith("Ship Acme.")
+        assert doc.template.render({}).endswith("{{ project_name }}.\n")
+
+    def test_missing_persona_md(self, tmp_path: Path):
+        doc = PersonaDocument("ghost", tmp_path)
+        assert doc.data is None and doc.text is None and doc.header is None
+        assert doc.template is None and doc.body is None
+
+
+# ---------------------------------------------------------------------------
+# PersonaDocuments
+# ---------------------------------------------------------------------------
+
+
+class TestPersonaDocuments:
+
+    def test_builds_each_document_once(self, tmp_path: Path):
+        docs = PersonaDocuments(_library(tmp_path, "developer", "architect"))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            found = list(pool.map(docs.get, ["developer", "architect"] * 20))
+
+        assert docs.reads == 2
+        assert found[0] is docs.get("developer")
+        assert docs.get("nobody") is None
+        assert docs.reads == 2
+
+    def test_pipeline_reads_each_persona_md_once(self, tmp_path: Path):
+        index = _library(tmp_path, "developer", "architect", "tech-qa")
+        spec = CompositionSpec(
+            project=ProjectIdentity(name="Acme", slug="acme"),
+            team=TeamConfig(personas=[
+                PersonaSelection(id="developer"), PersonaSelection(id="architect"),
+            ]),
+        )
+        built: Counter[str] = Counter()
+        original = PersonaDocument.__init__
+
+        def counting_init(self, persona_id, *args, **kwargs):
+            built[persona_id] += 1
+            original(self, persona_id, *args, **kwargs)
+
+        with patch.object(PersonaDocument, "__init__", counting_init):
+            _run_pipeline(
+                spec, index, Path(index.library_root), tmp_path / "out", stage_workers=4,
+            )
+
+        # The name map needs every library persona; none is read twice.
+        assert built == {"developer": 1, "architect": 1, "tech-qa": 1}
+        agent = (tmp_path / "out" / ".claude" / "agents" / "developer.md").read_text()
+        assert "Ship Acme." in agent
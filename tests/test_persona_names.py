@@ -0,0 +1,184 @@
+"""Tests for persona names — titles, aliases, and the index's alias map."""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+from foundry_app.core.models import LibraryIndex, PersonaAliases, PersonaInfo
+from foundry_app.services.compiler import (
+    _filter_collaboration_table,
+    _filter_defer_references,
+    _filter_persona_references,
+    _persona_aliases,
+)
+from foundry_app.services.library_indexer import build_library_index
+from foundry_app.services.persona_names import persona_aliases, persona_title
+
+_LIBRARY_ROOT = Path(__file__).resolve().parent.parent / "ai-team-library"
+
+
+# ---------------------------------------------------------------------------
+# persona_title
+# ---------------------------------------------------------------------------
+
+
+class TestPersonaTitle:
+
+    def test_reads_header(self):
+        assert persona_title("intro\n# Persona: Team Lead  \nbody") == "Team Lead"
+
+    def test_no_header_is_empty(self):
+        assert persona_title("# Team Lead\n") == ""
+
+
+# ---------------------------------------------------------------------------
+# persona_aliases
+# ---------------------------------------------------------------------------
+
+
+class TestPersonaAliasesForms:
+
+    def test_parenthetical_acronym_and_short_form(self):
+        aliases = persona_aliases("Business Analyst (BA)", "ba")
+        assert aliases == ["Business Analyst", "BA"]
+
+    def test_tight_slash_variant(self):
+        aliases = persona_aliases("UX / UI Designer", "ux-ui-designer")
+        assert aliases == ["UX/UI Designer"]
+
+    def test_spaced_slash_variant(self):
+        aliases = persona_aliases("UX/UI Designer", "ux-ui-designer")
+        assert aliases == ["UX / UI Designer"]
+
+    def test_id_display_name(self):
+        aliases = persona_aliases("Software Architect", "architect")
+        assert aliases == ["Architect"]
+
+    def test_title_itself_not_listed(self):
+        assert persona_aliases("Developer", "developer") == []
+
+    def test_no_title_uses_dirname(self):
+        assert persona_aliases(None, "tech-qa") == ["Tech QA"]
+
+
+# ---------------------------------------------------------------------------
+# PersonaAliases
+# ---------------------------------------------------------------------------
+
+
+class TestPersonaAliasesMap:
+
+    def test_full_name_beats_short_form_and_alias(self):
+        aliases = PersonaAliases(
+            [("Writer / Editor", "writer"), ("Writer", "solo-writer")],
+            [("Writer / Editor", "other")],
+        )
+        assert aliases.resolve("Writer") == "solo-writer"
+        assert aliases.resolve("Writer / Editor") == "writer"
+
+    def test_short_form_beats_alias(self):
+        aliases = PersonaAliases(
+            [("Technical Writer / Doc Owner", "technical-writer")],
+            [("Technical Writer", "someone-else")],
+        )
+        assert aliases.resolve("Technical Writer") == "technical-writer"
+
+    def test_every_leading_part_of_slashed_name(self):
+        aliases = PersonaAliases([("A / B / C", "abc")])
+        assert aliases.resolve("A") == "abc"
+        assert aliases.resolve("A / B") == "abc"
+        assert aliases.resolve("B") is None
+
+    def test_first_persona_wins_short_forms_and_aliases(self):
+        aliases = PersonaAliases(
+            [("Lead / One", "one"), ("Lead / Two", "two")],
+            [("L", "one"), ("L", "two")],
+        )
+        assert aliases.resolve("Lead") == "one"
+        assert aliases.resolve("L") == "one"
+
+    def test_later_full_name_wins(self):
+        aliases = PersonaAliases([("Dev", "one"), ("Dev", "two")])
+        assert aliases.resolve("Dev") == "two"
+
+    def test_resolve_strips_whitespace(self):
+        assert PersonaAliases([("Dev", "dev")]).resolve("  Dev ") == "dev"
+
+
+# ---------------------------------------------------------------------------
+# LibraryIndex.persona_aliases
+# ---------------------------------------------------------------------------
+
+
+class TestIndexPersonaAliases:
+
+    def _index(self) -> LibraryIndex:
+        return LibraryIndex(library_root="/lib", personas=[
+            PersonaInfo(id="ba", path="/lib/personas/ba", title="Business Analyst (BA)",
+                        aliases=["Business Analyst", "BA"]),
+        ])
+
+    def test_built_from_titles_and_aliases(self):
+        aliases = self._index().persona_aliases()
+        assert aliases.resolve("Business Analyst (BA)") == "ba"
+        assert aliases.resolve("BA") == "ba"
+
+    def test_cached(self):
+        index = self._index()
+        assert index.persona_aliases() is index.persona_aliases()
+
+    def test_rebuilt_when_personas_change(self):
+        index = self._index()
+        first = index.persona_aliases()
+        index.personas.append(PersonaInfo(id="dev", path="/lib/personas/dev", title="Developer"))
+        second = index.persona_aliases()
+        assert second is not first
+        assert second.resolve("Developer") == "dev"
+
+    def test_indexer_records_titles_and_aliases(self):
+        index = build_library_index(_LIBRARY_ROOT)
+        ba = index.persona_by_id("ba")
+        assert ba is not None and ba.title
+        assert "BA" in ba.aliases
+        assert _persona_aliases(index) is index.persona_aliases()
+
+    def test_hand_built_index_matches_indexer(self):
+        index = build_library_index(_LIBRARY_ROOT)
+        hand_built = index.model_copy(update={"personas": [
+            p.model_copy(update={"title": None, "aliases": []}) for p in index.personas
+        ]})
+        assert _persona_aliases(hand_built) == index.persona_aliases()
+
+
+# ---------------------------------------------------------------------------
+# Single-pass reference filtering
+# ---------------------------------------------------------------------------
+
+
+class TestSinglePassFiltering:
+
+    def test_matches_table_then_defer_passes_on_library(self):
+        index = build_library_index(_LIBRARY_ROOT)
+        aliases = index.persona_aliases()
+        ids = [p.id for p in index.personas]
+        rng = random.Random(0)
+        for path in sorted((_LIBRARY_ROOT / "personas").rglob("persona.md")):
+            text = path.read_text(encoding="utf-8")
+            for _ in range(4):
+                selected = set(rng.sample(ids, rng.randint(0, len(ids))))
+                two_pass = _filter_defer_references(
+                    _filter_collaboration_table(text, selected, aliases), selected, aliases,
+                )
+                assert _filter_persona_references(text, selected, aliases) == two_pass, path
+
+    def test_table_at_end_without_newline_dropped_with_its_break(self):
+        text = (
+            "Intro\n"
+            "## Collaboration\n"
+            "| Collaborator | Pattern |\n"
+            "|---|---|\n"
+            "| Developer | Code |"
+        )
+        result = _filter_persona_references(text, set(), {"Developer": "developer"})
+        assert result == "Intro"
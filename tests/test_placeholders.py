@@ -0,0 +1,127 @@
+"""Tests for foundry_app.services.placeholders — compiled placeholder templates."""
+
+from __future__ import annotations
+
+import os
+import re
+from pathlib import Path
+
+import pytest
+
+from foundry_app.services.placeholders import (
+    _PLACEHOLDER_RE,
+    PlaceholderTemplate,
+    compile_template,
+    load_template,
+    unresolved_placeholders,
+)
+
+_LIBRARY_ROOT = Path(__file__).resolve().parent.parent / "ai-team-library"
+
+
+def _regex_substitute(text: str, context: dict[str, str]) -> str:
+    """Reference: the per-match regex callback templates replaced."""
+
+    def resolve(match: re.Match[str]) -> str:
+        expr = match.group(1).strip()
+        join_match = re.match(r"(\w+)\s*\|\s*join\(\s*\"([^\"]*)\"\s*\)", expr)
+        if join_match:
+            value = context.get(join_match.group(1))
+            if value is None:
+                return match.group(0)
+            return join_match.group(2).join(v.strip() for v in value.split(","))
+        value = context.get(expr)
+        return match.group(0) if value is None else value
+
+    return _PLACEHOLDER_RE.sub(resolve, text)
+
+
+_CONTEXT = {
+    "project_name": "Acme",
+    "expertise": "python, react ,go",
+    "team": "developer,architect",
+    "empty": "",
+}
+
+
+# ---------------------------------------------------------------------------
+# PlaceholderTemplate
+# ---------------------------------------------------------------------------
+
+
+class TestPlaceholderTemplate:
+
+    @pytest.mark.parametrize("text", [
+        "",
+        "No variables here.",
+        "{{ project_name }}",
+        "Project: {{project_name}} and {{  project_name  }}.",
+        '{{ expertise | join(", ") }} / {{ team|join("") }} / {{ team | join( " + " ) }}',
+        '{{ expertise | join(", ") }} trailing {{ unknown | join(", ") }}',
+        "{{ unknown }} {{ empty }} {{ project_name }}",
+        "{{ a }}{{ b }}{{project_name}}{{",
+        "{{ project_name\n}} {{ x }} }} {{{ project_name }}}",
+        '{{ expertise | join(", ") | upper }} {{ expertise | upper }}',
+        "{{ }} {{   }} {{project_name }}",
+    ])
+    def test_matches_regex_substitution(self, text: str):
+        template = PlaceholderTemplate(text)
+        assert template.render(_CONTEXT) == _regex_substitute(text, _CONTEXT)
+        assert template.render({}) == _regex_substitute(text, {})
+        assert template.placeholders == _PLACEHOLDER_RE.findall(text)
+
+    def test_renders_many_contexts(self):
+        template = PlaceholderTemplate("Hi {{ persona }} of {{ project_name }}")
+        assert template.render({"persona": "dev", "project_name": "A"}) == "Hi dev of A"
+        assert template.render({"persona": "qa"}) == "Hi qa of {{ project_name }}"
+
+    @pytest.mark.skipif(not _LIBRARY_ROOT.is_dir(), reason="library not present")
+    def test_real_library_matches_regex_substitution(self):
+        for path in sorted(_LIBRARY_ROOT.rglob("*.md")):
+            text = path.read_text(encoding="utf-8")
+            assert PlaceholderTemplate(text).render(_CONTEXT) == (
+                _regex_substitute(text, _CONTEXT)
+            ), path
+
+
+# ---------------------------------------------------------------------------
+# Caches
+# ---------------------------------------------------------------------------
+
+
+class TestTemplateCaches:
+
+    def test_compile_template_reuses_compiled_text(self):
+        assert compile_template("x {{ y }}") is compile_template("x {{ y }}")
+
+    def test_load_template_follows_the_file(self, tmp_path: Path):
+        path = tmp_path / "persona.md"
+        path.write_text("  {{ project_name }}  \n", encoding="utf-8")
+        first = load_template(path, str.strip)
+        assert first.render(_CONTEXT) == "Acme"
+        assert load_template(path, str.strip) is first
+        assert load_template(path).render(_CONTEXT) == "  Acme  \n"
+
+        path.write_text("{{ team }}", encoding="utf-8")
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_template(path, str.strip).render(_CONTEXT) == "developer,architect"
+
+    def test_load_template_missing_file(self, tmp_path: Path):
+        with pytest.raises(OSError):
+            load_template(tmp_path / "missing.md")
+
+
+# ---------------------------------------------------------------------------
+# unresolved_placeholders
+# ---------------------------------------------------------------------------
+
+
+class TestUnresolvedPlaceholders:
+
+    def test_distinct_and_sorted(self):
+        text = "{{ b }} {{a}} {{ b }} {{ x | join(\", \") }}"
+        assert unresolved_placeholders(text) == ["a", "b", 'x | join(", ")']
+
+    def test_clean_text(self):
+        assert unresolved_placeholders("no braces {here}") == []
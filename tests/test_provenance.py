@@ -0,0 +1,78 @@
+"""Tests for foundry_app.services.provenance — output-to-source maps."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from foundry_app.services.output_writer import DirectoryWriter, VirtualTree
+from foundry_app.services.provenance import RecordingWriter, SourceMap, source_key
+
+
+class TestSourceKey:
+
+    def test_library_files_are_relative(self, tmp_path: Path):
+        lib = tmp_path / "library"
+        assert source_key(lib / "expertise" / "python" / "conventions.md", lib) == (
+            "expertise/python/conventions.md"
+        )
+
+    def test_outside_files_stay_absolute(self, tmp_path: Path):
+        kit_file = tmp_path / "kit" / "skills" / "x" / "SKILL.md"
+        assert source_key(kit_file, tmp_path / "library") == kit_file.resolve().as_posix()
+
+
+class TestSourceMap:
+
+    def test_merges_and_sorts(self, tmp_path: Path):
+        lib = tmp_path / "library"
+        sources = SourceMap(tmp_path / "out", lib)
+        sources.add(tmp_path / "out" / "CLAUDE.md", [lib / "b.md"])
+        sources.add("CLAUDE.md", [lib / "a.md", lib / "b.md"])
+        sources.add(tmp_path / "out" / ".mcp.json", [lib / "workflows" / "mcp.yaml"])
+
+        assert sources.as_dict() == {
+            ".mcp.json": ["workflows/mcp.yaml"],
+            "CLAUDE.md": ["a.md", "b.md"],
+        }
+        assert sources.sources_of("CLAUDE.md") == {"a.md", "b.md"}
+
+    def test_empty_map_is_none(self, tmp_path: Path):
+        assert SourceMap(tmp_path, tmp_path).as_dict() is None
+
+
+class TestRecordingWriter:
+
+    def _source(self, tmp_path: Path) -> Path:
+        src = tmp_path / "library" / "claude" / "hooks" / "guard.py"
+        src.parent.mkdir(parents=True)
+        src.write_text("print('guard')\n")
+        return src
+
+    def test_records_copies(self, tmp_path: Path):
+        src = self._source(tmp_path)
+        out = tmp_path / "out"
+        sources = SourceMap(out, tmp_path / "library")
+        writer = RecordingWriter(VirtualTree(out), sources)
+
+        writer.copy_file(src, out / ".claude" / "hooks" / "guard.py")
+        writer.write_text(out / "CLAUDE.md", "not a copy")
+
+        assert sources.as_dict() == {".claude/hooks/guard.py": ["claude/hooks/guard.py"]}
+        assert writer.read_text(out / ".claude" / "hooks" / "guard.py") == "print('guard')\n"
+
+    def test_records_identical_files_already_in_place(self, tmp_path: Path):
+        src = self._source(tmp_path)
+        out = tmp_path / "out"
+        dest = out / "guard.py"
+        out.mkdir()
+        dest.write_text("print('guard')\n")
+        sources = SourceMap(out, tmp_path / "library")
+        writer = RecordingWriter(DirectoryWriter(out), sources)
+
+        assert writer.same_content(dest, src)
+        assert sources.as_dict() == {"guard.py": ["claude/hooks/guard.py"]}
+
+        dest.write_text("edited")
+        other = SourceMap(out, tmp_path / "library")
+        assert not RecordingWriter(DirectoryWriter(out), other).same_content(dest, src)
+        assert other.as_dict() is None
@@ -0,0 +1,125 @@
+"""Tests for foundry_app.services.run_fingerprint — skipping unchanged regenerations."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from foundry_app.core.models import (
+    CompositionSpec,
+    GenerationManifest,
+    ProjectIdentity,
+    Strictness,
+)
+from foundry_app.services.file_ledger import write_ledger
+from foundry_app.services.run_fingerprint import input_fingerprint, up_to_date_manifest
+
+
+def _make_spec(name: str = "Demo") -> CompositionSpec:
+    return CompositionSpec(project=ProjectIdentity(name=name, slug="demo"))
+
+
+def _make_library(tmp_path: Path) -> Path:
+    lib = tmp_path / "library"
+    (lib / "personas" / "core" / "developer").mkdir(parents=True)
+    (lib / "personas" / "core" / "developer" / "persona.md").write_text("# Developer")
+    return lib
+
+
+def _make_kit(tmp_path: Path) -> Path:
+    kit = tmp_path / "kit"
+    (kit / "skills" / "shared-skill").mkdir(parents=True)
+    (kit / "skills" / "shared-skill" / "SKILL.md").write_text("v1")
+    (kit / "kit-manifest.json").write_text(
+        json.dumps({"distributed_skills": ["shared-skill"]}),
+    )
+    return kit
+
+
+def _fingerprint(tmp_path: Path, spec: CompositionSpec | None = None, **kwargs) -> str:
+    return input_fingerprint(
+        spec or _make_spec(),
+        tmp_path / "library",
+        kwargs.get("strictness", Strictness.STANDARD),
+        tmp_path / "kit",
+    )
+
+
+def _make_project(tmp_path: Path, fingerprint: str) -> Path:
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "CLAUDE.md").write_text("# Demo")
+    write_ledger(project, ["CLAUDE.md"])
+    manifest = GenerationManifest(run_id="run-1", input_fingerprint=fingerprint)
+    (project / "manifest.json").write_text(manifest.model_dump_json())
+    return project
+
+
+# ---------------------------------------------------------------------------
+# input_fingerprint
+# ---------------------------------------------------------------------------
+
+
+class TestInputFingerprint:
+
+    def test_stable_for_identical_inputs(self, tmp_path: Path):
+        _make_library(tmp_path)
+        _make_kit(tmp_path)
+        assert _fingerprint(tmp_path) == _fingerprint(tmp_path)
+
+    def test_ignores_library_mtimes(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        _make_kit(tmp_path)
+        before = _fingerprint(tmp_path)
+        persona = lib / "personas" / "core" / "developer" / "persona.md"
+        os.utime(persona, ns=(0, 0))
+        assert _fingerprint(tmp_path) == before
+
+    def test_moves_with_each_input(self, tmp_path: Path):
+        lib = _make_library(tmp_path)
+        kit = _make_kit(tmp_path)
+        seen = {_fingerprint(tmp_path)}
+
+        seen.add(_fingerprint(tmp_path, _make_spec("Other")))
+        seen.add(_fingerprint(tmp_path, strictness=Strictness.STRICT))
+        (lib / "personas" / "core" / "developer" / "persona.md").write_text("# Changed")
+        seen.add(_fingerprint(tmp_path))
+        (kit / "skills" / "shared-skill" / "SKILL.md").write_text("v2")
+        seen.add(_fingerprint(tmp_path))
+
+        assert len(seen) == 5
+
+
+# ---------------------------------------------------------------------------
+# up_to_date_manifest
+# ---------------------------------------------------------------------------
+
+
+class TestUpToDateManifest:
+
+    def test_matching_fingerprint_and_intact_tree(self, tmp_path: Path):
+        project = _make_project(tmp_path, "abc")
+        manifest = up_to_date_manifest(project, "abc")
+        assert manifest is not None
+        assert manifest.run_id == "run-1"
+
+    def test_different_fingerprint(self, tmp_path: Path):
+        project = _make_project(tmp_path, "abc")
+        assert up_to_date_manifest(project, "def") is None
+
+    def test_edited_output_file(self, tmp_path: Path):
+        project = _make_project(tmp_path, "abc")
+        (project / "CLAUDE.md").write_text("# Hand edited")
+        assert up_to_date_manifest(project, "abc") is None
+
+    def test_deleted_output_file(self, tmp_path: Path):
+        project = _make_project(tmp_path, "abc")
+        (project / "CLAUDE.md").unlink()
+        assert up_to_date_manifest(project, "abc") is None
+
+    def test_missing_ledger_or_manifest(self, tmp_path: Path):
+        project = _make_project(tmp_path, "abc")
+        (project / ".foundry" / "file-hashes.json").unlink()
+        assert up_to_date_manifest(project, "abc") is None
+        assert up_to_date_manifest(tmp_path / "nowhere", "abc") is None
@@ -17,6 +17,7 @@ from foundry_app.core.models import (
     PersonaSelection,
     Posture,
     ProjectIdentity,
+    SafetyConfig,
     TeamConfig,
 )
 from foundry_app.services.safety_writer import posture_base_packs, write_safety
@@ -37,6 +38,19 @@ def _make_spec(**kwargs) -> CompositionSpec:
     return CompositionSpec(**defaults)
 
 
+# The lint packs' hook scripts (ruff; prettier + eslint + tsc).
+_PY_LINT = "lint-python.py"
+_JS_LINT = "lint-js.py"
+
+
+def _ship_hook_scripts(output: Path) -> None:
+    """Place the packs' hook scripts, as the asset copier does before write_safety."""
+    hooks_dir = output / ".claude" / "hooks"
+    hooks_dir.mkdir(parents=True, exist_ok=True)
+    for script in (_PY_LINT, _JS_LINT, "secret-scan.py"):
+        (hooks_dir / script).write_text("# stub")
+
+
 def _read_settings(output: Path) -> dict:
     """Read and parse the generated settings.json."""
     return json.loads(
@@ -61,6 +75,7 @@ class TestBasicGeneration:
         assert (tmp_path / ".claude").is_dir()
 
     def test_returns_stage_result(self, tmp_path: Path):
+        _ship_hook_scripts(tmp_path)
         result = write_safety(_make_spec(), tmp_path)
         assert len(result.wrote) == 1
         assert result.warnings == []
@@ -187,7 +202,30 @@ class TestPreCommitLint:
         write_safety(spec, tmp_path)
         data = _read_settings(tmp_path)
         command = data["hooks"]["PostToolUse"][0]["hooks"][0]["command"]
-        assert "ruff" in command
+        assert command == "python3 .claude/hooks/lint-python.py"
+
+    def test_project_pass_runs_at_stop(self, tmp_path: Path):
+        spec = _make_spec(hooks=HooksConfig(
+            packs=[
+                HookPackSelection(id="pre-commit-lint"),
+                HookPackSelection(id="pre-commit-lint-js"),
+            ],
+            replace_defaults=True,
+        ))
+        write_safety(spec, tmp_path)
+        data = _read_settings(tmp_path)
+        assert [e["hooks"][0]["command"] for e in data["hooks"]["Stop"]] == [
+            "python3 .claude/hooks/lint-python.py",
+            "python3 .claude/hooks/lint-js.py",
+        ]
+
+    def test_no_stop_event_without_a_deferring_pack(self, tmp_path: Path):
+        spec = _make_spec(hooks=HooksConfig(
+            packs=[HookPackSelection(id="security-scan")],
+            replace_defaults=True,
+        ))
+        write_safety(spec, tmp_path)
+        assert "Stop" not in _read_settings(tmp_path)["hooks"]
 
 
 class TestSecurityScan:
@@ -209,7 +247,37 @@ class TestSecurityScan:
         write_safety(spec, tmp_path)
         data = _read_settings(tmp_path)
         command = data["hooks"]["PostToolUse"][0]["hooks"][0]["command"]
-        assert "secret" in command.lower() or "PRIVATE KEY" in command
+        assert command == "python3 .claude/hooks/secret-scan.py"
+
+    def test_writes_patterns_from_secret_policy(self, tmp_path: Path):
+        spec = _make_spec(hooks=HooksConfig(
+            posture=Posture.HARDENED,
+            packs=[HookPackSelection(id="security-scan")],
+            replace_defaults=True,
+        ))
+        result = write_safety(spec, tmp_path)
+        config = json.loads((tmp_path / ".claude" / "secret-scan.json").read_text())
+        assert config == {
+            "scan": True,
+            "patterns": SafetyConfig.hardened_safety().secrets.secret_patterns,
+        }
+        assert ".claude/secret-scan.json" in result.wrote
+
+    def test_scan_can_be_turned_off(self, tmp_path: Path):
+        spec = _make_spec(
+            hooks=HooksConfig(
+                packs=[HookPackSelection(id="security-scan")], replace_defaults=True,
+            ),
+            safety=SafetyConfig.permissive_safety(),
+        )
+        write_safety(spec, tmp_path)
+        config = json.loads((tmp_path / ".claude" / "secret-scan.json").read_text())
+        assert config == {"scan": False, "patterns": []}
+
+    def test_no_pattern_file_without_the_pack(self, tmp_path: Path):
+        result = write_safety(_make_spec(), tmp_path)
+        assert not (tmp_path / ".claude" / "secret-scan.json").exists()
+        assert result.wrote == [".claude/settings.json"]
 
 
 class TestAzReadOnly:
@@ -262,7 +330,7 @@ class TestBaselinePosture:
             for e in data["hooks"]["PostToolUse"]
             for h in e["hooks"]
         ]
-        assert any("ruff" in c for c in commands)
+        assert any(_PY_LINT in c for c in commands)
 
 
 class TestHardenedPosture:
@@ -506,10 +574,8 @@ class TestStackAwareLintSelection:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        assert any("ruff" in c for c in commands)
-        assert not any("eslint" in c.lower() for c in commands)
-        assert not any("prettier" in c.lower() for c in commands)
-        assert not any("tsc" in c.lower() for c in commands)
+        assert any(_PY_LINT in c for c in commands)
+        assert not any(_JS_LINT in c for c in commands)
 
     def test_react_typescript_stack_gets_eslint_prettier_tsc(self, tmp_path: Path):
         spec = _make_spec(
@@ -521,10 +587,8 @@ class TestStackAwareLintSelection:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        assert any("eslint" in c.lower() for c in commands)
-        assert any("prettier" in c.lower() for c in commands)
-        assert any("tsc" in c.lower() for c in commands)
-        assert not any("ruff" in c for c in commands)
+        assert any(_JS_LINT in c for c in commands)
+        assert not any(_PY_LINT in c for c in commands)
 
     def test_node_only_stack_gets_js_lint(self, tmp_path: Path):
         spec = _make_spec(
@@ -533,8 +597,8 @@ class TestStackAwareLintSelection:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        assert any("eslint" in c.lower() for c in commands)
-        assert not any("ruff" in c for c in commands)
+        assert any(_JS_LINT in c for c in commands)
+        assert not any(_PY_LINT in c for c in commands)
 
     def test_mixed_python_and_typescript_gets_both_lints(self, tmp_path: Path):
         spec = _make_spec(
@@ -546,8 +610,8 @@ class TestStackAwareLintSelection:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        assert any("ruff" in c for c in commands)
-        assert any("eslint" in c.lower() for c in commands)
+        assert any(_PY_LINT in c for c in commands)
+        assert any(_JS_LINT in c for c in commands)
 
     def test_duplicate_js_expertises_add_pack_once(self, tmp_path: Path):
         spec = _make_spec(
@@ -560,9 +624,9 @@ class TestStackAwareLintSelection:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        # eslint should appear in one pack's command only
-        eslint_hits = sum(1 for c in commands if "eslint" in c.lower())
-        assert eslint_hits == 1
+        # the JS lint script should appear in one pack's command only
+        js_lint_hits = sum(1 for c in commands if _JS_LINT in c)
+        assert js_lint_hits == 1
 
     def test_unmapped_expertise_adds_no_lint(self, tmp_path: Path):
         spec = _make_spec(
@@ -571,8 +635,8 @@ class TestStackAwareLintSelection:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        assert not any("ruff" in c for c in commands)
-        assert not any("eslint" in c.lower() for c in commands)
+        assert not any(_PY_LINT in c for c in commands)
+        assert not any(_JS_LINT in c for c in commands)
 
 
 class TestStackAwareCloudSelection:
@@ -655,7 +719,7 @@ class TestStackMismatchWarnings:
         assert any("pre-commit-lint" in w and "python" in w for w in result.warnings)
         # Pack still written (backward compatibility)
         commands = _all_commands(_read_settings(tmp_path))
-        assert any("ruff" in c for c in commands)
+        assert any(_PY_LINT in c for c in commands)
 
     def test_eslint_on_python_project_warns(self, tmp_path: Path):
         spec = _make_spec(
@@ -678,6 +742,7 @@ class TestStackMismatchWarnings:
             expertise=[ExpertiseSelection(id="python")],
             hooks=HooksConfig(packs=[HookPackSelection(id="pre-commit-lint")]),
         )
+        _ship_hook_scripts(tmp_path)
         result = write_safety(spec, tmp_path)
         assert result.warnings == []
 
@@ -687,6 +752,7 @@ class TestStackMismatchWarnings:
             hooks=HooksConfig(posture=Posture.HARDENED),
             architecture=ArchitectureConfig(cloud_providers=[CloudProvider.AWS]),
         )
+        _ship_hook_scripts(tmp_path)
         result = write_safety(spec, tmp_path)
         assert result.warnings == []
 
@@ -707,8 +773,8 @@ class TestStackAwareEndToEnd:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        assert any("ruff" in c for c in commands)
-        assert not any("eslint" in c.lower() for c in commands)
+        assert any(_PY_LINT in c for c in commands)
+        assert not any(_JS_LINT in c for c in commands)
         assert not any("az\\s" in c for c in commands)
         assert not any("aws\\s" in c for c in commands)
 
@@ -725,10 +791,8 @@ class TestStackAwareEndToEnd:
         )
         write_safety(spec, tmp_path)
         commands = _all_commands(_read_settings(tmp_path))
-        assert any("eslint" in c.lower() for c in commands)
-        assert any("prettier" in c.lower() for c in commands)
-        assert any("tsc" in c.lower() for c in commands)
-        assert not any("ruff" in c for c in commands)
+        assert any(_JS_LINT in c for c in commands)
+        assert not any(_PY_LINT in c for c in commands)
 
 
 # ---------------------------------------------------------------------------
@@ -884,6 +948,7 @@ class TestPostureCompatibilityFilter:
                 HookPackSelection(id="compliance-gate"),
             ],
         ))
+        _ship_hook_scripts(tmp_path)
         result = write_safety(spec, tmp_path)
         assert result.warnings == []
         data = _read_settings(tmp_path)
@@ -1004,3 +1069,131 @@ class TestMissingHookScripts:
         ))
         result = write_safety(spec, tmp_path)
         assert not any("not present" in w for w in result.warnings)
+
+
+# ---------------------------------------------------------------------------
+# Hook dispatcher: one process per event
+# ---------------------------------------------------------------------------
+
+
+def _ship_dispatcher(output: Path) -> None:
+    hooks_dir = output / ".claude" / "hooks"
+    hooks_dir.mkdir(parents=True, exist_ok=True)
+    (hooks_dir / "foundry-hooks.py").write_text("# stub")
+
+
+def _commands(data: dict, event: str) -> list[str]:
+    return [h["command"] for e in data["hooks"][event] for h in e["hooks"]]
+
+
+class TestHookDispatch:
+
+    def _spec(self, **hooks) -> CompositionSpec:
+        return _make_spec(hooks=HooksConfig(
+            packs=[HookPackSelection(id="hook-policy")],
+            replace_defaults=True,
+            **hooks,
+        ))
+
+    def test_scripts_folded_into_one_entry_per_event(self, tmp_path: Path):
+        _ship_dispatcher(tmp_path)
+        write_safety(self._spec(), tmp_path)
+        data = _read_settings(tmp_path)
+
+        pre = data["hooks"]["PreToolUse"]
+        assert len(pre) == 2
+        assert "protected branch" in pre[0]["hooks"][0]["command"]
+        assert pre[1] == {
+            "matcher": "Edit|Write",
+            "hooks": [{
+                "type": "command",
+                "command": (
+                    "python3 .claude/hooks/foundry-hooks.py "
+                    "validate-task-inputs.py vdd-gate.py handoff-reminder.py"
+                ),
+            }],
+        }
+        # A lone script keeps its direct command.
+        assert _commands(data, "PostToolUse") == [
+            "python3 .claude/hooks/telemetry-stamp.py",
+        ]
+
+    def test_library_settings_folded_with_pack_hooks(self, tmp_path: Path):
+        _ship_dispatcher(tmp_path)
+        (tmp_path / ".claude" / "settings.json").write_text(json.dumps({
+            "hooks": {
+                "PostToolUse": [
+                    {"matcher": "Edit|Write", "hooks": [{
+                        "type": "command",
+                        "command": "python3 .claude/hooks/format-on-save.py",
+                    }]},
+                    {"matcher": "Edit|Write", "hooks": [{
+                        "type": "command",
+                        "command": "python3 .claude/hooks/slow.py",
+                        "timeout": 5,
+                    }]},
+                ],
+                "Stop": [{"hooks": [{
+                    "type": "command",
+                    "command": "python3 .claude/hooks/stop-quality-reminder.py",
+                }]}],
+            },
+        }), encoding="utf-8")
+
+        write_safety(self._spec(), tmp_path)
+        data = _read_settings(tmp_path)
+
+        assert _commands(data, "PostToolUse") == [
+            "python3 .claude/hooks/foundry-hooks.py format-on-save.py telemetry-stamp.py",
+            "python3 .claude/hooks/slow.py",
+        ]
+        assert data["hooks"]["Stop"] == [{"hooks": [{
+            "type": "command",
+            "command": "python3 .claude/hooks/stop-quality-reminder.py",
+        }]}]
+
+    def test_rewrite_is_stable(self, tmp_path: Path):
+        _ship_dispatcher(tmp_path)
+        write_safety(self._spec(), tmp_path)
+        first = _read_settings(tmp_path)
+        write_safety(self._spec(), tmp_path)
+        assert _read_settings(tmp_path) == first
+
+    def test_dispatch_off_keeps_one_entry_per_script(self, tmp_path: Path):
+        _ship_dispatcher(tmp_path)
+        write_safety(self._spec(dispatch=False), tmp_path)
+        commands = _commands(_read_settings(tmp_path), "PreToolUse")
+        assert "python3 .claude/hooks/vdd-gate.py" in commands
+        assert not any("foundry-hooks.py" in c for c in commands)
+
+    def test_not_folded_without_dispatcher_script(self, tmp_path: Path):
+        write_safety(self._spec(), tmp_path)
+        commands = _commands(_read_settings(tmp_path), "PreToolUse")
+        assert "python3 .claude/hooks/vdd-gate.py" in commands
+
+    def test_dispatched_scripts_checked_for_presence(self, tmp_path: Path):
+        _ship_dispatcher(tmp_path)
+        result = write_safety(self._spec(), tmp_path)
+        assert any("vdd-gate.py" in w and "not present" in w for w in result.warnings)
+        assert not any("foundry-hooks.py" in w for w in result.warnings)
+
+    def test_daemon_routes_every_script_entry_through_the_client(self, tmp_path: Path):
+        _ship_dispatcher(tmp_path)
+        write_safety(self._spec(daemon=True), tmp_path)
+        data = _read_settings(tmp_path)
+
+        assert _commands(data, "PreToolUse")[1] == (
+            "python3 .claude/hooks/foundry-hooks.py --daemon "
+            "validate-task-inputs.py vdd-gate.py handoff-reminder.py"
+        )
+        assert _commands(data, "PostToolUse") == [
+            "python3 .claude/hooks/foundry-hooks.py --daemon telemetry-stamp.py",
+        ]
+
+    def test_daemon_toggle_refolds(self, tmp_path: Path):
+        _ship_dispatcher(tmp_path)
+        write_safety(self._spec(), tmp_path)
+        first = _read_settings(tmp_path)
+        write_safety(self._spec(daemon=True), tmp_path)
+        write_safety(self._spec(), tmp_path)
+        assert _read_settings(tmp_path) == first
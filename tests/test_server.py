@@ -0,0 +1,283 @@
+"""Tests for foundry_app.services.server — the warm-library generation server."""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from foundry_app.core.models import CompositionSpec, GenerationRequest
+from foundry_app.services.library_cache import library_fingerprint
+from foundry_app.services.server import GenerationService, RequestError, make_server
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _make_library_dir(tmp_path: Path) -> Path:
+    """Create a minimal library directory on disk and return its path."""
+    lib_root = tmp_path / "library"
+    persona_dir = lib_root / "personas" / "core" / "developer"
+    persona_dir.mkdir(parents=True)
+    (persona_dir / "persona.md").write_text("# Developer persona")
+    expertise_dir = lib_root / "expertise" / "python"
+    expertise_dir.mkdir(parents=True)
+    (expertise_dir / "conventions.md").write_text("# Python conventions")
+    workflows = lib_root / "workflows"
+    workflows.mkdir()
+    (workflows / "mcp-registry.yaml").write_text(
+        "servers: {}\nbaseline: []\nby_expertise: {}\n"
+    )
+    return lib_root
+
+
+def _composition(slug: str = "demo", personas: tuple[str, ...] = ("developer",)) -> dict:
+    return {
+        "project": {"name": slug.title(), "slug": slug},
+        "expertise": [{"id": "python"}],
+        "team": {"personas": [{"id": p} for p in personas]},
+    }
+
+
+def _request(tmp_path: Path, slug: str = "demo", **overrides) -> GenerationRequest:
+    return GenerationRequest(
+        composition=CompositionSpec.model_validate(_composition(slug)),
+        output_root=str(tmp_path / "out" / slug),
+        **overrides,
+    )
+
+
+def _bump_mtime(path: Path) -> None:
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+# ---------------------------------------------------------------------------
+# library_fingerprint
+# ---------------------------------------------------------------------------
+
+
+class TestLibraryFingerprint:
+
+    def test_stable_until_a_file_changes(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        before = library_fingerprint(lib)
+        assert library_fingerprint(lib) == before
+
+        _bump_mtime(lib / "workflows" / "mcp-registry.yaml")
+        assert library_fingerprint(lib) != before
+
+    def test_added_file_moves_it(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        before = library_fingerprint(lib)
+        (lib / "templates").mkdir()
+        (lib / "templates" / "new.md").write_text("x")
+        assert library_fingerprint(lib) != before
+
+
+# ---------------------------------------------------------------------------
+# GenerationService
+# ---------------------------------------------------------------------------
+
+
+class TestGenerationService:
+
+    def test_generate_reuses_the_warm_library(self, tmp_path: Path):
+        service = GenerationService(_make_library_dir(tmp_path))
+
+        for slug in ("one", "two"):
+            manifest, validation, plan = service.generate(_request(tmp_path, slug))
+            assert validation.is_valid
+            assert plan is None
+            assert manifest.total_files_written > 0
+            assert (tmp_path / "out" / slug / "CLAUDE.md").is_file()
+
+        assert service.loads == 1
+
+    def test_library_change_reindexes(self, tmp_path: Path):
+        lib = _make_library_dir(tmp_path)
+        service = GenerationService(lib)
+        request = GenerationRequest(
+            composition=CompositionSpec.model_validate(
+                _composition(personas=("developer", "reviewer")),
+            ),
+        )
+        first = service.validate(request)
+        assert any("reviewer" in m.message for m in first.errors)
+
+        reviewer = lib / "personas" / "core" / "reviewer"
+        reviewer.mkdir()
+        (reviewer / "persona.md").write_text("# Reviewer persona")
+
+        assert not any("reviewer" in m.message for m in service.validate(request).errors)
+        assert service.loads == 2
+
+    def test_reload_forces_a_reindex(self, tmp_path: Path):
+        service = GenerationService(_make_library_dir(tmp_path))
+        service.library()
+        service.reload()
+        assert service.loads == 2
+
+    def test_validate_leaves_the_request_untouched(self, tmp_path: Path):
+        service = GenerationService(_make_library_dir(tmp_path))
+        request = GenerationRequest(
+            composition=CompositionSpec.model_validate(_composition(personas=())),
+        )
+        service.validate(request)
+        assert request.composition.team.personas == []
+
+    def test_loads_composition_path(self, tmp_path: Path):
+        service = GenerationService(_make_library_dir(tmp_path))
+        path = tmp_path / "demo.yml"
+        path.write_text(json.dumps(_composition()))
+        validation = service.validate(GenerationRequest(composition_path=str(path)))
+        assert validation.is_valid
+
+    @pytest.mark.parametrize("request_kwargs", [
+        {},
+        {"composition_path": "missing.yml"},
+        {"composition_path": "a.yml", "composition": _composition()},
+    ])
+    def test_bad_composition_source(self, tmp_path: Path, request_kwargs):
+        service = GenerationService(_make_library_dir(tmp_path))
+        with pytest.raises(RequestError):
+            service.validate(GenerationRequest.model_validate(request_kwargs))
+
+    def test_dry_run_requires_overlay(self, tmp_path: Path):
+        service = GenerationService(_make_library_dir(tmp_path))
+        with pytest.raises(RequestError, match="overlay"):
+            service.generate(_request(tmp_path, dry_run=True))
+
+    def test_concurrent_requests(self, tmp_path: Path):
+        service = GenerationService(_make_library_dir(tmp_path))
+        # Two requests per slug: same-directory generations must serialise.
+        slugs = ["alpha", "beta", "gamma", "alpha", "beta", "gamma"]
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            results = list(pool.map(
+                lambda slug: service.generate(_request(tmp_path, slug, overlay=True)),
+                slugs,
+            ))
+
+        assert all(validation.is_valid for _m, validation, _p in results)
+        for slug in set(slugs):
+            assert (tmp_path / "out" / slug / "CLAUDE.md").is_file()
+        assert service.loads == 1
+
+
+# ---------------------------------------------------------------------------
+# HTTP transport
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture
+def http_server(tmp_path: Path):
+    server = make_server(GenerationService(_make_library_dir(tmp_path)), port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url: str, payload: object, **headers: str) -> tuple[int, dict]:
+    data = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    req = urllib.request.Request(
+        url, data=data, headers={"Content-Type": "application/json", **headers},
+    )
+    try:
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+class TestHttpServer:
+
+    def test_health(self, http_server: str):
+        with urllib.request.urlopen(f"{http_server}/health", timeout=30) as resp:
+            body = json.loads(resp.read())
+        assert body["status"] == "ok"
+        assert body["personas"] == 1
+
+    def test_generate_returns_manifest_and_validation(self, http_server: str, tmp_path: Path):
+        status, body = _post(f"{http_server}/generate", {
+            "composition": _composition(),
+            "output_root": str(tmp_path / "out"),
+        })
+        assert status == 200
+        assert body["valid"] is True
+        assert all(m["severity"] != "error" for m in body["validation"]["messages"])
+        assert body["manifest"]["stages"]["scaffold"]["wrote"]
+        assert body["overlay_plan"] is None
+        assert (tmp_path / "out" / "CLAUDE.md").is_file()
+
+    def test_validate_reports_errors(self, http_server: str):
+        status, body = _post(f"{http_server}/validate", {
+            "composition": _composition(personas=("nobody",)),
+        })
+        assert status == 200
+        assert body["valid"] is False
+        assert body["validation"]["messages"]
+
+    def test_bad_requests_get_400(self, http_server: str):
+        assert _post(f"{http_server}/validate", b"{not json")[0] == 400
+        assert _post(f"{http_server}/validate", {"strictness": "lax"})[0] == 400
+        assert _post(f"{http_server}/validate", {})[0] == 400
+        assert _post(f"{http_server}/nowhere", {})[0] == 404
+
+    def test_non_json_content_type_gets_415(self, http_server: str):
+        status, body = _post(f"{http_server}/generate", b"{}", **{"Content-Type": "text/plain"})
+        assert status == 415
+        assert "application/json" in body["error"]
+        assert _post(f"{http_server}/reload", b"", **{"Content-Type": "text/plain"})[0] == 415
+        assert _post(
+            f"{http_server}/reload", b"", **{"Content-Type": "application/json; charset=utf-8"},
+        )[0] == 200
+
+    def test_foreign_host_gets_403(self, http_server: str):
+        port = http_server.rsplit(":", 1)[1]
+        status, body = _post(f"{http_server}/reload", {}, Host=f"evil.example:{port}")
+        assert status == 403
+        assert "evil.example" in body["error"]
+
+        req = urllib.request.Request(f"{http_server}/health", headers={"Host": "127.0.0.1"})
+        with pytest.raises(urllib.error.HTTPError) as exc_info:
+            urllib.request.urlopen(req, timeout=30)
+        assert exc_info.value.code == 403
+
+        status, _ = _post(f"{http_server}/reload", {}, Host=f"localhost:{port}")
+        assert status == 200
+
+
+class TestUnixSocketServer:
+
+    def test_health_over_unix_socket(self, tmp_path: Path):
+        sock_path = tmp_path / "foundry.sock"
+        server = make_server(
+            GenerationService(_make_library_dir(tmp_path)), socket_path=sock_path,
+        )
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+                client.connect(str(sock_path))
+                client.sendall(b"GET /health HTTP/1.0\r\n\r\n")
+                response = b""
+                while chunk := client.recv(65536):
+                    response += chunk
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        head, _, body = response.partition(b"\r\n\r\n")
+        assert head.startswith(b"HTTP/1.0 200")
+        assert json.loads(body)["status"] == "ok"
@@ -0,0 +1,88 @@
+"""Tests for foundry_app.services.stage_metrics — per-stage timing and I/O."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from foundry_app.core.models import StageMetrics, StageResult
+from foundry_app.io.composition_io import load_composition
+from foundry_app.services import stage_metrics
+from foundry_app.services.generator import generate_project
+from foundry_app.services.stage_metrics import measure_stage
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+LIBRARY_ROOT = REPO_ROOT / "ai-team-library"
+
+_HAS_THREAD_IO = stage_metrics._thread_io() is not None
+
+
+def _write_stage(path: Path, data: bytes) -> StageResult:
+    path.write_bytes(data)
+    return StageResult(wrote=[path.name])
+
+
+# ---------------------------------------------------------------------------
+# measure_stage
+# ---------------------------------------------------------------------------
+
+
+class TestMeasureStage:
+
+    def test_records_time_and_file_count(self, tmp_path: Path):
+        result = measure_stage(_write_stage, tmp_path / "a.md", b"x")
+        m = result.metrics
+        assert m.files == 1
+        assert m.wall_seconds > 0
+        assert m.cpu_seconds >= 0
+        assert result.wrote == ["a.md"]
+
+    @pytest.mark.skipif(not _HAS_THREAD_IO, reason="no per-thread I/O counters")
+    def test_counts_bytes_written_and_read(self, tmp_path: Path):
+        written = measure_stage(_write_stage, tmp_path / "a.md", b"x" * 50_000)
+        assert written.metrics.bytes_written >= 50_000
+
+        def _read_stage() -> StageResult:
+            (tmp_path / "a.md").read_bytes()
+            return StageResult()
+
+        assert measure_stage(_read_stage).metrics.bytes_read >= 50_000
+
+    def test_io_unknown_without_proc(self, tmp_path: Path, monkeypatch):
+        monkeypatch.setattr(stage_metrics, "_THREAD_IO", tmp_path / "missing")
+        m = measure_stage(_write_stage, tmp_path / "a.md", b"x").metrics
+        assert m.bytes_read is None
+        assert m.bytes_written is None
+
+    def test_does_not_mutate_the_stage_result(self):
+        shared = StageResult(wrote=["x"])
+        result = measure_stage(lambda: shared)
+        assert shared.metrics is None
+        assert result.metrics is not None
+
+
+# ---------------------------------------------------------------------------
+# Manifest integration
+# ---------------------------------------------------------------------------
+
+
+class TestManifestMetrics:
+
+    def test_every_stage_has_metrics(self, tmp_path: Path):
+        spec = load_composition(REPO_ROOT / "examples" / "small-python-team.yml")
+        manifest, _, _ = generate_project(
+            spec, LIBRARY_ROOT, tmp_path / "out", stage_workers=2,
+        )
+
+        for key, stage in manifest.stages.items():
+            assert stage.metrics is not None, key
+            assert stage.metrics.files == len(stage.wrote)
+        on_disk = json.loads((tmp_path / "out" / "manifest.json").read_text())
+        assert set(on_disk["stages"]["compile"]["metrics"]) == set(
+            StageMetrics.model_fields,
+        )
+
+    def test_unmeasured_results_omit_metrics(self):
+        assert "metrics" not in StageResult(wrote=["a"]).model_dump()
@@ -0,0 +1,72 @@
+"""Tests for the library's telemetry-stamp hook run as Claude Code runs it.
+
+tests/test_telemetry_stamp.py covers the stamping logic; these cover the
+script entry point: the fast path for non-bean edits, and stamping on its
+own and through the foundry-hooks dispatcher.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_LIBRARY_HOOKS = (
+    Path(__file__).resolve().parent.parent / "ai-team-library" / "claude" / "hooks"
+)
+
+_BEAN = """\
+| Field | Value |
+|-------|-------|
+| **Status** | In Progress |
+| **Started** | — |
+"""
+
+
+@pytest.fixture()
+def project(tmp_path: Path) -> Path:
+    hooks = tmp_path / ".claude" / "hooks"
+    hooks.mkdir(parents=True)
+    for script in ("telemetry-stamp.py", "hook_state.py", "foundry-hooks.py"):
+        shutil.copy2(_LIBRARY_HOOKS / script, hooks / script)
+    return tmp_path
+
+
+def _run(project: Path, *args: str, file_path: Path) -> subprocess.CompletedProcess:
+    payload = {"tool_name": "Edit", "tool_input": {"file_path": str(file_path)}}
+    return subprocess.run(
+        [sys.executable, *args], input=json.dumps(payload),
+        capture_output=True, text=True, timeout=30, cwd=project,
+    )
+
+
+class TestEntryPoint:
+
+    def test_non_bean_edit_exits_before_heavy_imports(self, project: Path):
+        result = _run(
+            project, "-X", "importtime", ".claude/hooks/telemetry-stamp.py",
+            file_path=project / "src" / "app.py",
+        )
+        assert result.returncode == 0
+        assert result.stdout == ""
+        imported = {line.rsplit("|", 1)[-1].strip() for line in result.stderr.splitlines()}
+        assert not imported & {"json", "hook_state", "datetime", "pathlib"}
+
+    @pytest.mark.parametrize("command", [
+        [".claude/hooks/telemetry-stamp.py"],
+        [".claude/hooks/foundry-hooks.py", "telemetry-stamp.py"],
+    ])
+    def test_bean_edit_is_stamped(self, project: Path, command: list[str]):
+        bean = project / "ai" / "beans" / "BEAN-042-example" / "bean.md"
+        bean.parent.mkdir(parents=True)
+        bean.write_text(_BEAN, encoding="utf-8")
+
+        result = _run(project, *command, file_path=bean)
+
+        assert result.returncode == 0, result.stderr
+        assert "stamped Started" in json.loads(result.stdout)["message"]
+        assert "| **Started** | — |" not in bean.read_text(encoding="utf-8")